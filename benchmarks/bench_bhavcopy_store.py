@@ -0,0 +1,121 @@
+"""
+Benchmark for BhavcopyStore as-of lookups against per-run dictionary builds.
+
+Synthetic UDiFF F&O bhavcopies (one per trading day) are ingested into a
+temporary store. A reconciliation-sized set of contract keys is then priced
+two ways:
+
+  dict   - what the reconciliation did per run: read the day's bhavcopy frame,
+           build a key -> close dictionary over every row, then look keys up
+  store  - one bulk BhavcopyStore.close_prices() call for just those keys
+
+Both must return the same prices. An as-of lookup (latest date on or before a
+day with no bhavcopy) is timed as well.
+
+The pages import each other as `my_app.pages...`, so the checkout must live in
+a directory named my_app (as it does for the app itself).
+
+Usage (from the repository root):
+    python benchmarks/bench_bhavcopy_store.py
+    python benchmarks/bench_bhavcopy_store.py --days 20 --contracts 40000 --keys 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.dirname(ROOT)]
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from my_app.pages.bhavcopy_store import BhavcopyStore, normalize_bhavcopy  # noqa: E402
+
+
+def make_bhavcopy(day, contracts, rng):
+    """A UDiFF F&O bhavcopy frame with `contracts` option rows"""
+    symbols = np.array([f"SYM{i:03d}" for i in range(200)])
+    strikes = (np.arange(contracts) % 100 + 1) * 50.0
+    return pd.DataFrame({
+        "TradDt": day.isoformat(),
+        "BizDt": day.isoformat(),
+        "Sgmt": "FO",
+        "FinInstrmTp": "STO",
+        "ISIN": None,
+        "TckrSymb": symbols[(np.arange(contracts) // 200) % len(symbols)],
+        "SctySrs": None,
+        "XpryDt": np.where(np.arange(contracts) % 2 == 0, "2025-03-27", "2025-04-24"),
+        "StrkPric": strikes,
+        "OptnTp": np.where(np.arange(contracts) % 200 < 100, "CE", "PE"),
+        "OpnPric": 1.0,
+        "HghPric": 1.0,
+        "LwPric": 1.0,
+        "ClsPric": rng.uniform(1, 500, contracts).round(2),
+        "LastPric": 1.0,
+        "SttlmPric": 1.0,
+    })
+
+
+def dict_prices(df, keys):
+    """The per-run approach: key -> close over the whole file, then look keys up"""
+    rows = normalize_bhavcopy(df, "FO")
+    prices = {}
+    for key, close in zip(rows["contract_key"], rows["close"]):
+        prices[key] = close
+    return {key: prices[key] for key in keys if key in prices}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=10, help="trading days to ingest (default 10)")
+    parser.add_argument("--contracts", type=int, default=20000, help="contracts per bhavcopy (default 20000)")
+    parser.add_argument("--keys", type=int, default=5000, help="contract keys to price (default 5000)")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(7)
+    days = []
+    current = date(2025, 1, 1)
+    while len(days) < args.days:
+        if current.weekday() < 5:
+            days.append(current)
+        current += timedelta(days=1)
+
+    with tempfile.TemporaryDirectory() as directory:
+        store = BhavcopyStore(os.path.join(directory, "bench.sqlite3"))
+        frames = {}
+        started = time.perf_counter()
+        for day in days:
+            frames[day] = make_bhavcopy(day, args.contracts, rng)
+            store.ingest_frame(frames[day], "FO")
+        ingest = time.perf_counter() - started
+        print(f"ingest: {args.days} days x {args.contracts} rows in {ingest:.2f} s")
+
+        last = days[-1]
+        all_keys = normalize_bhavcopy(frames[last], "FO")["contract_key"]
+        keys = list(all_keys.sample(min(args.keys, len(all_keys)), random_state=1))
+
+        started = time.perf_counter()
+        expected = dict_prices(frames[last], keys)
+        dict_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        found = store.close_prices(keys, as_of=last, exact=True)
+        store_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        as_of = store.close_prices(keys, as_of=last + timedelta(days=3))
+        as_of_time = time.perf_counter() - started
+
+    assert found == expected, "store prices differ from the dictionary build"
+    assert as_of == expected, "as-of lookup did not fall back to the latest date"
+    print(f"dict:   {dict_time * 1000:8.1f} ms   ({len(expected)} keys priced)")
+    print(f"store:  {store_time * 1000:8.1f} ms   exact date")
+    print(f"as-of:  {as_of_time * 1000:8.1f} ms   latest date on or before")
+    print(f"speed-up {dict_time / store_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Benchmark for DownloadEngine against a local stand-in for the NSE archive.
+
+A ThreadingHTTPServer on 127.0.0.1 serves fake bhavcopy ZIPs with a fixed
+per-request latency. Some dates answer 404 (holidays), some answer 429 with
+Retry-After once, and some fail with 503 once before succeeding, so retries
+and backoff are exercised as well as throughput. The same date list is
+downloaded sequentially (one worker) and concurrently, and every run is
+checked to return the same outcome per date.
+
+The pages import each other as `my_app.pages...`, so the checkout must live in
+a directory named my_app (as it does for the app itself).
+
+Usage (from the repository root):
+    python benchmarks/bench_download_engine.py
+    python benchmarks/bench_download_engine.py --dates 120 --latency-ms 150 --workers 8
+"""
+import argparse
+import io
+import os
+import sys
+import threading
+import time
+import zipfile
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [ROOT, os.path.dirname(ROOT)]
+
+from my_app.pages.download_engine import DownloadEngine  # noqa: E402
+
+
+def make_zip(date_str, rows=200):
+    """A small bhavcopy-like ZIP for one date"""
+    lines = ["TckrSymb,ISIN,ClsPric"] + [f"SYM{i},INE{i:09d},{100 + i}.5" for i in range(rows)]
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr(f"BhavCopy_NSE_CM_0_0_0_{date_str}_F_0000.csv", "\n".join(lines))
+    return buffer.getvalue()
+
+
+class StandInArchive:
+    """Serves /content/cm/<file> from 127.0.0.1; behaviour per date is fixed by its day number"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.failed_once = set()
+        self.requests = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._zips = {}
+        archive = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so session pooling matters
+
+            def do_GET(self):
+                archive.handle(self)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}/content/cm/"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def handle(self, request):
+        with self._lock:
+            self.requests += 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(self.latency)
+            date_str = request.path.rsplit("_", 3)[-3]
+            day = int(date_str[-2:])
+            status, headers, body = 200, {}, b""
+            with self._lock:
+                first_try = date_str not in self.failed_once
+                if day % 11 in (3, 7) and first_try:
+                    self.failed_once.add(date_str)
+            if day % 13 == 0:
+                status, body = 404, b"<html>Not found</html>"
+            elif day % 11 == 3 and first_try:
+                status, headers = 429, {"Retry-After": "0.2"}
+            elif day % 11 == 7 and first_try:
+                status = 503
+            else:
+                body = self._zips.get(date_str) or self._zips.setdefault(date_str, make_zip(date_str))
+            request.send_response(status)
+            for name, value in headers.items():
+                request.send_header(name, value)
+            request.send_header("Content-Length", str(len(body)))
+            request.end_headers()
+            request.wfile.write(body)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def reset(self):
+        with self._lock:
+            self.failed_once.clear()
+            self.requests = 0
+            self.max_in_flight = 0
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def run(archive, dates, workers, min_interval):
+    archive.reset()
+    tasks = [(d, f"{archive.base_url}BhavCopy_NSE_CM_0_0_0_{d:%Y%m%d}_F_0000.csv.zip") for d in dates]
+    progress = []
+
+    def on_progress(done, total, key, result):
+        progress.append(done)
+
+    started = time.perf_counter()
+    with DownloadEngine(max_workers=workers, min_interval=min_interval, backoff=0.1) as engine:
+        results = engine.run(tasks, on_progress=on_progress)
+    elapsed = time.perf_counter() - started
+    assert progress == list(range(1, len(tasks) + 1)), "progress must count up once per task"
+    outcomes = {key: (result.status, len(result.content or b"")) for key, result in results.items()}
+    return elapsed, outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dates", type=int, default=60, help="weekdays to download (default 60)")
+    parser.add_argument("--latency-ms", type=float, default=100, help="server latency per request (default 100)")
+    parser.add_argument("--workers", type=int, default=4, help="concurrent workers (default 4)")
+    parser.add_argument("--min-interval", type=float, default=0.02,
+                        help="per-host request spacing in seconds (default 0.02)")
+    args = parser.parse_args()
+
+    dates = []
+    current = date(2025, 1, 1)
+    while len(dates) < args.dates:
+        if current.weekday() < 5:
+            dates.append(current)
+        current += timedelta(days=1)
+
+    archive = StandInArchive(args.latency_ms / 1000)
+    try:
+        sequential, expected = run(archive, dates, 1, args.min_interval)
+        print(f"sequential  (1 worker):  {sequential:7.2f} s   {archive.requests} requests")
+        concurrent, outcomes = run(archive, dates, args.workers, args.min_interval)
+        print(f"concurrent ({args.workers} workers): {concurrent:7.2f} s   {archive.requests} requests, "
+              f"max {archive.max_in_flight} in flight")
+    finally:
+        archive.close()
+
+    assert outcomes == expected, "concurrent run returned different outcomes"
+    assert archive.max_in_flight <= args.workers
+    ok = sum(1 for status, _ in outcomes.values() if status == 200)
+    print(f"{ok} downloaded, {len(outcomes) - ok} not found; speed-up {sequential / concurrent:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: headless Excel merge of many files, sequential vs parallel parsing.
+
+Generates `--files` source files (.xlsx, every fifth one .csv; no .xls, since
+nothing installed here can write that format) and merges them with
+excel_merge_engine.merge_workbooks.
+
+Usage (from the repository root):
+    python benchmarks/bench_excel_merge.py --files 50 --rows 2000
+"""
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openpyxl import Workbook  # noqa: E402
+
+from pages.excel_merge_engine import merge_workbooks  # noqa: E402
+
+COLUMNS = ["Date", "ClientCode", "Symbol", "ISIN", "Quantity", "Price", "Value", "Exchange", "Remarks", "Flag"]
+
+
+def make_row(rng, i):
+    quantity = rng.randint(1, 5000)
+    price = round(rng.uniform(10, 5000), 2)
+    return [
+        datetime(2025, 1, 1) + timedelta(days=i % 250),
+        f"C{rng.randint(1000, 9999)}",
+        f"SYM{i % 300}",
+        f"INE{rng.randint(100000, 999999)}01",
+        quantity,
+        price,
+        round(quantity * price, 2),
+        rng.choice(["NSE", "BSE", "MCX"]),
+        "settled" if i % 3 else "",
+        i % 2 == 0,
+    ]
+
+
+def make_sources(directory, files, rows):
+    rng = random.Random(42)
+    sources = []
+    for index in range(files):
+        data = [make_row(rng, i) for i in range(rows)]
+        if index % 5 == 4:
+            path = os.path.join(directory, f"source_{index:02d}.csv")
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(COLUMNS)
+                writer.writerows([[row[0].strftime("%d-%m-%Y")] + row[1:] for row in data])
+        else:
+            path = os.path.join(directory, f"source_{index:02d}.xlsx")
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Data")
+            ws.append(COLUMNS)
+            for row in data:
+                ws.append(row)
+            wb.save(path)
+        sources.append((f"Sheet {index + 1}", path, None))
+    return sources
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50, help="number of source files (default 50)")
+    parser.add_argument("--rows", type=int, default=2000, help="rows per source file (default 2000)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        sources = make_sources(directory, args.files, args.rows)
+        print(f"{args.files} files x {args.rows} rows x {len(COLUMNS)} columns, {os.cpu_count()} CPUs")
+
+        timings = {}
+        for label, parallel in (("sequential parse", False), ("parallel parse", True)):
+            output = os.path.join(directory, f"merged_{parallel}.xlsx")
+            start = time.perf_counter()
+            merge_workbooks(output, sources, parallel=parallel)
+            timings[label] = time.perf_counter() - start
+            print(f"{label:<18} {timings[label]:8.2f} s   output {os.path.getsize(output) / 1e6:6.2f} MB")
+        print(f"speed-up: {timings['sequential parse'] / timings['parallel parse']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark: output_save_in_template write-only path vs the original per-cell workbook.
+
+The original implementation (one styled cell at a time in a regular openpyxl
+workbook, then a second pass for the zebra fill) is kept here as the baseline.
+
+Usage (from the repository root):
+    python benchmarks/bench_output_save_in_template.py --rows 50000
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from CONSTANTS import CAR_TRADE_HEADERS  # noqa: E402
+from pages.helper import output_save_in_template  # noqa: E402
+
+
+def original_output_save_in_template(data, headers, filename="Report.xlsx"):
+    """The original per-cell styled workbook, for comparison."""
+    from openpyxl import Workbook
+    from openpyxl.styles import PatternFill, Font
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Sheet1"
+
+    header_fill = PatternFill(start_color="87CEEB", end_color="87CEEB", fill_type="solid")
+    header_font = Font(color="FFFFFF", bold=True)
+    zebra_fill = PatternFill(start_color="DCE6F1", end_color="DCE6F1", fill_type="solid")
+
+    for col, title in enumerate(headers, start=1):
+        cell = ws.cell(row=1, column=col, value=title)
+        cell.fill = header_fill
+        cell.font = header_font
+
+    header_map = {header: idx + 1 for idx, header in enumerate(headers)}
+    start_row = 2
+
+    for i, record in enumerate(data, start=start_row):
+        for header in headers:
+            ws.cell(row=i, column=header_map[header], value=record.get(header, ""))
+
+    if data:
+        max_row = start_row + len(data) - 1
+        for row in range(start_row, max_row + 1, 2):
+            for col in range(1, len(headers) + 1):
+                ws.cell(row=row, column=col).fill = zebra_fill
+
+    output = io.BytesIO()
+    wb.save(output)
+    output.seek(0)
+    return output, filename
+
+
+def make_rows(count, headers):
+    """Trade-loader shaped row dicts: dates, quantities, Decimal prices and text."""
+    rows = []
+    for i in range(count):
+        row = {header: "" for header in headers}
+        row.update({
+            "RecordType": "Buy" if i % 2 else "Sell",
+            "KeyValue": f"NSENIFTY20251230C{24000 + i % 50}",
+            "Investment": f"NSENIFTY20251230C{24000 + i % 50}",
+            "EventDate": "10-28-2025",
+            "SettleDate": "10-28-2025",
+            "ActualSettleDate": "10-28-2025",
+            "Quantity": 75 * (i % 9 + 1),
+            "Price": Decimal("123.45") + i % 100,
+        })
+        rows.append(row)
+    return rows
+
+
+def measure(label, func, track_memory=False):
+    """Time one export; with track_memory, re-run it under tracemalloc for the peak allocation."""
+    start = time.perf_counter()
+    output, _ = func()
+    elapsed = time.perf_counter() - start
+    line = f"{label:<28} {elapsed:8.2f} s   file {len(output.getvalue()) / 1e6:6.2f} MB"
+    if track_memory:
+        # tracemalloc slows allocation-heavy code a lot, so it is kept out of the timed run
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        line += f"   peak {peak / 1e6:8.1f} MB"
+    print(line)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20000, help="number of data rows (default 20000)")
+    parser.add_argument("--memory", action="store_true", help="also report peak traced memory (slow)")
+    args = parser.parse_args()
+
+    headers = CAR_TRADE_HEADERS
+    rows = make_rows(args.rows, headers)
+    row_lists = [[row.get(header, "") for header in headers] for row in rows]
+    print(f"{args.rows} rows x {len(headers)} columns")
+
+    original = measure("original per-cell workbook", lambda: original_output_save_in_template(rows, headers),
+                       args.memory)
+    streamed = measure("write-only, dict rows", lambda: output_save_in_template(rows, headers), args.memory)
+    measure("write-only, list rows", lambda: output_save_in_template(row_lists, headers), args.memory)
+    print(f"speed-up (dict rows): {original / streamed:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark: loading, sorting and search-filtering a large result table model.
+
+The VirtualTable widget only materializes the visible rows, so the cost of
+showing a result set is the TableModel work timed here (no display needed).
+
+Usage (from the repository root):
+    python benchmarks/bench_virtual_table.py --rows 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pages.virtual_table import TableModel  # noqa: E402
+
+COLUMNS = (
+    "Date", "InstrumentType", "BuySell", "Qty", "Price", "TMCode",
+    "Securitiy Nmaes", "UnderlyingInvestment", "StrikePrice",
+    "Option/Future Type", "PutCallFlag", "ExpireDate"
+)
+
+
+def make_rows(count):
+    rng = random.Random(42)
+    rows = []
+    for i in range(count):
+        symbol = f"SYM{i % 400}"
+        rows.append([
+            f"{1 + i % 28:02d}-01-2025", rng.choice(["OPTSTK", "FUTSTK", "OPTIDX"]), rng.choice(["Buy", "Sell"]),
+            rng.randint(1, 5000), Decimal(f"{rng.uniform(1, 5000):.2f}"), f"{rng.randint(1000, 99999):05d}",
+            f"{symbol} 250130C{rng.randint(100, 900)}", symbol, rng.randint(100, 900),
+            rng.choice(["Option", "Future"]), rng.choice(["Call", "Put", ""]), "30-01-2025",
+        ])
+    return rows
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"{label:<28} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100000, help="number of rows (default 100000)")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    print(f"{args.rows} rows x {len(COLUMNS)} columns")
+    model = TableModel(COLUMNS)
+    timed("load", lambda: model.set_rows(rows))
+    timed("sort by Price", lambda: model.sort("Price"))
+    timed("build search index", lambda: model.set_filter("s"))
+    # Typing narrows the previous result instead of rescanning every row
+    for term in ("sy", "sym", "sym1", "sym12"):
+        timed(f"filter {term!r}", lambda: model.set_filter(term))
+    print(f"{'matching rows':<28} {len(model):8d}")
+    timed("backspace to 'sym1'", lambda: model.set_filter("sym1"))
+    model.set_filter("sym12")
+    timed("first screen (30 rows)", lambda: [model.row(position) for position in range(min(30, len(model)))])
+    timed("export visible rows", lambda: list(model.rows()))
+
+
+if __name__ == "__main__":
+    main()
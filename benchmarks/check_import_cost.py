@@ -0,0 +1,131 @@
+"""
+Import-cost check for page modules, based on `python -X importtime`.
+
+Each module is imported in a fresh interpreter so every measurement is a cold
+import. The script prints each module's cumulative import time and its most
+expensive dependencies. It exits non-zero when a module listed in
+LIGHT_MODULES pulls in one of HEAVY_MODULES at import time, or when a module
+exceeds its import budget. This is the regression check for keeping pandas and
+openpyxl out of module-level imports.
+
+The pages import each other as `my_app.pages...`, so the checkout must live in
+a directory named my_app (as it does for the app itself).
+
+Usage (from the repository root):
+    python benchmarks/check_import_cost.py
+    python benchmarks/check_import_cost.py --budget-ms 100 pages.gtn_loader
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Libraries that must only be imported inside the functions that use them
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "xlrd")
+
+# Modules that must import without any of HEAVY_MODULES
+LIGHT_MODULES = (
+    "pages.bhavcopy_repository",
+    "pages.bhavcopy_store",
+    "pages.download_engine",
+    "pages.helper",
+    "pages.fo_reconciliation",
+    "pages.job_runner",
+    "pages.loading",
+    "pages.search_filter",
+    "pages.sheet_directory",
+    "pages.trading_calendar",
+    "pages.zip_sink",
+)
+
+# Default cumulative import budget for LIGHT_MODULES (milliseconds)
+DEFAULT_BUDGET_MS = 150
+
+
+def measure(module):
+    """Cold-import `module` and parse its -X importtime report.
+
+    Returns:
+        tuple: (entries, error) - entries is a list of (indented name, self_us, cumulative_us)
+            in report order, error is the child's stderr tail when the import failed
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [ROOT, os.path.dirname(ROOT), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env=env, capture_output=True, text=True,
+    )
+    entries = []
+    other = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            other.append(line)
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # column header
+        # Keep the indentation (two spaces per nesting level) after the separator space
+        entries.append((fields[2][1:].rstrip(), int(fields[0]), int(fields[1])))
+    error = "\n".join(other[-5:]) if proc.returncode else None
+    return entries, error
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", help="modules to check (default: LIGHT_MODULES and every page)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"cumulative import budget for light modules (default {DEFAULT_BUDGET_MS})")
+    parser.add_argument("--top", type=int, default=5, help="dependencies listed per module (default 5)")
+    args = parser.parse_args()
+
+    modules = args.modules
+    if not modules:
+        pages = sorted(
+            f"pages.{name[:-3]}" for name in os.listdir(os.path.join(ROOT, "pages"))
+            if name.endswith(".py") and name != "__init__.py"
+        )
+        modules = list(LIGHT_MODULES) + [m for m in pages if m not in LIGHT_MODULES]
+
+    failures = []
+    for module in modules:
+        entries, error = measure(module)
+        light = module in LIGHT_MODULES or module in args.modules
+        if error:
+            # Only light modules must import here; others may need optional packages (e.g. pywin32)
+            print(f"{module:<40} import failed\n    {error.strip()}")
+            if light:
+                failures.append(f"{module}: import failed")
+            continue
+        # The module's own subtree: the lines after the previous top-level
+        # import (interpreter startup) up to its own line, which comes last
+        start = len(entries) - 1
+        while start > 0 and entries[start - 1][0].startswith(" "):
+            start -= 1
+        entries = entries[start:]
+        total_ms = entries[-1][2] / 1000 if entries else 0.0
+        imported = {name.strip().split(".")[0] for name, _, _ in entries}
+        heavy = sorted(imported.intersection(HEAVY_MODULES))
+        print(f"{module:<40} {total_ms:8.1f} ms" + (f"   heavy: {', '.join(heavy)}" if heavy else ""))
+
+        # Top-level dependencies (two leading spaces: direct children) by cumulative time
+        direct = [(name, cumulative) for name, _, cumulative in entries if name.startswith("  ") and not name.startswith("   ")]
+        for name, cumulative in sorted(direct, key=lambda item: item[1], reverse=True)[:args.top]:
+            print(f"    {name.strip():<36} {cumulative / 1000:8.1f} ms")
+
+        if light and heavy:
+            failures.append(f"{module}: imports {', '.join(heavy)} at module level")
+        if light and total_ms > args.budget_ms:
+            failures.append(f"{module}: {total_ms:.1f} ms > budget {args.budget_ms:.0f} ms")
+
+    if failures:
+        print("\nFAILED")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\nOK")
+
+
+if __name__ == "__main__":
+    main()
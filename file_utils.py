@@ -3,6 +3,13 @@ import json
 import sys
 import shutil
 
+# Dashboard statistics for consolidated_data.json, rewritten on every save.
+# Not a .json file, so dataset discovery never mistakes it for a dataset.
+CONFIG_STATS_FILENAME = "consolidated_data.stats"
+
+# JSON files in the app directory that are not datasets
+NON_DATASET_JSON_FILES = ("lotsize_data.json", "consolidated_data.json", "startup_trace.json", "trading_calendar.json")
+
 def get_app_directory():
     """Get the application directory - works for both development and compiled EXE"""
     if getattr(sys, 'frozen', False):
@@ -553,8 +560,7 @@ def ensure_consolidated_data_file():
         
         # Save the default consolidated data file
         try:
-            with open(consolidated_path, "w", encoding="utf-8") as f:
-                json.dump(default_data, f, indent=4, ensure_ascii=False)
+            save_consolidated_data(default_data, consolidated_path, indent=4, ensure_ascii=False)
         except Exception as e:
             # If there's an error creating the file, log but don't fail
             # The app should still start even if config file creation fails
@@ -570,8 +576,7 @@ def ensure_consolidated_data_file():
                 # Add filter configurations
                 default_data["mcx_group2_filters"] = ['Commodity Future Option', 'Commodity Option', 'Commodity Future']
                 default_data["fno_group2_filters"] = ['Equity Option', 'Index Option', 'Index Future', 'Equity Future']
-                with open(consolidated_path, "w", encoding="utf-8") as f:
-                    json.dump(default_data, f, indent=4, ensure_ascii=False)
+                save_consolidated_data(default_data, consolidated_path, indent=4, ensure_ascii=False)
             else:
                 # File exists and has content - read and update if needed
                 with open(consolidated_path, "r", encoding="utf-8") as f:
@@ -585,8 +590,7 @@ def ensure_consolidated_data_file():
                     # Add filter configurations
                     consolidated_data["mcx_group2_filters"] = ['Commodity Future Option', 'Commodity Option', 'Commodity Future']
                     consolidated_data["fno_group2_filters"] = ['Equity Option', 'Index Option', 'Index Future', 'Equity Future']
-                    with open(consolidated_path, "w", encoding="utf-8") as f:
-                        json.dump(consolidated_data, f, indent=4, ensure_ascii=False)
+                    save_consolidated_data(consolidated_data, consolidated_path, indent=4, ensure_ascii=False)
                 else:
                     # Check if asio_sf4_ft exists, if not add it
                     updated = False
@@ -609,8 +613,7 @@ def ensure_consolidated_data_file():
                     
                     # Save updated data if changes were made
                     if updated:
-                        with open(consolidated_path, "w", encoding="utf-8") as f:
-                            json.dump(consolidated_data, f, indent=4, ensure_ascii=False)
+                        save_consolidated_data(consolidated_data, consolidated_path, indent=4, ensure_ascii=False)
         except json.JSONDecodeError as e:
             # File exists but is corrupted/invalid JSON - backup and recreate
             try:
@@ -625,8 +628,7 @@ def ensure_consolidated_data_file():
                 # Add filter configurations
                 default_data["mcx_group2_filters"] = ['Commodity Future Option', 'Commodity Option', 'Commodity Future']
                 default_data["fno_group2_filters"] = ['Equity Option', 'Index Option', 'Index Future', 'Equity Future']
-                with open(consolidated_path, "w", encoding="utf-8") as f:
-                    json.dump(default_data, f, indent=4, ensure_ascii=False)
+                save_consolidated_data(default_data, consolidated_path, indent=4, ensure_ascii=False)
                 print(f"Warning: consolidated_data.json was corrupted. Recreated file. Backup saved as {backup_path}")
             except Exception as backup_error:
                 print(f"Warning: Could not backup corrupted file: {backup_error}")
@@ -639,3 +641,126 @@ def ensure_consolidated_data_file():
             print(f"Warning: Could not update consolidated_data.json: {e}")
     
     return consolidated_path
+
+
+def _entry_count(value):
+    """Mappings/items in a dataset value (scalars count as 1 when set)"""
+    if isinstance(value, (dict, list)):
+        return len(value)
+    return 1 if value else 0
+
+
+def list_extra_dataset_files(directory=None):
+    """Dataset JSON files in the app directory besides consolidated_data.json, sorted"""
+    try:
+        return sorted(
+            fname for fname in os.listdir(directory or get_app_directory())
+            if fname.lower().endswith(".json") and fname not in NON_DATASET_JSON_FILES
+        )
+    except OSError:
+        return []
+
+
+def write_config_stats(consolidated_data, consolidated_path=None):
+    """Write the statistics sidecar for consolidated_data, which was just saved to consolidated_path.
+
+    The sidecar records the config file's size and modification time (so
+    stale statistics can be detected) and the entry count of every dataset.
+
+    Returns:
+        dict: The statistics written
+    """
+    app_dir = get_app_directory()
+    consolidated_path = consolidated_path or os.path.join(app_dir, "consolidated_data.json")
+    config_stat = os.stat(consolidated_path)
+    datasets = consolidated_data if isinstance(consolidated_data, dict) else {}
+    stats = {
+        "config_size": config_stat.st_size,
+        "config_mtime_ns": config_stat.st_mtime_ns,
+        "datasets": {name: _entry_count(value) for name, value in datasets.items()},
+    }
+    stats_path = os.path.join(os.path.dirname(consolidated_path), CONFIG_STATS_FILENAME)
+    temp_path = stats_path + ".tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(stats, f, ensure_ascii=False)
+    os.replace(temp_path, stats_path)
+    return stats
+
+
+def save_consolidated_data(consolidated_data, consolidated_path=None, **dump_options):
+    """Save consolidated_data.json and refresh its statistics sidecar.
+
+    Args:
+        consolidated_data (dict): Full configuration
+        consolidated_path (str | None): Defaults to consolidated_data.json in the app directory
+        dump_options: json.dump options (indent, ensure_ascii, ...)
+
+    Returns:
+        str: Path written
+    """
+    consolidated_path = consolidated_path or os.path.join(get_app_directory(), "consolidated_data.json")
+    with open(consolidated_path, "w", encoding="utf-8") as f:
+        json.dump(consolidated_data, f, **dump_options)
+    try:
+        write_config_stats(consolidated_data, consolidated_path)
+    except Exception as e:
+        # Statistics are rebuilt from the config on the next load_config_stats()
+        print(f"Warning: Could not update {CONFIG_STATS_FILENAME}: {e}")
+    return consolidated_path
+
+
+def load_config_stats():
+    """Dataset statistics for the dashboard without parsing the full config.
+
+    Reads the sidecar written by save_consolidated_data(). If it is missing,
+    unreadable, or does not match the config file's current size and
+    modification time (e.g. the file was edited by hand), it is rebuilt from
+    consolidated_data.json once. Extra dataset files are listed from the app
+    directory on every call, so a JSON file dropped in shows up right away.
+
+    Returns:
+        dict: config_exists, config_size, config_modified (epoch seconds),
+            datasets ({name: entry count}) and extra_dataset_files
+    """
+    app_dir = get_app_directory()
+    consolidated_path = os.path.join(app_dir, "consolidated_data.json")
+    empty = {"config_exists": False, "config_size": 0, "config_modified": None,
+             "datasets": {}, "extra_dataset_files": []}
+    try:
+        config_stat = os.stat(consolidated_path)
+    except OSError:
+        return empty
+
+    stats = None
+    try:
+        with open(os.path.join(app_dir, CONFIG_STATS_FILENAME), "r", encoding="utf-8") as f:
+            stats = json.load(f)
+        if (stats.get("config_size") != config_stat.st_size
+                or stats.get("config_mtime_ns") != config_stat.st_mtime_ns):
+            stats = None
+    except (OSError, ValueError, AttributeError):
+        stats = None
+
+    if stats is None:
+        try:
+            with open(consolidated_path, "r", encoding="utf-8") as f:
+                consolidated_data = json.load(f)
+        except (OSError, ValueError):
+            return dict(empty, config_exists=True, config_size=config_stat.st_size,
+                        config_modified=config_stat.st_mtime,
+                        extra_dataset_files=list_extra_dataset_files(app_dir))
+        try:
+            stats = write_config_stats(consolidated_data, consolidated_path)
+        except OSError:
+            stats = {
+                "datasets": {name: _entry_count(value) for name, value in consolidated_data.items()}
+                if isinstance(consolidated_data, dict) else {},
+            }
+
+    return {
+        "config_exists": True,
+        "config_size": config_stat.st_size,
+        "config_modified": config_stat.st_mtime,
+        "datasets": stats.get("datasets", {}),
+        "extra_dataset_files": list_extra_dataset_files(app_dir),
+    }
@@ -1,8 +1,14 @@
+import sys
+import startup_trace
+if __name__ == "__main__":
+    # Opt-in cold-start trace (FUND_APP_TRACE_STARTUP=1 or --trace-startup), enabled
+    # before anything else is imported so the imports are recorded too
+    startup_trace.enable_from_environment()
 import tkinter as tk
 from tkinter import messagebox, ttk
-import sys
 import os
 import threading
+from collections import OrderedDict
 # LAZY IMPORTS - Only import when needed for faster startup
 from file_utils import ensure_consolidated_data_file
 
@@ -18,68 +24,131 @@ APP_ENVIRONMENT = "UAT"
 # Application Version
 APP_VERSION = "1.0"
 
+# Page keep-alive: visited pages are hidden instead of destroyed, up to this
+# many instances; the least recently shown is destroyed first
+PAGE_CACHE_SIZE = 5
+
+# Above this resident memory (MB) hidden pages are destroyed until it drops
+PAGE_CACHE_MEMORY_MB = 1500
+
+# Page registry: page name -> (module in pages/, page class name).
+# Modules are imported on first use (or by the idle-time preloader).
+PAGE_REGISTRY = {
+    "dashboard": ("dashboard", "DashboardPage"),
+    "dataconfig": ("dataconfig", "DataConfigPage"),
+    "settings": ("settings", "SettingsPage"),
+    "alpha_report": ("alpha_report", "AlphaReportPage"),
+    "asio_reconciliation": ("asio_reconciliation", "ASIOReconciliationPage"),
+    "asio_trade_loader": ("asio_trade_loader", "ASIOTradeLoaderPage"),
+    "asio_trade_loader_mcx": ("asio_trade_loader_mcx", "ASIOTradeLoaderMCXPage"),
+    "asio_sub_fund4": ("asio_sub_fund4", "ASIOSubFund4Page"),
+    "fo_reconciliation": ("fo_reconciliation", "FOReconciliationPage"),
+    "fno_mcx_price_recon_loader": ("fno_mcx_price_recon_loader", "FNOMCXPriceReconLoaderPage"),
+    "excel_merger": ("excel_merger", "ExcelMergerPage"),
+    "bhavcopy_downloader": ("bhavcopy_downloader", "BhavcopyDownloaderPage"),
+    "gtn_loader": ("gtn_loader", "GTNLoaderPage"),
+}
+
+# Third-party modules most pages need; preloaded before the page modules so
+# each page's measured import cost is its own
+PRELOAD_HEAVY_MODULES = ("pandas", "openpyxl")
+
+# Preloading starts this long after the first page is shown (milliseconds)
+PRELOAD_DELAY_MS = 1500
+
+# Pause between preloaded modules so the UI thread keeps getting the GIL (seconds)
+PRELOAD_PAUSE = 0.05
+
 # Lazy page loader - pages imported only when accessed
 _page_cache = {}
 
+# (module name, import seconds, error or None) for each preloaded module
+PRELOAD_TIMINGS = []
+
 def _get_page_class(page_name):
     """Lazy load page classes to speed up startup"""
     if page_name in _page_cache:
         return _page_cache[page_name]
     
+    entry = PAGE_REGISTRY.get(page_name)
+    if entry is None:
+        return None
     # Import only when needed
-    if page_name == "dashboard":
-        from pages import dashboard
-        _page_cache[page_name] = dashboard.DashboardPage
-        return dashboard.DashboardPage
-    elif page_name == "dataconfig":
-        from pages import dataconfig
-        _page_cache[page_name] = dataconfig.DataConfigPage
-        return dataconfig.DataConfigPage
-    elif page_name == "settings":
-        from pages import settings
-        _page_cache[page_name] = settings.SettingsPage
-        return settings.SettingsPage
-    elif page_name == "alpha_report":
-        from pages import alpha_report
-        _page_cache[page_name] = alpha_report.AlphaReportPage
-        return alpha_report.AlphaReportPage
-    elif page_name == "asio_reconciliation":
-        from pages import asio_reconciliation
-        _page_cache[page_name] = asio_reconciliation.ASIOReconciliationPage
-        return asio_reconciliation.ASIOReconciliationPage
-    elif page_name == "asio_trade_loader":
-        from pages import asio_trade_loader
-        _page_cache[page_name] = asio_trade_loader.ASIOTradeLoaderPage
-        return asio_trade_loader.ASIOTradeLoaderPage
-    elif page_name == "asio_trade_loader_mcx":
-        from pages import asio_trade_loader_mcx
-        _page_cache[page_name] = asio_trade_loader_mcx.ASIOTradeLoaderMCXPage
-        return asio_trade_loader_mcx.ASIOTradeLoaderMCXPage
-    elif page_name == "asio_sub_fund4":
-        from pages import asio_sub_fund4
-        _page_cache[page_name] = asio_sub_fund4.ASIOSubFund4Page
-        return asio_sub_fund4.ASIOSubFund4Page
-    elif page_name == "fo_reconciliation":
-        from pages import fo_reconciliation
-        _page_cache[page_name] = fo_reconciliation.FOReconciliationPage
-        return fo_reconciliation.FOReconciliationPage
-    elif page_name == "fno_mcx_price_recon_loader":
-        from pages import fno_mcx_price_recon_loader
-        _page_cache[page_name] = fno_mcx_price_recon_loader.FNOMCXPriceReconLoaderPage
-        return fno_mcx_price_recon_loader.FNOMCXPriceReconLoaderPage
-    elif page_name == "excel_merger":
-        from pages import excel_merger
-        _page_cache[page_name] = excel_merger.ExcelMergerPage
-        return excel_merger.ExcelMergerPage
-    elif page_name == "bhavcopy_downloader":
-        from pages import bhavcopy_downloader
-        _page_cache[page_name] = bhavcopy_downloader.BhavcopyDownloaderPage
-        return bhavcopy_downloader.BhavcopyDownloaderPage
-    elif page_name == "gtn_loader":
-        from pages import gtn_loader
-        _page_cache[page_name] = gtn_loader.GTNLoaderPage
-        return gtn_loader.GTNLoaderPage
-    return None
+    import importlib
+    module_name, class_name = entry
+    module = importlib.import_module(f"pages.{module_name}")
+    page_class = getattr(module, class_name)
+    _page_cache[page_name] = page_class
+    return page_class
+
+def _menu_page_names(menu_dict):
+    """Page names in MENU_STRUCTURE order (dropdowns flattened)"""
+    names = []
+    for target in menu_dict.values():
+        if isinstance(target, dict):
+            names.extend(_menu_page_names(target))
+        else:
+            names.append(target)
+    return names
+
+def _preload_modules(module_names):
+    """Import modules one by one, recording each one's import cost in PRELOAD_TIMINGS.
+
+    Runs in a background thread. Modules that are already imported are
+    skipped; a module that fails to import is recorded and left for the page
+    to report when it is actually opened. Timings are printed only while
+    startup tracing is on.
+    """
+    import importlib
+    import time
+    for module_name in module_names:
+        if module_name in sys.modules:
+            continue
+        start = time.perf_counter()
+        error = None
+        try:
+            importlib.import_module(module_name)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+        PRELOAD_TIMINGS.append((module_name, elapsed, error))
+        if startup_trace.enabled():
+            print(f"[preload] {module_name:<40} {elapsed * 1000:8.1f} ms" + (f"  FAILED {error}" if error else ""))
+        time.sleep(PRELOAD_PAUSE)
+
+def _process_memory_mb():
+    """Resident memory of this process in MB, or None where it cannot be read."""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = PROCESS_MEMORY_COUNTERS()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if not ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return None
+            return counters.WorkingSetSize / (1024 * 1024)
+        with open("/proc/self/statm") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except Exception:
+        return None
+
 
 # Menu structure with lazy loading
 MENU_STRUCTURE = {
@@ -103,7 +172,8 @@ MENU_STRUCTURE = {
 
 class MainApp(tk.Tk):
     def __init__(self):
-        super().__init__()
+        with startup_trace.phase("create Tk root"):
+            super().__init__()
         
         # OPTIMIZATION: Update window immediately before heavy operations
         self.update_idletasks()
@@ -123,11 +193,20 @@ class MainApp(tk.Tk):
 
         self.open_menu = None
 
+        # Live page instances by page class, least recently shown first
+        self._pages = OrderedDict()
+        self._current_page = None
+
+        # Startup callbacks not yet run (see _startup_step)
+        self._startup_pending = set()
+
         # Generate menu immediately
-        self.generate_menu(MENU_STRUCTURE)
+        with startup_trace.phase("build menu"):
+            self.generate_menu(MENU_STRUCTURE)
         
         # Force window to appear immediately
-        self.update()
+        with startup_trace.phase("first window paint"):
+            self.update()
         
         # Center the main window, positioned slightly above center
         self.update_idletasks()
@@ -136,16 +215,58 @@ class MainApp(tk.Tk):
         self.geometry(f"{self.winfo_width()}x{self.winfo_height()}+{x}+{y}")
         
         # Show environment popup on startup
-        self.after(200, self._show_environment_popup)
+        self.after(200, self._startup_step("environment popup", self._show_environment_popup))
         
         # Load icon and data file in background (non-blocking)
-        self.after(100, self._load_resources)
+        self.after(100, self._startup_step("load resources", self._load_resources))
         
         # Reload dataconfig data on startup (non-blocking)
-        self.after(150, self._reload_dataconfig_on_startup)
+        self.after(150, self._startup_step("reload dataconfig", self._reload_dataconfig_on_startup))
         
         # Show dashboard immediately (lazy loaded)
-        self.after(50, lambda: self.show_page("dashboard"))
+        self.after(50, self._startup_step("show dashboard", lambda: self.show_page("dashboard")))
+        
+        # Import pandas/openpyxl and the page modules in idle time once the first page is up
+        self._preloader = None
+        self.after(PRELOAD_DELAY_MS, lambda: self.after_idle(self._start_preloader))
+    
+    def _startup_step(self, name, callback):
+        """Wrap a startup callback so it is recorded as a phase when tracing startup.
+
+        The trace is written at the first idle moment after every wrapped
+        callback has run.
+        """
+        self._startup_pending.add(name)
+
+        def run():
+            try:
+                with startup_trace.phase(name):
+                    callback()
+            finally:
+                self._startup_pending.discard(name)
+                if not self._startup_pending and startup_trace.enabled():
+                    self.after_idle(self._finish_startup_trace)
+        return run
+
+    def _finish_startup_trace(self):
+        """Write the startup trace (see startup_trace.py)"""
+        path = startup_trace.finish()
+        if path:
+            print(f"Startup trace written to {path}")
+
+    def _start_preloader(self):
+        """Preload heavy dependencies and the MENU_STRUCTURE page modules in a background thread"""
+        if self._preloader is not None:
+            return
+        module_names = list(PRELOAD_HEAVY_MODULES)
+        for page_name in _menu_page_names(MENU_STRUCTURE):
+            entry = PAGE_REGISTRY.get(page_name)
+            if entry is not None:
+                module_names.append(f"pages.{entry[0]}")
+        self._preloader = threading.Thread(
+            target=_preload_modules, args=(module_names,), name="module-preloader", daemon=True
+        )
+        self._preloader.start()
     
     def _show_environment_popup(self):
         """Show status popup with all reports on startup"""
@@ -253,35 +374,29 @@ class MainApp(tk.Tk):
         """Load resources in background to not block UI"""
         try:
             # Load icon (non-blocking)
-            self._load_icon()
+            with startup_trace.phase("load icon"):
+                self._load_icon()
         except:
             pass
         
         # Ensure consolidated data file exists (in background)
         try:
-            ensure_consolidated_data_file()
+            with startup_trace.phase("ensure_consolidated_data_file"):
+                ensure_consolidated_data_file()
         except:
             pass
     
     def _reload_dataconfig_on_startup(self):
         """Reload dataconfig page data on startup to ensure required datasets are created"""
         try:
-            # Import and initialize dataconfig to ensure all datasets are created
-            # This ensures ASIO Sub Fund 2 FNO datasets exist on startup
-            from pages import dataconfig
-            import tkinter as tk
-            
-            # Create a hidden parent frame for temporary dataconfig instance
-            dummy_parent = tk.Frame(self)
-            dummy_parent.pack_forget()  # Hide immediately
-            
-            # Create temporary dataconfig instance - this will:
-            # 1. Call load_saved_data_on_startup() which creates missing datasets
-            # 2. Ensure all required datasets for ASIO Sub Fund 2 FNO exist
-            temp_dataconfig = dataconfig.DataConfigPage(dummy_parent)
-            
-            # Clean up
-            dummy_parent.destroy()
+            # Creating the page calls load_saved_data_on_startup(), which creates
+            # missing datasets (e.g. the ASIO Sub Fund 2 FNO ones). The instance is
+            # kept hidden in the page cache, so opening Data Config later is instant.
+            page_class = _get_page_class("dataconfig")
+            if page_class in self._pages:
+                return
+            self._pages[page_class] = page_class(self.content)
+            self._pages.move_to_end(page_class, last=False)
         except Exception as e:
             # Silently fail - dataconfig will reload when user opens it
             # The ensure_consolidated_data_file() already handles file creation
@@ -378,51 +493,122 @@ class MainApp(tk.Tk):
                 return widget
         return None
 
-    def clear_content(self):
-        """Fast widget destruction - optimized for speed"""
-        widgets = list(self.content.winfo_children())
-        for widget in widgets:
-            widget_type = widget.winfo_class()
-            # Fast clear complex widgets before destroying
-            if widget_type == "Treeview":
-                try:
-                    items = list(widget.get_children())
-                    if items:
-                        widget.delete(*items)  # Batch delete
-                except:
-                    pass
-            elif widget_type == "Canvas":
-                try:
-                    widget.delete("all")
-                except:
-                    pass
-            widget.destroy()
+    def _destroy_widget(self, widget):
+        """Fast widget destruction - empties Treeviews/Canvases before destroying"""
+        widget_type = widget.winfo_class()
+        # Fast clear complex widgets before destroying
+        if widget_type == "Treeview":
+            try:
+                items = list(widget.get_children())
+                if items:
+                    widget.delete(*items)  # Batch delete
+            except:
+                pass
+        elif widget_type == "Canvas":
+            try:
+                widget.delete("all")
+            except:
+                pass
+        widget.destroy()
+
+    def _call_page_hook(self, page, hook):
+        """Call page.on_show()/page.on_hide() if the page defines it"""
+        method = getattr(page, hook, None)
+        if callable(method):
+            try:
+                method()
+            except Exception as e:
+                print(f"{type(page).__name__}.{hook} failed: {e}")
+
+    def _page_is_busy(self, page):
+        """A page with a running background job must not be destroyed"""
+        runner = getattr(page, "_job_runner", None)
+        return runner is not None and runner.busy
+
+    def _trim_page_cache(self):
+        """Destroy least recently shown pages beyond PAGE_CACHE_SIZE or the memory cap"""
+        while len(self._pages) > 1:
+            over_count = len(self._pages) > PAGE_CACHE_SIZE
+            if not over_count:
+                memory_mb = _process_memory_mb()
+                if memory_mb is None or memory_mb <= PAGE_CACHE_MEMORY_MB:
+                    return
+            victim = next(
+                (key for key, page in self._pages.items()
+                 if page is not self._current_page and not self._page_is_busy(page)),
+                None,
+            )
+            if victim is None:
+                return
+            page = self._pages.pop(victim)
+            self._destroy_widget(page)
+            if not over_count:
+                # Let DataFrames held by the page go before measuring again
+                import gc
+                gc.collect()
 
     def show_page(self, page_identifier):
-        """Show a page - optimized for speed"""
+        """Show a page, reusing its hidden instance when one is cached.
+
+        Pages are hidden with pack_forget() when navigating away and kept in an
+        LRU (see PAGE_CACHE_SIZE / PAGE_CACHE_MEMORY_MB), so loaded files and
+        results survive switching pages. Pages may define on_show() (called when
+        a cached instance is shown again) and on_hide() (called when hidden).
+        """
         if self.open_menu:
             self.open_menu.unpost()
             self.open_menu = None
         
-        # Fast clear
-        self.clear_content()
-        
         # Handle lazy loading - if string, get the class
         if isinstance(page_identifier, str):
             page_class = _get_page_class(page_identifier)
         else:
             page_class = page_identifier
         
-        if page_class:
+        if not page_class:
+            return
+
+        page = self._pages.get(page_class)
+        if page is not None and not page.winfo_exists():
+            del self._pages[page_class]
+            page = None
+        if page is not None and page is self._current_page:
+            return
+
+        # Hide the current page and drop anything else left in the content area
+        if self._current_page is not None:
+            if self._current_page.winfo_exists():
+                self._current_page.pack_forget()
+                self._call_page_hook(self._current_page, "on_hide")
+            self._current_page = None
+        cached = set(self._pages.values())
+        for widget in list(self.content.winfo_children()):
+            if widget not in cached:
+                self._destroy_widget(widget)
+
+        if page is None:
             # Create and pack immediately
             page = page_class(self.content)
+            self._pages[page_class] = page
             page.pack(fill="both", expand=True)
-            # Force UI update for instant visual feedback
-            self.update_idletasks()
+        else:
+            self._pages.move_to_end(page_class)
+            page.pack(fill="both", expand=True)
+            self._call_page_hook(page, "on_show")
+        self._current_page = page
+        # Force UI update for instant visual feedback
+        self.update_idletasks()
+
+        self._trim_page_cache()
 
 
 if __name__ == "__main__":
-    app = MainApp()
+    # Export workers are separate processes; a frozen build must not start the GUI in them
+    import multiprocessing
+    multiprocessing.freeze_support()
+    with startup_trace.phase("MainApp()"):
+        app = MainApp()
+    startup_trace.mark("mainloop")
     app.mainloop()
 
 
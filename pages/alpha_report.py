@@ -1,9 +1,8 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import filedialog, messagebox
 import os
 import json
 import zipfile
-from datetime import datetime
 from openpyxl import load_workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.styles import Alignment, Font, Border
@@ -14,22 +13,18 @@ import threading
 
 
 from my_app.pages.loading import LoadingSpinner
-from .helper import output_save_in_template, output_save_in_template_csv, multiple_files_to_zip
-
-
-def _safe_decimal(value):
-    if value in [None, ""]:
-        return Decimal("0")
-    cleaned = str(value).replace(",", "").strip()
-    try:
-        return Decimal(cleaned)
-    except Exception:
-        return Decimal("0")
+from my_app.pages.search_filter import DebouncedSearch
+from my_app.pages.virtual_table import VirtualTable
+from .helper import output_save_in_template, output_save_in_template_csv
+from .fixed_point import FixedPointColumn
+from .date_utils import format_date_column, parse_date
 
 
 def _format_date(date_str: str):
     # '18Sep25' -> (yyyymmdd, mm-dd-YYYY)
-    date_obj = datetime.strptime(date_str, '%d%b%y')
+    date_obj = parse_date(date_str, formats=('%d%b%y',))
+    if date_obj is None:
+        raise ValueError(f"time data '{date_str}' does not match format '%d%b%y'")
     yyyymmdd = date_obj.strftime('%Y%m%d')
     mm_dd_yyyy = date_obj.strftime('%m-%d-%Y')
     return yyyymmdd, mm_dd_yyyy
@@ -92,24 +87,19 @@ class AlphaReportPage(tk.Frame):
         tk.Label(header_left, text="For Trade", font=("Arial", 13, "bold"), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
         # left search aligned to right of its header (label then entry)
         self.for_trade_search_var = tk.StringVar()
-        self.for_trade_search_var.trace_add("write", lambda *_: self._render_for_trade())
+        DebouncedSearch(self, self.for_trade_search_var, lambda _term: self._render_for_trade())
         left_search_box = tk.Frame(header_left, bg="#ecf0f1")
         left_search_box.pack(side="right", padx=(0, 18))
         tk.Label(left_search_box, text="Search:", font=("Arial", 10), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
         tk.Entry(left_search_box, textvariable=self.for_trade_search_var, width=24).pack(side="left", padx=(6, 0))
         left_table = tk.Frame(left, bg="#ecf0f1")
         left_table.pack(fill="both", expand=True)
-        self.for_trade_tree = ttk.Treeview(left_table, columns=("Scrip", "Buy/Sell", "Qty", "Rate"), show="headings", height=12)
+        self.for_trade_table = VirtualTable(left_table, columns=("Scrip", "Buy/Sell", "Qty", "Rate"), height=12)
+        self.for_trade_tree = self.for_trade_table.tree
         for col, w in [("Scrip", 260), ("Buy/Sell", 90), ("Qty", 100), ("Rate", 100)]:
             self.for_trade_tree.heading(col, text=col)
             self.for_trade_tree.column(col, width=w, anchor="w")
-        y1 = ttk.Scrollbar(left_table, orient="vertical", command=self.for_trade_tree.yview)
-        x1 = ttk.Scrollbar(left_table, orient="horizontal", command=self.for_trade_tree.xview)
-        self.for_trade_tree.configure(yscrollcommand=y1.set, xscrollcommand=x1.set)
-        # grid layout so the bottom scrollbar spans full width
-        self.for_trade_tree.grid(row=0, column=0, sticky="nsew")
-        y1.grid(row=0, column=1, sticky="ns")
-        x1.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.for_trade_table.grid(row=0, column=0, sticky="nsew")
         left_table.rowconfigure(0, weight=1)
         left_table.columnconfigure(0, weight=1)
 
@@ -118,31 +108,25 @@ class AlphaReportPage(tk.Frame):
         header_right.pack(fill="x", pady=(0, 4))
         tk.Label(header_right, text="Security Creation", font=("Arial", 13, "bold"), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
         self.sec_search_var = tk.StringVar()
-        self.sec_search_var.trace_add("write", lambda *_: self._render_sec())
+        DebouncedSearch(self, self.sec_search_var, lambda _term: self._render_sec())
         right_search_box = tk.Frame(header_right, bg="#ecf0f1")
         right_search_box.pack(side="right", padx=(0, 18))
         tk.Label(right_search_box, text="Search:", font=("Arial", 10), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
         tk.Entry(right_search_box, textvariable=self.sec_search_var, width=24).pack(side="left", padx=(6, 0))
         right_table = tk.Frame(right, bg="#ecf0f1")
         right_table.pack(fill="both", expand=True)
-        self.sec_tree = ttk.Treeview(
+        self.sec_table = VirtualTable(
             right_table,
             columns=("Scrip Name", "Underlying", "Expiry", "Strike Price", "CallPut", "Trading Size"),
-            show="headings",
             height=12
         )
+        self.sec_tree = self.sec_table.tree
         for col, w in [
             ("Scrip Name", 260), ("Underlying", 100), ("Expiry", 140), ("Strike Price", 110), ("CallPut", 80), ("Trading Size", 110)
         ]:
             self.sec_tree.heading(col, text=col)
             self.sec_tree.column(col, width=w, anchor="w")
-        y2 = ttk.Scrollbar(right_table, orient="vertical", command=self.sec_tree.yview)
-        x2 = ttk.Scrollbar(right_table, orient="horizontal", command=self.sec_tree.xview)
-        self.sec_tree.configure(yscrollcommand=y2.set, xscrollcommand=x2.set)
-        # grid layout so the bottom scrollbar spans full width
-        self.sec_tree.grid(row=0, column=0, sticky="nsew")
-        y2.grid(row=0, column=1, sticky="ns")
-        x2.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.sec_table.grid(row=0, column=0, sticky="nsew")
         right_table.rowconfigure(0, weight=1)
         right_table.columnconfigure(0, weight=1)
 
@@ -171,11 +155,12 @@ class AlphaReportPage(tk.Frame):
 
     # ---- Core processing (reflecting test.py) ----
     def _process(self):
+        # Reading and processing run in a background job; tables are filled on completion
+        from .job_runner import run_page_job
+
         # Clear tables
-        for it in self.for_trade_tree.get_children():
-            self.for_trade_tree.delete(it)
-        for it in self.sec_tree.get_children():
-            self.sec_tree.delete(it)
+        self.for_trade_table.clear()
+        self.sec_table.clear()
         self.for_trade_rows = []
         self.security_creation_rows = []
         self._aafspl_car_future_data = []
@@ -183,7 +168,7 @@ class AlphaReportPage(tk.Frame):
         self._option_security_data = []
 
         # Load consolidated JSON
-        from my_app.file_utils import get_app_directory
+        from my_app.file_utils import get_app_directory, save_consolidated_data
         app_dir = get_app_directory()
         consolidated_path = os.path.join(app_dir, "consolidated_data.json")
 
@@ -370,9 +355,8 @@ class AlphaReportPage(tk.Frame):
                         "NonCapExpenses.NonCapPaymentType": ""
                     }
                 }
-                # Save the default consolidated data file
-                with open(consolidated_path, "w") as f:
-                    json.dump(consolidated_data, f, indent=4)
+                # Save the default consolidated data file (and its statistics sidecar)
+                save_consolidated_data(consolidated_data, consolidated_path, indent=4)
             
             lotsize_data = consolidated_data.get("lotsize_data", {})
             headers = consolidated_data.get("trade_headers", {})
@@ -395,77 +379,83 @@ class AlphaReportPage(tk.Frame):
             messagebox.showwarning("File Missing", "Please select a valid Trade file (CSV/Excel).")
             return
 
-        try:
-            # Detect file extension and read accordingly
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext == '.csv':
-                df_csv = pd.read_csv(file_path, usecols=headers_values)
-            elif file_ext == '.xlsx':
-                # Read first sheet of XLSX file using openpyxl
-                df_csv = pd.read_excel(file_path, usecols=headers_values, engine='openpyxl')
-            elif file_ext == '.xls':
-                # Read first sheet of XLS file (pandas will use xlrd if available)
-                try:
-                    df_csv = pd.read_excel(file_path, usecols=headers_values, engine='xlrd')
-                except ImportError:
-                    messagebox.showerror(
-                        "Missing Library", 
-                        "Reading .xls files requires the 'xlrd' library.\n"
-                        "Please install it using: pip install xlrd"
+        def work(job):
+            job.stage("Reading trade file", unit="files")
+            try:
+                # Detect file extension and read accordingly
+                file_ext = os.path.splitext(file_path)[1].lower()
+                if file_ext == '.csv':
+                    df_csv = pd.read_csv(file_path, usecols=headers_values)
+                elif file_ext == '.xlsx':
+                    # Read first sheet of XLSX file using openpyxl
+                    df_csv = pd.read_excel(file_path, usecols=headers_values, engine='openpyxl')
+                elif file_ext == '.xls':
+                    # Read first sheet of XLS file (pandas will use xlrd if available)
+                    try:
+                        df_csv = pd.read_excel(file_path, usecols=headers_values, engine='xlrd')
+                    except ImportError:
+                        job.call_ui(
+                            messagebox.showerror,
+                            "Missing Library", 
+                            "Reading .xls files requires the 'xlrd' library.\n"
+                            "Please install it using: pip install xlrd"
+                        )
+                        return None
+                else:
+                    job.call_ui(messagebox.showerror, "Error", f"Unsupported file format: {file_ext}\nPlease use CSV, XLS, or XLSX files.")
+                    return None
+            except Exception as e:
+                error_msg = str(e)
+                if "xlrd" in error_msg.lower() or "openpyxl" in error_msg.lower():
+                    job.call_ui(
+                        messagebox.showerror,
+                        "Library Error", 
+                        f"Failed to read file: {error_msg}\n\n"
+                        "For .xlsx files, ensure 'openpyxl' is installed: pip install openpyxl\n"
+                        "For .xls files, ensure 'xlrd' is installed: pip install xlrd"
                     )
-                    return
-            else:
-                messagebox.showerror("Error", f"Unsupported file format: {file_ext}\nPlease use CSV, XLS, or XLSX files.")
+                else:
+                    job.call_ui(messagebox.showerror, "Error", f"Failed to read file: {error_msg}")
+                return None
+
+            # Process data
+            processed = self._template_data(df_csv, date_key, scrip_key, buy_qty_key,
+                                buy_rate_key,sell_qty_key,sell_rate_key,
+                                lotsize_data, aafspl_car_future, option_security, car_trade_loader,
+                                job=job)
+            return df_csv, processed
+
+        def show_result(result):
+            if result is None:
                 return
-        except Exception as e:
-            error_msg = str(e)
-            if "xlrd" in error_msg.lower() or "openpyxl" in error_msg.lower():
-                messagebox.showerror(
-                    "Library Error", 
-                    f"Failed to read file: {error_msg}\n\n"
-                    "For .xlsx files, ensure 'openpyxl' is installed: pip install openpyxl\n"
-                    "For .xls files, ensure 'xlrd' is installed: pip install xlrd"
-                )
-            else:
-                messagebox.showerror("Error", f"Failed to read file: {error_msg}")
-            return
+            df_csv, processed = result
+            for_trade, security_creation, aafspl_car_future_data, car_trade_loader_data, option_security_data = processed
 
-        # Process data
-        for_trade, security_creation, aafspl_car_future_data, car_trade_loader_data, option_security_data = self._template_data(df_csv, date_key, scrip_key, buy_qty_key,
-                            buy_rate_key,sell_qty_key,sell_rate_key,
-                            lotsize_data, aafspl_car_future, option_security, car_trade_loader)
+            # Persist in instance and render
+            self._df_csv = df_csv
+            self.for_trade_rows = for_trade
+            self.security_creation_rows = list(security_creation.values())
+            self._aafspl_car_future_data = aafspl_car_future_data
+            self._car_trade_loader_data = car_trade_loader_data
+            self._option_security_data = option_security_data
 
-        # Persist in instance and render
-        self._df_csv = df_csv
-        self.for_trade_rows = for_trade
-        self.security_creation_rows = list(security_creation.values())
-        self._aafspl_car_future_data = aafspl_car_future_data
-        self._car_trade_loader_data = car_trade_loader_data
-        self._option_security_data = option_security_data
+            self._render_for_trade()
+            self._render_sec()
 
-        self._render_for_trade()
-        self._render_sec()
+            self.status_var.set(f"Processed {len(self.for_trade_rows)} trades | {len(self.security_creation_rows)} securities")
+            self.status_label.config(fg="#6c757d")  # Reset to default gray color
 
-        self.status_var.set(f"Processed {len(self.for_trade_rows)} trades | {len(self.security_creation_rows)} securities")
-        self.status_label.config(fg="#6c757d")  # Reset to default gray color
+        run_page_job(self, work, show_result, text="Processing trades...", status_var=self.status_var)
 
     # ---- Rendering with filtering ----
     def _render_for_trade(self):
-        # clear
-        for it in self.for_trade_tree.get_children():
-            self.for_trade_tree.delete(it)
-        term = (self.for_trade_search_var.get() if hasattr(self, 'for_trade_search_var') else "").lower().strip()
-        for r in self.for_trade_rows:
-            if not term or term in " ".join(map(str, r)).lower():
-                self.for_trade_tree.insert("", "end", values=r)
+        # Only the visible rows are materialized in the Treeview
+        term = self.for_trade_search_var.get() if hasattr(self, 'for_trade_search_var') else ""
+        self.for_trade_table.show(self.for_trade_rows, term)
 
     def _render_sec(self):
-        for it in self.sec_tree.get_children():
-            self.sec_tree.delete(it)
-        term = (self.sec_search_var.get() if hasattr(self, 'sec_search_var') else "").lower().strip()
-        for r in self.security_creation_rows:
-            if not term or term in " ".join(map(str, r)).lower():
-                self.sec_tree.insert("", "end", values=r)
+        term = self.sec_search_var.get() if hasattr(self, 'sec_search_var') else ""
+        self.sec_table.show(self.security_creation_rows, term)
 
     def _export_excel(self):
         if not self.for_trade_rows and not self.security_creation_rows:
@@ -615,37 +605,24 @@ class AlphaReportPage(tk.Frame):
 
         def task():
             try:
+                from .export_executor import write_export_files
+                from .zip_sink import ZipSink
                 files = []
                 
-                # Helper function to create files in selected format
+                # Helper function to queue the files in the selected format
                 def create_files(format_type, ext, func):
                     file_list = []
                     # Create aafspl_future_loader file
                     if self._aafspl_car_future_data:
-                        file_io, file_name = func(
-                            self._aafspl_car_future_data, 
-                            AAFSPL_HEADER, 
-                            f"aafspl_future_loader{ext}"
-                        )
-                        file_list.append((file_io, file_name))
+                        file_list.append((func, (self._aafspl_car_future_data, AAFSPL_HEADER, f"aafspl_future_loader{ext}")))
                     
                     # Create aafspl_trade_loader file
                     if self._car_trade_loader_data:
-                        file_io, file_name = func(
-                            self._car_trade_loader_data, 
-                            CAR_TRADE_HEADERS, 
-                            f"aafspl_trade_loader{ext}"
-                        )
-                        file_list.append((file_io, file_name))
+                        file_list.append((func, (self._car_trade_loader_data, CAR_TRADE_HEADERS, f"aafspl_trade_loader{ext}")))
                     
                     # Create aafspl_option_loader file
                     if self._option_security_data:
-                        file_io, file_name = func(
-                            self._option_security_data, 
-                            OPTION_HEADER, 
-                            f"aafspl_option_loader{ext}"
-                        )
-                        file_list.append((file_io, file_name))
+                        file_list.append((func, (self._option_security_data, OPTION_HEADER, f"aafspl_option_loader{ext}")))
                     
                     return file_list
                 
@@ -662,14 +639,10 @@ class AlphaReportPage(tk.Frame):
                     messagebox.showwarning("Warning", "No data to export.")
                     return
                 
-                # Create zip file
-                zip_buffer = multiple_files_to_zip(files, "TradeVentura.zip")
-                
-                # Save zip file
-                with open(out_path, 'wb') as f:
-                    f.write(zip_buffer.read())
+                # Write zip file straight to disk; CSVs stream into their members
+                with ZipSink(out_path) as sink:
+                    file_list = write_export_files(files, sink)
                 
-                file_list = [name for _, name in files]
                 loader.close()
                 
                 email_zip_path = out_path
@@ -706,7 +679,7 @@ class AlphaReportPage(tk.Frame):
 
     def _template_data(self, df_csv, date_key, scrip_key, buy_qty_key,
                             buy_rate_key,sell_qty_key,sell_rate_key,
-                            lotsize_data, aafspl_car_future, option_security, car_trade_loader):
+                            lotsize_data, aafspl_car_future, option_security, car_trade_loader, job=None):
         
         # Build rows following test.py logic
         for_trade = []
@@ -883,6 +856,28 @@ class AlphaReportPage(tk.Frame):
         # Convert to list for faster iteration (much faster than iterrows)
         rows_data = df_csv.to_dict('records')
         
+        # Quantities and rates parsed once per column as exact fixed-point;
+        # strings/Decimals are only materialised for the exported values
+        def fixed_point_column(key):
+            if key in df_csv.columns:
+                return FixedPointColumn.parse(df_csv[key])
+            return FixedPointColumn.zeros(len(df_csv))
+        
+        buy_qty_col = fixed_point_column(buy_qty_key)
+        is_sell = (buy_qty_col == 0).tolist()
+        abs_diff_text = abs(buy_qty_col - fixed_point_column(sell_qty_key)).to_strings()
+        abs_rate_diff_text = abs(fixed_point_column(buy_rate_key) - fixed_point_column(sell_rate_key)).to_strings()
+        
+        # Trade dates: Timestamps from Excel pass through, '%d-%b-%y' strings from CSV
+        # are parsed once per distinct value
+        if date_key in df_csv.columns:
+            trade_dates, trade_date_rejected = format_date_column(df_csv[date_key], "%Y/%m/%d", formats=("%d-%b-%y",))
+            trade_dates = trade_dates.tolist()
+            trade_date_rejected = trade_date_rejected.tolist()
+        else:
+            trade_dates = [""] * len(df_csv)
+            trade_date_rejected = [False] * len(df_csv)
+        
         # Track unique scrip names for filtering
         seen_option_scrips = set()
         seen_aafspl_scrips = set()
@@ -894,7 +889,12 @@ class AlphaReportPage(tk.Frame):
             s = str(x).strip()
             return "" if s.lower() in {"", "na", "nan", "none", "null"} else s
 
+        total_rows = len(rows_data)
+        if job is not None:
+            job.stage("Processing trades", total=total_rows)
         for idx, row in enumerate(rows_data):            # Clean string values
+            if job is not None:
+                job.progress(idx + 1, total_rows)
             for key, value in row.items():
                 if isinstance(value, str):
                     row[key] = value.strip()
@@ -904,37 +904,14 @@ class AlphaReportPage(tk.Frame):
                 continue
 
             date = row.get(date_key)
-            # Handle both string dates (from CSV) and Timestamp objects (from Excel)
-            if date is None:
-                continue  # Skip rows with missing dates
-            elif isinstance(date, (pd.Timestamp, datetime)):
-                # Already a datetime object from Excel
-                date_obj = date if isinstance(date, datetime) else date.to_pydatetime()
-                # formatted_date = date_obj.strftime("%d/%m/%Y")
-                formatted_date = date_obj.strftime("%Y/%m/%d")
-            elif isinstance(date, str):
-                # String date from CSV - parse it
-                date_obj = datetime.strptime(date, "%d-%b-%y")
-                # formatted_date = date_obj.strftime("%d/%m/%Y")
-                formatted_date = date_obj.strftime("%Y/%m/%d")
-            else:
-                # Try to convert to string first, then parse
-                try:
-                    date_str = str(date)
-                    date_obj = datetime.strptime(date_str, "%d-%b-%y")
-                    # formatted_date = date_obj.strftime("%d/%m/%Y")
-                    formatted_date = date_obj.strftime("%Y/%m/%d")
-                except (ValueError, TypeError):
-                    continue  # Skip rows with unparseable dates
-
-            buy_qty = _safe_decimal(row.get(buy_qty_key))
-            sell_qty = _safe_decimal(row.get(sell_qty_key))
-            buy_rate = _safe_decimal(row.get(buy_rate_key))
-            sell_rate = _safe_decimal(row.get(sell_rate_key))
-
-            buy_sell = "Sell" if buy_qty == 0 else "Buy"
-            abs_diff = abs(buy_qty - sell_qty)
-            abs_rate_diff = abs(buy_rate - sell_rate)
+            formatted_date = trade_dates[idx]
+            if trade_date_rejected[idx] and isinstance(date, str):
+                # String date from CSV that is not '%d-%b-%y'
+                raise ValueError(f"time data '{date}' does not match format '%d-%b-%y'")
+            if not formatted_date:
+                continue  # Skip rows with missing or unparseable dates
+
+            buy_sell = "Sell" if is_sell[idx] else "Buy"
 
             try:
                 underlying, expiry_date, strike_price, call_or_put_flag, trading_size, scrip_name = genevascrip(row.get(scrip_key))
@@ -942,7 +919,7 @@ class AlphaReportPage(tk.Frame):
                 # Skip malformed scrip lines
                 continue
 
-            for_trade.append([scrip_name, buy_sell, str(abs_diff), str(abs_rate_diff)])
+            for_trade.append([scrip_name, buy_sell, abs_diff_text[idx], abs_rate_diff_text[idx]])
             security_creation[scrip_name] = [
                 scrip_name,
                 underlying,
@@ -982,8 +959,8 @@ class AlphaReportPage(tk.Frame):
                 CAR_TRADE_EVENTDATE: formatted_date,
                 CAR_TRADE_SETTLEDATE: formatted_date,
                 CAR_TRADE_ACTUALSETTLEDATE: formatted_date,
-                CAR_TRADE_QUANTITY: abs_diff,
-                CAR_TRADE_PRICE: abs_rate_diff,
+                CAR_TRADE_QUANTITY: Decimal(abs_diff_text[idx]),
+                CAR_TRADE_PRICE: Decimal(abs_rate_diff_text[idx]),
             })
             car_trade_loader_data.append(car_trade_record)
 
@@ -5,7 +5,7 @@ import json
 from datetime import datetime
 import pandas as pd
 from my_app.pages.helper import read_file
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from my_app.pages.xlsx_writer import format_sheet
 from my_app.CONSTANTS import FORMAT_1, FORMAT_2, BHAVCOPY
 
 class ASIOReconciliationPage(tk.Frame):
@@ -400,31 +400,9 @@ class ASIOReconciliationPage(tk.Frame):
         """
         Apply formatting to Excel worksheet
         - Header: Blue, Accent 1, Darker 25% (no borders)
-        - Data: Light blue and white zebra striping
+        - Data: Light blue and white zebra striping (one conditional-format rule)
         """
-        # Header formatting - Blue, Accent 1, Darker 25%
-        header_fill = PatternFill(start_color="305496", end_color="305496", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        no_border = Border()  # Empty border (no borders)
-        
-        # Data formatting - Light blue zebra
-        light_blue_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        
-        # Apply header formatting (row 1)
-        for col in range(1, num_cols + 1):
-            cell = worksheet.cell(row=1, column=col)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-            cell.border = no_border  # Remove border from header
-        
-        # Apply zebra striping to data rows (alternating light blue and white)
-        for row in range(2, num_rows + 2):  # Start from row 2 (data rows)
-            if row % 2 == 0:  # Even rows - light blue
-                for col in range(1, num_cols + 1):
-                    cell = worksheet.cell(row=row, column=col)
-                    cell.fill = light_blue_fill
+        format_sheet(worksheet, num_rows, num_cols)
 
     def export_results(self):
         """
@@ -587,59 +565,39 @@ class ASIOReconciliationPage(tk.Frame):
                         if reconciled_records:
                             format_2_results.extend(reconciled_records)
                     elif format_type == BHAVCOPY:
-                        # Handle BhavCopy reconciliation with Geneva - Manual implementation
-                        
-                        # Create BhavCopy dict: ISIN -> BhavCopy data
-                        bhavcopy_dict = {}
-                        for _, row in holding_df.iterrows():
-                            isin = row['ISIN']
-                            bhavcopy_dict[isin] = {
-                                'TradDt': row['TradDt'],
-                                'BizDt': row['BizDt'],
-                                'ISIN': row['ISIN'],
-                                'TckrSymb': row['TckrSymb'],
-                                'SctySrs': row['SctySrs'],
-                                'OpnPric': row['OpnPric'],
-                                'HghPric': row['HghPric'],
-                                'LwPric': row['LwPric'],
-                                'ClsPric': row['ClsPric'],
-                                'LastPric': row['LastPric']
-                            }
-                        
-                        # Match and reconcile manually
-                        reconciled_records = []
-                        for _, geneva_row in geneva_data.iterrows():
-                            investment = geneva_row['Investment']
-                            
-                            # Check if this ISIN exists in BhavCopy
-                            if investment in bhavcopy_dict:
-                                bhavcopy_data = bhavcopy_dict[investment]
-                                
-                                # Calculate difference: Market Price Local - ClsPric
-                                market_price = geneva_row['Market Price Local']
-                                cls_pric = bhavcopy_data['ClsPric']
-                                difference = market_price - cls_pric
-                                
-                                # Create reconciled record
-                                record = {
-                                    'Portfolio': geneva_row['Portfolio'],
-                                    'Investment': geneva_row['Investment'],
-                                    'Traded Quantity': geneva_row['Traded Quantity'],
-                                    'Market Price Local': market_price,
-                                    'TradDt': bhavcopy_data['TradDt'],
-                                    'BizDt': bhavcopy_data['BizDt'],
-                                    'ISIN': bhavcopy_data['ISIN'],
-                                    'TckrSymb': bhavcopy_data['TckrSymb'],
-                                    'SctySrs': bhavcopy_data['SctySrs'],
-                                    'OpnPric': bhavcopy_data['OpnPric'],
-                                    'HghPric': bhavcopy_data['HghPric'],
-                                    'LwPric': bhavcopy_data['LwPric'],
-                                    'ClsPric': cls_pric,
-                                    'LastPric': bhavcopy_data['LastPric'],
-                                    'Difference': difference
-                                }
-                                
-                                reconciled_records.append(record)
+                        # Handle BhavCopy reconciliation with Geneva through the bhavcopy price store
+                        from my_app.pages.bhavcopy_store import get_store
+
+                        # Add the BhavCopy to the store, then fetch prices for just the ISINs Geneva holds
+                        store = get_store()
+                        trade_dates = store.ingest_frame(holding_df, "CM")
+                        investments = geneva_data['Investment'].dropna().astype(str).unique()
+                        if trade_dates:
+                            prices = store.isin_prices(investments, as_of=trade_dates[-1], exact=True)
+                        else:
+                            prices = store.isin_prices([])
+
+                        # Inner join keeps Geneva's row order; unmatched ISINs drop out
+                        matched = geneva_data.merge(prices, left_on='Investment', right_on='key', how='inner')
+                        reconciled = pd.DataFrame({
+                            'Portfolio': matched['Portfolio'],
+                            'Investment': matched['Investment'],
+                            'Traded Quantity': matched['Traded Quantity'],
+                            'Market Price Local': matched['Market Price Local'],
+                            'TradDt': matched['trade_date'],
+                            'BizDt': matched['biz_date'],
+                            'ISIN': matched['isin'],
+                            'TckrSymb': matched['symbol'],
+                            'SctySrs': matched['series'],
+                            'OpnPric': matched['open'],
+                            'HghPric': matched['high'],
+                            'LwPric': matched['low'],
+                            'ClsPric': matched['close'],
+                            'LastPric': matched['last'],
+                        })
+                        # Calculate difference: Market Price Local - ClsPric
+                        reconciled['Difference'] = reconciled['Market Price Local'] - reconciled['ClsPric']
+                        reconciled_records = reconciled.to_dict('records')
                         
                         # Add to BhavCopy results
                         if reconciled_records:
@@ -5,8 +5,6 @@ import os
 import json
 from collections import defaultdict
 import threading
-import csv
-import io
 import zipfile
 import re
 import tempfile
@@ -811,7 +809,7 @@ class ASIOSubFund4Page(tk.Frame):
     def _save_read_config(self, read_row, read_col_letter):
         """Save read configuration to consolidated_data.json."""
         try:
-            from my_app.file_utils import get_app_directory
+            from my_app.file_utils import get_app_directory, save_consolidated_data
             app_dir = get_app_directory()
             consolidated_path = os.path.join(app_dir, "consolidated_data.json")
             
@@ -828,8 +826,7 @@ class ASIOSubFund4Page(tk.Frame):
             }
             
             # Save back to file
-            with open(consolidated_path, "w", encoding="utf-8") as f:
-                json.dump(consolidated_data, f, indent=4)
+            save_consolidated_data(consolidated_data, consolidated_path, indent=4)
         except Exception as e:
             # Silently fail - don't interrupt user workflow
             pass
@@ -1013,6 +1010,12 @@ class ASIOSubFund4Page(tk.Frame):
         # Reset index after all operations
         df = df.reset_index(drop=True)
         
+        # Normalize ExpiryDate for the whole file in one call (day-first strings are
+        # parsed once per distinct value, Excel dates pass through, bad values become NaT)
+        if "ExpiryDate" in df.columns:
+            from my_app.pages.date_utils import parse_date_column
+            df["ExpiryDate"], _ = parse_date_column(df["ExpiryDate"], dayfirst=True)
+        
         return df
 
     def _get_location_account_from_trading_code(self, trading_code_key):
@@ -1043,23 +1046,16 @@ class ASIOSubFund4Page(tk.Frame):
         try:
             value = row.get("ExpiryDate")
 
-            if pd.isna(row["ExpiryDate"]):
+            # read_dynamic_file has already parsed the column (NaT when missing/unparseable)
+            if pd.isna(value):
                 expiry = ""
+            elif isinstance(value, str):
+                # Row not produced by read_dynamic_file: parse through the shared (memoized) parser
+                from my_app.pages.date_utils import reformat_date
+                expiry = reformat_date(value, "%Y%m%d", dayfirst=True)
             else:
-                # If already a string → normalize/return safely
-                if isinstance(value, str):
-                    # try to parse into datetime first
-                    try:
-                        # value = pd.to_datetime(value)
-                        value = pd.to_datetime(value, dayfirst=True, errors="coerce")
-                        expiry = value.strftime("%Y%m%d") if value is not pd.NaT else ""
-                    except:
-                        # If string cannot be parsed, return original string (or "")
-                        expiry = value.replace("-", "").replace("/", "")
-                else:
-                    # It is a datetime → directly format
-                    expiry = value.strftime("%Y%m%d")
-                    expiry = row["ExpiryDate"].strftime("%Y%m%d")  # format date
+                # It is a datetime → directly format
+                expiry = value.strftime("%Y%m%d")
         except Exception as e:
             print(e)
             raise Exception(f"Error processing ExpiryDate: {e}, type: {type(row.get('ExpiryDate', 'N/A'))}, value: {row.get('ExpiryDate', 'N/A')}")
@@ -1271,7 +1267,11 @@ class ASIOSubFund4Page(tk.Frame):
         return prepared_row
     
     def _submit(self):
-        """Handle form submission."""
+        """Handle form submission.
+
+        Validation and dialogs run here; reading and transforming the files run
+        in a background job (see job_runner) and the export starts when it ends.
+        """
         # Lazy import CONSTANTS (heavy import) - only import TradingCode needed here
         from CONSTANTS import TradingCode
         
@@ -1310,317 +1310,431 @@ class ASIOSubFund4Page(tk.Frame):
             self.status_label.config(fg="#dc3545")  # Red color for errors
             return
         
-        # Process all files in the list
-        total_rows_processed = 0
-        total_files_processed = 0
-        temp_dirs = []  # Track temp directories for cleanup
-        bulk_generated_zips = []  # Track all generated ZIP files for bulk mode
+        from my_app.pages.job_runner import run_page_job
         
-        try:
-            # Check if bulk processing mode is enabled
-            if self.bulk_var.get():
-                # Ask for output directory once at the start
-                self.bulk_export_dir = filedialog.askdirectory(
-                    title="Select Directory to Save All Output ZIP Files"
+        def show_failure(e):
+            messagebox.showerror("Error", f"Failed to process files: {str(e)}")
+            self.status_var.set(f"Error: {str(e)}")
+            self.status_label.config(fg="#dc3545")  # Red color for errors
+        
+        # Check if bulk processing mode is enabled
+        if self.bulk_var.get():
+            # Every input writes ASIO_Sub_Fund_4_FT_Trades_<date>.zip, so ZIPs sharing a
+            # filename date would overwrite each other's output; refuse them up front
+            zips_by_date = defaultdict(list)
+            for zip_path in self.selected_files:
+                zip_name = os.path.basename(zip_path)
+                extracted_date = self._extract_date_from_zip_filename(zip_name)
+                if extracted_date:
+                    zips_by_date[extracted_date.strftime("%d%m%Y")].append(zip_name)
+            duplicates = [f"{date_str}: {', '.join(names)}"
+                          for date_str, names in sorted(zips_by_date.items()) if len(names) > 1]
+            if duplicates:
+                messagebox.showerror(
+                    "Duplicate Dates",
+                    "These ZIP files have the same date and would write the same output ZIP:\n\n"
+                    + "\n".join(duplicates)
+                    + "\n\nRemove the duplicates from the selection and try again."
                 )
-                if not self.bulk_export_dir:
-                    self.status_var.set("Bulk processing cancelled by user")
-                    return
+                self.status_var.set("Error: Several ZIP files have the same date")
+                self.status_label.config(fg="#dc3545")  # Red color for errors
+                return
+            
+            # Ask for output directory once at the start
+            self.bulk_export_dir = filedialog.askdirectory(
+                title="Select Directory to Save All Output ZIP Files"
+            )
+            if not self.bulk_export_dir:
+                self.status_var.set("Bulk processing cancelled by user")
+                return
+            
+            # Bulk processing mode: process zip files separately, overlapping
+            # read -> transform -> write of different ZIPs in a staged pipeline
+            # that runs inside a background job
+            from my_app.pages.pipeline import PipelineStage, StagedPipeline
+            from my_app.pages.run_manifest import RunManifest, settings_digest
+            
+            export_excel = self.export_excel_var.get()
+            export_csv = self.export_csv_var.get()
+            selected_files = list(self.selected_files)
+            total_zips = len(selected_files)
+            zip_names = [os.path.basename(zip_path) for zip_path in selected_files]
+            
+            # ZIPs already completed by an earlier run into this directory (same input,
+            # same settings, output unchanged) are skipped and their outputs reused
+            manifest = RunManifest(self.bulk_export_dir)
+            settings = settings_digest({
+                "config": asio_sf4_ft_config,
+                "trading_code_mapping": trading_code_mapping,
+                "excel": export_excel,
+                "csv": export_csv,
+            })
+            
+            pipeline = StagedPipeline([
+                PipelineStage("Reading", lambda zip_path: self._read_bulk_zip(
+                    zip_path, manifest, settings), workers=2),
+                PipelineStage("Processing", lambda job: self._transform_bulk_zip(
+                    job, asio_sf4_ft_config, trading_code_mapping), workers=1),
+                PipelineStage("Writing", lambda job: self._write_bulk_zip(
+                    job, export_excel, export_csv, manifest), workers=2),
+            ], queue_size=2)
+            
+            def run_bulk(job):
+                completed = [0]
                 
-                # Bulk processing mode: process zip files separately
-                for zip_index, zip_path in enumerate(self.selected_files):
-                    zip_filename = os.path.basename(zip_path)
-                    self.status_var.set(f"Processing ZIP {zip_index + 1}/{len(self.selected_files)}: {zip_filename}")
-                    
-                    # Extract date from zip filename
-                    extracted_date = self._extract_date_from_zip_filename(zip_filename)
-                    if not extracted_date:
-                        raise Exception(f"Could not extract date from zip filename: {zip_filename}")
-                    
-                    # Use extracted date for all three date fields
-                    event_date = extracted_date
-                    settlement_date = extracted_date
-                    actual_date = extracted_date
-                    
-                    # Format date string for output filename
-                    event_date_str = extracted_date.strftime("%d%m%Y")
-                    
-                    # Create temporary directory for this zip
-                    temp_dir = tempfile.mkdtemp()
-                    temp_dirs.append(temp_dir)
-                    
-                    # Extract files from zip
-                    extracted_files = self._extract_files_from_zip(zip_path, temp_dir)
-                    
-                    if not extracted_files:
-                        raise Exception(f"No Excel or CSV files found in zip: {zip_filename}")
-                    
-                    # Process data for this zip only (separate loader_data per zip)
-                    zip_loader_data = defaultdict(list)
-                    
-                    # Process each extracted file
-                    for file_path, is_excel in extracted_files:
-                        self.status_var.set(f"Processing {os.path.basename(file_path)} from {zip_filename}")
-                        
-                        # Set read parameters based on file type
-                        if is_excel:
-                            # Excel: Row 10, Column B
-                            read_row = 10
-                            read_col = self._column_letter_to_index("B")
-                        else:
-                            # CSV: Row 1, Column A
-                            read_row = 1
-                            read_col = self._column_letter_to_index("A")
-                        
-                        # Read file
-                        df = self.read_dynamic_file(
-                            file_path=file_path,
-                            header_row=read_row,
-                            header_start_col=read_col,
-                            sheet_name=0
-                        )
-                        
-                        # Process each row
-                        for index, row in df.iterrows():
-                            try:
-                                trading_code = str(row.get(TradingCode, "")).strip()
-                            except Exception as e:
-                                raise Exception(f"Error getting TradingCode at row {index} in file {os.path.basename(file_path)}: {e}")
-                            
-                            try:
-                                data_row = self._prepare_data_row(
-                                    row, 
-                                    asio_sf4_ft_config, 
-                                    trading_code, 
-                                    trading_code_mapping, 
-                                    columns=df.columns.tolist(),
-                                    event_date=event_date,
-                                    settlement_date=settlement_date,
-                                    actual_date=actual_date
-                                )
-                            except Exception as e:
-                                raise Exception(f"Error in _prepare_data_row at row {index} in file {os.path.basename(file_path)}: {e}")
-
-                            zip_loader_data[trading_code].append(data_row)
-                            total_rows_processed += 1
-                        
-                        total_files_processed += 1
-                    
-                    # Create output files for this zip and save as separate ZIP file
-                    generated_zip_path = self._export_zip_to_separate_zip(
-                        zip_loader_data, 
-                        event_date_str,
-                        zip_filename,
-                        zip_index + 1,
-                        len(self.selected_files)
-                    )
-                    
-                    # Track generated ZIP file
-                    if generated_zip_path:
-                        bulk_generated_zips.append(generated_zip_path)
+                # One stage for the whole run, so the spinner keeps its rate and ETA; a ZIP
+                # counts once its output is written and the ZIP at work goes in the status line
+                def on_event(stage_name, index, finished):
+                    if not finished:
+                        job.call_ui(self.status_var.set,
+                                    f"{stage_name} {zip_names[index]} ({completed[0]} / {total_zips} ZIPs done)")
+                    elif stage_name == "Writing":
+                        completed[0] += 1
+                        job.progress(completed[0], total_zips)
                 
-                # Cleanup temporary directories
-                for temp_dir in temp_dirs:
-                    try:
-                        shutil.rmtree(temp_dir)
-                    except Exception:
-                        pass  # Ignore cleanup errors
+                job.stage("Processing ZIPs", total=total_zips, unit="ZIPs")
+                return pipeline.run(selected_files, on_event=on_event, poll=job.check_cancelled)
+            
+            def show_bulk_results(results):
+                # Collect outputs in input order
+                total_rows_processed = 0
+                skipped_zips = 0
+                bulk_generated_zips = []  # Track all generated ZIP files for bulk mode
+                for zip_index, result in enumerate(results):
+                    total_rows_processed += result["rows"]
+                    skipped_zips += 1 if result.get("skipped") else 0
+                    if result.get("error"):
+                        messagebox.showerror("Error", f"Failed to export ZIP {zip_index + 1}: {result['error']}")
+                    elif result.get("output_path"):
+                        bulk_generated_zips.append(result["output_path"])
                 
                 # Create master ZIP containing all generated ZIPs and show email dialog
                 if bulk_generated_zips:
                     self._create_master_zip_and_email(bulk_generated_zips)
                 
-                self.status_var.set(f"Processed {len(self.selected_files)} ZIP file(s) - {total_rows_processed} total rows processed")
+                status = f"Processed {total_zips} ZIP file(s) - {total_rows_processed} total rows processed"
+                if skipped_zips:
+                    status += f" ({skipped_zips} already completed, skipped)"
+                self.status_var.set(status)
+            
+            run_page_job(self, run_bulk, show_bulk_results, text="Processing ZIP files...",
+                         status_var=self.status_var, on_error=show_failure)
+            return
+        
+        # Normal processing mode: process individual files
+        # Validate dates (ensure widgets are created)
+        if not (self.event_date_entry and self.settlement_date_entry and self.actual_date_entry):
+            # Wait a moment for async creation
+            self.update_idletasks()
+            if not (self.event_date_entry and self.settlement_date_entry and self.actual_date_entry):
+                messagebox.showerror("Error", "Date widgets are still initializing. Please wait a moment.")
+                self.status_var.set("Error: Date widgets not ready")
+                self.status_label.config(fg="#dc3545")  # Red color for errors
                 return
-            else:
-                # Normal processing mode: process individual files
-                # Validate dates (ensure widgets are created)
-                if not (self.event_date_entry and self.settlement_date_entry and self.actual_date_entry):
-                    # Wait a moment for async creation
-                    self.update_idletasks()
-                    if not (self.event_date_entry and self.settlement_date_entry and self.actual_date_entry):
-                        messagebox.showerror("Error", "Date widgets are still initializing. Please wait a moment.")
-                        self.status_var.set("Error: Date widgets not ready")
-                        self.status_label.config(fg="#dc3545")  # Red color for errors
-                        return
-                try:
-                    event_date = self.event_date_entry.get_date()
-                    settlement_date = self.settlement_date_entry.get_date()
-                    actual_date = self.actual_date_entry.get_date()
-                except Exception as e:
-                    messagebox.showerror("Error", f"Invalid date selection: {str(e)}")
-                    self.status_var.set("Error: Invalid date")
-                    self.status_label.config(fg="#dc3545")  # Red color for errors
-                    return
+        try:
+            event_date = self.event_date_entry.get_date()
+            settlement_date = self.settlement_date_entry.get_date()
+            actual_date = self.actual_date_entry.get_date()
+        except Exception as e:
+            messagebox.showerror("Error", f"Invalid date selection: {str(e)}")
+            self.status_var.set("Error: Invalid date")
+            self.status_label.config(fg="#dc3545")  # Red color for errors
+            return
 
-                # Validate row and column inputs
-                # Check if fallback checkbox is checked
-                if self.fallback_var.get():
-                    # Use fallback values: Row 10, Column B
-                    read_row = 10
-                    column_letter = "B"
-                    read_col = self._column_letter_to_index(column_letter)
-                else:
-                    # Use values from input fields
-                    try:
-                        read_row = int(self.read_row_var.get())
-                        
-                        if read_row < 1:
-                            messagebox.showwarning("Warning", "Read From Row must be at least 1")
-                            return
-                        
-                        # Convert column letter to index
-                        column_letter = self.read_col_var.get().strip().upper()
-                        if not column_letter:
-                            messagebox.showwarning("Warning", "Please enter a valid column letter (A, B, C, etc.)")
-                            return
-                        
-                        read_col = self._column_letter_to_index(column_letter)
-                        
-                        if read_col < 0:
-                            messagebox.showwarning("Warning", "Invalid column letter. Please use A-Z or AA-ZZ format.")
-                            return
-                        
-                        # Save read configuration for next time (only if not using fallback)
-                        self._save_read_config(read_row, column_letter)
-                    except ValueError:
-                        messagebox.showerror("Error", "Read From Row must be a valid number")
-                        self.status_var.set("Error: Invalid row value")
-                        self.status_label.config(fg="#dc3545")  # Red color for errors
-                        return
-                    except Exception as e:
-                        messagebox.showerror("Error", f"Invalid column input: {str(e)}")
-                        self.status_var.set("Error: Invalid column value")
-                        self.status_label.config(fg="#dc3545")  # Red color for errors
-                        return
+        # Validate row and column inputs
+        # Check if fallback checkbox is checked
+        if self.fallback_var.get():
+            # Use fallback values: Row 10, Column B
+            read_row = 10
+            column_letter = "B"
+            read_col = self._column_letter_to_index(column_letter)
+        else:
+            # Use values from input fields
+            try:
+                read_row = int(self.read_row_var.get())
                 
-                # Process individual files
-                for file_index, file_path in enumerate(self.selected_files):
-                    self.status_var.set(f"Processing file {file_index + 1}/{len(self.selected_files)}: {os.path.basename(file_path)}")
-                    
-                    # Read file with correct parameters:
-                    # header_row: 1-based row number where headers are (use read_row)
-                    # header_start_col: 0-based column index where headers start (use read_col)
-                    df = self.read_dynamic_file(
-                        file_path=file_path,
-                        header_row=read_row,  # Row number (1-based) where header is located
-                        header_start_col=read_col,  # Column index (0-based) where headers start
-                        sheet_name=0
-                    )
-                    
-                    # Process each row in the current file
-                    for index, row in df.iterrows():
-                        try:
-                            trading_code = str(row.get(TradingCode, "")).strip()
-                        except Exception as e:
-                            raise Exception(f"Error getting TradingCode at row {index} in file {os.path.basename(file_path)}: {e}")
-                        
-                        try:
-                            # Use single asio_sf4_ft config for all trading codes
-                            # LocationAccount will be set dynamically based on trading code
-                            # Pass dates and DataFrame columns
-                            data_row = self._prepare_data_row(
-                                row, 
-                                asio_sf4_ft_config, 
-                                trading_code, 
-                                trading_code_mapping, 
-                                columns=df.columns.tolist(),
-                                event_date=event_date,
-                                settlement_date=settlement_date,
-                                actual_date=actual_date
-                            )
-                        except Exception as e:
-                            raise Exception(f"Error in _prepare_data_row at row {index} in file {os.path.basename(file_path)}: {e}")
-
-                        self.loader_data[trading_code].append(data_row)
-                        total_rows_processed += 1
-                    
-                    total_files_processed += 1
+                if read_row < 1:
+                    messagebox.showwarning("Warning", "Read From Row must be at least 1")
+                    return
+                
+                # Convert column letter to index
+                column_letter = self.read_col_var.get().strip().upper()
+                if not column_letter:
+                    messagebox.showwarning("Warning", "Please enter a valid column letter (A, B, C, etc.)")
+                    return
+                
+                read_col = self._column_letter_to_index(column_letter)
+                
+                if read_col < 0:
+                    messagebox.showwarning("Warning", "Invalid column letter. Please use A-Z or AA-ZZ format.")
+                    return
+                
+                # Save read configuration for next time (only if not using fallback)
+                self._save_read_config(read_row, column_letter)
+            except ValueError:
+                messagebox.showerror("Error", "Read From Row must be a valid number")
+                self.status_var.set("Error: Invalid row value")
+                self.status_label.config(fg="#dc3545")  # Red color for errors
+                return
+            except Exception as e:
+                messagebox.showerror("Error", f"Invalid column input: {str(e)}")
+                self.status_var.set("Error: Invalid column value")
+                self.status_label.config(fg="#dc3545")  # Red color for errors
+                return
+        
+        selected_files = list(self.selected_files)
+        
+        def run_files(job):
+            # Normal mode: combine all data first, then export
+            # Dynamic dictionary to store data by trading code (shared across all files)
+            loader_data = defaultdict(list)
+            total_rows_processed = 0
+            total_files_processed = 0
             
-                # Normal mode: combine all data first, then export
-                # Dynamic dictionary to store data by trading code (shared across all files)
-                self.loader_data = defaultdict(list)
+            for file_index, file_path in enumerate(selected_files):
+                job.stage(f"File {file_index + 1}/{len(selected_files)}: {os.path.basename(file_path)}")
                 
-                for file_index, file_path in enumerate(self.selected_files):
-                    self.status_var.set(f"Processing file {file_index + 1}/{len(self.selected_files)}: {os.path.basename(file_path)}")
-                    
-                    # Read file with correct parameters:
-                    # header_row: 1-based row number where headers are (use read_row)
-                    # header_start_col: 0-based column index where headers start (use read_col)
-                    df = self.read_dynamic_file(
-                        file_path=file_path,
-                        header_row=read_row,  # Row number (1-based) where header is located
-                        header_start_col=read_col,  # Column index (0-based) where headers start
-                        sheet_name=0
-                    )
+                # Read file with correct parameters:
+                # header_row: 1-based row number where headers are (use read_row)
+                # header_start_col: 0-based column index where headers start (use read_col)
+                df = self.read_dynamic_file(
+                    file_path=file_path,
+                    header_row=read_row,  # Row number (1-based) where header is located
+                    header_start_col=read_col,  # Column index (0-based) where headers start
+                    sheet_name=0
+                )
+                
+                # Process each row in the current file
+                columns = df.columns.tolist()
+                total_rows = len(df)
+                for position, (index, row) in enumerate(df.iterrows(), 1):
+                    job.progress(position, total_rows)
+                    try:
+                        trading_code = str(row.get(TradingCode, "")).strip()
+                    except Exception as e:
+                        raise Exception(f"Error getting TradingCode at row {index} in file {os.path.basename(file_path)}: {e}")
                     
-                    # Process each row in the current file
-                    for index, row in df.iterrows():
-                        try:
-                            trading_code = str(row.get(TradingCode, "")).strip()
-                        except Exception as e:
-                            raise Exception(f"Error getting TradingCode at row {index} in file {os.path.basename(file_path)}: {e}")
-                        
-                        try:
-                            # Use single asio_sf4_ft config for all trading codes
-                            # LocationAccount will be set dynamically based on trading code
-                            # Pass dates and DataFrame columns
-                            data_row = self._prepare_data_row(
-                                row, 
-                                asio_sf4_ft_config, 
-                                trading_code, 
-                                trading_code_mapping, 
-                                columns=df.columns.tolist(),
-                                event_date=event_date,
-                                settlement_date=settlement_date,
-                                actual_date=actual_date
-                            )
-                        except Exception as e:
-                            raise Exception(f"Error in _prepare_data_row at row {index} in file {os.path.basename(file_path)}: {e}")
+                    try:
+                        # Use single asio_sf4_ft config for all trading codes
+                        # LocationAccount will be set dynamically based on trading code
+                        # Pass dates and DataFrame columns
+                        data_row = self._prepare_data_row(
+                            row, 
+                            asio_sf4_ft_config, 
+                            trading_code, 
+                            trading_code_mapping, 
+                            columns=columns,
+                            event_date=event_date,
+                            settlement_date=settlement_date,
+                            actual_date=actual_date
+                        )
+                    except Exception as e:
+                        raise Exception(f"Error in _prepare_data_row at row {index} in file {os.path.basename(file_path)}: {e}")
 
-                        self.loader_data[trading_code].append(data_row)
-                        total_rows_processed += 1
-                    
-                    total_files_processed += 1
+                    loader_data[trading_code].append(data_row)
+                    total_rows_processed += 1
+                
+                total_files_processed += 1
             
+            return loader_data, total_files_processed, total_rows_processed
+        
+        def show_file_results(result):
+            self.loader_data, total_files_processed, total_rows_processed = result
             self.status_var.set(f"Processed {total_files_processed} file(s) successfully - {total_rows_processed} total rows processed")
             
             # Automatically export to template after processing all files
             self._export_to_template()
-        except Exception as e:
-            # Cleanup temporary directories on error
-            for temp_dir in temp_dirs:
-                try:
-                    shutil.rmtree(temp_dir)
-                except Exception:
-                    pass  # Ignore cleanup errors
+        
+        run_page_job(self, run_files, show_file_results, text="Processing files...",
+                     status_var=self.status_var, on_error=show_failure)
+    
+    def _read_bulk_zip(self, zip_path, manifest=None, settings=""):
+        """Bulk pipeline stage 1: extract one input ZIP and read its files.
+        
+        Runs in a worker thread, so it must not touch Tk widgets or variables.
+        
+        Args:
+            zip_path: Input ZIP
+            manifest: RunManifest of the output directory (None disables resuming)
+            settings: Digest of the settings that shape the output
+        
+        Returns:
+            dict: Job with zip_filename, the manifest key, the date taken from the
+            filename and frames as a list of (file_path, DataFrame); or, when the
+            manifest shows this ZIP already done, the job with its entry as "skipped"
+        """
+        from my_app.pages.run_manifest import file_fingerprint
+        
+        zip_filename = os.path.basename(zip_path)
+        
+        # Extract date from zip filename
+        extracted_date = self._extract_date_from_zip_filename(zip_filename)
+        if not extracted_date:
+            raise Exception(f"Could not extract date from zip filename: {zip_filename}")
+        event_date_str = extracted_date.strftime("%d%m%Y")
+        
+        # The date comes from the filename, so a renamed copy of the same ZIP is a new job
+        key = f"asio_sf4:{settings}:{event_date_str}:{file_fingerprint(zip_path)}"
+        if manifest is not None:
+            entry = manifest.completed(key)
+            if entry:
+                return {"zip_filename": zip_filename, "key": key, "skipped": entry}
+        
+        # Temporary directory only lives while this zip is being read
+        temp_dir = tempfile.mkdtemp()
+        try:
+            # Extract files from zip
+            extracted_files = self._extract_files_from_zip(zip_path, temp_dir)
             
-            messagebox.showerror("Error", f"Failed to process files: {str(e)}")
-            self.status_var.set(f"Error: {str(e)}")
-            self.status_label.config(fg="#dc3545")  # Red color for errors
-            return
+            if not extracted_files:
+                raise Exception(f"No Excel or CSV files found in zip: {zip_filename}")
+            
+            frames = []
+            for file_path, is_excel in extracted_files:
+                # Set read parameters based on file type
+                if is_excel:
+                    # Excel: Row 10, Column B
+                    read_row = 10
+                    read_col = self._column_letter_to_index("B")
+                else:
+                    # CSV: Row 1, Column A
+                    read_row = 1
+                    read_col = self._column_letter_to_index("A")
+                
+                # Read file
+                df = self.read_dynamic_file(
+                    file_path=file_path,
+                    header_row=read_row,
+                    header_start_col=read_col,
+                    sheet_name=0
+                )
+                frames.append((file_path, df))
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        return {
+            "zip_filename": zip_filename,
+            "key": key,
+            "date": extracted_date,
+            "event_date_str": event_date_str,
+            "frames": frames,
+        }
     
-    def _create_output_files_for_zip(self, zip_loader_data, event_date_str, zip_filename):
-        """Create output files (Excel/CSV) for a single zip file's data.
+    def _transform_bulk_zip(self, job, asio_sf4_ft_config, trading_code_mapping):
+        """Bulk pipeline stage 2: build the loader rows of one ZIP, grouped by trading code.
+        
+        Returns:
+            dict: The job with loader_data, rows and files added (frames dropped)
+        """
+        from CONSTANTS import TradingCode
+        
+        if job.get("skipped"):
+            return job
+        
+        # Use extracted date for all three date fields
+        extracted_date = job["date"]
+        zip_loader_data = defaultdict(list)
+        rows = 0
+        
+        frames = job.pop("frames")
+        for file_path, df in frames:
+            columns = df.columns.tolist()
+            for index, row in df.iterrows():
+                try:
+                    trading_code = str(row.get(TradingCode, "")).strip()
+                except Exception as e:
+                    raise Exception(f"Error getting TradingCode at row {index} in file {os.path.basename(file_path)}: {e}")
+                
+                try:
+                    data_row = self._prepare_data_row(
+                        row, 
+                        asio_sf4_ft_config, 
+                        trading_code, 
+                        trading_code_mapping, 
+                        columns=columns,
+                        event_date=extracted_date,
+                        settlement_date=extracted_date,
+                        actual_date=extracted_date
+                    )
+                except Exception as e:
+                    raise Exception(f"Error in _prepare_data_row at row {index} in file {os.path.basename(file_path)}: {e}")
+                
+                zip_loader_data[trading_code].append(data_row)
+                rows += 1
+        
+        job["loader_data"] = zip_loader_data
+        job["rows"] = rows
+        job["files"] = len(frames)
+        return job
+    
+    def _write_bulk_zip(self, job, export_excel, export_csv, manifest=None):
+        """Bulk pipeline stage 3: write one ZIP's output files into its own output ZIP.
+        
+        Export errors are returned (not raised) so the other ZIPs still complete,
+        as in the sequential loop. A written ZIP is recorded in the manifest.
+        
+        Returns:
+            dict: rows, files, output_path (None if nothing was written), error and skipped
+        """
+        entry = job.get("skipped")
+        if entry:
+            return {"rows": entry.get("rows", 0), "files": entry.get("files", 0),
+                    "output_path": entry["output"], "error": None, "skipped": True}
+        
+        result = {"rows": job["rows"], "files": job["files"], "output_path": None, "error": None}
+        output_jobs = self._output_jobs_for_zip(
+            job["loader_data"],
+            job["event_date_str"],
+            job["zip_filename"],
+            export_excel=export_excel,
+            export_csv=export_csv
+        )
+        if not output_jobs:
+            return result
+        
+        zip_output_filename = f"ASIO_Sub_Fund_4_FT_Trades_{job['event_date_str']}.zip"
+        out_path = os.path.join(self.bulk_export_dir, zip_output_filename)
+        try:
+            self._save_output_zip(output_jobs, out_path)
+            result["output_path"] = out_path
+            if manifest is not None:
+                manifest.record(job["key"], out_path, input=job["zip_filename"],
+                                rows=job["rows"], files=job["files"])
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            result["error"] = e
+        return result
+    
+    def _output_jobs_for_zip(self, zip_loader_data, event_date_str, zip_filename, export_excel=None, export_csv=None):
+        """Queue the output files (Excel/CSV) for a single zip file's data.
         
         Args:
             zip_loader_data: Dictionary of trading_code -> list of data rows
             event_date_str: Date string for filename (DDMMYYYY format)
             zip_filename: Original zip filename (for naming output files)
+            export_excel: Write XLSX files (default: the Excel checkbox)
+            export_csv: Write CSV files (default: the CSV checkbox)
         
         Returns:
-            list: List of tuples (file_io, filename) for all output files created
+            list: Export jobs (builder, args) for _save_output_zip, in trading-code order
         """
         # Lazy import helper and CONSTANTS (heavy imports)
         from my_app.pages.helper import output_save_in_template
+        from my_app.pages.export_executor import dict_rows_csv
         from my_app.CONSTANTS import sub_fund_4_headers
         
-        output_files = []
+        if export_excel is None:
+            export_excel = self.export_excel_var.get()
+        if export_csv is None:
+            export_csv = self.export_csv_var.get()
+        
+        jobs = []
         
         # Get zip base name without extension for naming
         zip_basename = os.path.splitext(zip_filename)[0]
         
-        # Create files for each trading code
+        # Queue files for each trading code
         for trading_code, data_list in sorted(zip_loader_data.items()):
             if not data_list:
                 continue
@@ -1640,31 +1754,16 @@ class ASIOSubFund4Page(tk.Frame):
                 continue
             
             # Create Excel file if Excel format is selected
-            if self.export_excel_var.get():
+            if export_excel:
                 excel_filename = f"ASIO_SF4_{trading_code}_{event_date_str}.xlsx"
-                excel_file, excel_name = output_save_in_template(
-                    template_data_dicts,
-                    sub_fund_4_headers,
-                    excel_filename
-                )
-                output_files.append((excel_file, excel_name))
+                jobs.append((output_save_in_template, (template_data_dicts, sub_fund_4_headers, excel_filename)))
             
             # Create CSV file if CSV format is selected
-            if self.export_csv_var.get():
+            if export_csv:
                 csv_filename = f"ASIO_SF4_{trading_code}_{event_date_str}.csv"
-                # Create CSV in memory
-                csv_buffer = io.StringIO()
-                csv_writer = csv.DictWriter(csv_buffer, fieldnames=sub_fund_4_headers)
-                csv_writer.writeheader()
-                csv_writer.writerows(template_data_dicts)
-                csv_content = csv_buffer.getvalue()
-                csv_buffer.close()
-                
-                # Convert to bytes
-                csv_bytes = io.BytesIO(csv_content.encode('utf-8'))
-                output_files.append((csv_bytes, csv_filename))
+                jobs.append((dict_rows_csv, (template_data_dicts, sub_fund_4_headers, csv_filename)))
         
-        return output_files
+        return jobs
     
     def _export_zip_to_separate_zip(self, zip_loader_data, event_date_str, zip_filename, zip_index, total_zips):
         """Export output files from a single zip into its own separate ZIP file.
@@ -1682,14 +1781,14 @@ class ASIOSubFund4Page(tk.Frame):
         if not zip_loader_data:
             return None
         
-        # Create output files for this zip
-        output_files = self._create_output_files_for_zip(
+        # Queue output files for this zip
+        output_jobs = self._output_jobs_for_zip(
             zip_loader_data, 
             event_date_str,
             zip_filename
         )
         
-        if not output_files:
+        if not output_jobs:
             return
         
         # Get output directory from parent (set during bulk processing)
@@ -1705,23 +1804,7 @@ class ASIOSubFund4Page(tk.Frame):
         self.status_var.set(f"Creating output ZIP {zip_index}/{total_zips}: {zip_output_filename}")
         
         try:
-            # Create zip file with output files from this zip
-            zip_buffer = io.BytesIO()
-            with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                # Add all output files
-                for file_io, filename in output_files:
-                    file_io.seek(0)
-                    zip_file.writestr(filename, file_io.read())
-            
-            # Save zip file
-            zip_buffer.seek(0)
-            with open(out_path, 'wb') as f:
-                f.write(zip_buffer.read())
-            
-            # Close all file buffers
-            for file_io, _ in output_files:
-                file_io.close()
-            zip_buffer.close()
+            self._save_output_zip(output_jobs, out_path)
             
             # Return the generated ZIP path
             return out_path
@@ -1731,12 +1814,19 @@ class ASIOSubFund4Page(tk.Frame):
             traceback.print_exc()
             return None
     
+    def _save_output_zip(self, output_jobs, out_path):
+        """Write one ZIP's output files straight into its output ZIP on disk.
+        
+        CSVs stream into their members; XLSX files are built across the process pool.
+        """
+        from my_app.pages.export_executor import write_export_files
+        from my_app.pages.zip_sink import ZipSink
+        
+        with ZipSink(out_path, compresslevel=6) as sink:
+            write_export_files(output_jobs, sink)
+    
     def _export_to_template(self):
         """Export data to template format (ZIP with Excel files separated by trading code)."""
-        # Lazy import helper and CONSTANTS (heavy imports)
-        from my_app.pages.helper import output_save_in_template
-        from my_app.CONSTANTS import sub_fund_4_headers
-        
         if not hasattr(self, 'loader_data') or not self.loader_data:
             messagebox.showinfo("Nothing to export", "Process files first to generate template data.")
             return
@@ -1775,92 +1865,26 @@ class ASIOSubFund4Page(tk.Frame):
         # Show spinner (non-blocking)
         loader = LoadingSpinner(self, text="Exporting templates...")
 
+        export_excel = self.export_excel_var.get()
+        export_csv = self.export_csv_var.get()
+
         def task():
             try:
-                excel_files = []
-                csv_files = []
+                # One file per trading code; Excel files first, then the CSVs
+                output_jobs = self._output_jobs_for_zip(self.loader_data, event_date_str, zip_filename,
+                                                        export_excel=export_excel, export_csv=export_csv)
+                output_jobs.sort(key=lambda job: job[1][2].endswith(".csv"))
                 
-                # Create files for each trading code
-                for trading_code, data_list in sorted(self.loader_data.items()):
-                    if not data_list:
-                        continue
-                    
-                    # Convert list of lists to list of dicts
-                    # Each row in data_list is a list matching sub_fund_4_headers order
-                    template_data_dicts = []
-                    for row in data_list:
-                        row_dict = {}
-                        for idx, header in enumerate(sub_fund_4_headers):
-                            if idx < len(row):
-                                row_dict[header] = row[idx]
-                            else:
-                                row_dict[header] = ''
-                        template_data_dicts.append(row_dict)
-                    
-                    if not template_data_dicts:
-                        continue
-                    
-                    # Create Excel file if Excel format is selected
-                    if self.export_excel_var.get():
-                        excel_filename = f"ASIO_SF4_{trading_code}_{event_date_str}.xlsx"
-                        excel_file, excel_name = output_save_in_template(
-                            template_data_dicts,
-                            sub_fund_4_headers,
-                            excel_filename
-                        )
-                        excel_files.append((excel_file, excel_name))
-                    
-                    # Create CSV file if CSV format is selected
-                    if self.export_csv_var.get():
-                        csv_filename = f"ASIO_SF4_{trading_code}_{event_date_str}.csv"
-                        # Create CSV in memory
-                        csv_buffer = io.StringIO()
-                        csv_writer = csv.DictWriter(csv_buffer, fieldnames=sub_fund_4_headers)
-                        csv_writer.writeheader()
-                        csv_writer.writerows(template_data_dicts)
-                        csv_content = csv_buffer.getvalue()
-                        csv_buffer.close()
-                        
-                        # Convert to bytes
-                        csv_bytes = io.BytesIO(csv_content.encode('utf-8'))
-                        csv_files.append((csv_bytes, csv_filename))
-                
-                if not excel_files and not csv_files:
+                if not output_jobs:
                     loader.close()
                     messagebox.showwarning("Warning", "No template data to export.")
                     return
                 
-                # Create zip file with all files
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    # Add Excel files
-                    for excel_file, excel_name in excel_files:
-                        excel_file.seek(0)
-                        zip_file.writestr(excel_name, excel_file.read())
-                    
-                    # Add CSV files
-                    for csv_file, csv_name in csv_files:
-                        csv_file.seek(0)
-                        zip_file.writestr(csv_name, csv_file.read())
-                
-                # Save zip file
-                zip_buffer.seek(0)
-                with open(out_path, 'wb') as f:
-                    f.write(zip_buffer.read())
-                
-                # Close all file buffers
-                for excel_file, _ in excel_files:
-                    excel_file.close()
-                for csv_file, _ in csv_files:
-                    csv_file.close()
-                zip_buffer.close()
+                # Write the zip straight to disk; CSVs stream into their members
+                self._save_output_zip(output_jobs, out_path)
                 
                 # Create file list for message
-                file_list = []
-                if excel_files:
-                    file_list.extend([name for _, name in excel_files])
-                if csv_files:
-                    file_list.extend([name for _, name in csv_files])
+                file_list = [args[2] for _, args in output_jobs]
                 
                 loader.close()
                 
@@ -1,45 +1,20 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import filedialog, messagebox
 import os
 import json
 import zipfile
-from datetime import datetime
 from decimal import Decimal
 import threading
 
 from my_app.pages.loading import LoadingSpinner
+from my_app.pages.search_filter import DebouncedSearch
+from my_app.pages.virtual_table import VirtualTable
 
 # LAZY IMPORTS - Heavy libraries imported only when needed (in methods)
 # This speeds up frame opening significantly
 # pandas, openpyxl, and CONSTANTS will be imported in _process() method when actually needed
 
 
-def _safe_decimal(value, precision=15):
-    """Safely convert value to Decimal with specified precision, handling None and empty strings.
-    
-    Args:
-        value: Value to convert to Decimal
-        precision: Number of decimal places to maintain (default: 15)
-    
-    Returns:
-        Decimal: Decimal value with specified precision (up to 15 decimal places)
-    """
-    from decimal import getcontext
-    # Set precision context to ensure we can handle up to 15 decimal places
-    getcontext().prec = 28  # Set precision high enough to handle 15 decimal places accurately
-    
-    if value in [None, ""]:
-        return Decimal("0")
-    
-    cleaned = str(value).replace(",", "").strip()
-    try:
-        decimal_val = Decimal(cleaned)
-        # Normalize to remove trailing zeros but preserve precision
-        return decimal_val.normalize()
-    except Exception:
-        return Decimal("0")
-
-
 def _format_date(date_str: str):
     """Format date string from one format to another.
     
@@ -49,7 +24,10 @@ def _format_date(date_str: str):
     Returns:
         tuple: (yyyymmdd, mm-dd-YYYY) formats
     """
-    date_obj = datetime.strptime(date_str, '%d%b%y')
+    from .date_utils import parse_date
+    date_obj = parse_date(date_str, formats=('%d%b%y',))
+    if date_obj is None:
+        raise ValueError(f"time data '{date_str}' does not match format '%d%b%y'")
     yyyymmdd = date_obj.strftime('%Y%m%d')
     mm_dd_yyyy = date_obj.strftime('%m-%d-%Y')
     return yyyymmdd, mm_dd_yyyy
@@ -83,6 +61,7 @@ class ASIOTradeLoaderPage(tk.Frame):
         tk.Label(bhavcopy_file_row, text="Bhavcopy File:", font=("Arial", 11), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
         tk.Entry(bhavcopy_file_row, textvariable=self.bhavcopy_path_var, width=60).pack(side="left", padx=8)
         tk.Button(bhavcopy_file_row, text="Browse", command=self._browse_bhavcopy, bg="#3498db", fg="white", relief="flat", padx=10, pady=4).pack(side="left")
+        tk.Button(bhavcopy_file_row, text="From Repository", command=self._choose_repository_bhavcopy, bg="#8e44ad", fg="white", relief="flat", padx=10, pady=4).pack(side="left", padx=(6, 0))
 
         # Format selection row
         format_row = tk.Frame(controls, bg="#ecf0f1")
@@ -132,7 +111,7 @@ class ASIOTradeLoaderPage(tk.Frame):
         
         # Search box
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *_: self._render_table())
+        DebouncedSearch(self, self.search_var, lambda _term: self._render_table())
         search_box = tk.Frame(header, bg="#ecf0f1")
         search_box.pack(side="right", padx=(0, 18))
         tk.Label(search_box, text="Search:", font=("Arial", 10), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
@@ -148,7 +127,8 @@ class ASIOTradeLoaderPage(tk.Frame):
             "Securitiy Nmaes", "UnderlyingInvestment", "StrikePrice",
             "Option/Future Type", "PutCallFlag", "ExpireDate"
         )
-        self.tree = ttk.Treeview(table_frame, columns=self.table_columns, show="headings", height=12)
+        self.table = VirtualTable(table_frame, columns=self.table_columns, height=12)
+        self.tree = self.table.tree
         # Column widths - adjust based on content
         column_widths = {
             "Date": 100,
@@ -167,13 +147,7 @@ class ASIOTradeLoaderPage(tk.Frame):
         for col in self.table_columns:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=column_widths.get(col, 120), anchor="w")
-        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        x_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
-        # Grid layout so the bottom scrollbar spans full width
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        y_scroll.grid(row=0, column=1, sticky="ns")
-        x_scroll.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.table.grid(row=0, column=0, sticky="nsew")
         table_frame.rowconfigure(0, weight=1)
         table_frame.columnconfigure(0, weight=1)
 
@@ -217,15 +191,25 @@ class ASIOTradeLoaderPage(tk.Frame):
         if path:
             self.bhavcopy_path_var.set(path)
 
+    def _choose_repository_bhavcopy(self):
+        """Use the equity bhavcopy for a date from the local repository (downloading it if needed)."""
+        from my_app.pages.bhavcopy_repository import choose_repository_bhavcopy
+
+        choose_repository_bhavcopy(self, "CM", self.bhavcopy_path_var.set)
+
     # ---- Core processing ----
     def _process(self):
-        """Process the file (CSV/XLS/XLSX) and populate table."""
+        """Process the file (CSV/XLS/XLSX) and populate table.
+
+        Reading and processing run in a background job (see job_runner); the
+        table is filled on the Tk thread when the job finishes.
+        """
         # Lazy import heavy libraries only when processing (speeds up frame opening)
         from .helper import read_file
+        from .job_runner import run_page_job
         
         # Clear table
-        for it in self.tree.get_children():
-            self.tree.delete(it)
+        self.table.clear()
         self.all_table_rows = []
         self.unique_table_rows = []
         self._template_data_1 = []
@@ -258,110 +242,155 @@ class ASIOTradeLoaderPage(tk.Frame):
         if not file_path or not os.path.exists(file_path):
             messagebox.showwarning("File Missing", "Please select a valid Trade file (CSV/XLS/XLSX).")
             return
-
-        # Read bhavcopy file if provided
-        df_bhavcopy = None
+        # Without a bhavcopy, tickers are mapped to ISINs from the bhavcopy price store
         bhavcopy_path = self.bhavcopy_path_var.get().strip()
-        if bhavcopy_path and os.path.exists(bhavcopy_path):
+
+        def work(job):
+            # Read bhavcopy file if provided
+            df_bhavcopy = None
+            if bhavcopy_path and os.path.exists(bhavcopy_path):
+                job.stage("Reading bhavcopy", unit="files")
+                try:
+                    # Read bhavcopy file - adjust parameters based on file format
+                    df_bhavcopy = read_file(
+                        file_path=bhavcopy_path,
+                        sheet_name=0,   # Always first sheet
+                        start_row=0,    # Start from first row (adjust if needed)
+                        header=True,
+                        skip_blank_rows=False
+                    )
+                    # Clean headers (strip whitespace)
+                    df_bhavcopy.columns = df_bhavcopy.columns.str.strip()
+                    
+                    # Validate bhavcopy: Check if "Sgmt" column contains "FO"
+                    if not df_bhavcopy.empty:
+                        # Check if "Sgmt" column exists (case-insensitive)
+                        sgmt_col = None
+                        for col in df_bhavcopy.columns:
+                            if col.strip().upper() == 'SGMT':
+                                sgmt_col = col
+                                break
+                        
+                        if sgmt_col:
+                            # Check if any row has "FO" in Sgmt column
+                            if df_bhavcopy[sgmt_col].astype(str).str.strip().str.upper().isin(['FO']).any():
+                                filename = os.path.basename(bhavcopy_path)
+                                job.call_ui(
+                                    messagebox.showwarning,
+                                    "Wrong Bhavcopy File",
+                                    f"Warning: The selected bhavcopy file '{filename}' contains 'FO' in the 'Sgmt' column.\n\n"
+                                    "This is the wrong bhavcopy file. Please attach equity bhavcopy file."
+                                )
+                except Exception as e:
+                    job.call_ui(messagebox.showwarning, "Warning", f"Failed to read Bhavcopy file: {e}\nContinuing without bhavcopy data.")
+                    df_bhavcopy = None
+
+            job.stage("Reading trade file", unit="files")
             try:
-                # Read bhavcopy file - adjust parameters based on file format
-                df_bhavcopy = read_file(
-                    file_path=bhavcopy_path,
+                # Use read_file helper function to support CSV, XLS, and XLSX
+                # Read from row 11 (0-based, so row 12 in Excel) - no end_row needed, reads until end naturally
+                df_data = read_file(
+                    file_path=file_path,
                     sheet_name=0,   # Always first sheet
-                    start_row=0,    # Start from first row (adjust if needed)
+                    start_row=11,   # Row 12 becomes header (0-based index)
                     header=True,
                     skip_blank_rows=False
                 )
+
+                # Keep only B → end (skip column A)
+                df_data = df_data.iloc[:, 1:]
+                
                 # Clean headers (strip whitespace)
-                df_bhavcopy.columns = df_bhavcopy.columns.str.strip()
+                df_data.columns = df_data.columns.str.strip()
                 
-                # Validate bhavcopy: Check if "Sgmt" column contains "FO"
-                if not df_bhavcopy.empty:
-                    # Check if "Sgmt" column exists (case-insensitive)
-                    sgmt_col = None
-                    for col in df_bhavcopy.columns:
-                        if col.strip().upper() == 'SGMT':
-                            sgmt_col = col
-                            break
-                    
-                    if sgmt_col:
-                        # Check if any row has "FO" in Sgmt column
-                        if df_bhavcopy[sgmt_col].astype(str).str.strip().str.upper().isin(['FO']).any():
-                            filename = os.path.basename(bhavcopy_path)
-                            messagebox.showwarning(
-                                "Wrong Bhavcopy File",
-                                f"Warning: The selected bhavcopy file '{filename}' contains 'FO' in the 'Sgmt' column.\n\n"
-                                "This is the wrong bhavcopy file. Please attach equity bhavcopy file."
-                            )
-            except Exception as e:
-                messagebox.showwarning("Warning", f"Failed to read Bhavcopy file: {e}\nContinuing without bhavcopy data.")
-                df_bhavcopy = None
-
-        try:
-            # Use read_file helper function to support CSV, XLS, and XLSX
-            # Read from row 11 (0-based, so row 12 in Excel) - no end_row needed, reads until end naturally
-            df_data = read_file(
-                file_path=file_path,
-                sheet_name=0,   # Always first sheet
-                start_row=11,   # Row 12 becomes header (0-based index)
-                header=True,
-                skip_blank_rows=False
-            )
+                # Filter rows where Date exists (not empty/NaN)
+                # Try to find Date column (case-insensitive, handle variations)
+                date_col = None
+                for col in df_data.columns:
+                    if col.strip().lower() == 'date':
+                        date_col = col
+                        break
+                
+                if date_col:
+                    # Keep only rows where Date is not empty/NaN
+                    df_data = df_data[df_data[date_col].notna() & (df_data[date_col].astype(str).str.strip() != '')]
+                else:
+                    # If Date column not found, show warning but continue
+                    job.call_ui(messagebox.showwarning, "Warning", "Date column not found. Processing all rows.")
+                
+                # Reset index after filtering
+                df_data = df_data.reset_index(drop=True)
 
-            # Keep only B → end (skip column A)
-            df_data = df_data.iloc[:, 1:]
-            
-            # Clean headers (strip whitespace)
-            df_data.columns = df_data.columns.str.strip()
-            
-            # Filter rows where Date exists (not empty/NaN)
-            # Try to find Date column (case-insensitive, handle variations)
-            date_col = None
-            for col in df_data.columns:
-                if col.strip().lower() == 'date':
-                    date_col = col
-                    break
+            except Exception as e:
+                job.call_ui(messagebox.showerror, "Error", f"Failed to read file: {e}")
+                return None
             
-            if date_col:
-                # Keep only rows where Date is not empty/NaN
-                df_data = df_data[df_data[date_col].notna() & (df_data[date_col].astype(str).str.strip() != '')]
+            # Process data - placeholder function, logic to be implemented
+            processed = self._process_data(
+                df_data, asio_sf_2_trade_loader, asio_sf_2_option_security, asio_sf_2_future_security, fno_tm_code_with_tm_name, df_bhavcopy,
+                job=job
+            )
+            return df_data, df_bhavcopy, processed
+
+        def show_result(result):
+            if result is None:
+                return
+            df_data, df_bhavcopy, processed = result
+            left_table_data, right_table_data, asio_sub_fund_2_future, asio_sub_fund_2_option, template_data_3 = processed
+
+            # Persist in instance and render
+            self._df_data = df_data
+            self._df_bhavcopy = df_bhavcopy  # Store bhavcopy data for later use
+            self.all_table_rows = left_table_data  # All records
+            self.unique_table_rows = right_table_data  # Unique records
+            self.asio_sub_fund_2_future = asio_sub_fund_2_future
+            self.asio_sub_fund_2_option = asio_sub_fund_2_option
+            self._template_data_3 = template_data_3
+
+            self._render_table()
+
+            # Show the checkbox when data is loaded
+            if len(self.all_table_rows) > 0:
+                self.checkbox_frame.pack(side="left", padx=(15, 0))
             else:
-                # If Date column not found, show warning but continue
-                messagebox.showwarning("Warning", "Date column not found. Processing all rows.")
-            
-            # Reset index after filtering
-            df_data = df_data.reset_index(drop=True)
+                self.checkbox_frame.pack_forget()
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to read file: {e}")
-            return
-        
-        # Process data - placeholder function, logic to be implemented
-        left_table_data, right_table_data, asio_sub_fund_2_future, asio_sub_fund_2_option, template_data_3 = self._process_data(
-            df_data, asio_sf_2_trade_loader, asio_sf_2_option_security, asio_sf_2_future_security, fno_tm_code_with_tm_name, df_bhavcopy
-        )
+            # Update status based on checkbox state
+            self._update_status()
 
-        # Persist in instance and render
-        self._df_data = df_data
-        self._df_bhavcopy = df_bhavcopy  # Store bhavcopy data for later use
-        self.all_table_rows = left_table_data  # All records
-        self.unique_table_rows = right_table_data  # Unique records
-        self.asio_sub_fund_2_future = asio_sub_fund_2_future
-        self.asio_sub_fund_2_option = asio_sub_fund_2_option
-        self._template_data_3 = template_data_3
+        run_page_job(self, work, show_result, text="Processing trades...", status_var=self.status_var)
 
-        self._render_table()
+    def _ticker_isin_dict(self, df_data, df_bhavcopy):
+        """Map the trades' UnderlyingCode tickers to ISINs through the bhavcopy price store.
 
-        # Show the checkbox when data is loaded
-        if len(self.all_table_rows) > 0:
-            self.checkbox_frame.pack(side="left", padx=(15, 0))
-        else:
-            self.checkbox_frame.pack_forget()
+        Only the bhavcopy chosen on the page (a file, or one picked with "From
+        Repository") is used; without one there is no mapping.
 
-        # Update status based on checkbox state
-        self._update_status()
+        Args:
+            df_data (pd.DataFrame): Trade file data
+            df_bhavcopy (pd.DataFrame | None): Equity bhavcopy chosen on the page
+
+        Returns:
+            dict: ticker -> ISIN for the tickers found (empty if none are)
+        """
+        from my_app.pages.bhavcopy_store import get_store
+
+        if 'UnderlyingCode' not in df_data.columns or df_bhavcopy is None or df_bhavcopy.empty:
+            return {}
+        tickers = df_data['UnderlyingCode'].dropna().astype(str).str.strip().unique()
+        try:
+            store = get_store()
+            # The chosen bhavcopy is authoritative: use its own date only
+            trade_dates = store.ingest_frame(df_bhavcopy, "CM")
+            if not trade_dates:
+                return {}
+            return store.symbol_isins(tickers, as_of=trade_dates[-1], exact=True)
+        except Exception as e:
+            # If mapping fails, continue without it
+            print(f"Warning: Could not map tickers to ISINs: {e}")
+            return {}
 
-    def _process_data(self, df_data, asio_sf_2_trade_loader, asio_sf_2_option_security, asio_sf_2_future_security, fno_tm_code_with_tm_name, df_bhavcopy=None):
+    def _process_data(self, df_data, asio_sf_2_trade_loader, asio_sf_2_option_security, asio_sf_2_future_security, fno_tm_code_with_tm_name, df_bhavcopy=None, job=None):
         """
         Process file data and generate table data and template data.
         
@@ -372,6 +401,7 @@ class ASIOTradeLoaderPage(tk.Frame):
             asio_sf_2_future_security: Future security configuration
             fno_tm_code_with_tm_name: TM code to TM name mapping
             df_bhavcopy: Optional DataFrame from bhavcopy file (CSV/XLS/XLSX)
+            job: Optional JobContext for progress reporting and cancellation
         
         Returns:
             tuple: (left_table_data, right_table_data, template_data_1, template_data_2, template_data_3)
@@ -394,17 +424,6 @@ class ASIOTradeLoaderPage(tk.Frame):
         asio_sub_fund_2_option = []
         template_data_3 = []
         
-        # Create ticker to ISIN mapping from bhavcopy file if available
-        ticker_isin_dict = {}
-        if df_bhavcopy is not None and not df_bhavcopy.empty:
-            try:
-                # Check if required columns exist
-                if 'TckrSymb' in df_bhavcopy.columns and 'ISIN' in df_bhavcopy.columns:
-                    ticker_isin_dict = dict(zip(df_bhavcopy['TckrSymb'], df_bhavcopy['ISIN']))
-            except Exception as e:
-                # If mapping fails, continue without it
-                ticker_isin_dict = {}
-        
         # Group data by TM code with TM_NAME_HEADERS structure
         data_by_tm_code = {}  # {tm_code: [list of dicts matching TM_NAME_HEADERS]}
         
@@ -413,8 +432,36 @@ class ASIOTradeLoaderPage(tk.Frame):
         # Track unique security names for option data
         seen_option_securities = set()
         
+        # Parse the whole Price column once as exact fixed-point; rows carry its
+        # values and the writers convert them to text/Decimal when they are exported
+        from .fixed_point import FixedPointColumn
+        if 'Price' in df_data.columns:
+            price_column = FixedPointColumn.parse(df_data['Price'])
+        else:
+            price_column = FixedPointColumn.zeros(len(df_data))
+        
+        # Date columns (dd-mm-yyyy) parsed once through the shared date module
+        from .date_utils import parse_date_column
+        
+        def parsed_dates(col):
+            values = df_data[col] if col in df_data.columns else pd.Series([''] * len(df_data), dtype=object)
+            return parse_date_column(values, formats=("%d-%m-%Y",))
+        
+        expiry_parsed, _ = parsed_dates('ExpiryDate')
+        expiry_yyyymmdd = expiry_parsed.dt.strftime("%Y%m%d").fillna('').tolist()
+        expiry_mm_dd_yyyy = expiry_parsed.dt.strftime("%m-%d-%Y").fillna('').tolist()
+        trade_date_parsed, trade_date_rejected = parsed_dates('Date')
+        trade_date_mm_dd_yyyy = trade_date_parsed.dt.strftime("%m-%d-%Y").fillna('').tolist()
+        
+        ticker_isin_dict = self._ticker_isin_dict(df_data, df_bhavcopy)
+        
         # Process each row in the file
+        total_rows = len(df_data)
+        if job is not None:
+            job.stage("Processing trades", total=total_rows)
         for idx, row in df_data.iterrows():
+            if job is not None:
+                job.progress(idx + 1, total_rows)
             # Extract values for each column (handle missing values)
             def safe_get(col, default=''):
                 """Safely get value from row, handling missing columns"""
@@ -432,9 +479,8 @@ class ASIOTradeLoaderPage(tk.Frame):
                 qty_val = int(float(qty_str))
             except:
                 qty_val = 0
-            # Handle price - convert to Decimal with 15 digit precision
-            price_str = safe_get('Price', '')
-            price_val = _safe_decimal(price_str, precision=15)
+            # Price from the pre-parsed fixed-point column (exact decimal precision)
+            price_val = price_column.item(idx)
             tm_code_val = safe_get('TMCode', '')
             
             # Look up TM name from fno_tm_code_with_tm_name
@@ -472,16 +518,9 @@ class ASIOTradeLoaderPage(tk.Frame):
             option_future_val = safe_get('OptionType', '')
             expire_date_val = safe_get('ExpiryDate', '')
             
-            from datetime import datetime
-            # Parse date from format '28-10-2025' (dd-mm-yyyy)
-            try:
-                date_obj = datetime.strptime(expire_date_val, "%d-%m-%Y")
-                expire_date_formatted = date_obj.strftime("%Y%m%d")
-                mm_dd_yyyy = date_obj.strftime("%m-%d-%Y")
-                expiry_date = mm_dd_yyyy + ' 23:59:59'
-            except:
-                expire_date_formatted = ''
-                expiry_date = ''
+            # Expiry date pre-parsed from format '28-10-2025' (dd-mm-yyyy)
+            expire_date_formatted = expiry_yyyymmdd[idx]
+            expiry_date = expiry_mm_dd_yyyy[idx] + ' 23:59:59' if expire_date_formatted else ''
             option_future_first_char = option_future_val[0] if option_future_val else ''
 
             security_name_val = f"NSE{underlying_val}{expire_date_formatted}{option_future_first_char}{strike_price_val}"
@@ -590,11 +629,12 @@ class ASIOTradeLoaderPage(tk.Frame):
                 row_dict = {}
 
                 if date_val:
-                    # Parse the input (DD-MM-YYYY)
-                    dt = datetime.strptime(date_val, "%d-%m-%Y")
+                    # Date column was parsed once as DD-MM-YYYY
+                    if trade_date_rejected[idx]:
+                        raise ValueError(f"time data '{date_val}' does not match format '%d-%m-%Y'")
 
-                    # Convert to MM-DD-YYYY
-                    formatted_date = dt.strftime("%m-%d-%Y")
+                    # MM-DD-YYYY
+                    formatted_date = trade_date_mm_dd_yyyy[idx]
                 
                 for header in TM_NAME_HEADERS:
                     # Get mapping from asio_sf_2_trade_loader (maps header to file column name)
@@ -639,11 +679,7 @@ class ASIOTradeLoaderPage(tk.Frame):
     # ---- Rendering with filtering ----
     def _render_table(self):
         """Render table with search filtering. Shows unique or all data based on checkbox."""
-        # Clear table
-        for it in self.tree.get_children():
-            self.tree.delete(it)
-        
-        term = (self.search_var.get() if hasattr(self, 'search_var') else "").lower().strip()
+        term = self.search_var.get() if hasattr(self, 'search_var') else ""
         
         # Choose data source based on checkbox state
         if self.unique_checkbox_var.get():
@@ -653,9 +689,8 @@ class ASIOTradeLoaderPage(tk.Frame):
             # Show all data
             data_source = self.all_table_rows
         
-        for r in data_source:
-            if not term or term in " ".join(map(str, r)).lower():
-                self.tree.insert("", "end", values=r)
+        # Only the visible rows are materialized in the Treeview
+        self.table.show(data_source, term)
     
     def _on_checkbox_toggle(self):
         """Callback when checkbox is toggled - refresh table display."""
@@ -674,6 +709,7 @@ class ASIOTradeLoaderPage(tk.Frame):
     def _export_excel(self):
         """Export data to Excel and/or CSV file based on format selection."""
         import pandas as pd
+        from .fixed_point import FixedPointValue
         from openpyxl.styles import Font, Border
         
         if not self.all_table_rows and not self.unique_table_rows:
@@ -719,6 +755,12 @@ class ASIOTradeLoaderPage(tk.Frame):
                     initialfile=f"ASIOTradeLoader_Output_{data_type}.xlsx"
                 )
                 if out_path:
+                    # Fixed-point prices become Decimals so Excel gets numeric cells
+                    if "Price" in df_table.columns:
+                        df_table["Price"] = [
+                            value.to_decimal() if isinstance(value, FixedPointValue) else value
+                            for value in df_table["Price"]
+                        ]
                     with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
                         (df_data if df_data is not None else pd.DataFrame()).to_excel(writer, sheet_name="Original_Data", index=False)
                         ws_orig = writer.book["Original_Data"]
@@ -737,7 +779,7 @@ class ASIOTradeLoaderPage(tk.Frame):
     def _export_to_template(self):
         """Export data to template format (ZIP with Excel/CSV files grouped by TM code)."""
         from CONSTANTS import TM_NAME_HEADERS, ASIO_SUB_FUND_2_OPTION_SECURITY_HEADER
-        from .helper import output_save_in_template, output_save_in_template_csv, multiple_files_to_zip
+        from .helper import output_save_in_template, output_save_in_template_csv
         
         if not hasattr(self, 'data_by_tm_code') or not self.data_by_tm_code:
             messagebox.showinfo("Nothing to export", "Process a file first to generate template data.")
@@ -767,63 +809,59 @@ class ASIOTradeLoaderPage(tk.Frame):
 
         def task():
             try:
-                files = []
-                from .helper import convert_dates_for_csv
+                from .export_executor import write_export_files, csv_with_converted_dates
+                from .zip_sink import ZipSink
+                jobs = []
                 
-                # Helper function to create files
+                # Helper function to queue one file per TM code plus the security files
                 def create_files(format_type, ext, func):
                     file_list = []
                     # Create files for each TM code
                     for tm_code, data_list in self.data_by_tm_code.items():
                         if data_list:
-                            # Convert dates for CSV format
-                            processed_data = convert_dates_for_csv(data_list) if format_type == "CSV" else data_list
-                            file_io, file_name = func(
-                                processed_data, TM_NAME_HEADERS,
+                            # CSV dates are converted while the rows are written
+                            builder = csv_with_converted_dates if format_type == "CSV" else func
+                            file_list.append((builder, (
+                                data_list, TM_NAME_HEADERS,
                                 f"TM_{tm_code}_template{ext}"
-                            )
-                            file_list.append((file_io, file_name))
+                            )))
                     
                     # Create option security file
                     if hasattr(self, 'asio_sub_fund_2_option') and self.asio_sub_fund_2_option:
                         processed_data = self.asio_sub_fund_2_option
-                        file_io, file_name = func(
+                        file_list.append((func, (
                             processed_data, ASIO_SUB_FUND_2_OPTION_SECURITY_HEADER,
                             f"ASIO_Sub_Fund_2_Option_Security{ext}"
-                        )
-                        file_list.append((file_io, file_name))
+                        )))
                     
                     # Create future security file
                     if hasattr(self, 'asio_sub_fund_2_future') and self.asio_sub_fund_2_future:
                         processed_data = self.asio_sub_fund_2_future
-                        file_io, file_name = func(
+                        file_list.append((func, (
                             processed_data, ASIO_SUB_FUND_2_OPTION_SECURITY_HEADER,
                             f"ASIO_Sub_Fund_2_Future_Security{ext}"
-                        )
-                        file_list.append((file_io, file_name))
+                        )))
                     return file_list
                 
                 # Export CSV if selected
                 if export_csv:
-                    files.extend(create_files("CSV", ".csv", output_save_in_template_csv))
+                    jobs.extend(create_files("CSV", ".csv", output_save_in_template_csv))
                 
                 # Export XLSX if selected
                 if export_xlsx:
-                    files.extend(create_files("XLSX", ".xlsx", output_save_in_template))
+                    jobs.extend(create_files("XLSX", ".xlsx", output_save_in_template))
                 
-                if not files:
+                if not jobs:
                     loader.close()
                     messagebox.showwarning("Warning", "No data to export.")
                     return
                 
-                # Create zip file
-                zip_buffer = multiple_files_to_zip(files, "FNO_ASIO_SF2_TradeLoader.zip")
-                
-                # Save zip file
-                with open(out_path, 'wb') as f:
-                    f.write(zip_buffer.read())
+                # CSVs stream straight into the zip on disk; XLSX files are built across
+                # the process pool meanwhile and added as they arrive (ZIP order follows job order)
+                with ZipSink(out_path) as sink:
+                    write_export_files(jobs, sink)
                 
-                file_list = [name for _, name in files]
+                file_list = list(sink.names)
                 loader.close()
                 
                 email_zip_path = out_path
@@ -1,14 +1,11 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
-import threading
 from datetime import datetime, date, timedelta
 from tkcalendar import DateEntry
 
-from my_app.pages.loading import LoadingSpinner
-
 # LAZY IMPORTS - Heavy libraries imported only when needed
-# pandas, requests, zipfile will be imported in download methods
+# pandas, requests, zipfile are imported by the bhavcopy repository when downloading
 
 
 class BhavcopyDownloaderPage(tk.Frame):
@@ -36,6 +33,32 @@ class BhavcopyDownloaderPage(tk.Frame):
         controls = tk.Frame(controls_card, bg="white")
         controls.pack(fill="both", expand=True, padx=25, pady=35)
 
+        # Segment selection
+        segment_row = tk.Frame(controls, bg="white")
+        segment_row.pack(fill="x", pady=(0, 10))
+        tk.Label(
+            segment_row,
+            text="📊 Segment:",
+            font=("Arial", 12, "bold"),
+            bg="white",
+            fg="#2c3e50",
+            width=15,
+            anchor="w"
+        ).pack(side="left", padx=(0, 10))
+        self.segment_var = tk.StringVar(value="CM")
+        for segment_text, segment_value in (("Equity (CM)", "CM"), ("F&O (FO)", "FO")):
+            tk.Radiobutton(
+                segment_row,
+                text=segment_text,
+                variable=self.segment_var,
+                value=segment_value,
+                font=("Arial", 11),
+                bg="white",
+                fg="#2c3e50",
+                selectcolor="white",
+                activebackground="white"
+            ).pack(side="left", padx=5)
+
         # Checkbox for date range
         checkbox_row = tk.Frame(controls, bg="white")
         checkbox_row.pack(fill="x", pady=(0, 10))
@@ -192,6 +215,17 @@ class BhavcopyDownloaderPage(tk.Frame):
         )
         browse_btn.pack(side="left", padx=5)
 
+        path_hint = tk.Label(
+            controls,
+            text="Optional: downloads are always kept in the app's bhavcopy repository; "
+                 "a copy of each CSV is also saved here.",
+            font=("Arial", 9),
+            bg="white",
+            fg="#7f8c8d",
+            anchor="w"
+        )
+        path_hint.pack(fill="x")
+
         # Download Button Row
         button_row = tk.Frame(controls, bg="white")
         button_row.pack(fill="x", pady=(20, 10))
@@ -242,10 +276,6 @@ class BhavcopyDownloaderPage(tk.Frame):
         # Configure text tags for formatting
         self.status_text.tag_config("success", font=("Arial", 11, "bold"), foreground="#27ae60")
 
-        # Data holders
-        self.loading_spinner = None
-        self.download_thread = None
-
     def _toggle_date_range(self):
         """Show/hide date range fields based on checkbox state"""
         if self.date_range_var.get():
@@ -285,12 +315,9 @@ class BhavcopyDownloaderPage(tk.Frame):
         self.status_text.see(tk.END)
 
     def _download_bhavcopy(self):
-        """Start download in a separate thread"""
+        """Validate the inputs and start the download job"""
         save_path = self.save_path_var.get().strip()
-        
-        if not save_path:
-            messagebox.showerror("Error", "Please select a folder to save the bhavcopy.")
-            return
+        segment = self.segment_var.get()
 
         today = date.today()
         
@@ -318,30 +345,6 @@ class BhavcopyDownloaderPage(tk.Frame):
                 )
                 if not response:
                     return
-            
-            # Create save directory if it doesn't exist
-            try:
-                os.makedirs(save_path, exist_ok=True)
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to create directory: {str(e)}")
-                return
-
-            # Disable download button
-            self.download_btn.config(state="disabled")
-            
-            # Clear previous status
-            self._update_status("Downloading...", is_success=False)
-            
-            # Show loading spinner
-            self.loading_spinner = LoadingSpinner(self, text="Downloading Bhavcopy Range...")
-            
-            # Start download thread for date range
-            self.download_thread = threading.Thread(
-                target=self._download_range_worker,
-                args=(from_date, to_date, save_path),
-                daemon=True
-            )
-            self.download_thread.start()
         else:
             # Single date download
             selected_date = self.date_entry.get_date()
@@ -362,409 +365,169 @@ class BhavcopyDownloaderPage(tk.Frame):
                 if not response:
                     return
 
-            # Create save directory if it doesn't exist
+        # Create save directory if it doesn't exist
+        if save_path:
             try:
                 os.makedirs(save_path, exist_ok=True)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to create directory: {str(e)}")
                 return
 
-            # Disable download button
-            self.download_btn.config(state="disabled")
-            
-            # Clear previous status
-            self._update_status("Downloading...", is_success=False)
-            
-            # Show loading spinner
-            self.loading_spinner = LoadingSpinner(self, text="Downloading Bhavcopy...")
-            
-            # Start download thread
-            self.download_thread = threading.Thread(
-                target=self._download_worker,
-                args=(selected_date, save_path),
-                daemon=True
+        # Disable download button
+        self.download_btn.config(state="disabled")
+        
+        # Clear previous status
+        self._update_status("Downloading...", is_success=False)
+
+        if self.date_range_var.get():
+            self._start_download(
+                lambda job: self._download_range_worker(job, from_date, to_date, segment, save_path),
+                text="Downloading Bhavcopy Range...",
+            )
+        else:
+            self._start_download(
+                lambda job: self._download_worker(job, selected_date, segment, save_path),
+                text="Downloading Bhavcopy...",
             )
-            self.download_thread.start()
 
-    def _download_worker(self, target_date, save_path):
-        """Worker thread for downloading bhavcopy"""
-        try:
-            # Import heavy libraries here (lazy import)
-            import pandas as pd
-            import requests
-            import zipfile
-
-            def get_user_friendly_error(status_code, failure_reason):
-                """Convert technical error messages to user-friendly ones"""
-                # Handle HTTP status codes
-                if status_code == 404:
-                    return "holiday/invalid date"
-                elif status_code == 403:
-                    return "access denied"
-                elif status_code == 500:
-                    return "server error"
-                elif status_code and status_code != 200:
-                    return f"HTTP error ({status_code})"
-                
-                # Handle failure reason strings
-                if failure_reason:
-                    failure_lower = failure_reason.lower()
-                    if "404" in failure_reason or "not found" in failure_lower:
-                        return "holiday/invalid date"
-                    elif "403" in failure_reason or "forbidden" in failure_lower:
-                        return "access denied"
-                    elif "500" in failure_reason or "server error" in failure_lower:
-                        return "server error"
-                    elif "not a valid zip file" in failure_lower or "invalid zip file" in failure_lower:
-                        return "holiday/invalid date"
-                    elif "empty or invalid response" in failure_lower:
-                        return "holiday/invalid date"
-                    elif "http" in failure_lower:
-                        # Extract status code from HTTP error message
-                        if "404" in failure_reason:
-                            return "holiday/invalid date"
-                        elif "403" in failure_reason:
-                            return "access denied"
-                        elif "500" in failure_reason:
-                            return "server error"
-                
-                return failure_reason if failure_reason else "failed to get bhavcopy"
-
-            # Format: BhavCopy_NSE_CM_0_0_0_YYYYMMDD_F_0000.csv.zip
-            date_str = target_date.strftime("%Y%m%d")
-            filename = f"BhavCopy_NSE_CM_0_0_0_{date_str}_F_0000.csv.zip"
-            url = f"https://nsearchives.nseindia.com/content/cm/{filename}"
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': '*/*',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Referer': 'https://www.nseindia.com/'
-            }
-            
-            download_failed = False
-            failure_reason = ""
-            
-            try:
-                # Download ZIP file
-                response = requests.get(url, headers=headers, timeout=30)
-                
-                if response.status_code == 200:
-                    # Check if response content is valid (not empty and not an error page)
-                    if len(response.content) < 100:  # Very small files are likely errors
-                        download_failed = True
-                        failure_reason = get_user_friendly_error(200, "empty or invalid response")
-                    # Check if it's an HTML error page (common for 404s that return 200)
-                    elif b'<html' in response.content[:500].lower() or b'<!doctype' in response.content[:500].lower():
-                        download_failed = True
-                        failure_reason = get_user_friendly_error(404, "HTTP 404")
-                    # Check if content looks like a ZIP file (starts with PK signature)
-                    elif not response.content.startswith(b'PK'):
-                        download_failed = True
-                        failure_reason = get_user_friendly_error(200, "not a valid ZIP file (likely error page)")
-                    else:
-                        # Valid ZIP file - proceed with extraction
-                        # Save ZIP file
-                        zip_path = os.path.join(save_path, filename)
-                        
-                        with open(zip_path, 'wb') as f:
-                            f.write(response.content)
-                        
-                        # Try to extract ZIP file
-                        try:
-                            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                                zip_ref.extractall(save_path)
-                            
-                            # Find extracted CSV file
-                            extracted_files = [f for f in os.listdir(save_path) 
-                                             if f.endswith('.csv') and date_str in f]
-                            
-                            if extracted_files:
-                                csv_path = os.path.join(save_path, extracted_files[0])
-                                
-                                # Try to read CSV to verify it's valid
-                                try:
-                                    df = pd.read_csv(csv_path)
-                                    if len(df) > 0:  # Check if CSV has data
-                                        record_count = len(df)
-                                        
-                                        # Close loading spinner
-                                        if self.loading_spinner:
-                                            self.after(0, self.loading_spinner.close)
-                                            self.loading_spinner = None
-                                        
-                                        # Show success message in green
-                                        success_msg = f"✅ Downloaded successfully! ({record_count:,} records)"
-                                        self.after(0, lambda: self._update_status(success_msg, is_success=True))
-                                        # Re-enable download button
-                                        self.after(0, lambda: self.download_btn.config(state="normal"))
-                                        return  # Success - exit early
-                                    else:
-                                        download_failed = True
-                                        failure_reason = get_user_friendly_error(200, "CSV file is empty")
-                                except Exception as csv_error:
-                                    download_failed = True
-                                    failure_reason = get_user_friendly_error(200, f"CSV read error: {str(csv_error)[:50]}")
-                            else:
-                                download_failed = True
-                                failure_reason = get_user_friendly_error(200, "no CSV file found in ZIP")
-                        except zipfile.BadZipFile:
-                            download_failed = True
-                            failure_reason = get_user_friendly_error(200, "invalid ZIP file")
-                        except Exception as zip_error:
-                            download_failed = True
-                            failure_reason = get_user_friendly_error(200, f"ZIP extraction error: {str(zip_error)[:50]}")
-                else:
-                    download_failed = True
-                    failure_reason = get_user_friendly_error(response.status_code, f"HTTP {response.status_code}")
-                    
-            except requests.exceptions.Timeout:
-                download_failed = True
-                failure_reason = get_user_friendly_error(None, "request timeout")
-            except requests.exceptions.RequestException as req_error:
-                download_failed = True
-                error_msg = str(req_error)[:50].lower()
-                # Check if it's a 404 or similar in the error message
-                if "404" in error_msg or "not found" in error_msg:
-                    failure_reason = get_user_friendly_error(404, "HTTP 404")
-                else:
-                    failure_reason = get_user_friendly_error(None, f"network error: {str(req_error)[:50]}")
-            except Exception as e:
-                download_failed = True
-                error_msg = str(e)[:50].lower()
-                if "404" in error_msg or "not found" in error_msg:
-                    failure_reason = get_user_friendly_error(404, "HTTP 404")
-                else:
-                    failure_reason = get_user_friendly_error(None, f"error: {str(e)[:50]}")
-            
-            # If download failed, show error message
-            if download_failed:
-                # Close loading spinner
-                if self.loading_spinner:
-                    self.after(0, self.loading_spinner.close)
-                    self.loading_spinner = None
-                
-                # Get user-friendly error message
-                user_friendly_reason = get_user_friendly_error(None, failure_reason) if failure_reason else "holiday/invalid date"
-                error_msg = f"❌ Failed to download: {user_friendly_reason}"
-                date_str_formatted = target_date.strftime('%d/%m/%Y')
-                
-                self.after(0, lambda: self._update_status(error_msg, is_success=False))
-                self.after(0, lambda: messagebox.showerror("Error", f"Failed to download bhavcopy for {date_str_formatted}.\n{user_friendly_reason}"))
-                # Re-enable download button
-                self.after(0, lambda: self.download_btn.config(state="normal"))
-                
-        except Exception as e:
-            if self.loading_spinner:
-                self.after(0, self.loading_spinner.close)
-                self.loading_spinner = None
-            error_msg = f"❌ Error: {str(e)[:80]}"
-            self.after(0, lambda: self._update_status(error_msg, is_success=False))
-            self.after(0, lambda: messagebox.showerror("Error", f"An unexpected error occurred:\n{str(e)}"))
-            # Re-enable download button
-            self.after(0, lambda: self.download_btn.config(state="normal"))
-
-    def _download_range_worker(self, from_date, to_date, save_path):
-        """Worker thread for downloading bhavcopy for a date range"""
+    def _start_download(self, work, text):
+        """Run a download worker behind a cancellable progress spinner"""
+        from my_app.pages.job_runner import run_page_job
+
+        def show_result(result):
+            message, is_success, error_detail = result
+            self._update_status(message, is_success=is_success)
+            self.download_btn.config(state="normal")
+            if error_detail:
+                messagebox.showerror("Error", error_detail)
+
+        def show_error(e):
+            self._update_status(f"❌ Error: {str(e)[:80]}", is_success=False)
+            messagebox.showerror("Error", f"An unexpected error occurred:\n{str(e)}")
+            self.download_btn.config(state="normal")
+
+        def cancelled():
+            self._update_status("Download cancelled. Files already downloaded are kept and skipped next time.")
+            self.download_btn.config(state="normal")
+
+        run_page_job(self, work, show_result, text=text, on_error=show_error, on_cancelled=cancelled)
+
+    @staticmethod
+    def _save_copy(csv_path, save_path):
+        """Copy a repository CSV into the user's save folder (if one was chosen)"""
+        import shutil
+
+        if not save_path:
+            return
+        target = os.path.join(save_path, os.path.basename(csv_path))
+        if os.path.abspath(target) == os.path.abspath(csv_path):
+            return
+        if os.path.isfile(target):
+            source_stat, target_stat = os.stat(csv_path), os.stat(target)
+            # copy2 keeps the modification time, so an unchanged earlier copy matches
+            if (source_stat.st_size, int(source_stat.st_mtime)) == (target_stat.st_size, int(target_stat.st_mtime)):
+                return
+        shutil.copy2(csv_path, target)
+
+    @staticmethod
+    def _save_calendar(calendar):
         try:
-            # Import heavy libraries here (lazy import)
-            import pandas as pd
-            import requests
-            import zipfile
-            import time
-
-            def get_user_friendly_error(status_code, failure_reason):
-                """Convert technical error messages to user-friendly ones"""
-                # Handle HTTP status codes
-                if status_code == 404:
-                    return "holiday/invalid date"
-                elif status_code == 403:
-                    return "access denied"
-                elif status_code == 500:
-                    return "server error"
-                elif status_code and status_code != 200:
-                    return f"HTTP error ({status_code})"
-                
-                # Handle failure reason strings
-                if failure_reason:
-                    failure_lower = failure_reason.lower()
-                    if "404" in failure_reason or "not found" in failure_lower:
-                        return "holiday/invalid date"
-                    elif "403" in failure_reason or "forbidden" in failure_lower:
-                        return "access denied"
-                    elif "500" in failure_reason or "server error" in failure_lower:
-                        return "server error"
-                    elif "not a valid zip file" in failure_lower or "invalid zip file" in failure_lower:
-                        return "holiday/invalid date"
-                    elif "empty or invalid response" in failure_lower:
-                        return "holiday/invalid date"
-                    elif "http" in failure_lower:
-                        # Extract status code from HTTP error message
-                        if "404" in failure_reason:
-                            return "holiday/invalid date"
-                        elif "403" in failure_reason:
-                            return "access denied"
-                        elif "500" in failure_reason:
-                            return "server error"
-                
-                return failure_reason if failure_reason else "failed to get bhavcopy"
-
-            successful_downloads = 0
-            failed_dates = []  # List to store failed dates
-            total_records = 0
-            
-            # Count total weekdays in range
-            total_weekdays = 0
-            temp_date = from_date
-            while temp_date <= to_date:
-                if temp_date.weekday() < 5:  # Monday to Friday
-                    total_weekdays += 1
-                temp_date += timedelta(days=1)
-            
-            # Iterate through date range
-            current_date = from_date
-            current_day = 0
-            
-            while current_date <= to_date:
-                # Skip weekends (Monday=0, Friday=4)
-                if current_date.weekday() < 5:
-                    current_day += 1
-                    
-                    # Update status
-                    progress_msg = f"Downloading {current_date.strftime('%d/%m/%Y')}... ({current_day}/{total_weekdays} files)"
-                    self.after(0, lambda msg=progress_msg: self._update_status(msg, is_success=False))
-                    
-                    # Download for this date
-                    date_str = current_date.strftime("%Y%m%d")
-                    filename = f"BhavCopy_NSE_CM_0_0_0_{date_str}_F_0000.csv.zip"
-                    url = f"https://nsearchives.nseindia.com/content/cm/{filename}"
-                    
-                    headers = {
-                        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                        'Accept': '*/*',
-                        'Accept-Language': 'en-US,en;q=0.9',
-                        'Referer': 'https://www.nseindia.com/'
-                    }
-                    
-                    download_failed = False
-                    failure_reason = ""
-                    try:
-                        response = requests.get(url, headers=headers, timeout=30)
-                        
-                        if response.status_code == 200:
-                            # Check if response content is valid (not empty and not an error page)
-                            if len(response.content) < 100:  # Very small files are likely errors
-                                download_failed = True
-                                failure_reason = get_user_friendly_error(200, "empty or invalid response")
-                            # Check if it's an HTML error page (common for 404s that return 200)
-                            elif b'<html' in response.content[:500].lower() or b'<!doctype' in response.content[:500].lower():
-                                download_failed = True
-                                failure_reason = get_user_friendly_error(404, "HTTP 404")
-                            # Check if content looks like a ZIP file (starts with PK signature)
-                            elif not response.content.startswith(b'PK'):
-                                download_failed = True
-                                failure_reason = get_user_friendly_error(200, "not a valid ZIP file (likely error page)")
-                            else:
-                                # Valid ZIP file - proceed with extraction
-                                # Save ZIP file
-                                zip_path = os.path.join(save_path, filename)
-                                
-                                with open(zip_path, 'wb') as f:
-                                    f.write(response.content)
-                                
-                                # Try to extract ZIP file
-                                try:
-                                    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                                        zip_ref.extractall(save_path)
-                                    
-                                    # Find extracted CSV file
-                                    extracted_files = [f for f in os.listdir(save_path) 
-                                                     if f.endswith('.csv') and date_str in f]
-                                    
-                                    if extracted_files:
-                                        csv_path = os.path.join(save_path, extracted_files[0])
-                                        # Try to read CSV to verify it's valid
-                                        try:
-                                            df = pd.read_csv(csv_path)
-                                            if len(df) > 0:  # Check if CSV has data
-                                                total_records += len(df)
-                                                successful_downloads += 1
-                                            else:
-                                                download_failed = True
-                                                failure_reason = get_user_friendly_error(200, "CSV file is empty")
-                                        except Exception as csv_error:
-                                            download_failed = True
-                                            failure_reason = get_user_friendly_error(200, f"CSV read error: {str(csv_error)[:50]}")
-                                    else:
-                                        download_failed = True
-                                        failure_reason = get_user_friendly_error(200, "no CSV file found in ZIP")
-                                except zipfile.BadZipFile:
-                                    download_failed = True
-                                    failure_reason = get_user_friendly_error(200, "invalid ZIP file")
-                                except Exception as zip_error:
-                                    download_failed = True
-                                    failure_reason = get_user_friendly_error(200, f"ZIP extraction error: {str(zip_error)[:50]}")
-                        else:
-                            download_failed = True
-                            failure_reason = get_user_friendly_error(response.status_code, f"HTTP {response.status_code}")
-                    except requests.exceptions.Timeout:
-                        download_failed = True
-                        failure_reason = get_user_friendly_error(None, "request timeout")
-                    except requests.exceptions.RequestException as req_error:
-                        download_failed = True
-                        error_msg = str(req_error)[:50].lower()
-                        # Check if it's a 404 or similar in the error message
-                        if "404" in error_msg or "not found" in error_msg:
-                            failure_reason = get_user_friendly_error(404, "HTTP 404")
-                        else:
-                            failure_reason = get_user_friendly_error(None, f"network error: {str(req_error)[:50]}")
-                    except Exception as e:
-                        download_failed = True
-                        error_msg = str(e)[:50].lower()
-                        if "404" in error_msg or "not found" in error_msg:
-                            failure_reason = get_user_friendly_error(404, "HTTP 404")
-                        else:
-                            failure_reason = get_user_friendly_error(None, f"error: {str(e)[:50]}")
-                    
-                    # Track failed dates with reason - ALWAYS track if download failed
-                    if download_failed:
-                        failed_date_str = current_date.strftime('%d/%m/%Y')
-                        # Ensure we have a user-friendly reason
-                        if not failure_reason:
-                            failure_reason = "failed to get bhavcopy"
-                        user_friendly_reason = get_user_friendly_error(None, failure_reason)
-                        failed_dates.append(f"{failed_date_str} - {user_friendly_reason}")
-                    
-                    # Small delay between requests
-                    time.sleep(0.5)
-                
-                # Move to next day
-                current_date += timedelta(days=1)
-            
-            # Close loading spinner
-            if self.loading_spinner:
-                self.after(0, self.loading_spinner.close)
-                self.loading_spinner = None
-            
-            # Show success message with failed dates
-            total_processed = successful_downloads + len(failed_dates)
-            success_msg = f"✅ Download complete! {successful_downloads} files downloaded (out of {total_processed} weekdays processed)"
-            if failed_dates:
-                failed_count = len(failed_dates)
-                success_msg += f"\n\n❌ {failed_count} failed date(s):\n"
-                for failed_date in failed_dates:
-                    # failed_date already contains the date and reason
-                    success_msg += f"   • {failed_date}\n"
-            self.after(0, lambda: self._update_status(success_msg, is_success=True))
-            # Re-enable download button
-            self.after(0, lambda: self.download_btn.config(state="normal"))
-            
-        except Exception as e:
-            if self.loading_spinner:
-                self.after(0, self.loading_spinner.close)
-                self.loading_spinner = None
-            error_msg = f"❌ Error: {str(e)[:80]}"
-            self.after(0, lambda: self._update_status(error_msg, is_success=False))
-            self.after(0, lambda: messagebox.showerror("Error", f"An unexpected error occurred:\n{str(e)}"))
-            # Re-enable download button
-            self.after(0, lambda: self.download_btn.config(state="normal"))
+            calendar.save()
+        except OSError as e:
+            print(f"Warning: Could not update trading calendar: {e}")
+
+    def _download_worker(self, job, target_date, segment, save_path):
+        """Fetch one date into the bhavcopy repository (worker thread)
+
+        Returns:
+            tuple: (status message, is_success, error dialog text or None)
+        """
+        from my_app.pages.bhavcopy_repository import get_repository, get_user_friendly_error
+        from my_app.pages.trading_calendar import load_trading_calendar
+
+        calendar = load_trading_calendar()
+        job.stage(f"Downloading {segment} bhavcopy", total=1, unit="files")
+        fetch = get_repository().download([target_date], segment, cancel_event=job.cancel_event,
+                                          calendar=calendar)[target_date]
+        self._save_calendar(calendar)
+        job.check_cancelled()
+
+        if fetch.csv_path:
+            self._save_copy(fetch.csv_path, save_path)
+            if fetch.cached:
+                return f"✅ Already in the bhavcopy repository ({fetch.records:,} records)", True, None
+            return f"✅ Downloaded successfully! ({fetch.records:,} records)", True, None
+
+        # Get user-friendly error message
+        user_friendly_reason = get_user_friendly_error(fetch.status, fetch.error)
+        return (
+            f"❌ Failed to download: {user_friendly_reason}",
+            False,
+            f"Failed to download bhavcopy for {target_date.strftime('%d/%m/%Y')}.\n{user_friendly_reason}",
+        )
+
+    def _download_range_worker(self, job, from_date, to_date, segment, save_path):
+        """Download a date range concurrently into the bhavcopy repository (worker thread)
+
+        Only trading days are requested: weekends and holidays in the trading
+        calendar are skipped, and a past weekday that answers HTTP 404 is
+        learned as a holiday once the 404 is confirmed (other 404s are listed
+        as failed and tried again next time). Dates the repository already
+        holds a verified copy of are not downloaded again; the rest are
+        fetched concurrently (see BhavcopyRepository.download).
+
+        Returns:
+            tuple: (status message, is_success, error dialog text or None)
+        """
+        from my_app.pages.bhavcopy_repository import get_repository, get_user_friendly_error
+        from my_app.pages.trading_calendar import load_trading_calendar
+
+        successful_downloads = 0
+        skipped_downloads = 0
+        failed_dates = []  # List to store failed dates
+        
+        calendar = load_trading_calendar()
+        days = calendar.trading_days(from_date, to_date)
+        known_holidays = sum(
+            1 for offset in range((to_date - from_date).days + 1)
+            if calendar.is_holiday(from_date + timedelta(days=offset))
+            and (from_date + timedelta(days=offset)).weekday() < 5
+        )
+
+        def show_progress(done, total, target_date, fetch):
+            job.progress(done, total)
+            progress_msg = f"Downloaded {target_date.strftime('%d/%m/%Y')} ({done}/{total} files)"
+            job.call_ui(self._update_status, progress_msg, is_success=False)
+
+        repository = get_repository()
+        pending = sum(1 for day in days if not repository.entry(day, segment))
+        job.stage("Downloading bhavcopy files", total=pending, unit="files")
+        results = repository.download(days, segment, on_progress=show_progress,
+                                      cancel_event=job.cancel_event, calendar=calendar)
+        self._save_calendar(calendar)
+        job.check_cancelled()
+
+        for day in days:
+            fetch = results[day]
+            if fetch.csv_path:
+                self._save_copy(fetch.csv_path, save_path)
+                successful_downloads += 1
+                skipped_downloads += fetch.cached
+            else:
+                # Ensure we have a user-friendly reason
+                failed_dates.append(f"{day.strftime('%d/%m/%Y')} - {get_user_friendly_error(fetch.status, fetch.error)}")
+        
+        # Show success message with failed dates
+        total_processed = successful_downloads + len(failed_dates)
+        success_msg = f"✅ Download complete! {successful_downloads} files downloaded (out of {total_processed} weekdays processed)"
+        if skipped_downloads:
+            success_msg += f"\n{skipped_downloads} already in the bhavcopy repository (skipped)"
+        if known_holidays:
+            success_msg += f"\n{known_holidays} holiday(s) in the trading calendar (skipped)"
+        if failed_dates:
+            failed_count = len(failed_dates)
+            success_msg += f"\n\n❌ {failed_count} failed date(s):\n"
+            for failed_date in failed_dates:
+                # failed_date already contains the date and reason
+                success_msg += f"   • {failed_date}\n"
+        return success_msg, True, None
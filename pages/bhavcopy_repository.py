@@ -0,0 +1,408 @@
+"""
+Managed local repository of NSE bhavcopies.
+
+Every downloaded bhavcopy is kept once, as its CSV, under the app directory:
+
+    bhavcopy/<segment>/<YYYY>/BhavCopy_NSE_<segment>_0_0_0_<YYYYMMDD>_F_0000.csv
+
+A RunManifest in bhavcopy/ records each file's date, segment, SHA-256, row
+count and source URL. Downloads skip any date whose recorded CSV is still on
+disk unchanged, and pages look files up with get_bhavcopy(date, segment)
+instead of making the user browse to them. Each stored CSV is also added to
+the price store in the same folder (see bhavcopy_store).
+"""
+import io
+import os
+import threading
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+
+
+REPOSITORY_DIRNAME = "bhavcopy"
+
+# Segment code -> archive folder on nsearchives.nseindia.com
+SEGMENTS = {"CM": "cm", "FO": "fo"}
+
+NSE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Referer': 'https://www.nseindia.com/'
+}
+
+# Parallel downloads for a date range (NSE throttles aggressive clients)
+DOWNLOAD_WORKERS = 4
+
+# Days searched either side of a 404 for the trading days whose bhavcopies confirm it
+HOLIDAY_NEIGHBOUR_DAYS = 7
+
+BhavcopyFetch = namedtuple("BhavcopyFetch", ["day", "csv_path", "records", "status", "error", "cached"])
+BhavcopyFetch.__doc__ = """Outcome for one date of BhavcopyRepository.download().
+
+csv_path is None when the date failed; status and error then describe why
+(see get_user_friendly_error). cached is True when no download was needed.
+"""
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def _check_segment(segment):
+    segment = str(segment).upper()
+    if segment not in SEGMENTS:
+        raise ValueError(f"Unknown bhavcopy segment '{segment}' (expected one of {', '.join(SEGMENTS)})")
+    return segment
+
+
+def bhavcopy_filename(day, segment="CM"):
+    """CSV name of a bhavcopy; the archive serves it as this name plus .zip"""
+    return f"BhavCopy_NSE_{_check_segment(segment)}_0_0_0_{day.strftime('%Y%m%d')}_F_0000.csv"
+
+
+def bhavcopy_url(day, segment="CM"):
+    """Archive URL of the bhavcopy ZIP for a date and segment"""
+    segment = _check_segment(segment)
+    return f"https://nsearchives.nseindia.com/content/{SEGMENTS[segment]}/{bhavcopy_filename(day, segment)}.zip"
+
+
+def manifest_key(day, segment="CM"):
+    return f"bhavcopy:nse_{_check_segment(segment).lower()}:{day.strftime('%Y%m%d')}"
+
+
+def get_user_friendly_error(status_code, failure_reason):
+    """Convert technical error messages to user-friendly ones"""
+    # Handle HTTP status codes
+    if status_code == 404:
+        return "holiday/invalid date"
+    elif status_code == 403:
+        return "access denied"
+    elif status_code == 500:
+        return "server error"
+    elif status_code and status_code != 200:
+        return f"HTTP error ({status_code})"
+
+    # Handle failure reason strings
+    if failure_reason:
+        failure_lower = failure_reason.lower()
+        if "404" in failure_reason or "not found" in failure_lower:
+            return "holiday/invalid date"
+        elif "403" in failure_reason or "forbidden" in failure_lower:
+            return "access denied"
+        elif "500" in failure_reason or "server error" in failure_lower:
+            return "server error"
+        elif "not a valid zip file" in failure_lower or "invalid zip file" in failure_lower:
+            return "holiday/invalid date"
+        elif "empty or invalid response" in failure_lower:
+            return "holiday/invalid date"
+        elif "http" in failure_lower:
+            # Extract status code from HTTP error message
+            if "404" in failure_reason:
+                return "holiday/invalid date"
+            elif "403" in failure_reason:
+                return "access denied"
+            elif "500" in failure_reason:
+                return "server error"
+
+    return failure_reason if failure_reason else "failed to get bhavcopy"
+
+
+class BhavcopyRepository:
+    """Bhavcopy CSVs and their manifest under one root folder (thread-safe)."""
+
+    def __init__(self, root=None):
+        """
+        Args:
+            root (str | None): Repository folder; defaults to bhavcopy/ in the app directory
+        """
+        from my_app.pages.run_manifest import RunManifest
+
+        if root is None:
+            from my_app.file_utils import get_app_directory
+            root = os.path.join(get_app_directory(), REPOSITORY_DIRNAME)
+        os.makedirs(root, exist_ok=True)
+        self.root = root
+        self.manifest = RunManifest(root)
+
+    def csv_path(self, day, segment="CM"):
+        """Where the CSV for a date and segment is (or would be) stored"""
+        segment = _check_segment(segment)
+        return os.path.join(self.root, segment, day.strftime("%Y"), bhavcopy_filename(day, segment))
+
+    def entry(self, day, segment="CM"):
+        """Manifest entry for a verified copy (CSV present with the recorded hash), else None"""
+        return self.manifest.completed(manifest_key(day, segment))
+
+    def get_bhavcopy(self, day, segment="CM", as_of=False):
+        """Path of the verified bhavcopy CSV for a date.
+
+        Args:
+            day (date | datetime): Trading date
+            segment (str): "CM" (equity) or "FO" (F&O)
+            as_of (bool): If there is none for `day`, fall back to the latest earlier one
+
+        Returns:
+            str | None: CSV path, or None if the repository has no verified copy
+        """
+        if isinstance(day, datetime):
+            day = day.date()
+        entry = self.entry(day, segment)
+        if entry:
+            return entry["output"]
+        if not as_of:
+            return None
+        segment = _check_segment(segment)
+        for earlier in reversed(self.dates(segment)):
+            if earlier < day:
+                entry = self.entry(earlier, segment)
+                if entry:
+                    return entry["output"]
+        return None
+
+    def dates(self, segment="CM"):
+        """Dates recorded for a segment, oldest first (not re-verified)"""
+        segment = _check_segment(segment)
+        return sorted(
+            date.fromisoformat(entry["date"]) for entry in dict(self.manifest.entries).values()
+            if entry.get("segment") == segment and entry.get("date")
+        )
+
+    def store(self, day, segment, content, source=None):
+        """Validate a downloaded bhavcopy ZIP and add its CSV to the repository.
+
+        Args:
+            day (date): Trading date
+            segment (str): "CM" or "FO"
+            content (bytes): Response body (the ZIP)
+            source (str | None): URL it came from, kept in the manifest
+
+        Returns:
+            tuple: (csv_path, record_count, status, error) - csv_path is None on
+                failure, with status/error for get_user_friendly_error
+        """
+        import pandas as pd
+        import zipfile
+
+        # Check if response content is valid (not empty and not an error page)
+        if len(content) < 100:  # Very small files are likely errors
+            return None, 0, 200, "empty or invalid response"
+        # Check if it's an HTML error page (common for 404s that return 200)
+        if b'<html' in content[:500].lower() or b'<!doctype' in content[:500].lower():
+            return None, 0, 404, "HTTP 404"
+        # Check if content looks like a ZIP file (starts with PK signature)
+        if not content.startswith(b'PK'):
+            return None, 0, 200, "not a valid ZIP file (likely error page)"
+
+        segment = _check_segment(segment)
+        csv_path = self.csv_path(day, segment)
+        os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+        temp_path = f"{csv_path}.tmp"
+        try:
+            with zipfile.ZipFile(io.BytesIO(content)) as zip_ref:
+                members = [name for name in zip_ref.namelist() if name.lower().endswith(".csv")]
+                if not members:
+                    return None, 0, 200, "no CSV file found in ZIP"
+                with zip_ref.open(members[0]) as src, open(temp_path, "wb") as dst:
+                    dst.write(src.read())
+        except zipfile.BadZipFile:
+            return None, 0, 200, "invalid ZIP file"
+        except Exception as zip_error:
+            return None, 0, 200, f"ZIP extraction error: {str(zip_error)[:50]}"
+
+        # Try to read CSV to verify it's valid
+        try:
+            df = pd.read_csv(temp_path)
+            record_count = len(df)
+        except Exception as csv_error:
+            os.remove(temp_path)
+            return None, 0, 200, f"CSV read error: {str(csv_error)[:50]}"
+        if record_count == 0:
+            os.remove(temp_path)
+            return None, 0, 200, "CSV file is empty"
+        os.replace(temp_path, csv_path)
+        entry = self.manifest.record(
+            manifest_key(day, segment), csv_path,
+            date=day.isoformat(), segment=segment, records=record_count, source=source,
+        )
+        # Keep the price store in step; a failure here never loses the download
+        try:
+            from my_app.pages.bhavcopy_store import STORE_FILENAME, get_store
+            get_store(os.path.join(self.root, STORE_FILENAME)).ingest_frame(
+                df, segment, source=csv_path, sha256=entry.get("sha256")
+            )
+        except Exception as e:
+            print(f"Warning: Could not add {os.path.basename(csv_path)} to the bhavcopy store: {e}")
+        return csv_path, record_count, 200, None
+
+    def download(self, days, segment="CM", on_progress=None, cancel_event=None, calendar=None, engine=None):
+        """Make sure the repository has the bhavcopy for each date, downloading what is missing.
+
+        Dates with a verified copy are not requested. The rest are fetched
+        concurrently through a DownloadEngine and stored as they arrive.
+
+        Args:
+            days (iterable): Trading dates
+            segment (str): "CM" or "FO"
+            on_progress (callable | None): on_progress(done, total, day, BhavcopyFetch) for
+                each downloaded date, from the calling thread
+            cancel_event (threading.Event | None): Stops the download once set
+            calendar (TradingCalendar | None): Learns past dates whose 404 is confirmed as
+                holidays (see _confirmed_holidays); the caller saves it. Unconfirmed
+                404s are only reported as failed, so the next run tries them again.
+            engine (DownloadEngine | None): Engine to use instead of a new one
+
+        Returns:
+            dict: date -> BhavcopyFetch (dates skipped by cancellation are absent)
+        """
+        from my_app.pages.download_engine import DownloadEngine
+
+        segment = _check_segment(segment)
+        results = {}
+        tasks = []
+        for day in days:
+            entry = self.entry(day, segment)
+            if entry:
+                results[day] = BhavcopyFetch(day, entry["output"], entry.get("records", 0), 200, None, True)
+            else:
+                tasks.append((day, bhavcopy_url(day, segment)))
+        if not tasks:
+            return results
+        today = date.today()
+
+        # Past dates answering 404; today's file may simply not be published yet
+        not_found = []
+
+        def process(day, result):
+            if result.error:
+                if result.status == 404 and day < today:
+                    not_found.append(day)
+                return BhavcopyFetch(day, None, 0, result.status, result.error, False)
+            csv_path, record_count, status, error = self.store(day, segment, result.content, source=result.url)
+            return BhavcopyFetch(day, csv_path, record_count, status, error, False)
+
+        owned = engine is None
+        engine = engine or DownloadEngine(max_workers=DOWNLOAD_WORKERS, headers=NSE_HEADERS)
+        try:
+            results.update(engine.run(tasks, process=process, on_progress=on_progress, cancel_event=cancel_event))
+            if calendar is not None and not_found:
+                for day in self._confirmed_holidays(not_found, segment, calendar, engine, cancel_event):
+                    calendar.learn_holiday(day, "bhavcopy not published (HTTP 404)")
+        finally:
+            if owned:
+                engine.close()
+        return results
+
+
+    def _confirmed_holidays(self, days, segment, calendar, engine, cancel_event=None):
+        """The 404 dates that are really holidays rather than gaps in the archive.
+
+        A 404 alone does not prove a holiday: dates before the archive's format
+        existed answer 404 too, and the calendar is shared by both segments. A
+        date is confirmed only when
+          - the nearest trading days before and after it (skipping weekends, known
+            holidays and the other 404 dates) have verified bhavcopies of this
+            segment, which also puts it inside the archive's coverage, and
+          - the other segment has no bhavcopy for it either (answers 404 as well).
+
+        Returns:
+            list[date]: Confirmed dates, oldest first
+        """
+        pending = set(days)
+        others = [other for other in SEGMENTS if other != segment]
+        confirmed = []
+        for day in sorted(pending):
+            if not all(self._neighbour_has_copy(day, step, segment, calendar, pending) for step in (-1, 1)):
+                continue
+            agreed = True
+            for other in others:
+                if cancel_event is not None and cancel_event.is_set():
+                    return confirmed
+                if self.entry(day, other) or engine.fetch(bhavcopy_url(day, other), cancel_event).status != 404:
+                    agreed = False
+                    break
+            if agreed:
+                confirmed.append(day)
+        return confirmed
+
+    def _neighbour_has_copy(self, day, step, segment, calendar, skipped):
+        """True if the nearest trading day in direction `step` has a verified bhavcopy"""
+        neighbour = day
+        for _ in range(HOLIDAY_NEIGHBOUR_DAYS):
+            neighbour += timedelta(days=step)
+            if neighbour in skipped or not calendar.is_trading_day(neighbour):
+                continue
+            return self.entry(neighbour, segment) is not None
+        return False
+
+
+def get_repository():
+    """The app's shared BhavcopyRepository"""
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = BhavcopyRepository()
+        return _repository
+
+
+def get_bhavcopy(day, segment="CM", as_of=False):
+    """Path of the verified bhavcopy CSV for a date in the app's repository, or None.
+
+    See BhavcopyRepository.get_bhavcopy.
+    """
+    return get_repository().get_bhavcopy(day, segment, as_of=as_of)
+
+
+def choose_repository_bhavcopy(page, segment, on_selected):
+    """Ask for a date and hand the repository's bhavcopy for it to `on_selected(path)`.
+
+    A date missing from the repository is downloaded first, behind the page's
+    cancellable progress spinner.
+
+    Args:
+        page (tk.Widget): Page asking for the file
+        segment (str): "CM" or "FO"
+        on_selected (callable): on_selected(csv_path), called on the Tk thread
+    """
+    from tkinter import messagebox, simpledialog
+    from my_app.pages.job_runner import run_page_job
+    from my_app.pages.trading_calendar import load_trading_calendar
+
+    calendar = load_trading_calendar()
+    default_day = calendar.previous_trading_day(date.today() + timedelta(days=1))
+    if default_day == date.today():
+        # Today's bhavcopy is only published after the close
+        default_day = calendar.previous_trading_day(default_day)
+    text = simpledialog.askstring(
+        "Bhavcopy Date", f"NSE {segment} bhavcopy date (DD/MM/YYYY):",
+        initialvalue=default_day.strftime("%d/%m/%Y"), parent=page,
+    )
+    if not text:
+        return
+    try:
+        day = datetime.strptime(text.strip(), "%d/%m/%Y").date()
+    except ValueError:
+        messagebox.showerror("Error", f"Invalid date '{text}'. Please use DD/MM/YYYY.")
+        return
+
+    repository = get_repository()
+    csv_path = repository.get_bhavcopy(day, segment)
+    if csv_path:
+        on_selected(csv_path)
+        return
+
+    def work(job):
+        job.stage(f"Downloading {segment} bhavcopy", total=1, unit="files")
+        fetch = repository.download([day], segment, cancel_event=job.cancel_event, calendar=calendar)[day]
+        try:
+            calendar.save()
+        except OSError as e:
+            print(f"Warning: Could not update trading calendar: {e}")
+        return fetch
+
+    def show_result(fetch):
+        if fetch.csv_path:
+            on_selected(fetch.csv_path)
+        else:
+            reason = get_user_friendly_error(fetch.status, fetch.error)
+            messagebox.showerror("Error", f"Failed to download bhavcopy for {day.strftime('%d/%m/%Y')}.\n{reason}")
+
+    run_page_job(page, work, show_result, text="Downloading Bhavcopy...")
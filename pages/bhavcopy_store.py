@@ -0,0 +1,405 @@
+"""
+Columnar SQLite store of bhavcopy prices, for as-of lookups by ISIN, ticker or contract.
+
+Bhavcopies in the current NSE format (UDiFF: TradDt, TckrSymb, ClsPric, ...) and
+the legacy equity/F&O formats are normalised into one `prices` table with a
+column per field, partitioned by (segment, trade date): ingesting a file
+replaces the rows of the dates it covers. Indexes on (segment, isin,
+trade_date), (segment, symbol, trade_date) and (segment, contract_key,
+trade_date) make a bulk lookup of thousands of keys one query:
+
+    get_store().close_prices(contract_keys, as_of=date(2025, 1, 14))
+
+returns each contract's closing price on the latest trading date on or before
+the as-of date (exact=True restricts it to that date).
+
+contract_key is the F&O key the reconciliations already use:
+NSE + SYMBOL + expiry (YYYYMMDD) + first letter of the option type + integer
+strike (futures: option type XX, strike 0). The database lives next to the
+bhavcopy repository (bhavcopy/bhavcopy_store.sqlite3); the repository adds
+every bhavcopy it downloads.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+
+
+STORE_FILENAME = "bhavcopy_store.sqlite3"
+SCHEMA_VERSION = 1
+
+# Canonical columns of the prices table, in order
+PRICE_COLUMNS = (
+    "segment", "trade_date", "biz_date", "instrument", "symbol", "isin", "series",
+    "expiry", "option_type", "strike", "contract_key",
+    "open", "high", "low", "close", "last", "settle",
+)
+_NUMERIC_COLUMNS = ("strike", "open", "high", "low", "close", "last", "settle")
+
+# Source column -> canonical column for each supported bhavcopy layout
+UDIFF_COLUMNS = {
+    "TradDt": "trade_date", "BizDt": "biz_date", "FinInstrmTp": "instrument", "TckrSymb": "symbol",
+    "ISIN": "isin", "SctySrs": "series", "XpryDt": "expiry", "OptnTp": "option_type",
+    "StrkPric": "strike", "OpnPric": "open", "HghPric": "high", "LwPric": "low",
+    "ClsPric": "close", "LastPric": "last", "SttlmPric": "settle",
+}
+LEGACY_FO_COLUMNS = {
+    "TIMESTAMP": "trade_date", "INSTRUMENT": "instrument", "SYMBOL": "symbol", "EXPIRY_DT": "expiry",
+    "OPTION_TYP": "option_type", "STRIKE_PR": "strike", "OPEN": "open", "HIGH": "high",
+    "LOW": "low", "CLOSE": "close", "SETTLE_PR": "settle",
+}
+LEGACY_CM_COLUMNS = {
+    "TIMESTAMP": "trade_date", "SYMBOL": "symbol", "SERIES": "series", "ISIN": "isin",
+    "OPEN": "open", "HIGH": "high", "LOW": "low", "CLOSE": "close", "LAST": "last",
+}
+
+# UDiFF instrument types -> legacy F&O INSTRUMENT values
+UDIFF_FO_INSTRUMENTS = {"STO": "OPTSTK", "IDO": "OPTIDX", "STF": "FUTSTK", "IDF": "FUTIDX"}
+
+# Lookups bind keys through a temporary table in batches of this size
+_KEY_BATCH = 5000
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS prices (
+    segment TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    biz_date TEXT,
+    instrument TEXT,
+    symbol TEXT,
+    isin TEXT,
+    series TEXT,
+    expiry TEXT,
+    option_type TEXT,
+    strike REAL,
+    contract_key TEXT,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    last REAL,
+    settle REAL
+);
+CREATE INDEX IF NOT EXISTS prices_by_date ON prices (segment, trade_date);
+CREATE INDEX IF NOT EXISTS prices_by_isin ON prices (segment, isin, trade_date);
+CREATE INDEX IF NOT EXISTS prices_by_symbol ON prices (segment, symbol, trade_date);
+CREATE INDEX IF NOT EXISTS prices_by_contract ON prices (segment, contract_key, trade_date);
+CREATE TABLE IF NOT EXISTS ingested (
+    segment TEXT NOT NULL,
+    trade_date TEXT NOT NULL,
+    source TEXT,
+    sha256 TEXT,
+    rows INTEGER,
+    ingested_at TEXT,
+    PRIMARY KEY (segment, trade_date)
+);
+PRAGMA user_version = {SCHEMA_VERSION};
+"""
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def _iso_day(value):
+    """date/datetime/ISO string -> 'YYYY-MM-DD'; None -> None"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    import pandas as pd
+    return pd.Timestamp(value).date().isoformat()
+
+
+def detect_layout(columns):
+    """Column mapping for a bhavcopy's layout, or None if it is not a bhavcopy"""
+    columns = {str(column).strip() for column in columns}
+    if {"TradDt", "TckrSymb", "ClsPric"} <= columns:
+        return UDIFF_COLUMNS
+    if {"INSTRUMENT", "SYMBOL", "EXPIRY_DT", "CLOSE"} <= columns:
+        return LEGACY_FO_COLUMNS
+    if {"SYMBOL", "SERIES", "CLOSE", "ISIN"} <= columns:
+        return LEGACY_CM_COLUMNS
+    return None
+
+
+def contract_keys(symbol, expiry, option_type, strike):
+    """Vectorised F&O contract keys (see the module docstring); None where there is no expiry.
+
+    Args:
+        symbol, option_type: pandas Series of strings
+        expiry: pandas Series of YYYYMMDD strings ('' where missing)
+        strike: pandas Series of numbers (NaN for futures)
+    """
+    import pandas as pd
+
+    option_type = option_type.fillna("").astype(str).str.strip()
+    option_type = option_type.where(option_type != "", "XX")
+    strike = pd.to_numeric(strike, errors="coerce").fillna(0).astype("int64").astype(str)
+    keys = "NSE" + symbol.fillna("").astype(str).str.strip() + expiry + option_type.str[0] + strike
+    return keys.where(expiry != "", None)
+
+
+def normalize_bhavcopy(df, segment):
+    """A bhavcopy DataFrame as rows of the prices table (columns PRICE_COLUMNS).
+
+    Rows of a UDiFF file whose Sgmt is not `segment` are dropped.
+
+    Raises:
+        ValueError: If the columns match no known bhavcopy layout
+    """
+    import pandas as pd
+    from my_app.pages.date_utils import BHAVCOPY_DATE_FORMATS, format_date_column
+
+    df = df.rename(columns=lambda column: str(column).strip())
+    layout = detect_layout(df.columns)
+    if layout is None:
+        raise ValueError("Not a bhavcopy: expected UDiFF (TradDt, TckrSymb, ClsPric) or legacy NSE columns")
+
+    if "Sgmt" in df.columns:
+        # UDiFF files name their segment per row; never file FO rows under CM or vice versa
+        df = df[df["Sgmt"].astype(str).str.strip().str.upper() == segment]
+
+    out = pd.DataFrame(index=df.index)
+    for source, column in layout.items():
+        if source in df.columns:
+            out[column] = df[source]
+    for column in PRICE_COLUMNS:
+        if column not in out.columns:
+            out[column] = None
+
+    out["segment"] = segment
+    # Bhavcopy dates are ISO or named-month, and month-first when numeric
+    trade_dates, _ = format_date_column(out["trade_date"], "%Y-%m-%d", formats=BHAVCOPY_DATE_FORMATS)
+    out["trade_date"] = trade_dates
+    if out["biz_date"].notna().any():
+        out["biz_date"], _ = format_date_column(out["biz_date"], "%Y-%m-%d", formats=BHAVCOPY_DATE_FORMATS)
+    for column in ("instrument", "symbol", "isin", "series", "option_type"):
+        values = out[column]
+        out[column] = values.where(values.isna(), values.astype(str).str.strip())
+    for column in _NUMERIC_COLUMNS:
+        out[column] = pd.to_numeric(out[column], errors="coerce")
+
+    # Same expiry parsing as the F&O reconciliation (numeric dates month-first)
+    expiry, _ = format_date_column(out["expiry"], "%Y%m%d", formats=BHAVCOPY_DATE_FORMATS)
+    expiry = expiry.fillna("")
+    out["expiry"] = expiry.where(expiry != "", None)
+    out["contract_key"] = contract_keys(out["symbol"], expiry, out["option_type"], out["strike"])
+
+    out = out[out["trade_date"].fillna("") != ""]
+    return out.loc[:, list(PRICE_COLUMNS)]
+
+
+def to_legacy_fo_layout(df):
+    """A UDiFF F&O bhavcopy with the legacy columns (INSTRUMENT ... TIMESTAMP); other frames unchanged"""
+    import pandas as pd
+
+    if detect_layout(df.columns) is not UDIFF_COLUMNS:
+        return df
+    df = df.rename(columns=lambda column: str(column).strip())
+
+    def column(name):
+        return df[name] if name in df.columns else pd.Series([None] * len(df), index=df.index, dtype=object)
+
+    option_type = column("OptnTp").fillna("").astype(str).str.strip()
+    return pd.DataFrame({
+        "INSTRUMENT": column("FinInstrmTp").map(lambda value: UDIFF_FO_INSTRUMENTS.get(value, value)),
+        "SYMBOL": column("TckrSymb"),
+        "EXPIRY_DT": column("XpryDt"),
+        "STRIKE_PR": pd.to_numeric(column("StrkPric"), errors="coerce").fillna(0),
+        "OPTION_TYP": option_type.where(option_type != "", "XX"),
+        "OPEN": column("OpnPric"),
+        "HIGH": column("HghPric"),
+        "LOW": column("LwPric"),
+        "CLOSE": column("ClsPric"),
+        "SETTLE_PR": column("SttlmPric"),
+        "CONTRACTS": column("TtlTradgVol"),
+        "VAL_INLAKH": pd.to_numeric(column("TtlTrfVal"), errors="coerce") / 100000,
+        "OPEN_INT": column("OpnIntrst"),
+        "CHG_IN_OI": column("ChngInOpnIntrst"),
+        "TIMESTAMP": column("TradDt"),
+    })
+
+
+class BhavcopyStore:
+    """The prices database at `path` (thread-safe; writes are serialised)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._write_lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connection() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connection(self):
+        # A short-lived connection per call, so worker threads never share one
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def ingest_frame(self, df, segment, source=None, sha256=None):
+        """Add a bhavcopy, replacing the store's rows for the dates it covers.
+
+        Args:
+            df (pd.DataFrame): Bhavcopy as read from its CSV/Excel file
+            segment (str): "CM" or "FO"
+            source (str | None): File it came from, kept in the ingest log
+            sha256 (str | None): That file's hash, so unchanged files are not ingested twice
+
+        Returns:
+            list[str]: Trade dates ingested (YYYY-MM-DD), oldest first
+        """
+        rows = normalize_bhavcopy(df, segment)
+        trade_dates = sorted(rows["trade_date"].unique())
+        records = rows.astype(object).where(rows.notna(), None).itertuples(index=False, name=None)
+        placeholders = ", ".join("?" for _ in PRICE_COLUMNS)
+        ingested_at = datetime.now().isoformat(timespec="seconds")
+        with self._write_lock, self._connection() as connection:
+            connection.executemany(
+                "DELETE FROM prices WHERE segment = ? AND trade_date = ?",
+                [(segment, trade_date) for trade_date in trade_dates],
+            )
+            connection.executemany(
+                f"INSERT INTO prices ({', '.join(PRICE_COLUMNS)}) VALUES ({placeholders})", records
+            )
+            counts = rows.groupby("trade_date").size()
+            connection.executemany(
+                "INSERT OR REPLACE INTO ingested VALUES (?, ?, ?, ?, ?, ?)",
+                [(segment, trade_date, source, sha256, int(counts[trade_date]), ingested_at)
+                 for trade_date in trade_dates],
+            )
+        return trade_dates
+
+    def ingest_file(self, path, segment, sha256=None):
+        """Ingest a bhavcopy CSV unless a file with the same hash already was.
+
+        Returns:
+            list[str]: Trade dates ingested (empty when skipped)
+        """
+        import pandas as pd
+        from my_app.pages.run_manifest import file_sha256
+
+        sha256 = sha256 or file_sha256(path)
+        with self._connection() as connection:
+            seen = connection.execute(
+                "SELECT 1 FROM ingested WHERE segment = ? AND sha256 = ? LIMIT 1", (segment, sha256)
+            ).fetchone()
+        if seen:
+            return []
+        return self.ingest_frame(pd.read_csv(path), segment, source=path, sha256=sha256)
+
+    def sync_repository(self, repository, segment):
+        """Ingest repository bhavcopies of a segment that the store does not have yet.
+
+        Returns:
+            int: Files ingested
+        """
+        with self._connection() as connection:
+            known = {sha for (sha,) in connection.execute(
+                "SELECT sha256 FROM ingested WHERE segment = ? AND sha256 IS NOT NULL", (segment,)
+            )}
+        ingested = 0
+        for entry in dict(repository.manifest.entries).values():
+            if entry.get("segment") != segment or entry.get("sha256") in known:
+                continue
+            if not os.path.isfile(entry.get("output", "")):
+                continue
+            try:
+                if self.ingest_file(entry["output"], segment, sha256=entry.get("sha256")):
+                    ingested += 1
+            except Exception as e:
+                print(f"Warning: Could not add {os.path.basename(entry['output'])} to the bhavcopy store: {e}")
+        return ingested
+
+    def trade_dates(self, segment):
+        """Ingested trade dates of a segment, oldest first"""
+        with self._connection() as connection:
+            return [day for (day,) in connection.execute(
+                "SELECT trade_date FROM ingested WHERE segment = ? ORDER BY trade_date", (segment,)
+            )]
+
+    def lookup(self, segment, key_column, keys, as_of=None, exact=False, columns=PRICE_COLUMNS):
+        """Bulk as-of lookup: for each key, its row on the latest trade date <= as_of.
+
+        Args:
+            segment (str): "CM" or "FO"
+            key_column (str): "isin", "symbol" or "contract_key"
+            keys (iterable): Keys to look up (duplicates and None are ignored)
+            as_of (date | str | None): Latest trade date to use (None: the latest ingested)
+            exact (bool): Only use rows of the as_of date itself
+            columns (tuple[str]): Columns to return
+
+        Returns:
+            pd.DataFrame: "key" plus `columns`, one row per key found; where a key
+                has several rows on its date, the last ingested one
+        """
+        import pandas as pd
+
+        if key_column not in ("isin", "symbol", "contract_key"):
+            raise ValueError(f"Unsupported lookup column '{key_column}'")
+        keys = list(dict.fromkeys(key for key in keys if key is not None and key == key))
+        as_of = _iso_day(as_of)
+        if exact and as_of is None:
+            raise ValueError("exact lookups need an as_of date")
+        date_test = "p2.trade_date = :as_of" if exact else "p2.trade_date <= :as_of"
+        query = f"""
+            SELECT k.key, {', '.join(f'p.{column}' for column in columns)}
+            FROM lookup_keys k
+            JOIN prices p ON p.rowid = (
+                SELECT p2.rowid FROM prices p2
+                WHERE p2.segment = :segment AND p2.{key_column} = k.key AND {date_test}
+                ORDER BY p2.trade_date DESC, p2.rowid DESC
+                LIMIT 1
+            )
+        """
+        found = []
+        with self._connection() as connection:
+            connection.execute("CREATE TEMP TABLE lookup_keys (key TEXT PRIMARY KEY)")
+            for start in range(0, len(keys), _KEY_BATCH):
+                connection.execute("DELETE FROM lookup_keys")
+                connection.executemany(
+                    "INSERT INTO lookup_keys VALUES (?)", ((str(key),) for key in keys[start:start + _KEY_BATCH])
+                )
+                found.extend(connection.execute(
+                    query, {"segment": segment, "as_of": as_of or "9999-12-31"}
+                ).fetchall())
+        return pd.DataFrame(found, columns=["key", *columns])
+
+    def close_prices(self, contract_keys, as_of=None, exact=False):
+        """F&O closing price per contract key (keys not found are absent)"""
+        found = self.lookup("FO", "contract_key", contract_keys, as_of, exact, columns=("close",))
+        return dict(zip(found["key"], found["close"]))
+
+    def symbol_isins(self, symbols, as_of=None, exact=False):
+        """Equity ISIN per ticker symbol (symbols not found are absent)"""
+        found = self.lookup("CM", "symbol", symbols, as_of, exact, columns=("isin",))
+        found = found[found["isin"].notna()]
+        return dict(zip(found["key"], found["isin"]))
+
+    def isin_prices(self, isins, as_of=None, exact=False):
+        """Equity price rows per ISIN: key, trade_date, biz_date, isin, symbol, series, open/high/low/close/last"""
+        return self.lookup(
+            "CM", "isin", isins, as_of, exact,
+            columns=("trade_date", "biz_date", "isin", "symbol", "series", "open", "high", "low", "close", "last"),
+        )
+
+
+def get_store(path=None):
+    """Shared BhavcopyStore (default: next to the app's bhavcopy repository)"""
+    if path is None:
+        from my_app.pages.bhavcopy_repository import get_repository
+        path = os.path.join(get_repository().root, STORE_FILENAME)
+    path = os.path.abspath(path)
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = BhavcopyStore(path)
+        return store
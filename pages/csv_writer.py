@@ -0,0 +1,115 @@
+"""
+Streaming CSV output for template exports.
+
+Rows (dicts or sequences in header order) are written one at a time through the
+csv module, so memory stays flat however many rows a loader produces. Each
+column gets a formatter compiled once up front: date columns are reformatted
+through date_utils (each distinct value parsed once), every other column only maps
+missing values to an empty cell (Decimal and the rest are written with str(),
+which keeps Decimals exact).
+"""
+import csv
+import io
+import math
+import os
+from collections.abc import Mapping
+from datetime import datetime
+
+
+# Loader date fields written MM-DD-YYYY in XLSX templates and DD-MM-YYYY in CSV
+TEMPLATE_CSV_DATE_FIELDS = ("EventDate", "SettleDate", "ActualSettleDate")
+
+
+def _plain_cell(value):
+    """Missing values (None, NaN) become an empty cell; anything else is written as-is."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return ""
+    return value
+
+
+def date_formatter(input_format="%m-%d-%Y", output_format="%d-%m-%Y"):
+    """Formatter that rewrites date strings through date_utils.reformat_date.
+
+    date_utils memoizes the parse, so each distinct value is parsed once. Values
+    that do not parse (and non-string values other than dates) are left unchanged.
+    """
+    from .date_utils import reformat_date
+
+    formats = (input_format,)
+
+    def format_date(value):
+        if value is None or value == "":
+            return _plain_cell(value)
+        if isinstance(value, datetime):
+            return value.strftime(output_format)
+        if not isinstance(value, str):
+            return _plain_cell(value)
+        return reformat_date(value, output_format, formats=formats, default=value)
+
+    return format_date
+
+
+def compile_formatters(headers, date_fields=(), input_format="%m-%d-%Y", output_format="%d-%m-%Y"):
+    """One formatter per header column.
+
+    Args:
+        headers (list[str]): Header column names
+        date_fields (iterable[str]): Columns to rewrite from `input_format` to `output_format`
+        input_format (str): strptime format of the incoming date strings
+        output_format (str): strftime format written to the CSV
+
+    Returns:
+        list[callable]: Formatters in header order
+    """
+    date_fields = set(date_fields or ())
+    return [
+        date_formatter(input_format, output_format) if header in date_fields else _plain_cell
+        for header in headers
+    ]
+
+
+def write_csv(rows, headers, output, formatters=None, encoding="utf-8-sig", lineterminator=os.linesep):
+    """Stream rows into a CSV file.
+
+    Args:
+        rows: Iterable of row dicts (missing keys become empty cells) or of
+            sequences in header order; may be a generator
+        headers (list[str]): Header column names
+        output: File path, or binary file object (e.g. BytesIO or a ZipSink member)
+        formatters (list[callable] | None): Per-column formatters from compile_formatters;
+            None writes values as-is with missing values blank
+        encoding (str): Text encoding ("utf-8-sig" writes the BOM Excel expects)
+        lineterminator (str): Row separator; defaults to the platform line ending
+            pandas' to_csv used for these exports
+
+    Returns:
+        int: Number of data rows written
+    """
+    if formatters is None:
+        formatters = compile_formatters(headers)
+    columns = list(zip(headers, formatters))
+
+    if isinstance(output, (str, os.PathLike)):
+        with open(output, "w", encoding=encoding, newline="") as handle:
+            return _write_rows(handle, rows, headers, columns, lineterminator)
+
+    # Wrap the binary stream, then detach so the caller's stream stays open
+    text = io.TextIOWrapper(output, encoding=encoding, newline="", write_through=True)
+    try:
+        return _write_rows(text, rows, headers, columns, lineterminator)
+    finally:
+        text.flush()
+        text.detach()
+
+
+def _write_rows(handle, rows, headers, columns, lineterminator):
+    writer = csv.writer(handle, lineterminator=lineterminator)
+    writer.writerow(headers)
+    count = 0
+    for row in rows:
+        if isinstance(row, Mapping):
+            writer.writerow([fmt(row.get(header)) for header, fmt in columns])
+        else:
+            writer.writerow([fmt(value) for (_, fmt), value in zip(columns, row)])
+        count += 1
+    return count
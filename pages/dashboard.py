@@ -1,7 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
 import os
-import json
 from datetime import datetime
 
 class DashboardPage(tk.Frame):
@@ -66,8 +65,9 @@ class DashboardPage(tk.Frame):
                                  font=("Arial", 11), bg="#ecf0f1", fg="#7f8c8d")
         subtitle_label.pack(anchor="w", pady=(5, 0))
         
-        # Get data from consolidated_data.json
-        config_data = self.load_config_data()
+        # Dataset statistics (from the sidecar kept next to consolidated_data.json)
+        self._overview_signature = self._get_overview_signature()
+        config_stats = self.load_config_stats()
         
         # Quick Access Section
         quick_access_frame = tk.LabelFrame(self.scrollable_frame, text="🚀 Quick Access", 
@@ -81,7 +81,8 @@ class DashboardPage(tk.Frame):
                                      font=("Arial", 14, "bold"),
                                      bg="#ecf0f1", fg="#2c3e50", padx=20, pady=15)
         dataset_frame.pack(fill="x", padx=20, pady=(0, 15))
-        self.create_dataset_overview(dataset_frame, config_data)
+        self.dataset_frame = dataset_frame
+        self.create_dataset_overview(dataset_frame, config_stats)
         
         # Pack canvas and scrollbar side by side
         self.canvas.pack(side="left", fill="both", expand=True)
@@ -125,63 +126,85 @@ class DashboardPage(tk.Frame):
         except Exception:
             pass
     
-    def load_config_data(self):
-        """Load data from consolidated_data.json"""
+    def on_show(self):
+        """Called by MainApp when the cached dashboard is shown again"""
+        # Only rebuild the overview if consolidated_data.json or the set of
+        # extra dataset files changed meanwhile
+        signature = self._get_overview_signature()
+        if signature != self._overview_signature:
+            self._overview_signature = signature
+            for child in self.dataset_frame.winfo_children():
+                child.destroy()
+            self.create_dataset_overview(self.dataset_frame, self.load_config_stats())
+            self._bind_mousewheel_recursive(self.dataset_frame)
+            self.after(100, self._finalize_scroll_region)
+        # Other pages may have taken over the global mousewheel binding
+        handler = getattr(self, "_dashboard_mousewheel_handler", None)
+        if handler is not None:
+            root = self.winfo_toplevel()
+            root.bind_all("<MouseWheel>", handler)
+            root.bind_all("<Button-4>", lambda e: handler(e) if e else None)
+            root.bind_all("<Button-5>", lambda e: handler(e) if e else None)
+        self.canvas.focus_set()
+
+    def on_hide(self):
+        """Called by MainApp when the dashboard is hidden"""
+        if getattr(self, "_dashboard_mousewheel_handler", None) is not None:
+            root = self.winfo_toplevel()
+            for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                root.unbind_all(sequence)
+
+    def _get_overview_signature(self):
+        """consolidated_data.json modification time (None if missing) and the extra dataset file names"""
         try:
-            from my_app.file_utils import get_app_directory
+            from my_app.file_utils import get_app_directory, list_extra_dataset_files
             app_dir = get_app_directory()
-            consolidated_path = os.path.join(app_dir, "consolidated_data.json")
-            
-            if os.path.exists(consolidated_path):
-                with open(consolidated_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+        except Exception:
+            return None, ()
+        try:
+            mtime = os.path.getmtime(os.path.join(app_dir, "consolidated_data.json"))
+        except OSError:
+            mtime = None
+        return mtime, tuple(list_extra_dataset_files(app_dir))
+
+    def load_config_stats(self):
+        """Dataset statistics (entry counts, config size/modified) without parsing the full config"""
+        try:
+            from my_app.file_utils import load_config_stats
+            return load_config_stats()
         except Exception as e:
-            print(f"Error loading config: {e}")
-        return {}
+            print(f"Error loading config statistics: {e}")
+        return {"config_exists": False, "config_size": 0, "config_modified": None,
+                "datasets": {}, "extra_dataset_files": []}
     
-    def _discover_datasets(self, config_data):
-        """Dynamically discover all datasets from consolidated_data.json"""
+    def _discover_datasets(self, config_stats):
+        """All datasets: consolidated_data.json keys plus extra dataset JSON files"""
         datasets = set()
         
         # Get ALL keys from consolidated_data.json (these are actual datasets)
         # This is the source of truth - includes all datasets that exist
-        if isinstance(config_data, dict):
-            for key in config_data.keys():
-                # Exclude non-dataset keys (these are configuration data, not datasets)
-                if key not in ["lotsize_data", "underlying_code_data"]:
-                    datasets.add(key)
+        for key in config_stats.get("datasets", {}):
+            # Exclude non-dataset keys (these are configuration data, not datasets)
+            if key not in ["lotsize_data", "underlying_code_data"]:
+                datasets.add(key)
         
-        # Also check for individual JSON files in app directory (additional datasets)
-        try:
-            from my_app.file_utils import get_app_directory
-            app_dir = get_app_directory()
-            if os.path.exists(app_dir):
-                for fname in os.listdir(app_dir):
-                    if fname.lower().endswith(".json"):
-                        if fname not in ["lotsize_data.json", "consolidated_data.json"]:
-                            dataset_name = os.path.splitext(os.path.basename(fname))[0]
-                            datasets.add(dataset_name)
-        except Exception:
-            pass
+        # Individual JSON files in app directory (additional datasets)
+        for fname in config_stats.get("extra_dataset_files", []):
+            datasets.add(os.path.splitext(os.path.basename(fname))[0])
         
         return sorted(list(datasets))
     
-    def create_statistics_cards(self, parent, config_data):
+    def create_statistics_cards(self, parent, config_stats):
         """Create statistics cards showing datasets with mapping counts and reports"""
         # Dynamically discover all datasets from consolidated_data.json
-        all_datasets = self._discover_datasets(config_data)
+        all_datasets = self._discover_datasets(config_stats)
         
         # Count total datasets - show ALL datasets that exist
         total_datasets = len(all_datasets)
         
         # Count configured datasets (datasets that have data/content)
-        configured_count = sum(
-            1 for ds in all_datasets 
-            if ds in config_data and config_data.get(ds) and 
-            (isinstance(config_data[ds], dict) and len(config_data[ds]) > 0 or 
-             isinstance(config_data[ds], list) and len(config_data[ds]) > 0 or
-             not isinstance(config_data[ds], (dict, list)))
-        )
+        entry_counts = config_stats.get("datasets", {})
+        configured_count = sum(1 for ds in all_datasets if entry_counts.get(ds, 0) > 0)
         
         # Count reports/modules
         report_count = 8  # Based on MENU_STRUCTURE
@@ -493,13 +516,14 @@ class DashboardPage(tk.Frame):
             "gtn_sp_30_put_option": ["GTN Loader"],
         }
     
-    def create_dataset_overview(self, parent, config_data):
+    def create_dataset_overview(self, parent, config_stats):
         """Create dataset overview showing process-wise dataset usage (grouped by reports)"""
         content = tk.Frame(parent, bg="#ecf0f1")
         content.pack(fill="both", expand=True)
         
         # Dynamically discover all datasets
-        all_datasets = self._discover_datasets(config_data)
+        all_datasets = self._discover_datasets(config_stats)
+        entry_counts = config_stats.get("datasets", {})
         
         # Get dataset to report mapping
         dataset_to_reports = self._get_dataset_to_report_mapping()
@@ -537,19 +561,12 @@ class DashboardPage(tk.Frame):
                 ds_frame = tk.Frame(datasets_frame, bg="#ecf0f1")
                 ds_frame.pack(fill="x", pady=2)
                 
-                # Check if dataset exists and get mapping count
-                dataset_data = config_data.get(dataset, {})
-                if dataset_data:
-                    if isinstance(dataset_data, dict):
-                        mapping_count = len(dataset_data)
-                    elif isinstance(dataset_data, list):
-                        mapping_count = len(dataset_data)
-                    else:
-                        mapping_count = 1 if dataset_data else 0
+                # Mapping count from the statistics (0 when missing or empty)
+                mapping_count = entry_counts.get(dataset, 0)
+                if mapping_count > 0:
                     status = "✓"
                     status_color = "#27ae60"
                 else:
-                    mapping_count = 0
                     status = "○"
                     status_color = "#95a5a6"
                 
@@ -565,28 +582,18 @@ class DashboardPage(tk.Frame):
                                    anchor="w")
                 ds_label.pack(anchor="w")
     
-    def create_system_status_section(self, parent, config_data):
+    def create_system_status_section(self, parent, config_stats):
         """Create system status indicators"""
         content = tk.Frame(parent, bg="#ecf0f1")
         content.pack(fill="both", expand=True)
         
-        # Check consolidated_data.json
-        try:
-            from my_app.file_utils import get_app_directory
-            app_dir = get_app_directory()
-            consolidated_path = os.path.join(app_dir, "consolidated_data.json")
-            config_exists = os.path.exists(consolidated_path)
-            
-            if config_exists:
-                file_size = os.path.getsize(consolidated_path)
-                file_size_kb = file_size / 1024
-                modified_time = datetime.fromtimestamp(os.path.getmtime(consolidated_path))
-                modified_str = modified_time.strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                file_size_kb = 0
-                modified_str = "N/A"
-        except:
-            config_exists = False
+        # consolidated_data.json size and last modified (from the statistics)
+        config_exists = config_stats.get("config_exists", False)
+        if config_exists and config_stats.get("config_modified"):
+            file_size_kb = config_stats.get("config_size", 0) / 1024
+            modified_time = datetime.fromtimestamp(config_stats["config_modified"])
+            modified_str = modified_time.strftime("%Y-%m-%d %H:%M:%S")
+        else:
             file_size_kb = 0
             modified_str = "N/A"
         
@@ -4,6 +4,8 @@ import json
 import os
 from datetime import datetime
 
+from my_app.pages.search_filter import DebouncedSearch, SearchIndex
+
 try:
     from my_app.CONSTANTS import fields as DEFAULT_HEADER_FIELDS
 except Exception:
@@ -64,6 +66,9 @@ class DataConfigPage(tk.Frame):
         # Alias for currently selected header dataset data
         self.header_data = self.datasets.get(self.current_dataset_name, {})
         self.mode_var = tk.StringVar(value="LOTSIZE")
+        # Treeview items of the loaded rows (in order) and their search index
+        self._row_items = []
+        self._search_index = SearchIndex([])
         self.setup_ui()
         self.load_saved_data_on_startup()
         self.load_data()
@@ -242,7 +247,7 @@ class DataConfigPage(tk.Frame):
         search_frame.pack(fill="x", padx=20, pady=5)
         tk.Label(search_frame, text="🔍 Search:", font=("Arial", 12), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", self.filter_data)
+        DebouncedSearch(self, self.search_var, lambda _term: self.filter_data())
         tk.Entry(search_frame, textvariable=self.search_var, font=("Arial", 12), width=30, relief="solid", bd=1).pack(side="left", padx=10)
 
         content_frame = tk.Frame(self, bg="#ecf0f1")
@@ -276,7 +281,7 @@ class DataConfigPage(tk.Frame):
     def load_saved_data_on_startup(self):
         try:
             # Load consolidated data
-            from my_app.file_utils import get_app_directory
+            from my_app.file_utils import get_app_directory, save_consolidated_data
             app_dir = get_app_directory()
             consolidated_path = os.path.join(app_dir, "consolidated_data.json")
             
@@ -720,8 +725,7 @@ class DataConfigPage(tk.Frame):
                             "X": "December"
                         }
                     }
-                    with open(consolidated_path, "w") as fw:
-                        json.dump(default_consolidated_data, fw, indent=4)
+                    save_consolidated_data(default_consolidated_data, consolidated_path, indent=4)
                     consolidated_data = default_consolidated_data
                 # Load lotsize data
                 lotsize_data = consolidated_data.get("lotsize_data", {})
@@ -765,8 +769,7 @@ class DataConfigPage(tk.Frame):
                 
                 # If we added missing datasets, save the file
                 if needs_save:
-                    with open(consolidated_path, "w") as fw:
-                        json.dump(consolidated_data, fw, indent=4)
+                    save_consolidated_data(consolidated_data, consolidated_path, indent=4)
             else:
                 # Create default consolidated data if file doesn't exist
                 default_consolidated_data = {
@@ -1470,8 +1473,7 @@ class DataConfigPage(tk.Frame):
                 }
                 
                 # Save the default consolidated data file
-                with open(consolidated_path, "w") as f:
-                    json.dump(default_consolidated_data, f, indent=4)
+                save_consolidated_data(default_consolidated_data, consolidated_path, indent=4)
                 
                 # Load the data from the newly created file
                 self.lotsize_data.update(default_consolidated_data["lotsize_data"])
@@ -1495,15 +1497,18 @@ class DataConfigPage(tk.Frame):
         except Exception as e:
             print(f"Could not load saved data: {e}")
 
-    def load_data(self):
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+    def _dataset_rows(self):
+        """Rows of the current dataset as (values, search text) pairs, in display order.
+
+        The search text is what the search box matches against (lowercase).
+        """
+        rows = []
         if self.mode_var.get() == "LOTSIZE":
             for symbol, lotsize in self.lotsize_data.items():
-                self.tree.insert("", "end", values=(symbol, lotsize))
+                rows.append(((symbol, lotsize), str(symbol).lower()))
         elif self.mode_var.get() == "UNDERLYINGCODE":
             for symbol, code in self.underlying_code_data.items():
-                self.tree.insert("", "end", values=(symbol, code))
+                rows.append(((symbol, code), str(symbol).lower()))
         elif self.current_dataset_name == "fund_filename_map":
             # User-friendly display for fund_filename_map
             for fund_code, fund_data in self.header_data.items():
@@ -1512,17 +1517,19 @@ class DataConfigPage(tk.Frame):
                     default_name = fund_names.get("Default", "") if isinstance(fund_names, dict) else ""
                     cds_name = fund_names.get("CDS", "") if isinstance(fund_names, dict) else ""
                     password = fund_data.get("Password", "")
-                    self.tree.insert("", "end", values=(fund_code, default_name, cds_name, password))
+                    # Search in custodian account, fund name, or CDS name
+                    text = "\n".join((str(fund_code), str(default_name), str(cds_name))).lower()
+                    rows.append(((fund_code, default_name, cds_name, password), text))
                 else:
-                    self.tree.insert("", "end", values=(fund_code, "", "", ""))
+                    rows.append(((fund_code, "", "", ""), str(fund_code).lower()))
         elif self.current_dataset_name in ["mcx_group2_filters", "fno_group2_filters"]:
-            # Handle list-type datasets (filters)
+            # Handle list-type datasets (filters) - filter by value
             if isinstance(self.header_data, list):
                 for index, filter_value in enumerate(self.header_data):
-                    self.tree.insert("", "end", values=(str(index + 1), filter_value))
+                    rows.append(((str(index + 1), filter_value), str(filter_value).lower()))
             else:
                 # Fallback if data is not a list
-                self.tree.insert("", "end", values=("1", str(self.header_data)))
+                rows.append((("1", str(self.header_data)), str(self.header_data).lower()))
         else:
             # Handle dictionary-type datasets
             if isinstance(self.header_data, dict):
@@ -1530,53 +1537,50 @@ class DataConfigPage(tk.Frame):
                     display_value = json.dumps(value) if isinstance(value, (dict, list)) else value
                     # Ensure header is always inserted as string to preserve leading zeros
                     header_str = str(header) if header is not None else ""
-                    self.tree.insert("", "end", values=(header_str, display_value))
+                    rows.append(((header_str, display_value), header_str.lower()))
             else:
                 # Fallback for non-dict, non-list data
-                self.tree.insert("", "end", values=("Value", str(self.header_data)))
+                rows.append((("Value", str(self.header_data)), "value"))
+        return rows
+
+    def _reset_selection_controls(self):
         self.edit_btn.config(state="disabled", bg="#bdc3c7", fg="#7f8c8d", relief="flat", bd=1, font=("Arial", 12))
         self.delete_btn.config(state="disabled", bg="#bdc3c7", fg="#7f8c8d", relief="flat", bd=1, font=("Arial", 12))
         self.selected_info.config(text="Select a row to edit or delete", fg="#7f8c8d", font=("Arial", 10))
 
+    def load_data(self):
+        # Detached (filtered-out) items are not children, so delete by the saved list too
+        self.tree.delete(*set(self.tree.get_children()) | set(self._row_items))
+        rows = self._dataset_rows()
+        self._row_items = [self.tree.insert("", "end", values=values) for values, _ in rows]
+        # Search text is lowercased once per dataset, not on every keystroke
+        self._search_index = SearchIndex(text for _, text in rows)
+        self._reset_selection_controls()
+
     def filter_data(self, *args):
-        term = self.search_var.get().lower()
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        if self.mode_var.get() == "LOTSIZE":
-            for symbol, lotsize in self.lotsize_data.items():
-                if term in symbol.lower():
-                    self.tree.insert("", "end", values=(symbol, lotsize))
-        elif self.mode_var.get() == "UNDERLYINGCODE":
-            for symbol, code in self.underlying_code_data.items():
-                if term in symbol.lower():
-                    self.tree.insert("", "end", values=(symbol, code))
-        elif self.current_dataset_name == "fund_filename_map":
-            # User-friendly filter for fund_filename_map
-            for fund_code, fund_data in self.header_data.items():
-                if isinstance(fund_data, dict):
-                    fund_names = fund_data.get("Fund Names", {})
-                    default_name = fund_names.get("Default", "") if isinstance(fund_names, dict) else ""
-                    cds_name = fund_names.get("CDS", "") if isinstance(fund_names, dict) else ""
-                    password = fund_data.get("Password", "")
-                    # Search in custodian account, fund name, or CDS name
-                    if term in fund_code.lower() or term in default_name.lower() or term in cds_name.lower():
-                        self.tree.insert("", "end", values=(fund_code, default_name, cds_name, password))
-        elif self.current_dataset_name in ["mcx_group2_filters", "fno_group2_filters"]:
-            # Handle list-type datasets (filters) - filter by value
-            if isinstance(self.header_data, list):
-                for index, filter_value in enumerate(self.header_data):
-                    if term in str(filter_value).lower():
-                        self.tree.insert("", "end", values=(str(index + 1), filter_value))
+        matches = self._search_index.search(self.search_var.get())
+        if matches is None:
+            visible = self._row_items
         else:
-            # Handle dictionary-type datasets
-            if isinstance(self.header_data, dict):
-                for header, value in self.header_data.items():
-                    if term in header.lower():
-                        display_value = json.dumps(value) if isinstance(value, (dict, list)) else value
-                        self.tree.insert("", "end", values=(header, display_value))
-        self.edit_btn.config(state="disabled", bg="#bdc3c7", fg="#7f8c8d", relief="flat", bd=1, font=("Arial", 12))
-        self.delete_btn.config(state="disabled", bg="#bdc3c7", fg="#7f8c8d", relief="flat", bd=1, font=("Arial", 12))
-        self.selected_info.config(text="Select a row to edit or delete", fg="#7f8c8d", font=("Arial", 10))
+            visible = [self._row_items[index] for index in matches]
+        self._show_items(visible)
+        self._reset_selection_controls()
+
+    def _show_items(self, items):
+        """Show exactly `items` (loaded rows, in load order) with the fewest Treeview changes.
+
+        Rows that stay visible are left alone; rows filtered out are detached
+        (not deleted) and re-attached at their position when they match again.
+        """
+        wanted = set(items)
+        current = self.tree.get_children()
+        leaving = [item for item in current if item not in wanted]
+        if leaving:
+            self.tree.detach(*leaving)
+        staying = wanted.intersection(current)
+        for position, item in enumerate(items):
+            if item not in staying:
+                self.tree.move(item, "", position)
 
     def on_selection_change(self, event):
         selection = self.tree.selection()
@@ -2011,7 +2015,7 @@ class DataConfigPage(tk.Frame):
 
     def auto_save(self):
         try:
-            from my_app.file_utils import get_app_directory
+            from my_app.file_utils import get_app_directory, save_consolidated_data
             app_dir = get_app_directory()
             consolidated_path = os.path.join(app_dir, "consolidated_data.json")
             
@@ -2037,14 +2041,13 @@ class DataConfigPage(tk.Frame):
             consolidated_data["lotsize_data"] = self.lotsize_data
             
             # Save consolidated data
-            with open(consolidated_path, "w") as f:
-                json.dump(consolidated_data, f, indent=4)
+            save_consolidated_data(consolidated_data, consolidated_path, indent=4)
         except Exception as e:
             print(f"Auto-save failed: {e}")
 
     def save_data(self):
         try:
-            from my_app.file_utils import get_app_directory
+            from my_app.file_utils import get_app_directory, save_consolidated_data
             app_dir = get_app_directory()
             consolidated_path = os.path.join(app_dir, "consolidated_data.json")
             
@@ -2070,8 +2073,7 @@ class DataConfigPage(tk.Frame):
             consolidated_data["lotsize_data"] = self.lotsize_data
             
             # Save consolidated data
-            with open(consolidated_path, "w") as f:
-                json.dump(consolidated_data, f, indent=4)
+            save_consolidated_data(consolidated_data, consolidated_path, indent=4)
             messagebox.showinfo("Success", "Data saved successfully!")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save data: {str(e)}")
@@ -2726,7 +2728,7 @@ class DataConfigPage(tk.Frame):
         datasets = {}
         try:
             # First check for consolidated file
-            from my_app.file_utils import get_app_directory
+            from my_app.file_utils import get_app_directory, NON_DATASET_JSON_FILES
             app_dir = get_app_directory()
             consolidated_path = os.path.join(app_dir, "consolidated_data.json")
             if os.path.exists(consolidated_path):
@@ -2743,7 +2745,7 @@ class DataConfigPage(tk.Frame):
             for fname in os.listdir(app_dir):
                 if not fname.lower().endswith(".json"):
                     continue
-                if fname == "lotsize_data.json" or fname == "consolidated_data.json":
+                if fname in NON_DATASET_JSON_FILES:
                     continue
                 # Use file stem as dataset name
                 dataset_name = os.path.splitext(os.path.basename(fname))[0]
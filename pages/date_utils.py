@@ -0,0 +1,206 @@
+"""
+Shared date normalization for loaders and reconciliations.
+
+Columns are parsed in one vectorized call: the format is inferred from a sample
+of the column, every distinct string is parsed only once, and the caller gets
+back a reject mask instead of per-row try/except fallbacks.
+"""
+import warnings
+from datetime import date, datetime
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+
+# Formats tried when the caller does not name one, in priority order (day-first wins)
+DEFAULT_DATE_FORMATS = (
+    "%d-%m-%Y",
+    "%d/%m/%Y",
+    "%Y-%m-%d",
+    "%d-%b-%y",
+    "%d-%b-%Y",
+    "%d%b%y",
+    "%d-%m-%y",
+    "%d/%m/%y",
+    "%m-%d-%Y",
+    "%Y%m%d",
+    "%Y-%m-%d %H:%M:%S",
+)
+
+# The same formats with the numeric ones month-first, for dayfirst=False
+MONTH_FIRST_DATE_FORMATS = (
+    "%m-%d-%Y",
+    "%m/%d/%Y",
+    "%Y-%m-%d",
+    "%d-%b-%y",
+    "%d-%b-%Y",
+    "%d%b%y",
+    "%m-%d-%y",
+    "%m/%d/%y",
+    "%d-%m-%Y",
+    "%Y%m%d",
+    "%Y-%m-%d %H:%M:%S",
+)
+
+# NSE bhavcopy dates (EXPIRY_DT, XpryDt): named months or ISO, month-first when numeric
+BHAVCOPY_DATE_FORMATS = (
+    "%d-%b-%Y",
+    "%Y-%m-%d",
+    "%d-%b-%y",
+    "%m/%d/%Y",
+    "%m-%d-%Y",
+    "%Y%m%d",
+    "%Y-%m-%d %H:%M:%S",
+)
+
+# Cell values treated as empty rather than rejected
+_MISSING_VALUES = ("", "nan", "nat", "none", "null", "<na>")
+
+
+def infer_date_format(values, formats=DEFAULT_DATE_FORMATS, sample_size=100):
+    """Pick the format that best parses a sample of the column.
+
+    Args:
+        values: Iterable of date strings (missing values already removed)
+        formats (tuple[str]): Candidate strptime formats, in priority order
+        sample_size (int): Number of distinct values to test
+
+    Returns:
+        str | None: First format parsing the whole sample, else the one parsing
+        the most values, or None if no format parses anything
+    """
+    sample = pd.Series(pd.unique(pd.Series(list(values), dtype=object)))[:sample_size]
+    if sample.empty:
+        return None
+    best_format, best_hits = None, 0
+    for date_format in formats:
+        hits = int(pd.to_datetime(sample, format=date_format, errors="coerce").notna().sum())
+        if hits == len(sample):
+            return date_format
+        if hits > best_hits:
+            best_format, best_hits = date_format, hits
+    return best_format
+
+
+def _parse_unique_strings(uniques, formats, dayfirst):
+    """Parse distinct date strings: inferred format first, then the others, then a guess."""
+    parsed = pd.Series(pd.NaT, index=range(len(uniques)), dtype="datetime64[ns]")
+    if not len(uniques):
+        return parsed
+    uniques = pd.Series(uniques, dtype=object)
+
+    primary = infer_date_format(uniques, formats)
+    ordered = ([primary] if primary else []) + [fmt for fmt in formats if fmt != primary]
+    pending = np.ones(len(uniques), dtype=bool)
+    for date_format in ordered:
+        if not pending.any():
+            break
+        attempt = pd.to_datetime(uniques[pending], format=date_format, errors="coerce")
+        hit = attempt.notna()
+        parsed[hit.index[hit]] = attempt[hit]
+        pending[hit.index[hit]] = False
+
+    # Free-form guess only when the caller did not pin the formats
+    if dayfirst is not None and pending.any():
+        with warnings.catch_warnings():
+            # pandas warns when a guessed format contradicts dayfirst; the guess is still wanted
+            warnings.simplefilter("ignore", UserWarning)
+            for position in np.flatnonzero(pending):
+                guess = pd.to_datetime(uniques[position], dayfirst=dayfirst, errors="coerce")
+                if pd.notna(guess):
+                    parsed[position] = guess
+    return parsed
+
+
+def parse_date_column(values, formats=None, dayfirst=True):
+    """Parse a whole date column in one vectorized call.
+
+    Datetime cells (e.g. from Excel) pass through; strings are parsed once per
+    distinct value using the format inferred from the column.
+
+    Args:
+        values: pandas Series or iterable of date cells
+        formats (tuple[str] | None): Accepted strptime formats in priority order.
+            None uses DEFAULT_DATE_FORMATS (or MONTH_FIRST_DATE_FORMATS when
+            dayfirst is False) and then falls back to a free-form pandas guess
+            for anything left over.
+        dayfirst (bool): Read ambiguous numeric dates day-first (the default) or
+            month-first; ignored when `formats` is given
+
+    Returns:
+        tuple: (parsed, rejected)
+            - parsed (pd.Series): datetime64 values (NaT for missing/rejected), same index as `values`
+            - rejected (np.ndarray): True where a non-empty cell could not be parsed
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(list(values), dtype=object)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series, np.zeros(len(series), dtype=bool)
+
+    guess_dayfirst = dayfirst if formats is None else None
+    if formats:
+        formats = tuple(formats)
+    else:
+        formats = DEFAULT_DATE_FORMATS if dayfirst else MONTH_FIRST_DATE_FORMATS
+
+    parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[ns]")
+    text = series.astype(str).str.strip()
+    missing = (series.isna() | text.str.lower().isin(_MISSING_VALUES)).to_numpy()
+    if series.dtype == object:
+        native = series.map(lambda value: isinstance(value, (datetime, date))).to_numpy(dtype=bool)
+    else:
+        native = np.zeros(len(series), dtype=bool)
+
+    if native.any():
+        parsed[native] = pd.to_datetime(series[native], errors="coerce")
+
+    to_parse = ~missing & ~native
+    if to_parse.any():
+        # Memoize repeated values: parse each distinct string once
+        codes, uniques = pd.factorize(text[to_parse])
+        parsed_uniques = _parse_unique_strings(uniques, formats, guess_dayfirst)
+        parsed[to_parse] = parsed_uniques.to_numpy()[codes]
+
+    rejected = ~missing & parsed.isna().to_numpy()
+    return parsed, rejected
+
+
+def format_date_column(values, output_format, formats=None, dayfirst=True, default=""):
+    """Parse a date column and format it with `output_format`.
+
+    Returns:
+        tuple: (formatted, rejected) - formatted is a pd.Series of strings with
+        `default` for missing or rejected cells
+    """
+    parsed, rejected = parse_date_column(values, formats=formats, dayfirst=dayfirst)
+    formatted = parsed.dt.strftime(output_format).astype(object)
+    formatted = formatted.where(parsed.notna(), default)
+    return formatted, rejected
+
+
+@lru_cache(maxsize=4096)
+def _parse_cached(text, formats, dayfirst):
+    parsed, _ = parse_date_column(pd.Series([text], dtype=object), formats=formats, dayfirst=dayfirst)
+    value = parsed.iloc[0]
+    return None if pd.isna(value) else value.to_pydatetime()
+
+
+def parse_date(value, formats=None, dayfirst=True):
+    """Parse a single date value (memoized on the string form).
+
+    Returns:
+        datetime | None
+    """
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    if value is None:
+        return None
+    return _parse_cached(str(value).strip(), tuple(formats) if formats else None, dayfirst)
+
+
+def reformat_date(value, output_format, formats=None, dayfirst=True, default=""):
+    """Parse a single date value and format it, returning `default` when it cannot be parsed."""
+    parsed = parse_date(value, formats=formats, dayfirst=dayfirst)
+    return parsed.strftime(output_format) if parsed else default
@@ -0,0 +1,212 @@
+"""
+Concurrent HTTP downloads for batch fetches (e.g. a bhavcopy date range).
+
+DownloadEngine shares one connection-pooled requests.Session between a
+bounded pool of worker threads, spaces requests to the same host by a minimum
+interval, and retries 403/429/5xx responses and network errors with
+exponential backoff (honouring Retry-After). Each task's result is handed to a
+`process` callback in the worker thread (so unzipping and parsing overlap with
+other downloads), while progress is reported one task at a time from the
+thread that called run(), so the progress callback needs no locking.
+"""
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+
+# Responses worth retrying: NSE answers throttled clients with 403 as well as 429
+RETRY_STATUSES = frozenset({403, 429, 500, 502, 503, 504})
+
+# Defaults: parallel downloads, minimum gap between requests to one host (seconds),
+# retries after the first attempt, first backoff delay and backoff ceiling (seconds)
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MIN_INTERVAL = 0.2
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF = 1.0
+MAX_BACKOFF = 30.0
+DEFAULT_TIMEOUT = 30
+
+
+DownloadResult = namedtuple("DownloadResult", ["url", "status", "content", "error", "attempts"])
+DownloadResult.__doc__ = """Outcome of one fetch.
+
+status is the final HTTP status (None when no response arrived), content the
+body of a 200 response, error a short description when the fetch failed.
+"""
+
+
+class HostRateLimiter:
+    """Spaces requests to each host at least `min_interval` seconds apart (thread-safe)."""
+
+    def __init__(self, min_interval, clock=time.monotonic, sleep=time.sleep):
+        self.min_interval = min_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._next_slot = {}
+        self._lock = threading.Lock()
+
+    def wait(self, host):
+        """Block until this caller's slot for `host` comes up."""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.min_interval
+        if slot > now:
+            self._sleep(slot - now)
+
+
+def _retry_after(response):
+    """Seconds from a numeric Retry-After header, or None."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
+
+
+class DownloadEngine:
+    """Pooled, rate-limited, retrying downloader shared by the worker threads of one batch."""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, min_interval=DEFAULT_MIN_INTERVAL,
+                 max_retries=DEFAULT_MAX_RETRIES, backoff=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT,
+                 headers=None, session=None):
+        """
+        Args:
+            max_workers (int): Downloads in flight at once
+            min_interval (float): Minimum seconds between requests to the same host
+            max_retries (int): Retries after the first attempt for retryable failures
+            backoff (float): First retry delay; doubles per retry up to MAX_BACKOFF
+            timeout (float): Per-request timeout (seconds)
+            headers (dict | None): Default headers for every request
+            session (requests.Session | None): Session to use instead of a new pooled one
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.max_retries = max(0, int(max_retries))
+        self.backoff = backoff
+        self.timeout = timeout
+        self.rate_limiter = HostRateLimiter(min_interval)
+        self._owns_session = session is None
+        self.session = session if session is not None else self._make_session(headers)
+        if session is not None and headers:
+            self.session.headers.update(headers)
+
+    def _make_session(self, headers):
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        # One keep-alive connection per worker; retries are handled here, not by urllib3
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if headers:
+            session.headers.update(headers)
+        return session
+
+    def close(self):
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _backoff_delay(self, attempt, response):
+        delay = min(self.backoff * (2 ** attempt), MAX_BACKOFF)
+        # Jitter keeps parallel workers from retrying in lockstep
+        delay *= random.uniform(0.5, 1.0)
+        retry_after = _retry_after(response)
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, MAX_BACKOFF))
+        return delay
+
+    def fetch(self, url, cancel_event=None):
+        """GET `url` with rate limiting and retries.
+
+        Args:
+            url (str): URL to fetch
+            cancel_event (threading.Event | None): Abandons retries once set
+
+        Returns:
+            DownloadResult
+        """
+        import requests
+
+        host = urlsplit(url).netloc
+        status = None
+        error = None
+        attempt = 0
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                return DownloadResult(url, status, None, error or "cancelled", attempt)
+            self.rate_limiter.wait(host)
+            response = None
+            try:
+                response = self.session.get(url, timeout=self.timeout)
+                status = response.status_code
+                if status == 200:
+                    return DownloadResult(url, status, response.content, None, attempt + 1)
+                error = f"HTTP {status}"
+                retryable = status in RETRY_STATUSES
+            except requests.exceptions.Timeout:
+                status, error, retryable = None, "request timeout", True
+            except requests.exceptions.RequestException as exc:
+                status, error, retryable = None, f"network error: {str(exc)[:80]}", True
+            finally:
+                if response is not None:
+                    response.close()
+
+            if not retryable or attempt >= self.max_retries:
+                return DownloadResult(url, status, None, error, attempt + 1)
+            delay = self._backoff_delay(attempt, response)
+            attempt += 1
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    return DownloadResult(url, status, None, "cancelled", attempt)
+            else:
+                time.sleep(delay)
+
+    def run(self, tasks, process=None, on_progress=None, cancel_event=None):
+        """Fetch every (key, url) task concurrently.
+
+        Args:
+            tasks (iterable): (key, url) pairs
+            process (callable | None): process(key, DownloadResult) -> outcome, run in
+                the worker thread right after the download (default: the result itself)
+            on_progress (callable | None): on_progress(done, total, key, outcome), called
+                from this thread as each task finishes
+            cancel_event (threading.Event | None): Once set, tasks not yet started are
+                skipped and running ones stop retrying
+
+        Returns:
+            dict: key -> outcome for every task that ran (skipped tasks are absent)
+        """
+        tasks = list(tasks)
+        total = len(tasks)
+        outcomes = {}
+        done = 0
+
+        def run_task(key, url):
+            if cancel_event is not None and cancel_event.is_set():
+                return key, None, False
+            result = self.fetch(url, cancel_event)
+            return key, (process(key, result) if process else result), True
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="download") as pool:
+            futures = [pool.submit(run_task, key, url) for key, url in tasks]
+            for future in as_completed(futures):
+                key, outcome, ran = future.result()
+                if not ran:
+                    continue
+                outcomes[key] = outcome
+                done += 1
+                if on_progress:
+                    on_progress(done, total, key, outcome)
+        return outcomes
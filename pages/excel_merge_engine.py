@@ -0,0 +1,226 @@
+"""
+Headless Excel merge engine.
+
+Merges one sheet from each source file (xlsx/xlsm via openpyxl, xls via xlrd,
+csv via the csv module) into a single write-only workbook with an "Index" sheet
+of hyperlinks in front. Source files are parsed in the shared process pool a
+few files ahead of the writer, which appends them to the target one at a time,
+so memory holds only the files in flight. Cell values (and formulas stored in
+xlsx sources) are copied; cell formatting is not.
+"""
+import csv
+import os
+import re
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.cell.cell import ILLEGAL_CHARACTERS_RE
+from openpyxl.styles import Font, PatternFill
+from openpyxl.worksheet.hyperlink import Hyperlink
+
+
+INDEX_SHEET_NAME = "Index"
+MAX_SHEET_NAME_LENGTH = 31
+
+# Index sheet colours (same as the xlwings version)
+INDEX_HEADER_FILL_COLOR = "4472C4"
+INDEX_HEADER_FONT_COLOR = "FFFFFF"
+INDEX_LINK_FONT_COLOR = "0000FF"
+
+# Plain decimal numbers in CSV cells; text such as "007" or "1e5" stays text
+_CSV_NUMBER = re.compile(r"^-?(?:0|[1-9]\d*)(?:\.\d+)?$")
+
+
+def unique_sheet_name(base_name, used_names):
+    """Excel-safe sheet name (31 chars max) not already in `used_names`."""
+    name = base_name[:MAX_SHEET_NAME_LENGTH]
+    counter = 1
+    original_name = name
+    while name in used_names:
+        name = f"{original_name}_{counter}"[:MAX_SHEET_NAME_LENGTH]
+        counter += 1
+    return name
+
+
+def _clean(value):
+    """Strip control characters openpyxl refuses to write."""
+    if isinstance(value, str):
+        return ILLEGAL_CHARACTERS_RE.sub("", value)
+    return value
+
+
+def _csv_value(text):
+    if text == "":
+        return None
+    if _CSV_NUMBER.match(text):
+        return int(text) if "." not in text else float(text)
+    return _clean(text)
+
+
+def _read_csv(file_path):
+    for encoding in ("utf-8-sig", "latin-1"):
+        try:
+            with open(file_path, "r", encoding=encoding, newline="") as f:
+                return [[_csv_value(cell) for cell in row] for row in csv.reader(f)]
+        except UnicodeDecodeError:
+            continue
+    return []
+
+
+def _read_xls(file_path, sheet_name):
+    import xlrd
+
+    book = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        sheet = book.sheet_by_name(sheet_name) if sheet_name else book.sheet_by_index(0)
+        rows = []
+        for row_index in range(sheet.nrows):
+            row = []
+            for cell in sheet.row(row_index):
+                if cell.ctype == xlrd.XL_CELL_DATE:
+                    row.append(xlrd.xldate.xldate_as_datetime(cell.value, book.datemode))
+                elif cell.ctype == xlrd.XL_CELL_NUMBER:
+                    row.append(int(cell.value) if float(cell.value).is_integer() else cell.value)
+                elif cell.ctype == xlrd.XL_CELL_BOOLEAN:
+                    row.append(bool(cell.value))
+                elif cell.ctype in (xlrd.XL_CELL_EMPTY, xlrd.XL_CELL_BLANK, xlrd.XL_CELL_ERROR):
+                    row.append(None)
+                else:
+                    row.append(_clean(cell.value))
+            rows.append(row)
+        return rows
+    finally:
+        book.release_resources()
+
+
+def _read_xlsx(file_path, sheet_name):
+    workbook = load_workbook(file_path, read_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+        # Stored dimensions can be wrong in files written by other tools
+        sheet.reset_dimensions()
+        return [list(row) for row in sheet.iter_rows(values_only=True)]
+    finally:
+        workbook.close()
+
+
+def read_source_rows(file_path, source_sheet_name=None):
+    """All rows of one source sheet as lists of cell values.
+
+    Args:
+        file_path (str): xlsx/xlsm, xls or csv file
+        source_sheet_name (str | None): Sheet to read; None reads the first sheet
+
+    Returns:
+        list[list]: Rows in sheet order
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    try:
+        if ext == ".csv":
+            return _read_csv(file_path)
+        if ext == ".xls":
+            return _read_xls(file_path, source_sheet_name)
+        return _read_xlsx(file_path, source_sheet_name)
+    except Exception as e:
+        raise Exception(f"Error processing file {file_path}: {str(e)}")
+
+
+def _parse_job(job):
+    file_path, source_sheet_name = job
+    return read_source_rows(file_path, source_sheet_name)
+
+
+def _iter_parsed(jobs, parallel, lookahead):
+    """Parsed rows per job, in job order, parsing up to `lookahead` files ahead."""
+    done = 0
+    if parallel:
+        from .export_executor import discard_process_pool, shared_process_pool
+        try:
+            pool = shared_process_pool()
+            pending = [pool.submit(_parse_job, job) for job in jobs[:lookahead]]
+            for position in range(len(jobs)):
+                rows = pending[position].result()
+                pending[position] = None  # let the parsed rows be freed once written
+                if position + lookahead < len(jobs):
+                    pending.append(pool.submit(_parse_job, jobs[position + lookahead]))
+                done += 1
+                yield rows
+        except (BrokenProcessPool, PicklingError, OSError):
+            # Pool unavailable: parse the remaining files in this process
+            discard_process_pool()
+    for job in jobs[done:]:
+        yield _parse_job(job)
+
+
+def _write_index_sheet(sheet, index_data):
+    """Index layout of the xlwings version: header at B2, one hyperlink per sheet below."""
+    width = max([len("Sheet Name")] + [len(item["sheet_name"]) for item in index_data]) + 2
+    sheet.column_dimensions["B"].width = width
+
+    header = WriteOnlyCell(sheet, value="Sheet Name")
+    header.font = Font(bold=True, color=INDEX_HEADER_FONT_COLOR)
+    header.fill = PatternFill(start_color=INDEX_HEADER_FILL_COLOR, end_color=INDEX_HEADER_FILL_COLOR,
+                              fill_type="solid")
+    sheet.append([])
+    sheet.append([None, header])
+
+    link_font = Font(color=INDEX_LINK_FONT_COLOR, underline="single")
+    for row_number, item in enumerate(index_data, start=3):
+        name = item["sheet_name"]
+        cell = WriteOnlyCell(sheet, value=name)
+        quoted = name.replace("'", "''")
+        cell.hyperlink = Hyperlink(ref=f"B{row_number}", location=f"'{quoted}'!A1", display=name)
+        cell.font = link_font
+        sheet.append([None, cell])
+
+
+def merge_workbooks(output_path, sources, parallel=None, lookahead=None):
+    """Merge one sheet per source into `output_path` with an index sheet first.
+
+    Args:
+        output_path (str): Target .xlsx
+        sources (list[tuple]): (target_sheet_name, file_path, source_sheet_name) in
+            output order; source_sheet_name None takes the first sheet
+        parallel (bool | None): Parse in the shared process pool; None parses in
+            parallel when there is more than one source and more than one CPU
+        lookahead (int | None): Files parsed ahead of the writer (default: CPU count)
+
+    Returns:
+        list[dict]: Index data - sheet_name, source_file, description per merged sheet
+    """
+    sources = list(sources)
+    cpu_count = os.cpu_count() or 1
+    if parallel is None:
+        parallel = len(sources) > 1 and cpu_count > 1
+    lookahead = max(1, lookahead or cpu_count)
+
+    # Names and index rows are known before anything is parsed
+    used_names = {INDEX_SHEET_NAME}
+    index_data = []
+    for target_sheet_name, file_path, source_sheet_name in sources:
+        name = unique_sheet_name(target_sheet_name, used_names)
+        used_names.add(name)
+        filename = os.path.basename(file_path)
+        if source_sheet_name:
+            description = f"Sheet '{source_sheet_name}' from {filename}"
+        else:
+            description = f"Data from {filename}"
+        index_data.append({"sheet_name": name, "source_file": filename, "description": description})
+
+    workbook = Workbook(write_only=True)
+    if index_data:
+        _write_index_sheet(workbook.create_sheet(INDEX_SHEET_NAME), index_data)
+
+    jobs = [(file_path, source_sheet_name) for _, file_path, source_sheet_name in sources]
+    for item, rows in zip(index_data, _iter_parsed(jobs, parallel, lookahead)):
+        sheet = workbook.create_sheet(item["sheet_name"])
+        for row in rows:
+            sheet.append(row)
+
+    if not index_data:
+        # A workbook needs at least one sheet
+        workbook.create_sheet("Sheet1")
+    workbook.save(output_path)
+    return index_data
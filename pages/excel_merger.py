@@ -1,13 +1,13 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import importlib.util
 import os
 import pandas as pd
-from openpyxl import Workbook, load_workbook
+from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
 import threading
 from datetime import datetime
-import xlwings as xw
 import time
 from dataclasses import dataclass
 from typing import Optional
@@ -87,6 +87,7 @@ class ExcelMergerPage(tk.Frame):
             except Exception:
                 delta = 1
             self.entries_canvas.yview_scroll(delta, "units")
+        self._on_entries_mousewheel = _on_mousewheel
         self.entries_canvas.bind_all("<MouseWheel>", _on_mousewheel)
 
         # Buttons
@@ -104,6 +105,13 @@ class ExcelMergerPage(tk.Frame):
         tk.Button(button_frame, text="Merge Files", command=self._merge_files, 
                  bg="#2196F3", fg="white", relief="flat", padx=15, pady=8, font=("Arial", 11, "bold")).pack(side="left")
 
+        # Opt-in merge through a live Excel instance, offered only where xlwings is installed
+        self.preserve_formatting_var = tk.BooleanVar(value=False)
+        if importlib.util.find_spec("xlwings") is not None:
+            tk.Checkbutton(button_frame, text="Preserve formatting (requires Excel)",
+                           variable=self.preserve_formatting_var, bg="#ecf0f1",
+                           font=("Arial", 10)).pack(side="left", padx=(10, 0))
+
         # Status
         self.status_var = tk.StringVar(value="Use 'Add Files', 'Browse Multiple', or 'Extract Sheets' to add files")
         tk.Label(self, textvariable=self.status_var, font=("Arial", 10), bg="#ecf0f1", fg="#7f8c8d").pack(fill="x", padx=20, pady=(0, 10))
@@ -111,6 +119,14 @@ class ExcelMergerPage(tk.Frame):
         # Data storage
         self.file_entries = []  # List of FileEntry objects
 
+    def on_show(self):
+        """Called by MainApp when the cached page is shown again"""
+        self.entries_canvas.bind_all("<MouseWheel>", self._on_entries_mousewheel)
+
+    def on_hide(self):
+        """Called by MainApp when the page is hidden"""
+        self.entries_canvas.unbind_all("<MouseWheel>")
+
     def _browse_files(self):
         """Browse and add Excel files from different folders"""
         files = filedialog.askopenfilenames(
@@ -268,17 +284,18 @@ class ExcelMergerPage(tk.Frame):
             return
 
         try:
-            # Get sheet names from the Excel file
-            workbook = load_workbook(file_path, read_only=True)
-            sheet_names = workbook.sheetnames
-            workbook.close()
+            # Get sheet names (and, for XLSX, used ranges) from the workbook directory only
+            from .sheet_directory import read_sheet_directory
+            is_xls = os.path.splitext(file_path)[1].lower() == ".xls"
+            sheet_directory = read_sheet_directory(file_path, dimensions=not is_xls)
+            sheet_names = [sheet.name for sheet in sheet_directory]
 
             if not sheet_names:
                 messagebox.showwarning("No Sheets", "The selected Excel file has no sheets.")
                 return
 
             # Show dialog to select which sheets to extract
-            selected_sheets = self._show_sheet_selection_dialog(sheet_names, file_path)
+            selected_sheets = self._show_sheet_selection_dialog(sheet_names, file_path, sheet_directory)
             if not selected_sheets:
                 return
 
@@ -292,8 +309,18 @@ class ExcelMergerPage(tk.Frame):
         except Exception as e:
             messagebox.showerror("Error", f"Error reading Excel file: {str(e)}")
 
-    def _show_sheet_selection_dialog(self, sheet_names, file_path):
-        """Show dialog to select which sheets to extract"""
+    def _show_sheet_selection_dialog(self, sheet_names, file_path, sheet_directory=None):
+        """Show dialog to select which sheets to extract
+        
+        Args:
+            sheet_names: Sheet names in workbook order
+            file_path: Workbook path (shown in the title)
+            sheet_directory: Optional SheetInfo list; known sizes are shown next to the names
+        """
+        sizes = {}
+        for sheet in sheet_directory or []:
+            if sheet.rows is not None and sheet.columns is not None:
+                sizes[sheet.name] = f"  ({sheet.rows:,} rows × {sheet.columns} cols)"
         dialog = tk.Toplevel(self)
         dialog.title("Select Sheets to Extract")
         dialog.geometry("650x550")
@@ -342,7 +369,7 @@ class ExcelMergerPage(tk.Frame):
             var = tk.BooleanVar(value=True)  # Default to checked
             checkbox_vars.append((sheet_name, var))  # Store as tuple to maintain order
             
-            cb = tk.Checkbutton(scrollable_frame, text=sheet_name, variable=var, 
+            cb = tk.Checkbutton(scrollable_frame, text=sheet_name + sizes.get(sheet_name, ""), variable=var, 
                                bg="#ecf0f1", fg="#2c3e50", font=("Arial", 10))
             cb.pack(anchor="w", pady=2)
 
@@ -484,12 +511,14 @@ class ExcelMergerPage(tk.Frame):
         if not output_path:
             return
 
+        preserve_formatting = self.preserve_formatting_var.get()
+
         # Show loading spinner
         loader = LoadingSpinner(self, text="Merging files...")
 
         def merge_task():
             try:
-                self._perform_merge(output_path, file_data)
+                self._perform_merge(output_path, file_data, preserve_formatting)
                 loader.close()
                 messagebox.showinfo("Success", f"Files merged successfully!\nSaved to: {output_path}")
                 self.status_var.set("Merge completed successfully")
@@ -559,8 +588,26 @@ class ExcelMergerPage(tk.Frame):
             except Exception:
                 pass
 
-    def _perform_merge(self, output_path, file_data):
-        """Perform the actual merge operation using xlwings for true formatting preservation"""
+    def _perform_merge(self, output_path, file_data, preserve_formatting=False):
+        """Perform the actual merge operation with the headless openpyxl merge engine.
+        
+        Source files are parsed in parallel and streamed into a write-only workbook;
+        works without Excel installed (values and formulas are copied, not formatting).
+        With preserve_formatting the merge runs through Excel via xlwings instead.
+        """
+        if preserve_formatting:
+            return self._perform_merge_xlwings(output_path, file_data)
+        
+        from .excel_merge_engine import merge_workbooks
+        
+        sources = [(target_sheet_name, file_path, source_sheet_name)
+                   for _, target_sheet_name, file_path, source_sheet_name in file_data]
+        return merge_workbooks(output_path, sources)
+
+    def _perform_merge_xlwings(self, output_path, file_data):
+        """Merge through a live Excel instance (Windows + Excel only) to keep all formatting"""
+        import xlwings as xw
+        
         # Create a new Excel workbook using xlwings
         app = xw.App(visible=False)
         app.display_alerts = False
@@ -711,12 +758,6 @@ class ExcelMergerPage(tk.Frame):
 
     def _get_unique_sheet_name(self, base_name, used_names):
         """Generate a unique sheet name"""
-        # Use the provided name, but ensure uniqueness
-        name = base_name[:31]  # Excel sheet name limit
-        counter = 1
-        original_name = name
-        while name in used_names:
-            name = f"{original_name}_{counter}"[:31]
-            counter += 1
-        return name
+        from .excel_merge_engine import unique_sheet_name
+        return unique_sheet_name(base_name, used_names)
 
@@ -0,0 +1,177 @@
+"""
+Parallel generation of per-code export files.
+
+Trade loaders write one XLSX and/or CSV per TM code or trading code. The files
+are independent, so they are built in a shared process pool and returned in
+the order the jobs were submitted, which keeps the ZIP member order stable.
+
+A job is a (builder, args) tuple: `builder` is a module-level function returning
+(BytesIO, filename) - e.g. helper.output_save_in_template - so it can be pickled
+into a worker process.
+
+CSV jobs (args[2], the filename, ends in .csv) are not built in the pool when
+written with write_export_files: their builder is called with `output=` set to
+the ZIP member and streams rows straight into it, so no CSV is held in memory.
+CSV builders therefore take an `output` keyword (see dict_rows_csv).
+"""
+import atexit
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pickle import PicklingError
+
+
+# Below this many rows in total, starting/feeding worker processes costs more than it saves
+MIN_PARALLEL_ROWS = 5000
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _worker_count():
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _get_pool():
+    """Shared process pool, created on first use and reused by later exports."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=_worker_count())
+        return _pool
+
+
+def shared_process_pool():
+    """The process pool shared by exports and other CPU-heavy file work (e.g. the Excel merge)."""
+    return _get_pool()
+
+
+def discard_process_pool():
+    """Drop the shared pool after it broke; the next caller gets a fresh one."""
+    _discard_pool()
+
+
+def _discard_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+atexit.register(_discard_pool)
+
+
+def _build_file(job):
+    """Run one job in a worker; return bytes so only plain data crosses the process boundary."""
+    builder, args = job
+    file_io, filename = builder(*args)
+    file_io.seek(0)
+    return file_io.read(), filename
+
+
+def csv_with_converted_dates(data, headers, filename, output=None):
+    """Template CSV with EventDate/SettleDate/ActualSettleDate switched to DD-MM-YYYY."""
+    from .csv_writer import TEMPLATE_CSV_DATE_FIELDS
+    from .helper import output_save_in_template_csv
+    return output_save_in_template_csv(data, headers, filename, date_fields=TEMPLATE_CSV_DATE_FIELDS,
+                                       output=output)
+
+
+def dict_rows_csv(data, headers, filename, output=None):
+    """Plain UTF-8 CSV (no BOM, rows as-is, CRLF line endings like csv.DictWriter).
+
+    Rows are written to `output` (a path or binary stream) when given, else to
+    a BytesIO, which is returned rewound.
+    """
+    from .csv_writer import write_csv
+    if output is not None:
+        write_csv(data, headers, output, encoding="utf-8", lineterminator="\r\n")
+        return output, filename
+    output = io.BytesIO()
+    write_csv(data, headers, output, encoding="utf-8", lineterminator="\r\n")
+    output.seek(0)
+    return output, filename
+
+
+def _streams_to_output(job):
+    """CSV jobs are written straight into their destination instead of being built in memory."""
+    _, args = job
+    return len(args) > 2 and str(args[2]).lower().endswith(".csv")
+
+
+def iter_export_files(jobs, parallel=None):
+    """Build every job's file, in parallel when it pays off, yielding them in job order.
+
+    Each file is yielded as soon as it and all earlier files are ready, so a
+    ZipSink can write it out while later files are still being built.
+
+    Args:
+        jobs (list[tuple]): [(builder, args), ...]; args[0] is the row data
+        parallel (bool | None): Force (True) or disable (False) the process pool;
+            None decides from the job count, total rows and CPU count
+
+    Yields:
+        tuple: (BytesIO, filename)
+    """
+    jobs = list(jobs)
+    if parallel is None:
+        total_rows = sum(len(args[0]) for _, args in jobs if args)
+        parallel = len(jobs) > 1 and _worker_count() > 1 and total_rows >= MIN_PARALLEL_ROWS
+
+    done = 0
+    if parallel:
+        try:
+            # map() yields in submission order, whatever order the workers finish in
+            for content, filename in _get_pool().map(_build_file, jobs):
+                done += 1
+                yield io.BytesIO(content), filename
+        except (BrokenProcessPool, PicklingError, OSError):
+            # Pool unavailable (e.g. worker died or spawning is blocked): build the rest in this process
+            _discard_pool()
+    for job in jobs[done:]:
+        content, filename = _build_file(job)
+        yield io.BytesIO(content), filename
+
+
+def write_export_files(jobs, sink, parallel=None):
+    """Write every job's file into a ZipSink, in job order.
+
+    CSV jobs stream their rows straight into the ZIP member on this thread;
+    the other jobs (XLSX) are built as by iter_export_files - in the process
+    pool when it pays off - while the CSVs are being written.
+
+    Args:
+        jobs (list[tuple]): [(builder, args), ...]; args[0] is the row data, args[2] the filename
+        sink (ZipSink): Open archive to write into
+        parallel (bool | None): As for iter_export_files (only the non-CSV jobs use the pool)
+
+    Returns:
+        list[str]: Member names written, in job order
+    """
+    jobs = list(jobs)
+    built = iter_export_files([job for job in jobs if not _streams_to_output(job)], parallel)
+    names = []
+    for job in jobs:
+        if _streams_to_output(job):
+            builder, args = job
+            with sink.open(args[2]) as member:
+                builder(*args, output=member)
+            names.append(args[2])
+        else:
+            file_io, filename = next(built)
+            sink.add(filename, file_io)
+            file_io.close()
+            names.append(filename)
+    return names
+
+
+def export_files(jobs, parallel=None):
+    """Build every job's file (see iter_export_files).
+
+    Returns:
+        list[tuple]: [(BytesIO, filename), ...] in the same order as `jobs`
+    """
+    return list(iter_export_files(jobs, parallel))
@@ -0,0 +1,326 @@
+"""
+Exact fixed-point numeric columns.
+
+A FixedPointColumn keeps a whole column of decimal numbers as int64 values
+scaled by 10**precision. Parsing and arithmetic run vectorized over the column
+instead of building one Decimal per cell; values are turned back into Decimal
+or str only when they are exported. Row-by-row code can carry single values as
+FixedPointValue, which the writers convert when the cell is written.
+"""
+from decimal import ROUND_HALF_EVEN, Decimal
+
+import numpy as np
+import pandas as pd
+
+
+# Any integer with at most 18 digits fits in int64 (max 9,223,372,036,854,775,807)
+_MAX_DIGITS = 18
+
+# Most decimal places kept when the precision is inferred (as the old _safe_decimal helpers)
+MAX_PRECISION = 15
+
+# sign, integer digits, fraction digits, exponent
+_NUMBER_PATTERN = r'^([+-]?)(\d*)(?:\.(\d*))?(?:[eE]([+-]?\d+))?$'
+
+# Significant digits a float64 holds reliably; digits past this in a float's
+# repr (e.g. the 4 in 0.30000000000000004) are representation noise
+_FLOAT_DIGITS = 15
+
+# Cell values treated as empty (parsed as 0, like the old _safe_decimal helpers)
+_MISSING_VALUES = ("", "nan", "none", "null", "<na>", "nat")
+
+
+def _pow10(exponents):
+    """Vectorized 10**exponent for non-negative int64 exponents."""
+    return np.power(np.int64(10), np.asarray(exponents, dtype=np.int64))
+
+
+class FixedPointColumn:
+    """Column of exact decimal numbers stored as int64 scaled by 10**precision.
+
+    Attributes:
+        values (np.ndarray): int64 scaled values
+        precision (int): Number of decimal places represented
+        invalid (np.ndarray): True where the source cell could not be parsed (value
+            is 0) or lost significant digits to rounding (value is rounded)
+    """
+
+    __slots__ = ("values", "precision", "invalid")
+
+    def __init__(self, values, precision=0, invalid=None):
+        self.values = np.asarray(values, dtype=np.int64)
+        self.precision = int(precision)
+        if invalid is None:
+            invalid = np.zeros(len(self.values), dtype=bool)
+        self.invalid = np.asarray(invalid, dtype=bool)
+
+    # ---- Construction ----
+    @classmethod
+    def parse(cls, values, precision=None):
+        """Parse a column of numbers (strings, ints or floats) in one vectorized pass.
+
+        Thousands separators and surrounding whitespace are ignored. Empty cells
+        parse as 0; unparseable cells, and cells too large for int64 even without
+        decimals, parse as 0 and are flagged in `invalid`. Cells with more decimal
+        places than the column keeps are rounded (half-even) to its precision;
+        if that drops any of their first 15 significant digits (e.g. 0.001 in a
+        column that keeps one decimal, or 1E-20) they are flagged in `invalid`
+        too. Float noise past the 15th digit is rounded away without a flag.
+
+        Args:
+            values: pandas Series or any iterable of cell values
+            precision (int | None): Decimal places to keep. None infers the smallest
+                precision that represents every value exactly, capped at
+                MAX_PRECISION and lowered until the largest value fits in int64.
+
+        Returns:
+            FixedPointColumn
+
+        Raises:
+            OverflowError: A value does not fit in int64 at the given `precision`
+        """
+        if isinstance(values, pd.Series):
+            series = values.reset_index(drop=True)
+        else:
+            series = pd.Series(list(values), dtype=object)
+
+        text = series.astype(str).str.replace(",", "", regex=False).str.strip()
+        missing = series.isna().to_numpy() | text.str.lower().isin(_MISSING_VALUES).to_numpy()
+
+        parts = text.str.extract(_NUMBER_PATTERN)
+        int_part = parts[1].fillna("")
+        frac_part = parts[2].fillna("")
+        matched = (parts[1].notna() & ((int_part + frac_part) != "")).to_numpy()
+        invalid = ~matched & ~missing
+        usable = matched & ~missing
+
+        # value = digits * 10**shift, with digits stripped of redundant zeros
+        frac_digits = frac_part.str.rstrip("0")
+        digits = (int_part + frac_digits).str.lstrip("0")
+        exponent = pd.to_numeric(parts[3], errors="coerce").fillna(0).astype(np.int64).to_numpy()
+        shift = exponent - frac_digits.str.len().to_numpy()
+        # Trailing zeros of the integer part can absorb a negative shift
+        is_zero = (digits == "").to_numpy() | ~usable
+        shift = np.where(is_zero, 0, shift)
+        n_digits = np.where(is_zero, 0, digits.str.len().to_numpy())
+
+        # Digits left of the decimal point; beyond _MAX_DIGITS not even the integer part fits
+        int_digits = np.where(is_zero, 0, np.maximum(n_digits + shift, 0))
+        too_large = int_digits > _MAX_DIGITS
+        invalid = invalid | too_large
+        usable = usable & ~too_large
+        is_zero = is_zero | too_large
+
+        needed = np.where(usable, np.maximum(-shift, 0), 0)
+        if precision is None:
+            widest = int(int_digits[usable].max()) if usable.any() else 0
+            precision = int(needed.max()) if len(needed) else 0
+            precision = max(0, min(precision, MAX_PRECISION, _MAX_DIGITS - widest))
+        else:
+            overflow = usable & (int_digits + precision > _MAX_DIGITS)
+            if overflow.any():
+                bad = text[overflow].iloc[0]
+                raise OverflowError(f"Value '{bad}' does not fit in a fixed-point column with {precision} decimal places")
+
+        # Cells with more decimals than kept are rounded one by one; the rest stay vectorized
+        rounded = usable & ~is_zero & (needed > precision)
+        exact_zero = is_zero | rounded
+        digit_values = digits.where(~exact_zero, "0").astype(np.int64).to_numpy()
+        scaled = digit_values * _pow10(np.where(exact_zero, 0, shift + precision))
+        negative = (parts[0] == "-").to_numpy()
+        scaled = np.where(negative, -scaled, scaled)
+        if rounded.any():
+            quantum = Decimal(1)
+            scaled[rounded] = [
+                int(Decimal(value).scaleb(precision).quantize(quantum, rounding=ROUND_HALF_EVEN))
+                for value in text[rounded]
+            ]
+            # Digits kept after rounding; a nonzero digit dropped within the first
+            # _FLOAT_DIGITS significant ones is a real loss, not float noise
+            kept = n_digits - (needed - precision)
+            positions = np.flatnonzero(rounded)
+            lost = [
+                digits.iat[i][max(int(kept[i]), 0):_FLOAT_DIGITS].strip("0") != ""
+                for i in positions
+            ]
+            invalid[positions[lost]] = True
+        return cls(scaled, precision, invalid)
+
+    @classmethod
+    def zeros(cls, length, precision=0):
+        """Column of `length` zeros."""
+        return cls(np.zeros(length, dtype=np.int64), precision)
+
+    # ---- Precision handling ----
+    def rescale(self, precision):
+        """Return the column at a higher (or equal) precision."""
+        if precision < self.precision:
+            raise ValueError("Rescaling to a lower precision would lose digits")
+        if precision == self.precision:
+            return self
+        factor = 10 ** (precision - self.precision)
+        if len(self.values) and np.abs(self.values).max() > np.iinfo(np.int64).max // factor:
+            raise OverflowError(f"Column does not fit in int64 at {precision} decimal places")
+        return FixedPointColumn(self.values * factor, precision, self.invalid)
+
+    def _aligned(self, other):
+        if not isinstance(other, FixedPointColumn):
+            if isinstance(other, (int, np.integer)):
+                other = FixedPointColumn(np.full(len(self.values), other, dtype=np.int64), 0)
+            else:
+                return None
+        if len(other.values) != len(self.values):
+            raise ValueError("Fixed-point columns must have the same length")
+        precision = max(self.precision, other.precision)
+        return self.rescale(precision), other.rescale(precision)
+
+    # ---- Vectorized arithmetic ----
+    def __len__(self):
+        return len(self.values)
+
+    def __add__(self, other):
+        pair = self._aligned(other)
+        if pair is None:
+            return NotImplemented
+        left, right = pair
+        return FixedPointColumn(left.values + right.values, left.precision, left.invalid | right.invalid)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        pair = self._aligned(other)
+        if pair is None:
+            return NotImplemented
+        left, right = pair
+        return FixedPointColumn(left.values - right.values, left.precision, left.invalid | right.invalid)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __neg__(self):
+        return FixedPointColumn(-self.values, self.precision, self.invalid)
+
+    def __abs__(self):
+        return FixedPointColumn(np.abs(self.values), self.precision, self.invalid)
+
+    def __mul__(self, other):
+        if isinstance(other, (int, np.integer)):
+            other = FixedPointColumn(np.full(len(self.values), other, dtype=np.int64), 0)
+        if not isinstance(other, FixedPointColumn):
+            return NotImplemented
+        if len(other.values) != len(self.values):
+            raise ValueError("Fixed-point columns must have the same length")
+        # Product precision is the sum of both precisions; check magnitude before multiplying
+        estimate = np.abs(self.values.astype(np.float64) * other.values.astype(np.float64))
+        if len(estimate) and estimate.max() >= 2.0 ** 63:
+            raise OverflowError("Fixed-point product does not fit in int64")
+        return FixedPointColumn(
+            self.values * other.values, self.precision + other.precision, self.invalid | other.invalid
+        )
+
+    __rmul__ = __mul__
+
+    def _compare(self, other, op):
+        pair = self._aligned(other)
+        if pair is None:
+            return NotImplemented
+        left, right = pair
+        return op(left.values, right.values)
+
+    def __eq__(self, other):
+        return self._compare(other, np.equal)
+
+    def __ne__(self, other):
+        return self._compare(other, np.not_equal)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    __hash__ = None
+
+    def sum(self):
+        """Exact total of the column as a Decimal."""
+        return Decimal(sum(self.values.tolist())).scaleb(-self.precision)
+
+    # ---- Export-time conversion ----
+    def to_strings(self):
+        """Exact plain-notation strings without trailing zeros (e.g. '100', '99.5', '-0.05')."""
+        if self.precision == 0:
+            return pd.Series(self.values).astype(str).tolist()
+        scale = np.int64(10 ** self.precision)
+        magnitude = np.abs(self.values)
+        int_str = pd.Series(magnitude // scale).astype(str)
+        frac_str = pd.Series(magnitude % scale).astype(str).str.zfill(self.precision).str.rstrip("0")
+        sign = pd.Series(np.where(self.values < 0, "-", ""))
+        dot = pd.Series(np.where(frac_str != "", ".", ""))
+        return (sign + int_str + dot + frac_str).tolist()
+
+    def item(self, index):
+        """The value at `index` as a FixedPointValue (no Decimal is built)."""
+        return FixedPointValue(self.values[index], self.precision)
+
+    def to_decimals(self):
+        """Exact Decimal per value, for exporters that write numeric cells."""
+        return [Decimal(text) for text in self.to_strings()]
+
+    def to_floats(self):
+        """Float approximation of every value as a numpy array."""
+        return self.values / float(10 ** self.precision)
+
+    def __getitem__(self, index):
+        return Decimal(int(self.values[index])).scaleb(-self.precision)
+
+    def __repr__(self):
+        return f"FixedPointColumn(len={len(self.values)}, precision={self.precision})"
+
+
+class FixedPointValue:
+    """One exact value of a FixedPointColumn: a scaled integer and its precision.
+
+    Loaders put it in their row dicts instead of a Decimal. str() gives the exact
+    plain-notation text (what the CSV writer writes) and to_decimal() the Decimal
+    for numeric XLSX cells, so the conversion happens only when a row is written.
+    """
+
+    __slots__ = ("scaled", "precision")
+
+    def __init__(self, scaled, precision=0):
+        self.scaled = int(scaled)
+        self.precision = int(precision)
+
+    def __str__(self):
+        if self.precision == 0:
+            return str(self.scaled)
+        int_part, frac_part = divmod(abs(self.scaled), 10 ** self.precision)
+        frac_str = str(frac_part).zfill(self.precision).rstrip("0")
+        sign = "-" if self.scaled < 0 else ""
+        return f"{sign}{int_part}.{frac_str}" if frac_str else f"{sign}{int_part}"
+
+    def __repr__(self):
+        return f"FixedPointValue('{self}')"
+
+    def to_decimal(self):
+        """The value as an exact Decimal (same digits as str())."""
+        return Decimal(str(self))
+
+    def __float__(self):
+        return self.scaled / 10 ** self.precision
+
+    def __eq__(self, other):
+        if isinstance(other, FixedPointValue):
+            return self.to_decimal() == other.to_decimal()
+        if isinstance(other, (int, Decimal)):
+            return self.to_decimal() == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self.to_decimal())
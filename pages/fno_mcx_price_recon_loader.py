@@ -10,33 +10,15 @@ import threading
 from tkcalendar import DateEntry
 
 from my_app.pages.loading import LoadingSpinner
-from .helper import output_save_in_template, output_save_in_template_csv, multiple_files_to_zip, read_file
+from my_app.pages.search_filter import DebouncedSearch
+from my_app.pages.virtual_table import VirtualTable
+from .helper import output_save_in_template, output_save_in_template_csv, read_file
+from .fixed_point import FixedPointColumn
+from .date_utils import format_date_column, parse_date_column
 
 
-def _safe_decimal(value, precision=15):
-    """Safely convert value to Decimal with specified precision, handling None and empty strings.
-    
-    Args:
-        value: Value to convert to Decimal
-        precision: Number of decimal places to maintain (default: 15)
-    
-    Returns:
-        Decimal: Decimal value with specified precision (up to 15 decimal places)
-    """
-    from decimal import getcontext
-    # Set precision context to ensure we can handle up to 15 decimal places
-    getcontext().prec = 28  # Set precision high enough to handle 15 decimal places accurately
-    
-    if value in [None, ""]:
-        return Decimal("0")
-    
-    cleaned = str(value).replace(",", "").strip()
-    try:
-        decimal_val = Decimal(cleaned)
-        # Normalize to remove trailing zeros but preserve precision
-        return decimal_val.normalize()
-    except Exception:
-        return Decimal("0")
+# Expiry date formats accepted in the Holding Statement, in priority order
+_EXPIRY_DATE_FORMATS = ('%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d', '%d/%m/%y', '%d-%m-%y', '%Y%m%d')
 
 
 class FNOMCXPriceReconLoaderPage(tk.Frame):
@@ -150,7 +132,7 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
         
         # Search box
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *_: self._render_table())
+        DebouncedSearch(self, self.search_var, lambda _term: self._render_table())
         search_box = tk.Frame(header, bg="#ecf0f1")
         search_box.pack(side="right", padx=(0, 18))
         tk.Label(search_box, text="Search:", font=("Arial", 10), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
@@ -164,7 +146,8 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
         self.table_columns = (
             "Security", "LPA_Quantity", "Holding_Quantity", "Quantity_Difference"
         )
-        self.tree = ttk.Treeview(table_frame, columns=self.table_columns, show="headings", height=12)
+        self.table = VirtualTable(table_frame, columns=self.table_columns, height=12)
+        self.tree = self.table.tree
         
         # Column widths
         column_widths = {
@@ -177,14 +160,9 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
             self.tree.heading(col, text=col)
             self.tree.column(col, width=column_widths.get(col, 120), anchor="w")
         
-        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        x_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
         
         # Grid layout
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        y_scroll.grid(row=0, column=1, sticky="ns")
-        x_scroll.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.table.grid(row=0, column=0, sticky="nsew")
         table_frame.rowconfigure(0, weight=1)
         table_frame.columnconfigure(0, weight=1)
 
@@ -234,10 +212,11 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
 
     # ---- Core processing ----
     def _process(self):
-        """Process the LPA and Holding Statement files."""
+        """Process the LPA and Holding Statement files (in a background job, see job_runner)."""
+        from .job_runner import run_page_job
+
         # Clear table
-        for it in self.tree.get_children():
-            self.tree.delete(it)
+        self.table.clear()
         self.table_rows = []
         self.processed_data = []
         self._template_data = []
@@ -272,10 +251,20 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
             messagebox.showerror("Error", f"Failed to load consolidated_data.json: {e}\nPlease ensure this file exists under my_app/.")
             return
 
-        try:
+        # Widget values are read here; the job itself never touches Tk
+        selected_date = self.date_entry.get_date() if hasattr(self, 'date_entry') else None
+        price_date = self.price_data_entry.get_date() if hasattr(self, 'price_data_entry') else None
+
+        # Get selected segment
+        selected_segment = self.segment_var.get().strip() if hasattr(self, 'segment_var') else 'FNO'
+        if not selected_segment:
+            messagebox.showwarning("Segment Missing", "Please select a segment (FNO or MCX).")
+            return
+
+        def work(job):
             # Load LPA file
-            self.status_var.set("Loading LPA file...")
-            self.lpa_data = read_file(
+            job.stage("Loading LPA file", unit="files")
+            lpa_data = read_file(
                 file_path=lpa_path,
                 sheet_name=0,
                 start_row=0,
@@ -283,100 +272,84 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
                 skip_blank_rows=False
             )
             # Clean headers
-            if self.lpa_data is not None and not self.lpa_data.empty:
-                self.lpa_data.columns = self.lpa_data.columns.str.strip()
+            if lpa_data is not None and not lpa_data.empty:
+                lpa_data.columns = lpa_data.columns.str.strip()
 
             # Load Holding Statement file
-            self.status_var.set("Loading Holding Statement file...")
+            job.stage("Loading Holding Statement file", unit="files")
             # Read from row 12 (0-based index 11) and skip first column
-            self.holding_data_raw = read_file(
+            holding_data_raw = read_file(
                 file_path=holding_path,
                 sheet_name=0,
                 start_row=11,  # Row 12 becomes header (0-based index)
                 header=True,
                 skip_blank_rows=False
             )
+            holding_data = None
             # Clean headers and skip first column (column A)
-            if self.holding_data_raw is not None and not self.holding_data_raw.empty:
+            if holding_data_raw is not None and not holding_data_raw.empty:
                 # Keep only B → end (skip column A)
-                self.holding_data_raw = self.holding_data_raw.iloc[:, 1:]
-                self.holding_data_raw.columns = self.holding_data_raw.columns.str.strip()
+                holding_data_raw = holding_data_raw.iloc[:, 1:]
+                holding_data_raw.columns = holding_data_raw.columns.str.strip()
                 
                 # Exclude expiry date based on selected date from DateEntry
                 # Use fixed ExpiryDate column
                 expiry_field = 'ExpiryDate'
                 
-                if expiry_field in self.holding_data_raw.columns:
-                    # Get selected date from DateEntry
-                    try:
-                        selected_date = self.date_entry.get_date() if hasattr(self, 'date_entry') else None
-                        if selected_date:
-                            # Convert selected date to match the format in the data
-                            selected_date_str = selected_date.strftime('%d/%m/%Y')
-                            
-                            # Filter out rows where expiry date matches the selected date
-                            # Try different date formats
-                            date_formats = ['%d/%m/%Y', '%d-%m-%Y', '%Y-%m-%d', '%d/%m/%y', '%d-%m-%y']
-                            
-                            self.holding_data = self.holding_data_raw.copy()
-                            for date_format in date_formats:
-                                try:
-                                    formatted_date = selected_date.strftime(date_format)
-                                    # Remove rows where expiry date matches
-                                    self.holding_data = self.holding_data[
-                                        self.holding_data[expiry_field].astype(str).str.strip() != formatted_date
-                                    ]
-                                    break
-                                except:
-                                    continue
-                            
-                            self.status_var.set(f"Excluded rows with expiry date '{selected_date_str}' from Holding Statement")
-                        else:
-                            # If no date selected, just exclude the expiry date column
-                            self.holding_data = self.holding_data_raw.drop(columns=[expiry_field])
-                            self.status_var.set(f"Excluded expiry date column '{expiry_field}' from Holding Statement")
-                    except Exception as e:
-                        # Fallback: just exclude the expiry date column
-                        self.holding_data = self.holding_data_raw.drop(columns=[expiry_field])
-                        self.status_var.set(f"Excluded expiry date column '{expiry_field}' from Holding Statement")
+                if expiry_field in holding_data_raw.columns:
+                    if selected_date:
+                        # Single boolean mask over every accepted date format
+                        expiry_dates, _ = parse_date_column(holding_data_raw[expiry_field], formats=_EXPIRY_DATE_FORMATS)
+                        excluded = (expiry_dates == pd.Timestamp(selected_date)).to_numpy()
+                        holding_data = holding_data_raw[~excluded].copy()
+                        job.call_ui(
+                            self.status_var.set,
+                            f"Excluded {int(excluded.sum())} rows with expiry date "
+                            f"'{selected_date.strftime('%d/%m/%Y')}' from Holding Statement"
+                        )
+                    else:
+                        holding_data = holding_data_raw.copy()
                 else:
                     # No ExpiryDate column found, keep all data
-                    self.holding_data = self.holding_data_raw.copy()
-                    self.status_var.set("No ExpiryDate column found in Holding Statement")
+                    holding_data = holding_data_raw.copy()
+                    job.call_ui(self.status_var.set, "No ExpiryDate column found in Holding Statement")
 
-            if self.lpa_data is None or self.lpa_data.empty:
-                messagebox.showerror("Error", "LPA file is empty or could not be loaded.")
-                return
-
-            if self.holding_data is None or self.holding_data.empty:
-                messagebox.showerror("Error", "Holding Statement file is empty or could not be loaded.")
-                return
+            if lpa_data is None or lpa_data.empty:
+                job.call_ui(messagebox.showerror, "Error", "LPA file is empty or could not be loaded.")
+                return None
 
-            # Get selected segment
-            selected_segment = self.segment_var.get().strip() if hasattr(self, 'segment_var') else 'FNO'
-            if not selected_segment:
-                messagebox.showwarning("Segment Missing", "Please select a segment (FNO or MCX).")
-                return
+            if holding_data is None or holding_data.empty:
+                job.call_ui(messagebox.showerror, "Error", "Holding Statement file is empty or could not be loaded.")
+                return None
             
             # Process data - placeholder function, logic to be implemented
-            self.status_var.set(f"Processing data for {selected_segment}...")
-            self.selected_segment = selected_segment  # Store segment for template export
-            self.table_rows, self.processed_data, self._template_data = self._process_data(
-                self.lpa_data, self.holding_data, consolidated_data, selected_segment
+            job.stage(f"Processing data for {selected_segment}")
+            processed = self._process_data(
+                lpa_data, holding_data, consolidated_data, selected_segment,
+                price_date=price_date, job=job
             )
+            return lpa_data, holding_data_raw, holding_data, processed
+
+        def show_result(result):
+            if result is None:
+                return
+            self.lpa_data, self.holding_data_raw, self.holding_data, processed = result
+            self.selected_segment = selected_segment  # Store segment for template export
+            self.table_rows, self.processed_data, self._template_data = processed
 
             # Render table
             self._render_table()
             self.status_var.set(f"Processed {len(self.table_rows)} records successfully")
             self.status_label.config(fg="#6c757d")  # Reset to default gray color
 
-        except Exception as e:
+        def show_error(e):
             messagebox.showerror("Error", f"Failed to process files: {e}")
             self.status_var.set("Processing failed")
-            import traceback
-            traceback.print_exc()
 
-    def _process_data(self, lpa_df, holding_df, consolidated_data, segment='FNO'):
+        run_page_job(self, work, show_result, text="Processing files...", status_var=self.status_var,
+                     on_error=show_error)
+
+    def _process_data(self, lpa_df, holding_df, consolidated_data, segment='FNO', price_date=None, job=None):
         """
         Process LPA and Holding Statement data to create price reconciliation.
         
@@ -385,6 +358,8 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
             holding_df: DataFrame from Holding Statement file (expiry date excluded)
             consolidated_data: Configuration data from consolidated_data.json
             segment: Selected segment ('FNO' or 'MCX')
+            price_date: Price date for the template (date); defaults to the price date entry
+            job: Optional JobContext; when given, status and errors go through the Tk thread
         
         Returns:
             tuple: (table_rows, processed_data, template_data)
@@ -393,6 +368,12 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
         processed_data = []
         template_data = []
         
+        def set_status(text):
+            if job is not None:
+                job.call_ui(self.status_var.set, text)
+            else:
+                self.status_var.set(text)
+        
         try:
             # Extract pricing data from consolidated_data
             asio_pricing_fno = consolidated_data.get("asio_pricing_fno", {})
@@ -437,239 +418,122 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
                 raise ValueError(f"Invalid segment: {segment}. Must be 'FNO' or 'MCX'")
             
             if lpa_filtered.empty:
-                self.status_var.set(f"No matching {segment} data found in LPA file")
+                set_status(f"No matching {segment} data found in LPA file")
                 return table_rows, processed_data, template_data
             
-            # Step 2: Process Holding Statement DataFrame
-            # First, exclude expiry date rows based on selected date from frontend using ExpiryDate column
-            # Manual exclusion without pandas-level operations
-            holding_processed = holding_df.copy()
-            
-            # Check if ExpiryDate column exists
-            if 'ExpiryDate' not in holding_processed.columns:
-                raise ValueError("Holding Statement missing required column: ExpiryDate")
-            
-            # Get selected expiry date from DateEntry and exclude matching rows
-            exclude_date = self.date_entry.get_date() if hasattr(self, 'date_entry') else None
-            if exclude_date:
-                exclude_date_str = exclude_date.strftime('%d-%m-%Y')  # Format: 25-11-2025
-                rows_to_keep = []
-                excluded_count = 0
-                
-                for idx, row in holding_processed.iterrows():
-                    expiry_date_val = str(row['ExpiryDate']).strip()
-                    if expiry_date_val != exclude_date_str:
-                        rows_to_keep.append(idx)
-                    else:
-                        excluded_count += 1
-                
-                holding_processed = holding_processed.loc[rows_to_keep].copy()
-                if excluded_count > 0:
-                    self.status_var.set(f"Excluded {excluded_count} rows with expiry date {exclude_date_str}")
-            
-            # Step 3: Create concatenated security codes for Holding Statement
+            # Step 2: Holding Statement DataFrame
+            # Expiry-date rows were already dropped in _process with a single boolean mask
             # Required columns: NetBuy, NetSell, UnderlyingCode, ExpiryDate, OptionType, StrikePrice, ContractSettlementPrice
             holding_cols_needed = ['NetBuy', 'NetSell', 'UnderlyingCode', 'ExpiryDate', 'OptionType', 'StrikePrice', 'ContractSettlementPrice']
             
             # Check if required columns exist
-            missing_holding_cols = [col for col in holding_cols_needed if col not in holding_processed.columns]
+            missing_holding_cols = [col for col in holding_cols_needed if col not in holding_df.columns]
             if missing_holding_cols:
                 raise ValueError(f"Holding Statement missing required columns: {missing_holding_cols}")
             
-            # Create concatenated security code for each row
-            def create_security_code(row, exchange_prefix):
-                """Create security code: EXCHANGE + UnderlyingCode + YYYYMMDD + OptionType[0] + StrikePrice"""
-                try:
-                    underlying = str(row['UnderlyingCode']).strip()
-                    
-                    # Parse expiry date
-                    expiry_date = row['ExpiryDate']
-                    if pd.isna(expiry_date) or expiry_date == '':
-                        return ''
-                    
-                    # Try different date formats
-                    expiry_formatted = ''
-                    date_formats = [
-                        ('%d/%m/%Y', '%Y%m%d'),
-                        ('%d-%m-%Y', '%Y%m%d'),
-                        ('%Y-%m-%d', '%Y%m%d'),
-                        ('%d/%m/%y', '%Y%m%d'),
-                        ('%d-%m-%y', '%Y%m%d'),
-                        ('%Y%m%d', '%Y%m%d'),  # Already in YYYYMMDD format
-                    ]
-                    
-                    expiry_str = str(expiry_date).strip()
-                    for read_fmt, write_fmt in date_formats:
-                        try:
-                            if read_fmt == '%Y%m%d' and len(expiry_str) == 8 and expiry_str.isdigit():
-                                expiry_formatted = expiry_str
-                                break
-                            else:
-                                date_obj = datetime.strptime(expiry_str, read_fmt)
-                                expiry_formatted = date_obj.strftime(write_fmt)
-                                break
-                        except:
-                            continue
-                    
-                    if not expiry_formatted:
-                        return ''
-                    
-                    # Get option type first character
-                    option_type = str(row['OptionType']).strip()
-                    option_first_char = option_type[0] if option_type else ''
-                    
-                    # Get strike price
-                    strike_price = str(row['StrikePrice']).strip()
-                    try:
-                        strike_price_int = int(float(strike_price))
-                    except:
-                        strike_price_int = 0
-                    
-                    # Create security code
-                    security_code = f"{exchange_prefix}{underlying}{expiry_formatted}{option_first_char}{strike_price_int}"
-                    return security_code
-                except Exception as e:
-                    return ''
+            # Step 3: Security code per row: EXCHANGE + UnderlyingCode + YYYYMMDD + OptionType[0] + StrikePrice
+            expiry_formatted, _ = format_date_column(holding_df['ExpiryDate'], '%Y%m%d', formats=_EXPIRY_DATE_FORMATS)
+            strike_int = (
+                pd.to_numeric(holding_df['StrikePrice'].astype(str).str.strip(), errors='coerce')
+                .fillna(0)
+                .astype('int64')
+            )
+            security_codes = (
+                exchange_prefix
+                + holding_df['UnderlyingCode'].astype(str).str.strip()
+                + expiry_formatted
+                + holding_df['OptionType'].astype(str).str.strip().str[:1]
+                + strike_int.astype(str)
+            )
+            # Rows whose expiry could not be parsed have no security code and are skipped
+            valid = expiry_formatted != ''
+            holding = pd.DataFrame({
+                'SecurityCode': security_codes[valid],
+                'NetQty': (
+                    pd.to_numeric(holding_df.loc[valid, 'NetBuy']).astype('int64')
+                    - pd.to_numeric(holding_df.loc[valid, 'NetSell']).astype('int64')
+                ),
+                'ContractSettlementPrice': holding_df.loc[valid, 'ContractSettlementPrice'],
+            })
+            
+            # Net quantity (NetBuy - NetSell) summed per security code
+            holding_summary = holding.groupby('SecurityCode', sort=False)['NetQty'].sum().to_frame('Holding_Quantity')
+            # ContractSettlementPrice per security code (last row wins), parsed as exact fixed-point
+            last_prices = holding.drop_duplicates('SecurityCode', keep='last')
+            holding_summary['Price'] = pd.Series(
+                FixedPointColumn.parse(last_prices['ContractSettlementPrice']).to_decimals(),
+                index=last_prices['SecurityCode'].to_numpy(),
+                dtype=object,
+            )
+            holding_summary = holding_summary.reset_index()
+            
+            # Step 4: Left-merge LPA against the holding summary
+            lpa = pd.DataFrame({
+                'Security': lpa_filtered['Invest'].astype(str).str.strip(),
+                'LPA_Quantity': pd.to_numeric(lpa_filtered['Quantity']).astype('int64'),
+                'Type': lpa_filtered['Type'],
+            })
+            merged = lpa.merge(holding_summary, how='left', left_on='Security', right_on='SecurityCode')
+            merged['Holding_Quantity'] = merged['Holding_Quantity'].fillna(0).astype('int64')
+            # Quantity difference (LPA - Holding)
+            merged['Quantity_Difference'] = merged['LPA_Quantity'] - merged['Holding_Quantity']
+            merged['Price'] = merged['Price'].astype(object).where(merged['Price'].notna(), '')
             
-            # Create dictionary: Key = SecurityCode, Value = net_qty (NetBuy - NetSell)
-            holding_dict = {}
-            # Create dictionary: Key = SecurityCode, Value = ContractSettlementPrice
-            holding_price_dict = {}
-            for _, row in holding_processed.iterrows():
-                net_buy= row['NetBuy']
-                net_sell=row['NetSell']
-                option_type=row['OptionType']
-                underlying_code=row['UnderlyingCode']
-                strike_price=row['StrikePrice']
-                expiry_date=row['ExpiryDate']
-                contract_settlement_price = row['ContractSettlementPrice']
-
-                security_code = create_security_code(row, exchange_prefix)
-                if not security_code:
-                    continue
-                net_qty = int(net_buy) - int(net_sell)
-
-                if security_code in holding_dict:
-                    holding_dict[security_code] += net_qty
+            table_df = merged[list(self.table_columns)]
+            processed_df = merged[['Security', 'LPA_Quantity', 'Holding_Quantity', 'Quantity_Difference', 'Type']]
+            
+            # Template frame with pricing headers, based on segment
+            if segment == 'FNO':
+                pricing_data = asio_pricing_fno
+                pricing_headers = FNO_PRICING_HEADER
+            else:
+                pricing_data = asio_pricing_mcx
+                pricing_headers = MCX_PRICING_HEADER
+            
+            # Get price date from frontend DateEntry, formatted as MM-DD-YYYY
+            if price_date is None and job is None and hasattr(self, 'price_data_entry'):
+                price_date = self.price_data_entry.get_date()
+            price_date_str = price_date.strftime('%m-%d-%Y') if price_date else ''
+            
+            template_columns = {}
+            for idx, header in enumerate(pricing_headers):
+                if header in pricing_data:
+                    template_columns[idx] = pricing_data[header]
+                elif header == PRICEDATE:
+                    template_columns[idx] = price_date_str
+                elif header == INVESTMENT:
+                    template_columns[idx] = merged['Security']
+                elif header == PRICE:
+                    # Use ContractSettlementPrice from the holding summary
+                    template_columns[idx] = merged['Price']
                 else:
-                    holding_dict[security_code] = net_qty
-                
-                # if option_type == "FF":
-                #     breakpoint()
-                
-                # Store ContractSettlementPrice (use the last value if multiple rows have same security_code)
-                # Convert to Decimal for exact precision
-                holding_price_dict[security_code] = _safe_decimal(contract_settlement_price)
-
-            # Match with holding statement using the dictionary
-            for _, lpa_row in lpa_filtered.iterrows():
-                invest_code = str(lpa_row['Invest']).strip()
-                lpa_qty = int(lpa_row['Quantity'])
-                lpa_type = lpa_row['Type']
-                
-                # Lookup net quantity from holding dictionary
-                holding_qty = holding_dict.get(invest_code, 0)
-                
-                # Calculate quantity difference (LPA - Holding)
-                qty_difference = lpa_qty - holding_qty
-                
-                # Create table row: Security, LPA_Quantity, Holding_Quantity, Quantity_Difference
-                table_row = [
-                    invest_code,      # Security
-                    lpa_qty,          # LPA_Quantity
-                    holding_qty,      # Holding_Quantity
-                    qty_difference    # Quantity_Difference (LPA - Holding)
-                ]
-                table_rows.append(table_row)
-                
-                # Store processed data
-                processed_data.append({
-                    'Security': invest_code,
-                    'LPA_Quantity': lpa_qty,
-                    'Holding_Quantity': holding_qty,
-                    'Quantity_Difference': qty_difference,
-                    'Type': lpa_type
-                })
-                
-                # if invest_code == "NSENIFTY20251230F0":
-                #     breakpoint()
-                
-                # Build template_data row with pricing headers
-                row = []
-                # Access pricing data based on segment
-                if segment == 'FNO':
-                    pricing_data = asio_pricing_fno
-                    for header in FNO_PRICING_HEADER:
-                        if header in pricing_data:
-                            row.append(pricing_data[header])
-                        else:
-                            if header == PRICEDATE:
-                                # Get price date from frontend DateEntry
-                                price_date = self.price_data_entry.get_date() if hasattr(self, 'price_data_entry') else None
-                                if price_date:
-                                    # Format date as MM-DD-YYYY
-                                    price_date_str = price_date.strftime('%m-%d-%Y')
-                                    row.append(price_date_str)
-                                else:
-                                    row.append('')
-                            elif header == INVESTMENT:
-                                # print("invest_code", invest_code)
-                                row.append(invest_code)
-                            elif header == PRICE:
-                                # Use ContractSettlementPrice from holding_price_dict
-                                contract_price = holding_price_dict.get(invest_code, '')
-                                row.append(contract_price)
-                            else:
-                                row.append('')
-                
-                elif segment == 'MCX':
-                    pricing_data = asio_pricing_mcx
-                    for header in MCX_PRICING_HEADER:
-                        if header in pricing_data:
-                            row.append(pricing_data[header])
-                        else:
-                            if header == PRICEDATE:
-                                # Get price date from frontend DateEntry
-                                price_date = self.price_data_entry.get_date() if hasattr(self, 'price_data_entry') else None
-                                if price_date:
-                                    # Format date as MM-DD-YYYY
-                                    price_date_str = price_date.strftime('%m-%d-%Y')
-                                    row.append(price_date_str)
-                                else:
-                                    row.append('')
-                            elif header == INVESTMENT:
-                                row.append(invest_code)
-                            elif header == PRICE:
-                                # Use ContractSettlementPrice from holding_price_dict
-                                contract_price = holding_price_dict.get(invest_code, '')
-                                row.append(contract_price)
-                            else:
-                                row.append('')
-                
-                template_data.append(row)
+                    template_columns[idx] = ''
+            template_df = pd.DataFrame(template_columns, index=merged.index)
             
-            self.status_var.set(f"Processed {len(table_rows)} records for {segment}")
+            table_rows = table_df.values.tolist()
+            processed_data = processed_df.to_dict('records')
+            template_data = template_df.values.tolist()
+            
+            set_status(f"Processed {len(table_rows)} records for {segment}")
             
         except Exception as e:
             import traceback
             error_msg = f"Error in _process_data: {str(e)}\n{traceback.format_exc()}"
-            messagebox.showerror("Processing Error", error_msg)
-            self.status_var.set(f"Processing error: {str(e)}")
+            if job is not None:
+                job.call_ui(messagebox.showerror, "Processing Error", error_msg)
+            else:
+                messagebox.showerror("Processing Error", error_msg)
+            set_status(f"Processing error: {str(e)}")
         
         return table_rows, processed_data, template_data
 
     # ---- Rendering with filtering ----
     def _render_table(self):
         """Render table with search filtering."""
-        # Clear table
-        for it in self.tree.get_children():
-            self.tree.delete(it)
-        
-        term = (self.search_var.get() if hasattr(self, 'search_var') else "").lower().strip()
+        term = self.search_var.get() if hasattr(self, 'search_var') else ""
         
-        for r in self.table_rows:
-            if not term or term in " ".join(map(str, r)).lower():
-                self.tree.insert("", "end", values=r)
+        # Only the visible rows are materialized in the Treeview
+        self.table.show(self.table_rows, term)
 
     def _export_excel(self):
         """Export data to Excel and/or CSV file based on format selection."""
@@ -785,11 +649,9 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
                 if self.selected_segment == 'FNO':
                     pricing_headers = FNO_PRICING_HEADER
                     template_filename_base = "FNO_Pricing_Template"
-                    zip_filename = "FNO_Price_Recon_Template.zip"
                 elif self.selected_segment == 'MCX':
                     pricing_headers = MCX_PRICING_HEADER
                     template_filename_base = "MCX_Pricing_Template"
-                    zip_filename = "MCX_Price_Recon_Template.zip"
                 else:
                     loader.close()
                     messagebox.showwarning("Warning", f"Invalid segment: {self.selected_segment}")
@@ -808,35 +670,31 @@ class FNOMCXPriceReconLoaderPage(tk.Frame):
                 
                 # Export CSV if selected
                 if export_csv and template_data_dicts:
-                    file_io, file_name = output_save_in_template_csv(
+                    files.append((output_save_in_template_csv, (
                         template_data_dicts,
                         pricing_headers,
                         f"{template_filename_base}.csv"
-                    )
-                    files.append((file_io, file_name))
+                    )))
                 
                 # Export XLSX if selected
                 if export_xlsx and template_data_dicts:
-                    file_io, file_name = output_save_in_template(
+                    files.append((output_save_in_template, (
                         template_data_dicts,
                         pricing_headers,
                         f"{template_filename_base}.xlsx"
-                    )
-                    files.append((file_io, file_name))
+                    )))
                 
                 if not files:
                     loader.close()
                     messagebox.showwarning("Warning", "No template data to export.")
                     return
                 
-                # Create zip file with segment-specific name
-                zip_buffer = multiple_files_to_zip(files, zip_filename)
-                
-                # Save zip file
-                with open(out_path, 'wb') as f:
-                    f.write(zip_buffer.read())
+                # Write zip file straight to disk; the CSV streams into its member
+                from .export_executor import write_export_files
+                from .zip_sink import ZipSink
+                with ZipSink(out_path) as sink:
+                    file_list = write_export_files(files, sink)
                 
-                file_list = [name for _, name in files]
                 loader.close()
                 
                 email_zip_path = out_path
@@ -1,4 +1,3 @@
-from decimal import Decimal
 import decimal
 import time
 import tkinter as tk
@@ -6,15 +5,13 @@ from tkinter import ttk, filedialog, messagebox
 import os
 import json
 from datetime import datetime
-import pandas as pd
 from my_app.CONSTANTS import CDS_GENEVA_HEADER_LIST, REG_GENEVA_HEADER_LIST
-from my_app.pages.helper import parse_expiry_date, read_file
 from my_app.pages.loading import LoadingSpinner
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-import io
-import zipfile
+from my_app.pages.zip_sink import ZipSink
 import threading
 from collections import defaultdict
+# pandas, openpyxl (xlsx_writer) and the pandas-based helpers are imported in
+# the methods that use them, so opening this page does not wait for them
 
 # Header configurations for F&O files
 CDS_HOLDINGS_HEADER = ['Source.Name','Date','QuantityUnit','Exchange','ClientCode','TradingCode','UnderlyingCode','ClientName','UnderlyingName','InstrumentType','ExpiryDate','OptionType','StrikePrice','OpenBuy','OpenSell','TradedBuy','DayBuyValue','TradedSell','DaySellValue','ExcerciseQty','AllocationQty','NetBuy','NetSell','ContractSettlementPrice','Settlement Price','BloombergCodes','Concatenate','Fund Name In Geneva','UniqueCode','Netbuy-Netsell']
@@ -158,6 +155,11 @@ class FOReconciliationPage(tk.Frame):
                                            relief="flat", padx=12, pady=4, command=self.browse_bhavcopy_file)
         self.browse_bhavcopy_btn.pack(side="right")
 
+        self.repository_bhavcopy_btn = tk.Button(bhavcopy_input_frame, text="From Repository",
+                                               bg="#8e44ad", fg="white", font=("Arial", 10, "bold"),
+                                               relief="flat", padx=12, pady=4, command=self.choose_repository_bhavcopy)
+        self.repository_bhavcopy_btn.pack(side="right", padx=(0, 6))
+
         # BhavCopy file info
         self.bhavcopy_info_label = tk.Label(bhavcopy_frame, text="No BhavCopy file selected", 
                                           font=("Arial", 10), bg="#ecf0f1", fg="#7f8c8d")
@@ -194,6 +196,7 @@ class FOReconciliationPage(tk.Frame):
         self.geneva_data = None
         self.bhavcopy_data = None
         self.bhavcopy_price_dict = {}  # Dictionary for concatenated key and closing price
+        self._bhavcopy_date = None  # Trade date of the bhavcopy in the price store
         self.Reg_Geneva = []
         self.Cds_Geneva = []
 
@@ -256,14 +259,23 @@ class FOReconciliationPage(tk.Frame):
         )
         
         if file_path:
-            self.bhavcopy_file_path = file_path
-            self.bhavcopy_path_var.set(file_path)
-            file_name = os.path.basename(file_path)
-            self.bhavcopy_info_label.config(
-                text=f"Selected: {file_name}",
-                fg="#27ae60"
-            )
-            self.status_var.set(f"BhavCopy file selected: {file_name}")
+            self._set_bhavcopy_file(file_path)
+
+    def choose_repository_bhavcopy(self):
+        """Use the F&O bhavcopy for a date from the local repository (downloading it if needed)"""
+        from my_app.pages.bhavcopy_repository import choose_repository_bhavcopy
+
+        choose_repository_bhavcopy(self, "FO", self._set_bhavcopy_file)
+
+    def _set_bhavcopy_file(self, file_path):
+        self.bhavcopy_file_path = file_path
+        self.bhavcopy_path_var.set(file_path)
+        file_name = os.path.basename(file_path)
+        self.bhavcopy_info_label.config(
+            text=f"Selected: {file_name}",
+            fg="#27ae60"
+        )
+        self.status_var.set(f"BhavCopy file selected: {file_name}")
 
     def clear_holdings_files(self):
         """Clear all selected holding files"""
@@ -299,38 +311,45 @@ class FOReconciliationPage(tk.Frame):
             return
         
         if not self.bhavcopy_file_path:
-            messagebox.showwarning("No BhavCopy File", "Please select a NSE F&O BhavCopy file.")
+            messagebox.showwarning("No BhavCopy File", "Please select a NSE F&O BhavCopy file (Browse or From Repository).")
             return
 
-        try:
-            self.status_var.set("Starting F&O reconciliation process...")
-            self.process_btn.config(state="disabled")
-            
+        from my_app.pages.job_runner import run_page_job
+
+        self.status_var.set("Starting F&O reconciliation process...")
+        self.process_btn.config(state="disabled")
+        geneva_file_path = self.geneva_file_path
+        bhavcopy_file_path = self.bhavcopy_file_path
+
+        # Files are loaded in a background job; results are stored on the Tk thread
+        def work(job):
             # Load Geneva file
-            self.status_var.set("Loading Geneva file...")
-            self.geneva_data = self.load_file(self.geneva_file_path, skip_blank_rows=True)
-            
-            if self.geneva_data is None or len(self.geneva_data) == 0:
-                messagebox.showerror("Error", "Geneva file is empty or could not be loaded.")
-                self.status_var.set("Geneva file loading failed")
-                return
+            job.stage("Loading Geneva file", unit="files")
+            geneva_data = self.load_file(geneva_file_path, skip_blank_rows=True)
             
-            self.status_var.set(f"Geneva file loaded ({len(self.geneva_data)} records)")
+            if geneva_data is None or len(geneva_data) == 0:
+                job.call_ui(messagebox.showerror, "Error", "Geneva file is empty or could not be loaded.")
+                job.call_ui(self.status_var.set, "Geneva file loading failed")
+                return None
             
             # Load BhavCopy file
-            self.status_var.set("Loading BhavCopy file...")
-            self.bhavcopy_data = self.load_file(self.bhavcopy_file_path, skip_blank_rows=True)
+            job.stage("Loading BhavCopy file", unit="files")
+            bhavcopy_data = self.load_file(bhavcopy_file_path, skip_blank_rows=True)
             
-            if self.bhavcopy_data is None or len(self.bhavcopy_data) == 0:
-                messagebox.showerror("Error", "BhavCopy file is empty or could not be loaded.")
-                self.status_var.set("BhavCopy file loading failed")
-                return
+            if bhavcopy_data is None or len(bhavcopy_data) == 0:
+                job.call_ui(messagebox.showerror, "Error", "BhavCopy file is empty or could not be loaded.")
+                job.call_ui(self.status_var.set, "BhavCopy file loading failed")
+                return None
             
-            self.status_var.set(f"BhavCopy file loaded ({len(self.bhavcopy_data)} records)")
+            return geneva_data, bhavcopy_data
+
+        def show_result(result):
+            self.process_btn.config(state="normal")
+            if result is None:
+                return
+            self.geneva_data, self.bhavcopy_data = result
             
             # Files will be processed in export_results
-            self.status_var.set("Files ready for processing")
-            
             # TODO: Implement reconciliation logic
             self.reconciliation_results = {}
             
@@ -343,15 +362,22 @@ class FOReconciliationPage(tk.Frame):
             summary_msg += f"Holdings: {len(self.holdings_files)} files selected"
             
             messagebox.showinfo("Success", summary_msg)
-            
-        except Exception as e:
+
+        def show_error(e):
+            self.process_btn.config(state="normal")
             messagebox.showerror("Error", f"Reconciliation failed:\n{str(e)}")
             self.status_var.set("Reconciliation failed")
-        finally:
+
+        def cancelled():
             self.process_btn.config(state="normal")
 
+        run_page_job(self, work, show_result, text="Loading files...", status_var=self.status_var,
+                     on_error=show_error, on_cancelled=cancelled)
+
     def load_file(self, file_path, skip_blank_rows=True):
         """Load a single file and return DataFrame"""
+        from my_app.pages.helper import read_file
+
         try:
             data = read_file(file_path, skip_blank_rows=skip_blank_rows)
             return data
@@ -360,30 +386,14 @@ class FOReconciliationPage(tk.Frame):
 
 
     def format_excel_sheet(self, worksheet, num_rows, num_cols):
-        """Apply formatting to Excel worksheet"""
-        # Header formatting
-        header_fill = PatternFill(start_color="305496", end_color="305496", fill_type="solid")
-        header_font = Font(color="FFFFFF", bold=True)
-        header_alignment = Alignment(horizontal="center", vertical="center")
-        no_border = Border()
-        
-        # Data formatting - Light blue zebra
-        light_blue_fill = PatternFill(start_color="D9E1F2", end_color="D9E1F2", fill_type="solid")
-        
-        # Apply header formatting (row 1)
-        for col in range(1, num_cols + 1):
-            cell = worksheet.cell(row=1, column=col)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
-            cell.border = no_border
-        
-        # Apply zebra striping to data rows
-        for row in range(2, num_rows + 2):
-            if row % 2 == 0:
-                for col in range(1, num_cols + 1):
-                    cell = worksheet.cell(row=row, column=col)
-                    cell.fill = light_blue_fill
+        """
+        Apply formatting to Excel worksheet
+        - Header: Blue, Accent 1, Darker 25% (no borders)
+        - Data: Light blue and white zebra striping (one conditional-format rule)
+        """
+        from my_app.pages.xlsx_writer import format_sheet
+
+        format_sheet(worksheet, num_rows, num_cols)
 
     def export_results(self):
         """Export F&O reconciliation results with robust error handling"""
@@ -397,10 +407,14 @@ class FOReconciliationPage(tk.Frame):
         
         def task():
             """Run the heavy export work in a background thread"""
+            from my_app.pages.helper import read_file
+
             try:
                 # Load configuration and initialize data structure
                 fund_map = self._load_fund_mapping()
                 data_dict = self._initialize_data_dict()
+                self.bhavcopy_price_dict = {}
+                self._bhavcopy_date = None
                 
                 
                 # Process all files
@@ -556,6 +570,8 @@ class FOReconciliationPage(tk.Frame):
 
     def _convert_to_numeric(self, value):
         """Convert value to appropriate numeric type for Excel"""
+        import pandas as pd
+
         if pd.isna(value) or value == '' or value is None:
             return None
         elif isinstance(value, (int, float)):
@@ -569,12 +585,20 @@ class FOReconciliationPage(tk.Frame):
             except (ValueError, TypeError, decimal.InvalidOperation):
                 return str(value)
 
-    def _create_concatenate_code(self, row):
-        """Create concatenate code from row data"""
+    def _expiry_column(self, df, column, formats=None, dayfirst=True):
+        """Whole expiry column as YYYYMMDD strings ('' where missing or unparseable)"""
+        from my_app.pages.date_utils import format_date_column
+
+        if column not in df.columns:
+            return [""] * len(df)
+        formatted, _ = format_date_column(df[column], "%Y%m%d", formats=formats, dayfirst=dayfirst)
+        return formatted.tolist()
+
+    def _create_concatenate_code(self, row, expiry_date):
+        """Create concatenate code from row data and its pre-parsed YYYYMMDD expiry date"""
         try:
             exchange = str(row['Exchange']).strip()
             underlying_code = str(row['UnderlyingCode']).strip()
-            expiry_date = parse_expiry_date(row['ExpiryDate'])
 
             option_type = str(row['OptionType']).strip()[0]
             strike_price = int(row['StrikePrice'])
@@ -583,12 +607,13 @@ class FOReconciliationPage(tk.Frame):
         except Exception as e:
             return ""
 
-    def _create_bhavcopy_concatenated_key(self, row):
+    def _create_bhavcopy_concatenated_key(self, row, expiry_dt):
         """Create concatenated key for BhavCopy data using NSE+SYMBOL+EXPIRY_DT+OPTION_TYP+STRIKE_PR format"""
         try:
             # Format: NSE + SYMBOL + EXPIRY_DT (yyyymmdd) + OPTION_TYP (first char) + STRIKE_PR
+            if not expiry_dt:
+                return ""
             symbol = str(row.get('SYMBOL', '')).strip()
-            expiry_dt = pd.to_datetime(row.get('EXPIRY_DT')).strftime('%Y%m%d')
             option_typ = str(row.get('OPTION_TYP', '')).strip()
             option_typ_first_char = option_typ[0] if option_typ else ''
             strike_pr = str(int(row.get('STRIKE_PR', 0)))
@@ -597,14 +622,19 @@ class FOReconciliationPage(tk.Frame):
         except Exception as e:
             return ""
 
-    def _calculate_net_difference(self, row):
-        """Calculate net buy - net sell with Decimal precision"""
-        try:
-            netbuy_decimal = Decimal(str(row['NetBuy'])) if pd.notna(row['NetBuy']) else Decimal('0')
-            netsell_decimal = Decimal(str(row['NetSell'])) if pd.notna(row['NetSell']) else Decimal('0')
-            return float(netbuy_decimal - netsell_decimal)
-        except Exception as e:
-            return 0.0
+    def _calculate_net_differences(self, df):
+        """Calculate net buy - net sell for every row with exact fixed-point precision"""
+        import numpy as np
+        from my_app.pages.fixed_point import FixedPointColumn
+
+        def column(name):
+            if name in df.columns:
+                return FixedPointColumn.parse(df[name])
+            return FixedPointColumn.zeros(len(df))
+
+        net = column('NetBuy') - column('NetSell')
+        # A row with an unparseable quantity nets to 0, as before
+        return np.where(net.invalid, 0.0, net.to_floats()).tolist()
 
     def _process_holdings_file(self, item, fund_map, data_dict):
         """Process a single holdings file and populate data_dict"""
@@ -624,7 +654,11 @@ class FOReconciliationPage(tk.Frame):
         fund_name = self._get_fund_name(filename, fund_map)
         print(f"Processing {filename} as {fund_name}")
 
-        for _, row in df.iterrows():
+        net_differences = self._calculate_net_differences(df)
+        # Holdings ExpiryDate is MM-DD-YYYY; parse the whole column once
+        expiry_dates = self._expiry_column(df, 'ExpiryDate', formats=("%m-%d-%Y",))
+
+        for position, (_, row) in enumerate(df.iterrows()):
             try:
                 # Build row values with proper numeric conversion
                 row_values = [fund_name]
@@ -632,10 +666,10 @@ class FOReconciliationPage(tk.Frame):
                     row_values.append(self._convert_to_numeric(v))
 
                 # Add calculated fields
-                concatenate_code = self._create_concatenate_code(row)
+                concatenate_code = self._create_concatenate_code(row, expiry_dates[position])
                 client_name = str(row['ClientName']).strip()
                 unique_code = f"{concatenate_code}{client_name}"
-                net_difference = self._calculate_net_difference(row)
+                net_difference = net_differences[position]
                 
                 row_values.extend([concatenate_code, "", unique_code, net_difference])
                 
@@ -648,6 +682,8 @@ class FOReconciliationPage(tk.Frame):
 
     def _process_geneva_data(self, df, data_dict):
         """Process Geneva data and add to data_dict"""
+        import pandas as pd
+
         try:
             self.status_var.set("Processing Geneva data...")
             
@@ -655,9 +691,18 @@ class FOReconciliationPage(tk.Frame):
             # Load Geneva custodian mapping from consolidated_data.json
             geneva_mapping = self._load_geneva_custodian_mapping()
             
-            # Ensure bhavcopy_price_dict exists (should be created by BhavCopy processing)
-            if not hasattr(self, 'bhavcopy_price_dict') or not self.bhavcopy_price_dict:
-                self.bhavcopy_price_dict = {}
+            # Closing prices for just the contracts held, in one as-of lookup on the price store
+            if self._bhavcopy_date:
+                from my_app.pages.bhavcopy_store import get_store
+
+                investments = df['Investment'].astype(str).str.strip().unique()
+                try:
+                    self.bhavcopy_price_dict = get_store().close_prices(
+                        investments, as_of=self._bhavcopy_date, exact=True
+                    )
+                except Exception as e:
+                    # Keep the prices read from the BhavCopy frame itself
+                    print(f"Warning: Could not read prices from the bhavcopy store: {e}")
             
             # Create dynamic headers that match the actual data structure
             # Use the actual DataFrame columns + the 4 extra columns we're adding
@@ -704,19 +749,33 @@ class FOReconciliationPage(tk.Frame):
         try:
             self.status_var.set("Processing BhavCopy data...")
             
+            from my_app.pages.bhavcopy_store import get_store, to_legacy_fo_layout
+            from my_app.pages.date_utils import BHAVCOPY_DATE_FORMATS
+
             # Initialize dictionary for concatenated key and closing price
             self.bhavcopy_price_dict = {}
+            # Current (UDiFF) bhavcopies are reported with the legacy column layout
+            df = to_legacy_fo_layout(df)
+            # Add the prices to the store; Geneva prices are then looked up from it,
+            # falling back to bhavcopy_price_dict built below
+            try:
+                trade_dates = get_store().ingest_frame(df, "FO", source=self.bhavcopy_file_path)
+                self._bhavcopy_date = trade_dates[-1] if trade_dates else None
+            except Exception as e:
+                print(f"Warning: Could not add the BhavCopy to the price store: {e}")
+                self._bhavcopy_date = None
+            # Parse the whole EXPIRY_DT column once; numeric dates are month-first, as pd.to_datetime read them
+            expiry_dates = self._expiry_column(df, 'EXPIRY_DT', formats=BHAVCOPY_DATE_FORMATS)
             
-            for _, row in df.iterrows():
+            for position, (_, row) in enumerate(df.iterrows()):
                 row_values = []
                 for v in row:
                     row_values.append(self._convert_to_numeric(v))
                 
                 # Create concatenated key and store closing price
-                concatenated_key = self._create_bhavcopy_concatenated_key(row)
-                closing_price = self._convert_to_numeric(row.get('CLOSE', 0))
-                
-                self.bhavcopy_price_dict[concatenated_key] = closing_price
+                concatenated_key = self._create_bhavcopy_concatenated_key(row, expiry_dates[position])
+                # Prices from the frame itself, used whenever the price store cannot be read
+                self.bhavcopy_price_dict[concatenated_key] = self._convert_to_numeric(row.get('CLOSE', 0))
 
                 row_values.extend([concatenated_key])
                 
@@ -743,6 +802,8 @@ class FOReconciliationPage(tk.Frame):
 
     def _export_to_excel(self, export_path, data_dict):
         """Export processed data to Excel file"""
+        import pandas as pd
+
         self.status_var.set("Exporting results...")
         
         # Check if any data exists
@@ -754,41 +815,35 @@ class FOReconciliationPage(tk.Frame):
         # Prepare sheets to create
         sheets_to_create = self._prepare_excel_sheets(data_dict)
         
-        # --- Create in-memory Excel files ---
-        processed_buffer = io.BytesIO()
-        cds_reg_buffer = io.BytesIO()
         sheets_created = 0
-        zip_path = ""
 
-        try:
+        # --- Create ZIP archive ---
+        # Ensure path ends with .zip
+        if not export_path.lower().endswith('.zip'):
+            zip_path = os.path.splitext(export_path)[0] + ".zip"
+        else:
+            zip_path = export_path
+
+        # Each workbook is saved straight into its ZIP member on disk (no in-memory copies)
+        with ZipSink(zip_path) as sink:
             # 1️⃣ Write processed data to first Excel
-            with pd.ExcelWriter(processed_buffer, engine='openpyxl') as writer:
-                for sheet_name, df in sheets_to_create:
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
-                    self.format_excel_sheet(writer.sheets[sheet_name], len(df), len(df.columns))
-                    sheets_created += 1
-            
+            with sink.open("Processed_Data.xlsx") as member:
+                with pd.ExcelWriter(member, engine='openpyxl') as writer:
+                    for sheet_name, df in sheets_to_create:
+                        df.to_excel(writer, sheet_name=sheet_name, index=False)
+                        self.format_excel_sheet(writer.sheets[sheet_name], len(df), len(df.columns))
+                        sheets_created += 1
+
             # 2️⃣ Write CDS and REG Geneva data to second Excel
-            with pd.ExcelWriter(cds_reg_buffer, engine='openpyxl') as writer:
-                cds_df = pd.DataFrame(self.cds_geneva_data, columns=CDS_GENEVA_HEADER_LIST)
-                cds_df.to_excel(writer, sheet_name="CDS_Geneva_Data", index=False)
-                self.format_excel_sheet(writer.sheets["CDS_Geneva_Data"], len(cds_df), len(cds_df.columns))
-
-                reg_df = pd.DataFrame(self.reg_geneva_data, columns=REG_GENEVA_HEADER_LIST)
-                reg_df.to_excel(writer, sheet_name="REG_Geneva_Data", index=False)
-                self.format_excel_sheet(writer.sheets["REG_Geneva_Data"], len(reg_df), len(reg_df.columns))
-
-            # --- Create ZIP archive ---
-            # Ensure path ends with .zip
-            if not export_path.lower().endswith('.zip'):
-                zip_path = os.path.splitext(export_path)[0] + ".zip"
-            else:
-                zip_path = export_path
-            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                zipf.writestr("Processed_Data.xlsx", processed_buffer.getvalue())
-                zipf.writestr("Geneva_Data.xlsx", cds_reg_buffer.getvalue())
-        except Exception as e:
-            raise e
+            with sink.open("Geneva_Data.xlsx") as member:
+                with pd.ExcelWriter(member, engine='openpyxl') as writer:
+                    cds_df = pd.DataFrame(self.cds_geneva_data, columns=CDS_GENEVA_HEADER_LIST)
+                    cds_df.to_excel(writer, sheet_name="CDS_Geneva_Data", index=False)
+                    self.format_excel_sheet(writer.sheets["CDS_Geneva_Data"], len(cds_df), len(cds_df.columns))
+
+                    reg_df = pd.DataFrame(self.reg_geneva_data, columns=REG_GENEVA_HEADER_LIST)
+                    reg_df.to_excel(writer, sheet_name="REG_Geneva_Data", index=False)
+                    self.format_excel_sheet(writer.sheets["REG_Geneva_Data"], len(reg_df), len(reg_df.columns))
 
         self.status_var.set(f"Results exported to {os.path.basename(zip_path)}")
         
@@ -849,6 +904,8 @@ class FOReconciliationPage(tk.Frame):
 
     def _prepare_excel_sheets(self, data_dict):
         """Prepare list of sheets to create in Excel"""
+        import pandas as pd
+
         sheets_to_create = []
         
         # Define sheet configurations
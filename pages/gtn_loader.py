@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import filedialog, messagebox
 import os
 import json
 
@@ -7,6 +7,9 @@ import json
 # This speeds up frame opening significantly
 # pandas, openpyxl will be imported in _process() method when actually needed
 
+from my_app.pages.search_filter import DebouncedSearch
+from my_app.pages.virtual_table import VirtualTable
+
 
 class GTNLoaderPage(tk.Frame):
     def __init__(self, parent):
@@ -74,7 +77,7 @@ class GTNLoaderPage(tk.Frame):
         
         # Search box
         self.search_var = tk.StringVar()
-        self.search_var.trace_add("write", lambda *_: self._render_table())
+        DebouncedSearch(self, self.search_var, lambda _term: self._render_table())
         search_box = tk.Frame(header, bg="#ecf0f1")
         search_box.pack(side="right", padx=(0, 18))
         tk.Label(search_box, text="Search:", font=("Arial", 10), bg="#ecf0f1", fg="#2c3e50").pack(side="left")
@@ -86,16 +89,11 @@ class GTNLoaderPage(tk.Frame):
         
         # Table columns (will be populated based on data)
         self.table_columns = ()
-        self.tree = ttk.Treeview(table_frame, columns=self.table_columns, show="headings", height=12)
-        
-        y_scroll = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
-        x_scroll = ttk.Scrollbar(table_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=y_scroll.set, xscrollcommand=x_scroll.set)
+        self.table = VirtualTable(table_frame, columns=self.table_columns, height=12)
+        self.tree = self.table.tree
         
         # Grid layout
-        self.tree.grid(row=0, column=0, sticky="nsew")
-        y_scroll.grid(row=0, column=1, sticky="ns")
-        x_scroll.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.table.grid(row=0, column=0, sticky="nsew")
         table_frame.rowconfigure(0, weight=1)
         table_frame.columnconfigure(0, weight=1)
 
@@ -131,8 +129,7 @@ class GTNLoaderPage(tk.Frame):
         self.file_paths = []
         self._update_files_display()
         # Clear table and data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.table.clear()
         self.table_rows = []
         self.processed_data = []
         self._template_data = []
@@ -217,6 +214,8 @@ class GTNLoaderPage(tk.Frame):
         """Process all selected files (CSV/XLS/XLSX) and generate loaders."""
         # Lazy import heavy libraries only when processing (speeds up frame opening)
         from .helper import read_file
+        from .date_utils import format_date_column
+        from .job_runner import JobCancelled, run_page_job
         
         if not self.file_paths:
             messagebox.showwarning("No Files", "Please select at least one file (CSV/XLS/XLSX).")
@@ -240,286 +239,280 @@ class GTNLoaderPage(tk.Frame):
             messagebox.showerror("Error", f"Failed to load consolidated_data.json: {e}\nPlease ensure this file exists under my_app/.")
             return
 
-        # Clear previous processed data
-        self.processed_files_data = {}
-        all_processed_rows = []
+        # Files are read and converted in a background job (see job_runner)
+        file_paths = list(self.file_paths)
 
-        # Process each file
-        total_files = len(self.file_paths)
-        successful_files = 0
-        failed_files = []
+        def work(job):
+            # Clear previous processed data
+            processed_files_data = {}
+            all_processed_rows = []
 
-        for file_idx, file_path in enumerate(self.file_paths, 1):
-            if not os.path.exists(file_path):
-                failed_files.append(f"{os.path.basename(file_path)} (file not found)")
-                continue
+            # Process each file
+            total_files = len(file_paths)
+            successful_files = 0
+            failed_files = []
+
+            for file_idx, file_path in enumerate(file_paths, 1):
+                if not os.path.exists(file_path):
+                    failed_files.append(f"{os.path.basename(file_path)} (file not found)")
+                    continue
 
-            # Update status
-            self.status_var.set(f"Processing file {file_idx}/{total_files}: {os.path.basename(file_path)}...")
-            self.update()  # Update UI to show progress
+                # Report progress (replaces the old self.update() refresh)
+                job.stage(f"File {file_idx}/{total_files}: {os.path.basename(file_path)}")
             
-            try:
-                # Import pandas for data handling
-                import pandas as pd
-                
-                # Read the file using helper function (supports CSV, XLS, XLSX)
-                # Default: read from row 0, use first row as header
-                df_data = read_file(
-                    file_path=file_path,
-                    sheet_name=0,   # First sheet for Excel files
-                    start_row=0,    # Start from first row (0-based)
-                    header=True,    # Use first row as column names
-                    skip_blank_rows=True
-                )
+                try:
+                    # Read the file using helper function (supports CSV, XLS, XLSX)
+                    # Default: read from row 0, use first row as header
+                    df_data = read_file(
+                        file_path=file_path,
+                        sheet_name=0,   # First sheet for Excel files
+                        start_row=0,    # Start from first row (0-based)
+                        header=True,    # Use first row as column names
+                        skip_blank_rows=True
+                    )
                 
-                # Clean headers (strip whitespace)
-                df_data.columns = df_data.columns.str.strip()
+                    # Clean headers (strip whitespace)
+                    df_data.columns = df_data.columns.str.strip()
                 
-                # Process each row and create GTN loader data
-                processed_rows = []
-
-                def get_side(text):
-                    return text.split(":")[1].strip()
-
-                def format_date(value):
-                    # Try DD-MM-YYYY first
-                    date = pd.to_datetime(value, errors="coerce", dayfirst=True)
-
-                    if pd.isna(date):
-                        # fallback (let pandas guess)
-                        date = pd.to_datetime(value, errors="coerce")
-
-                    if pd.isna(date):
-                        return ""
-
-                    return date.strftime("%m-%d-%Y")
+                    # Process each row and create GTN loader data
+                    processed_rows = []
+
+                    def get_side(text):
+                        return text.split(":")[1].strip()
+
+                    # Parse TRADE_DATE for the whole file at once (day-first formats,
+                    # then a pandas guess); unparseable dates become ""
+                    if "TRADE_DATE" in df_data.columns:
+                        trade_dates, _ = format_date_column(df_data["TRADE_DATE"], "%m-%d-%Y", dayfirst=True)
+                        trade_dates = trade_dates.tolist()
+                    else:
+                        trade_dates = [""] * len(df_data)
                 
-                row_errors = []  # Track errors per row
-                for index, row in df_data.iterrows():
-                    try:
-                        # Get fee amounts, defaulting to 0 if missing
-                        B2B_COMM = float(row.get("B2B_COMM", 0) or 0)
-                        BROKER_COMM = float(row.get("BROKER_COMM", 0) or 0)
-                        OTHER_FEE_AMOUNT = float(row.get("OTHER_FEE_AMOUNT", 0) or 0)
-                        VAT_AMOUNT = float(row.get("VAT_AMOUNT", 0) or 0)
-                        WHT_AMOUNT = float(row.get("WHT_AMOUNT", 0) or 0)
-
-                        # Calculate non-cap expenses sum
-                        noncap_sum = B2B_COMM + BROKER_COMM + OTHER_FEE_AMOUNT + VAT_AMOUNT + WHT_AMOUNT
-
-                        # Start with GTN loader config template
-                        row_data = gtn_loader_config.copy()
-
-                        # Parse ISIN code
-                        isin_code = row.get("ISINCODE", "")
-                        parsed_isin = self.parse_foreign_isin(isin_code, gtn_sp_30_call_option, gtn_sp_30_put_option)
+                    row_errors = []  # Track errors per row
+                    total_rows = len(df_data)
+                    for position, (index, row) in enumerate(df_data.iterrows(), 1):
+                        job.progress(position, total_rows)
+                        try:
+                            # Get fee amounts, defaulting to 0 if missing
+                            B2B_COMM = float(row.get("B2B_COMM", 0) or 0)
+                            BROKER_COMM = float(row.get("BROKER_COMM", 0) or 0)
+                            OTHER_FEE_AMOUNT = float(row.get("OTHER_FEE_AMOUNT", 0) or 0)
+                            VAT_AMOUNT = float(row.get("VAT_AMOUNT", 0) or 0)
+                            WHT_AMOUNT = float(row.get("WHT_AMOUNT", 0) or 0)
+
+                            # Calculate non-cap expenses sum
+                            noncap_sum = B2B_COMM + BROKER_COMM + OTHER_FEE_AMOUNT + VAT_AMOUNT + WHT_AMOUNT
+
+                            # Start with GTN loader config template
+                            row_data = gtn_loader_config.copy()
+
+                            # Parse ISIN code
+                            isin_code = row.get("ISINCODE", "")
+                            parsed_isin = self.parse_foreign_isin(isin_code, gtn_sp_30_call_option, gtn_sp_30_put_option)
                         
-                        ##############################################################
-                        # Determine if this is an option trade
-                        # Check if parsed ISIN contains 'C' or 'P' (option type indicator)
-                        # Format: {symbol} {YY}{MM}{DD}{C|P}000{strike}
-                        # So we check if 'C' or 'P' appears in the parsed ISIN
-                        # is_option = bool(parsed_isin and ('C' in parsed_isin or 'P' in parsed_isin))
-                        # Get UNIT value and apply option logic
-                        # unit_value = row.get("UNIT", "")
-                        # if is_option and unit_value:
-                        #     try:
-                        #         # For option trades, multiply UNIT by 100
-                        #         unit_float = float(unit_value)
-                        #         quantity_value = str(int(unit_float * 100))
-                        #     except (ValueError, TypeError):
-                        #         # If conversion fails, use original value
-                        #         quantity_value = str(unit_value)
-                        # else:
-                        #     # For non-option trades, use UNIT as is
-                        #     quantity_value = str(unit_value)
-                        ######################################################
-
-                        trade_date = format_date(row.get("TRADE_DATE"))
+                            ##############################################################
+                            # Determine if this is an option trade
+                            # Check if parsed ISIN contains 'C' or 'P' (option type indicator)
+                            # Format: {symbol} {YY}{MM}{DD}{C|P}000{strike}
+                            # So we check if 'C' or 'P' appears in the parsed ISIN
+                            # is_option = bool(parsed_isin and ('C' in parsed_isin or 'P' in parsed_isin))
+                            # Get UNIT value and apply option logic
+                            # unit_value = row.get("UNIT", "")
+                            # if is_option and unit_value:
+                            #     try:
+                            #         # For option trades, multiply UNIT by 100
+                            #         unit_float = float(unit_value)
+                            #         quantity_value = str(int(unit_float * 100))
+                            #     except (ValueError, TypeError):
+                            #         # If conversion fails, use original value
+                            #         quantity_value = str(unit_value)
+                            # else:
+                            #     # For non-option trades, use UNIT as is
+                            #     quantity_value = str(unit_value)
+                            ######################################################
+
+                            trade_date = trade_dates[index]
                     
-                        # Update row data with values from file
-                        row_data.update({
-                            "RecordType": str(get_side(row.get("SIDE", ""))),
-                            "KeyValue": parsed_isin,
-                            "Investment": parsed_isin,
-                            "EventDate": trade_date,
-                            "SettleDate": trade_date,
-                            "ActualSettleDate": trade_date,
-                            "Quantity": str(row.get("UNIT", "")),
-                            "Price": str(row.get("PRICE", "")),
-                            "NonCapExpenses.NonCapAmount": str(noncap_sum),
-                        })
-
-                        processed_rows.append(row_data)
-                    except Exception as row_error:
-                        # Track error for this row (Excel row number = index + 2, since index is 0-based and we skip header)
-                        excel_row_num = int(index) + 2
-                        side_value = row.get("SIDE", "")
-                        error_msg = f"Row {excel_row_num} (SIDE='{side_value}'): {str(row_error)}"
-                        row_errors.append(error_msg)
-                        # Continue processing other rows
-                        continue
+                            # Update row data with values from file
+                            row_data.update({
+                                "RecordType": str(get_side(row.get("SIDE", ""))),
+                                "KeyValue": parsed_isin,
+                                "Investment": parsed_isin,
+                                "EventDate": trade_date,
+                                "SettleDate": trade_date,
+                                "ActualSettleDate": trade_date,
+                                "Quantity": str(row.get("UNIT", "")),
+                                "Price": str(row.get("PRICE", "")),
+                                "NonCapExpenses.NonCapAmount": str(noncap_sum),
+                            })
+
+                            processed_rows.append(row_data)
+                        except Exception as row_error:
+                            # Track error for this row (Excel row number = index + 2, since index is 0-based and we skip header)
+                            excel_row_num = int(index) + 2
+                            side_value = row.get("SIDE", "")
+                            error_msg = f"Row {excel_row_num} (SIDE='{side_value}'): {str(row_error)}"
+                            row_errors.append(error_msg)
+                            # Continue processing other rows
+                            continue
                 
-                # Show user-friendly error message if any row errors occurred
-                if row_errors:
-                    error_count = len(row_errors)
-                    error_details = "\n".join(row_errors[:10])  # Show first 10 errors
-                    if error_count > 10:
-                        error_details += f"\n... and {error_count - 10} more error(s)"
+                    # Show user-friendly error message if any row errors occurred
+                    if row_errors:
+                        error_count = len(row_errors)
+                        error_details = "\n".join(row_errors[:10])  # Show first 10 errors
+                        if error_count > 10:
+                            error_details += f"\n... and {error_count - 10} more error(s)"
                     
-                    messagebox.showerror(
-                        "Processing Errors",
-                        f"Found {error_count} error(s) while processing {os.path.basename(file_path)}:\n\n"
-                        f"{error_details}\n\n"
-                        f"Valid rows were processed successfully."
-                    )
+                        job.call_ui(
+                            messagebox.showerror,
+                            "Processing Errors",
+                            f"Found {error_count} error(s) while processing {os.path.basename(file_path)}:\n\n"
+                            f"{error_details}\n\n"
+                            f"Valid rows were processed successfully."
+                        )
                 
-                # Store processed data for this file (after processing all rows)
-                self.processed_files_data[file_path] = {
-                    'processed_data': processed_rows,
-                    'template_data': processed_rows,
-                    'config': gtn_loader_config
-                }
+                    # Store processed data for this file (after processing all rows)
+                    processed_files_data[file_path] = {
+                        'processed_data': processed_rows,
+                        'template_data': processed_rows,
+                        'config': gtn_loader_config
+                    }
                 
-                # Add to combined data for table display
-                all_processed_rows.extend(processed_rows)
-                successful_files += 1
+                    # Add to combined data for table display
+                    all_processed_rows.extend(processed_rows)
+                    successful_files += 1
                     
-            except Exception as e:
-                failed_files.append(f"{os.path.basename(file_path)}: {str(e)[:50]}")
-                import traceback
-                print(f"Error processing {file_path}:")
-                print(traceback.format_exc())
-                continue
+                except JobCancelled:
+                    raise
+                except Exception as e:
+                    failed_files.append(f"{os.path.basename(file_path)}: {str(e)[:50]}")
+                    import traceback
+                    print(f"Error processing {file_path}:")
+                    print(traceback.format_exc())
+                    continue
         
-        # Update table with combined data from all files
-        if all_processed_rows:
-            # Store combined data for table display
-            self.processed_data = all_processed_rows
-            self._template_data = all_processed_rows
-            self.gtn_loader_config = gtn_loader_config  # Store config for later use
-            
-            # Prepare table columns based on GTN loader config keys
+            return processed_files_data, all_processed_rows, processed_rows if successful_files else [], successful_files, failed_files
+
+        def show_result(result):
+            processed_files_data, all_processed_rows, processed_rows, successful_files, failed_files = result
+            total_files = len(file_paths)
+            self.processed_files_data = processed_files_data
+
+            # Update table with combined data from all files
             if all_processed_rows:
-                self.table_columns = tuple(all_processed_rows[0].keys())
-            else:
-                self.table_columns = tuple(gtn_loader_config.keys())
+                # Store combined data for table display
+                self.processed_data = all_processed_rows
+                self._template_data = all_processed_rows
+                self.gtn_loader_config = gtn_loader_config  # Store config for later use
             
-            # Configure table with dynamic columns
-            self.tree.configure(columns=self.table_columns)
+                # Prepare table columns based on GTN loader config keys
+                if all_processed_rows:
+                    self.table_columns = tuple(all_processed_rows[0].keys())
+                else:
+                    self.table_columns = tuple(gtn_loader_config.keys())
             
-            # Hide the tree column (#0) to prevent stretching issues
-            self.tree.column("#0", width=0, stretch=False, minwidth=0)
+                # Configure table with dynamic columns
+                self.table.set_columns(self.table_columns)
             
-            # Define column widths mapping for GTN loader columns
-            col_widths = {
-                "RecordType": 100,
-                "RecordAction": 120,
-                "KeyValue": 200,
-                "KeyValue.KeyName": 200,
-                "UserTranId1": 120,
-                "Portfolio": 120,
-                "LocationAccount": 200,
-                "Strategy": 100,
-                "Investment": 200,
-                "Broker": 150,
-                "EventDate": 120,
-                "SettleDate": 120,
-                "ActualSettleDate": 140,
-                "Quantity": 100,
-                "Price": 100,
-                "PriceDenomination": 150,
-                "CounterInvestment": 150,
-                "NetInvestmentAmount": 150,
-                "NetCounterAmount": 150,
-                "tradeFX": 100,
-                "ContractFxRateNumerator": 180,
-                "ContractFxRateDenominator": 190,
-                "ContractFxRate": 150,
-                "NotionalAmount": 130,
-                "FundStructure": 130,
-                "SpotDate": 120,
-                "PriceDirectly": 120,
-                "CounterFXDenomination": 180,
-                "CounterTDateFx": 140,
-                "AccruedInterest": 130,
-                "InvestmentAccruedInterest": 200,
-                "Comments": 200,
-                "TradeExpenses.ExpenseNumber": 200,
-                "TradeExpenses.ExpenseCode": 200,
-                "TradeExpenses.ExpenseAmt": 200,
-                "TradeExpenses.ExpenseNumber1": 220,
-                "TradeExpenses.ExpenseCode1": 220,
-                "TradeExpenses.ExpenseAmt1": 220,
-                "TradeExpenses.ExpenseNumber2": 220,
-                "TradeExpenses.ExpenseCode2": 220,
-                "TradeExpenses.ExpenseAmt2": 220,
-                "NonCapExpenses.NonCapNumber": 220,
-                "NonCapExpenses.NonCapExpenseCode": 250,
-                "NonCapExpenses.NonCapAmount": 200,
-                "NonCapExpenses.NonCapCurrency": 200,
-                "NonCapExpenses.LocationAccount": 250,
-                "NonCapExpenses.NonCapLiabilityCode": 250,
-                "NonCapExpenses.NonCapPaymentType": 220,
-                "NonCapExpenses.NonCapNumber1": 230,
-                "NonCapExpenses.NonCapExpenseCode1": 260,
-                "NonCapExpenses.NonCapAmount1": 210,
-                "NonCapExpenses.NonCapCurrency1": 210,
-                "NonCapExpenses.LocationAccount1": 260,
-                "NonCapExpenses.NonCapLiabilityCode1": 260,
-                "NonCapExpenses.NonCapPaymentType1": 230,
-                "NonCapExpenses.NonCapNumber2": 230,
-                "NonCapExpenses.NonCapExpenseCode2": 260,
-                "NonCapExpenses.NonCapAmount2": 210,
-                "NonCapExpenses.NonCapCurrency2": 210,
-                "NonCapExpenses.LocationAccount2": 260,
-                "NonCapExpenses.NonCapLiabilityCode2": 260,
-                "NonCapExpenses.NonCapPaymentType2": 230,
-            }
+                # Hide the tree column (#0) to prevent stretching issues
+                self.tree.column("#0", width=0, stretch=False, minwidth=0)
             
-            for col in self.table_columns:
-                self.tree.heading(col, text=col)
-                # Use configured width if available, otherwise calculate based on column name length
-                col_width = col_widths.get(col, min(max(len(col) * 10, 100), 300))
-                # Set stretch=False and minwidth to prevent columns from stretching or shrinking
-                self.tree.column(col, width=col_width, minwidth=col_width, anchor="w", stretch=False)
+                # Define column widths mapping for GTN loader columns
+                col_widths = {
+                    "RecordType": 100,
+                    "RecordAction": 120,
+                    "KeyValue": 200,
+                    "KeyValue.KeyName": 200,
+                    "UserTranId1": 120,
+                    "Portfolio": 120,
+                    "LocationAccount": 200,
+                    "Strategy": 100,
+                    "Investment": 200,
+                    "Broker": 150,
+                    "EventDate": 120,
+                    "SettleDate": 120,
+                    "ActualSettleDate": 140,
+                    "Quantity": 100,
+                    "Price": 100,
+                    "PriceDenomination": 150,
+                    "CounterInvestment": 150,
+                    "NetInvestmentAmount": 150,
+                    "NetCounterAmount": 150,
+                    "tradeFX": 100,
+                    "ContractFxRateNumerator": 180,
+                    "ContractFxRateDenominator": 190,
+                    "ContractFxRate": 150,
+                    "NotionalAmount": 130,
+                    "FundStructure": 130,
+                    "SpotDate": 120,
+                    "PriceDirectly": 120,
+                    "CounterFXDenomination": 180,
+                    "CounterTDateFx": 140,
+                    "AccruedInterest": 130,
+                    "InvestmentAccruedInterest": 200,
+                    "Comments": 200,
+                    "TradeExpenses.ExpenseNumber": 200,
+                    "TradeExpenses.ExpenseCode": 200,
+                    "TradeExpenses.ExpenseAmt": 200,
+                    "TradeExpenses.ExpenseNumber1": 220,
+                    "TradeExpenses.ExpenseCode1": 220,
+                    "TradeExpenses.ExpenseAmt1": 220,
+                    "TradeExpenses.ExpenseNumber2": 220,
+                    "TradeExpenses.ExpenseCode2": 220,
+                    "TradeExpenses.ExpenseAmt2": 220,
+                    "NonCapExpenses.NonCapNumber": 220,
+                    "NonCapExpenses.NonCapExpenseCode": 250,
+                    "NonCapExpenses.NonCapAmount": 200,
+                    "NonCapExpenses.NonCapCurrency": 200,
+                    "NonCapExpenses.LocationAccount": 250,
+                    "NonCapExpenses.NonCapLiabilityCode": 250,
+                    "NonCapExpenses.NonCapPaymentType": 220,
+                    "NonCapExpenses.NonCapNumber1": 230,
+                    "NonCapExpenses.NonCapExpenseCode1": 260,
+                    "NonCapExpenses.NonCapAmount1": 210,
+                    "NonCapExpenses.NonCapCurrency1": 210,
+                    "NonCapExpenses.LocationAccount1": 260,
+                    "NonCapExpenses.NonCapLiabilityCode1": 260,
+                    "NonCapExpenses.NonCapPaymentType1": 230,
+                    "NonCapExpenses.NonCapNumber2": 230,
+                    "NonCapExpenses.NonCapExpenseCode2": 260,
+                    "NonCapExpenses.NonCapAmount2": 210,
+                    "NonCapExpenses.NonCapCurrency2": 210,
+                    "NonCapExpenses.LocationAccount2": 260,
+                    "NonCapExpenses.NonCapLiabilityCode2": 260,
+                    "NonCapExpenses.NonCapPaymentType2": 230,
+                }
             
-            # Convert processed rows (dictionaries) to list of tuples for table display
-            self.table_rows = [tuple(row_data.get(col, "") for col in self.table_columns) for row_data in processed_rows]
+                for col in self.table_columns:
+                    self.tree.heading(col, text=col)
+                    # Use configured width if available, otherwise calculate based on column name length
+                    col_width = col_widths.get(col, min(max(len(col) * 10, 100), 300))
+                    # Set stretch=False and minwidth to prevent columns from stretching or shrinking
+                    self.tree.column(col, width=col_width, minwidth=col_width, anchor="w", stretch=False)
             
-            # Render the table
-            self._render_table()
+                # Convert processed rows (dictionaries) to list of tuples for table display
+                self.table_rows = [tuple(row_data.get(col, "") for col in self.table_columns) for row_data in processed_rows]
             
-            # Update status
-            status_msg = f"Processed {successful_files}/{total_files} file(s). {len(self.table_rows)} total rows loaded."
-            if failed_files:
-                status_msg += f"\nFailed: {', '.join(failed_files)}"
-            self.status_var.set(status_msg)
+                # Render the table
+                self._render_table()
             
-            if successful_files > 0:
-                messagebox.showinfo("Success", f"Successfully processed {successful_files} file(s).\n{len(self.table_rows)} total rows loaded.\n\nClick 'Export to Template' to generate loader files.")
-            else:
-                messagebox.showerror("Error", f"Failed to process all files.\n\nErrors:\n" + "\n".join(failed_files))
+                # Update status
+                status_msg = f"Processed {successful_files}/{total_files} file(s). {len(self.table_rows)} total rows loaded."
+                if failed_files:
+                    status_msg += f"\nFailed: {', '.join(failed_files)}"
+                self.status_var.set(status_msg)
+            
+                if successful_files > 0:
+                    messagebox.showinfo("Success", f"Successfully processed {successful_files} file(s).\n{len(self.table_rows)} total rows loaded.\n\nClick 'Export to Template' to generate loader files.")
+                else:
+                    messagebox.showerror("Error", f"Failed to process all files.\n\nErrors:\n" + "\n".join(failed_files))
+
+        run_page_job(self, work, show_result, text="Processing files...", status_var=self.status_var)
 
     def _render_table(self):
         """Render table with filtered data based on search."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Get search term
-        search_term = self.search_var.get().lower()
-        
-        # Filter and display rows
-        for row in self.table_rows:
-            # Apply search filter if search term exists
-            if search_term:
-                # Check if search term matches any value in the row
-                row_str = " ".join(str(val) for val in row).lower()
-                if search_term not in row_str:
-                    continue
-            
-            self.tree.insert("", "end", values=row)
+        # Only the visible rows are materialized in the Treeview
+        self.table.show(self.table_rows, self.search_var.get())
 
     def _prepare_loader_data(self):
         """
@@ -638,7 +631,9 @@ class GTNLoaderPage(tk.Frame):
                 return
             
             # Use helper functions
-            from .helper import output_save_in_template, output_save_in_template_csv, multiple_files_to_zip
+            from .helper import output_save_in_template, output_save_in_template_csv
+            from .export_executor import write_export_files
+            from .zip_sink import ZipSink
             import threading
             from my_app.pages.loading import LoadingSpinner
             
@@ -673,21 +668,19 @@ class GTNLoaderPage(tk.Frame):
                             
                             # Export CSV if selected
                             if export_csv:
-                                file_io, file_name = output_save_in_template_csv(
+                                files.append((output_save_in_template_csv, (
                                     data_dicts,
                                     headers,
                                     f"{base_name}_loader.csv"
-                                )
-                                files.append((file_io, file_name))
+                                )))
                             
                             # Export XLSX if selected
                             if export_xlsx:
-                                file_io, file_name = output_save_in_template(
+                                files.append((output_save_in_template, (
                                     data_dicts,
                                     headers,
                                     f"{base_name}_loader.xlsx"
-                                )
-                                files.append((file_io, file_name))
+                                )))
                             
                         except Exception as e:
                             failed_exports.append(f"{os.path.basename(file_path)}: {str(e)[:50]}")
@@ -701,14 +694,10 @@ class GTNLoaderPage(tk.Frame):
                         messagebox.showwarning("Warning", "No template data to export.")
                         return
                     
-                    # Create zip file
-                    zip_buffer = multiple_files_to_zip(files, "GTN_Loader_Template.zip")
-                    
-                    # Save zip file
-                    with open(out_path, 'wb') as f:
-                        f.write(zip_buffer.read())
+                    # Write zip file straight to disk; CSVs stream into their members
+                    with ZipSink(out_path) as sink:
+                        file_list = write_export_files(files, sink)
                     
-                    file_list = [name for _, name in files]
                     loader.close()
                     
                     email_zip_path = out_path
@@ -1,144 +1,119 @@
+"""
+Report and file helpers shared by the pages.
+
+Only the standard library is imported at module level: openpyxl, pandas and
+date_utils (pandas/numpy) are imported inside the functions that need them, so
+pages that only use is_missing or the ZIP helpers do not pay for them.
+"""
 import io
-from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
-import zipfile
-import os
-import csv
-import xlrd
-import openpyxl
 import os
-import pandas as pd
-from datetime import datetime
 import math
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def output_save_in_template(data, headers, filename="Report.xlsx"):
     """
     Create an Excel workbook in memory with styled headers and zebra-striping.
     
+    Rows are streamed through a write-only workbook with a shared header style
+    and conditional-format zebra striping (see xlsx_writer.write_template_xlsx).
+    
     Args:
-        data (list[dict]): List of row dicts
+        data (list[dict] | list[list]): Row dicts, or row sequences in header order
         headers (list[str]): Header column names
         filename (str): Desired filename inside the zip (default "Report.xlsx")
     
     Returns:
         (BytesIO, str): Excel file content in memory and its filename
     """
-    # Create workbook directly (faster than loading from template)
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Sheet1"
-
-    # Define styles once (optimization)
-    header_fill = PatternFill(start_color="87CEEB", end_color="87CEEB", fill_type="solid")
-    header_font = Font(color="FFFFFF", bold=True)
-    zebra_fill = PatternFill(start_color="DCE6F1", end_color="DCE6F1", fill_type="solid")
-
-    # Write headers quickly
-    for col, title in enumerate(headers, start=1):
-        cell = ws.cell(row=1, column=col, value=title)
-        cell.fill = header_fill
-        cell.font = header_font
-
-    # Pre-build header map for faster lookups
-    header_map = {header: idx + 1 for idx, header in enumerate(headers)}
-    start_row = 2
+    from .xlsx_writer import write_template_xlsx
 
-    # Optimized data writing with fast zebra striping
-    # First pass: Write all data quickly
-    for i, record in enumerate(data, start=start_row):
-        for header in headers:
-            col = header_map[header]
-            ws.cell(row=i, column=col, value=record.get(header, ""))
-    
-    # Second pass: Apply zebra striping in batches (much faster)
-    if data:  # Only if we have data
-        max_row = start_row + len(data) - 1
-        max_col = len(headers)
-        
-        # Apply zebra striping to even rows only (starting from row 2)
-        for row in range(start_row, max_row + 1, 2):  # Every 2nd row starting from start_row
-            for col in range(1, max_col + 1):
-                ws.cell(row=row, column=col).fill = zebra_fill
-
-    # Save to memory
     output = io.BytesIO()
-    wb.save(output)
+    write_template_xlsx(data, headers, output)
     output.seek(0)
     return output, filename
 
-def multiple_excels_to_zip(excel_files, zip_filename="Output.zip"):
+def multiple_excels_to_zip(excel_files, zip_filename="Output.zip", output_path=None, compresslevel=1):
     """
-    Create a ZIP archive from multiple Excel files (all in memory) with optimized compression.
+    Create a ZIP archive from multiple Excel files.
     
     Args:
-        excel_files (list of tuples): [(excel_io, excel_filename), ...]
+        excel_files (iterable of tuples): [(excel_io, excel_filename), ...]
             - excel_io: BytesIO containing Excel content
             - excel_filename: Name for the file inside the zip
+        zip_filename (str): Archive name (kept for callers; not used for the content)
+        output_path (str | None): Write the archive straight to this path instead of memory
+        compresslevel (int): Deflate level for compressible members
     
     Returns:
-        BytesIO: In-memory ZIP archive
+        BytesIO | str: In-memory ZIP archive, or `output_path` when given
     """
-    zip_buffer = io.BytesIO()
-    # Use faster compression level (1-3 instead of default 6)
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
-        for excel_io, excel_filename in excel_files:
-            excel_io.seek(0)  # make sure pointer is at start
-            zf.writestr(excel_filename, excel_io.read())
-
-    zip_buffer.seek(0)
-    return zip_buffer
+    return multiple_files_to_zip(excel_files, zip_filename, output_path, compresslevel)
 
-def output_save_in_template_csv(data, headers, filename="Report.csv"):
+def output_save_in_template_csv(data, headers, filename="Report.csv", date_fields=None, output=None):
     """
-    Create a CSV file in memory with proper formatting for financial data.
+    Create a CSV file with proper formatting for financial data.
+    
+    Rows are streamed through csv_writer.write_csv (no DataFrame, no record
+    copies); Decimals are written exactly and missing values as empty cells.
     
     Args:
-        data (list[dict]): List of row dicts
+        data (iterable): Row dicts, or sequences in header order
         headers (list[str]): Header column names
         filename (str): Desired filename inside the zip (default "Report.csv")
+        date_fields (iterable[str] | None): Columns to convert from MM-DD-YYYY to
+            DD-MM-YYYY while writing
+        output: Path or writable binary stream (e.g. a ZipSink member) to write
+            to; None builds the file in memory
     
     Returns:
-        (BytesIO, str): CSV file content in memory and its filename
+        (BytesIO, str): CSV file content in memory (or `output` when given) and its filename
     """
-    from decimal import Decimal
-    import pandas as pd
-    
-    # Convert data to DataFrame
-    df = pd.DataFrame(data, columns=headers)
-    
-    # Convert Decimal objects to strings for CSV export
-    for col in df.columns:
-        if df[col].dtype == 'object' and len(df) > 0:
-            non_null_vals = df[col].dropna()
-            if not non_null_vals.empty and isinstance(non_null_vals.iloc[0], Decimal):
-                df[col] = df[col].apply(lambda x: str(x) if pd.notna(x) else '')
-    
-    # Save to memory as CSV
+    from .csv_writer import compile_formatters, write_csv
+
+    formatters = compile_formatters(headers, date_fields or ())
+    if output is not None:
+        write_csv(data, headers, output, formatters)
+        return output, filename
     output = io.BytesIO()
-    df.to_csv(output, index=False, encoding='utf-8-sig')
+    write_csv(data, headers, output, formatters)
     output.seek(0)
     return output, filename
 
-def multiple_files_to_zip(files, zip_filename="Output.zip"):
+def multiple_files_to_zip(files, zip_filename="Output.zip", output_path=None, compresslevel=1):
     """
-    Create a ZIP archive from multiple files (Excel or CSV, all in memory) with optimized compression.
+    Create a ZIP archive from multiple files (Excel or CSV).
+    
+    Members are written one at a time as `files` is iterated (it may be a
+    generator), so with `output_path` only one member is held in memory. XLSX
+    members are stored without recompression.
     
     Args:
-        files (list of tuples): [(file_io, filename), ...]
+        files (iterable of tuples): [(file_io, filename), ...]
             - file_io: BytesIO containing file content
             - filename: Name for the file inside the zip
+        zip_filename (str): Archive name (kept for callers; not used for the content)
+        output_path (str | None): Write the archive straight to this path instead of memory
+        compresslevel (int): Deflate level for compressible members
     
     Returns:
-        BytesIO: In-memory ZIP archive
+        BytesIO | str: In-memory ZIP archive, or `output_path` when given
     """
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+    from .zip_sink import ZipSink
+
+    target = output_path if output_path else io.BytesIO()
+    with ZipSink(target, compresslevel=compresslevel) as sink:
         for file_io, filename in files:
-            file_io.seek(0)
-            zf.writestr(filename, file_io.read())
-    zip_buffer.seek(0)
-    return zip_buffer
+            sink.add(filename, file_io)
+            if output_path:
+                file_io.close()
+    if output_path:
+        return output_path
+    target.seek(0)
+    return target
 
 
 def read_file(
@@ -148,7 +123,7 @@ def read_file(
     header: bool = True,
     skip_blank_rows: bool = True,
     **kwargs
-) -> pd.DataFrame:
+) -> "pd.DataFrame":
     """
     Dynamic pandas read function for CSV/XLS/XLSX with flexible options.
 
@@ -163,6 +138,8 @@ def read_file(
     Returns:
         pd.DataFrame
     """
+    import pandas as pd
+
     ext = os.path.splitext(file_path)[-1].lower()
     
     # Determine header row
@@ -199,18 +176,6 @@ def read_file(
 
     return df
 
-def parse_expiry_date(expiry_str):
-    expiry_str = str(expiry_str).strip()
-    if not expiry_str:
-        return ""
-
-    try:
-        dt = datetime.strptime(expiry_str.strip(), "%m-%d-%Y")
-        return dt.strftime("%Y%m%d")
-    except ValueError:
-        # Invalid date → return empty or raw (your choice)
-        return ""
-    
 def is_missing(value):
     # Case 1: None
     if value is None:
@@ -227,33 +192,3 @@ def is_missing(value):
             return True
 
     return False
-
-def convert_dates_for_csv(data_list, date_fields=None):
-    """
-    Convert dates from MM-DD-YYYY to DD-MM-YYYY format for CSV export.
-    
-    Args:
-        data_list: List of dictionaries containing date fields
-        date_fields: List of field names to convert (default: EventDate, SettleDate, ActualSettleDate)
-    
-    Returns:
-        List of dictionaries with converted dates
-    """
-    if date_fields is None:
-        date_fields = ["EventDate", "SettleDate", "ActualSettleDate"]
-    
-    converted_data = []
-    for record in data_list:
-        new_record = record.copy()
-        for field in date_fields:
-            if field in new_record and new_record[field]:
-                try:
-                    # Parse MM-DD-YYYY format
-                    dt = datetime.strptime(str(new_record[field]), "%m-%d-%Y")
-                    # Convert to DD-MM-YYYY format
-                    new_record[field] = dt.strftime("%d-%m-%Y")
-                except (ValueError, TypeError):
-                    # If parsing fails, keep original value
-                    pass
-        converted_data.append(new_record)
-    return converted_data
\ No newline at end of file
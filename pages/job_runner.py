@@ -0,0 +1,351 @@
+"""
+Background jobs for Tk pages.
+
+JobRunner runs a page's file reading and transformation in a worker thread and
+streams structured progress (stage, rows done, rows total) back to the Tk
+thread through a single queue that the page polls with after(). Work functions
+receive a JobContext to report progress, to check for cooperative cancellation
+and to hand UI calls (message boxes, status text) back to the Tk thread.
+"""
+import queue
+import threading
+import time
+import tkinter as tk
+from collections import namedtuple
+
+
+# How often the Tk thread drains the event queue
+POLL_INTERVAL_MS = 100
+
+# Row-loop progress is posted at most this often (seconds); cancellation is checked every call
+PROGRESS_INTERVAL = 0.2
+
+# Minimum time between throughput samples, and the weight of the newest sample
+RATE_SAMPLE_INTERVAL = 0.5
+RATE_SMOOTHING = 0.3
+
+
+ProgressEvent = namedtuple("ProgressEvent", ["stage", "done", "total", "unit", "elapsed"])
+
+
+class JobCancelled(Exception):
+    """Raised inside a job when the user cancelled it."""
+
+
+class JobContext:
+    """Handle given to a job's work function (used from the worker thread)."""
+
+    def __init__(self, events, cancel_event):
+        self._events = events
+        self._cancel_event = cancel_event
+        self._started = time.monotonic()
+        self._last_post = 0.0
+        self._stage = ""
+        self._unit = "rows"
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    @property
+    def cancel_event(self):
+        """threading.Event set on cancellation, for waits that should end early"""
+        return self._cancel_event
+
+    def check_cancelled(self):
+        """Raise JobCancelled if the user asked to stop."""
+        if self._cancel_event.is_set():
+            raise JobCancelled()
+
+    def stage(self, name, total=None, unit="rows"):
+        """Start a new stage (always reported) and check for cancellation."""
+        self.check_cancelled()
+        self._stage = name
+        self._unit = unit
+        self._post(0, total)
+
+    def progress(self, done, total=None):
+        """Report progress in the current stage.
+
+        Cheap enough to call on every row: cancellation is checked each time,
+        but an event is only posted every PROGRESS_INTERVAL seconds (and on the
+        last row).
+        """
+        self.check_cancelled()
+        now = time.monotonic()
+        if now - self._last_post >= PROGRESS_INTERVAL or (total is not None and done >= total):
+            self._post(done, total, now)
+
+    def _post(self, done, total, now=None):
+        now = now if now is not None else time.monotonic()
+        self._last_post = now
+        self._events.put(("progress", ProgressEvent(self._stage, done, total, self._unit, now - self._started)))
+
+    def call_ui(self, func, *args, wait=False, **kwargs):
+        """Run `func(*args, **kwargs)` on the Tk thread.
+
+        Args:
+            wait (bool): Block until it has run and return its result (e.g. for askyesno)
+        """
+        if not wait:
+            self._events.put(("ui", func, args, kwargs, None))
+            return None
+        reply = queue.Queue(maxsize=1)
+        self._events.put(("ui", func, args, kwargs, reply))
+        while True:
+            try:
+                ok, value = reply.get(timeout=0.1)
+                break
+            except queue.Empty:
+                self.check_cancelled()
+        if not ok:
+            raise value
+        return value
+
+
+class Job:
+    """A running job; cancel() asks its work function to stop at the next check."""
+
+    def __init__(self, runner):
+        self._runner = runner
+        self.cancel_event = threading.Event()
+        self.finished = False
+
+    def cancel(self):
+        self.cancel_event.set()
+
+
+class JobRunner:
+    """Runs one job at a time for a Tk widget and dispatches its events on the Tk thread."""
+
+    def __init__(self, widget, poll_interval_ms=POLL_INTERVAL_MS):
+        self.widget = widget
+        self.poll_interval_ms = poll_interval_ms
+        self.job = None
+
+    @property
+    def busy(self):
+        return self.job is not None and not self.job.finished
+
+    def start(self, work, on_done=None, on_error=None, on_progress=None, on_cancelled=None, on_finally=None):
+        """Run `work(context)` in a worker thread.
+
+        All callbacks run on the Tk thread:
+            on_done(result), on_error(exception), on_progress(ProgressEvent)
+            (only the latest event per poll), on_cancelled(), and on_finally()
+            after whichever of those applied.
+
+        Returns:
+            Job
+        """
+        job = Job(self)
+        self.job = job
+        events = queue.Queue()
+        context = JobContext(events, job.cancel_event)
+
+        def run():
+            try:
+                result = work(context)
+            except JobCancelled:
+                events.put(("cancelled",))
+            except Exception as exc:
+                events.put(("error", exc))
+            else:
+                events.put(("done", result))
+
+        threading.Thread(target=run, daemon=True).start()
+
+        def poll():
+            try:
+                alive = bool(self.widget.winfo_exists())
+            except tk.TclError:
+                alive = False
+            if not alive:
+                # Page was closed: stop the work, nothing left to update
+                job.cancel()
+                job.finished = True
+                return
+
+            latest_progress = None
+            outcome = None
+            while outcome is None:
+                try:
+                    event = events.get_nowait()
+                except queue.Empty:
+                    break
+                kind = event[0]
+                if kind == "progress":
+                    latest_progress = event[1]
+                elif kind == "ui":
+                    _, func, args, kwargs, reply = event
+                    try:
+                        value = func(*args, **kwargs)
+                        if reply is not None:
+                            reply.put((True, value))
+                    except Exception as exc:
+                        if reply is not None:
+                            reply.put((False, exc))
+                else:
+                    outcome = event
+
+            if latest_progress is not None and on_progress:
+                on_progress(latest_progress)
+            if outcome is None:
+                self.widget.after(self.poll_interval_ms, poll)
+                return
+
+            job.finished = True
+            try:
+                if outcome[0] == "done" and on_done:
+                    on_done(outcome[1])
+                elif outcome[0] == "error":
+                    if on_error:
+                        on_error(outcome[1])
+                    else:
+                        raise outcome[1]
+                elif outcome[0] == "cancelled" and on_cancelled:
+                    on_cancelled()
+            finally:
+                if on_finally:
+                    on_finally()
+
+        self.widget.after(self.poll_interval_ms, poll)
+        return job
+
+    def cancel(self):
+        """Ask the running job (if any) to stop."""
+        if self.busy:
+            self.job.cancel()
+
+
+class ThroughputMeter:
+    """Rate and ETA for the current stage of a stream of ProgressEvents.
+
+    The rate is an exponential moving average of samples taken at least
+    RATE_SAMPLE_INTERVAL apart, so a single slow file or a burst of cheap rows
+    does not make the ETA jump around. A new stage name starts a new measurement.
+    """
+
+    def __init__(self, smoothing=RATE_SMOOTHING, sample_interval=RATE_SAMPLE_INTERVAL):
+        self.smoothing = smoothing
+        self.sample_interval = sample_interval
+        self._stage = None
+        self.rate = None
+
+    def update(self, event):
+        """Feed an event; returns (rate per second or None, ETA in seconds or None)."""
+        if event.stage != self._stage or event.done < self._last_done:
+            self._stage = event.stage
+            self._stage_start = (event.elapsed, event.done)
+            self._last_sample = (event.elapsed, event.done)
+            self._last_done = event.done
+            self.rate = None
+            return None, None
+        self._last_done = event.done
+
+        sample_elapsed, sample_done = self._last_sample
+        if event.elapsed - sample_elapsed >= self.sample_interval:
+            rate = (event.done - sample_done) / (event.elapsed - sample_elapsed)
+            self.rate = rate if self.rate is None else self.smoothing * rate + (1 - self.smoothing) * self.rate
+            self._last_sample = (event.elapsed, event.done)
+        elif self.rate is None:
+            # Until the first full sample, use the average since the stage started
+            start_elapsed, start_done = self._stage_start
+            if event.elapsed > start_elapsed and event.done > start_done:
+                return (event.done - start_done) / (event.elapsed - start_elapsed), None
+
+        eta = None
+        if self.rate and event.total:
+            eta = max(event.total - event.done, 0) / self.rate
+        return self.rate, eta
+
+
+def format_rate(rate, unit="rows"):
+    """'1,234 rows/s' (or '0.4 files/s' for slow units)."""
+    if rate is None:
+        return ""
+    return f"{rate:,.0f} {unit}/s" if rate >= 10 else f"{rate:.1f} {unit}/s"
+
+
+def format_eta(seconds):
+    """'ETA 0:42' / 'ETA 1:02:03' ('' when unknown)."""
+    if seconds is None:
+        return ""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"ETA {hours}:{minutes:02d}:{secs:02d}" if hours else f"ETA {minutes}:{secs:02d}"
+
+
+def format_progress(event):
+    """Human-readable one-liner for a ProgressEvent, e.g. 'Processing rows: 1,200 / 5,000'."""
+    if event.total:
+        return f"{event.stage}: {event.done:,} / {event.total:,} {event.unit}"
+    if event.done:
+        return f"{event.stage}: {event.done:,} {event.unit}"
+    return f"{event.stage}..."
+
+
+def run_page_job(page, work, on_done, text="Processing...", status_var=None, on_error=None, on_cancelled=None):
+    """Run `work(context)` for a page behind a cancellable LoadingSpinner.
+
+    Progress (stage, counts, throughput and ETA) is shown in the spinner and a
+    one-line summary in `status_var` if given; an unexpected exception goes to
+    `on_error` (default: messagebox.showerror). A page runs one job at a time -
+    starting another while one is running does nothing.
+
+    Args:
+        page (tk.Widget): Page that owns the job
+        work (callable): work(context) run in a worker thread; returns the result
+        on_done (callable): on_done(result) on the Tk thread
+        text (str): Initial spinner text
+        status_var (tk.StringVar | None): Also receives progress and "Cancelled"
+        on_error (callable | None): on_error(exception) instead of the default error box
+        on_cancelled (callable | None): Called on the Tk thread after cancellation
+
+    Returns:
+        Job | None: The started job, or None if the page is already busy
+    """
+    from tkinter import messagebox
+    from my_app.pages.loading import LoadingSpinner
+
+    runner = getattr(page, "_job_runner", None)
+    if runner is None:
+        runner = JobRunner(page)
+        page._job_runner = runner
+    if runner.busy:
+        return None
+
+    loader = LoadingSpinner(page, text=text, cancel_command=runner.cancel)
+
+    def show_progress(event):
+        loader.set_progress(event)
+        if status_var is not None:
+            status_var.set(format_progress(event))
+
+    # The spinner holds a grab, so it is closed before any follow-up dialogs
+    def done(result):
+        loader.close()
+        on_done(result)
+
+    def show_error(exc):
+        loader.close()
+        if on_error:
+            on_error(exc)
+        else:
+            messagebox.showerror("Error", f"Processing failed: {exc}")
+
+    def cancelled():
+        loader.close()
+        if status_var is not None:
+            status_var.set("Cancelled")
+        if on_cancelled:
+            on_cancelled()
+
+    return runner.start(
+        work,
+        on_done=done,
+        on_error=show_error,
+        on_progress=show_progress,
+        on_cancelled=cancelled,
+    )
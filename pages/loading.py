@@ -1,11 +1,20 @@
 import tkinter as tk
+from tkinter import ttk
 import math
+import time
+
+# Determinate progress redraws at most this often (seconds), so a fast job is not slowed by the UI
+PROGRESS_UPDATE_INTERVAL = 0.25
+
+# Extra window height once determinate progress (bar, counts, rate/ETA) is shown
+PROGRESS_EXTRA_HEIGHT = 70
 
 class LoadingSpinner(tk.Toplevel):
-    def __init__(self, parent, text="Loading...", dot_count=8, radius=40, speed=50):
+    def __init__(self, parent, text="Loading...", dot_count=8, radius=40, speed=50, cancel_command=None):
         super().__init__(parent)
         self.title("Please wait")
-        self.geometry("220x220")
+        self._height = 260 if cancel_command else 220
+        self.geometry(f"220x{self._height}")
         self.resizable(False, False)
         self.configure(bg="white")
         self.transient(parent)   # stay on top of parent
@@ -22,9 +31,26 @@ class LoadingSpinner(tk.Toplevel):
         self.canvas.pack(pady=20)
 
         # Loading text
-        self.label = tk.Label(self, text=text, font=("Arial", 12), bg="white")
+        self.label = tk.Label(self, text=text, font=("Arial", 12), bg="white", wraplength=200)
         self.label.pack()
 
+        # Determinate progress (packed on the first set_progress call)
+        self.progress_bar = ttk.Progressbar(self, orient="horizontal", length=180, mode="determinate")
+        self.count_label = tk.Label(self, text="", font=("Arial", 9), bg="white", fg="#2c3e50")
+        self.rate_label = tk.Label(self, text="", font=("Arial", 9), bg="white", fg="#7f8c8d")
+        self._progress_shown = False
+        self._meter = None
+        self._last_progress_update = 0.0
+        self._shown_stage = None
+
+        # Optional Cancel button (for background jobs that support cancellation)
+        self.cancel_button = None
+        if cancel_command:
+            self.cancel_button = tk.Button(self, text="Cancel", command=self._on_cancel, width=10)
+            self.cancel_button.pack(pady=(8, 0))
+            self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        self._cancel_command = cancel_command
+
         # Spinner config
         self.dot_count = dot_count
         self.radius = radius
@@ -61,6 +87,64 @@ class LoadingSpinner(tk.Toplevel):
             return
         self.after(self.speed, self.animate)
 
+    def set_text(self, text):
+        """Update the text under the spinner (e.g. with job progress)."""
+        try:
+            self.label.config(text=text)
+        except Exception:
+            pass
+
+    def set_progress(self, event):
+        """Show a job_runner.ProgressEvent: stage, done/total with a bar, throughput and ETA.
+
+        Cheap to call for every event: throughput is always measured, but the
+        window is redrawn at most every PROGRESS_UPDATE_INTERVAL seconds (stage
+        changes and completion are shown immediately).
+        """
+        from my_app.pages.job_runner import ThroughputMeter, format_eta, format_rate
+
+        if self._meter is None:
+            self._meter = ThroughputMeter()
+        rate, eta = self._meter.update(event)
+
+        now = time.monotonic()
+        stage_changed = event.stage != self._shown_stage
+        finished = bool(event.total) and event.done >= event.total
+        if not (stage_changed or finished) and now - self._last_progress_update < PROGRESS_UPDATE_INTERVAL:
+            return
+        self._last_progress_update = now
+        self._shown_stage = event.stage
+
+        try:
+            if not self._progress_shown:
+                self._progress_shown = True
+                self.count_label.pack(pady=(6, 0))
+                self.progress_bar.pack(pady=(4, 0))
+                self.rate_label.pack()
+                if self.cancel_button is not None:
+                    # Keep Cancel at the bottom
+                    self.cancel_button.pack_forget()
+                    self.cancel_button.pack(pady=(8, 0))
+                self._height += PROGRESS_EXTRA_HEIGHT
+                self.geometry(f"220x{self._height}")
+
+            self.label.config(text=event.stage or "Processing...")
+            if event.total:
+                percent = min(event.done / event.total, 1.0) * 100
+                self.progress_bar.config(mode="determinate", maximum=event.total, value=min(event.done, event.total))
+                self.count_label.config(text=f"{event.done:,} / {event.total:,} {event.unit} ({percent:.0f}%)")
+            else:
+                self.progress_bar.config(mode="determinate", maximum=1, value=0)
+                self.count_label.config(text=f"{event.done:,} {event.unit}" if event.done else "")
+            self.rate_label.config(text="  ·  ".join(part for part in (format_rate(rate, event.unit), format_eta(eta)) if part))
+        except Exception:
+            pass
+
+    def _on_cancel(self):
+        if self.cancel_button is not None:
+            self.cancel_button.config(state="disabled", text="Cancelling...")
+        self._cancel_command()
+
     def close(self):
         self._running = False
         try:
@@ -0,0 +1,154 @@
+"""
+Staged pipeline over bounded queues.
+
+Each stage (e.g. read -> transform -> write) runs in its own small pool of
+worker threads, connected to the next stage by a bounded queue, so different
+inputs are in different stages at the same time while at most a few
+intermediate results are held in memory. The caller's thread only consumes
+progress events, which lets a Tk page keep its status bar (and the window)
+updated while the batch runs.
+"""
+import queue
+import threading
+
+
+_POLL_SECONDS = 0.05
+_DONE = object()
+
+
+class PipelineStage:
+    """One step of a pipeline.
+
+    Attributes:
+        name (str): Label reported in progress events
+        func (callable): func(value) -> value passed to the next stage
+        workers (int): Number of threads running this stage
+    """
+
+    __slots__ = ("name", "func", "workers")
+
+    def __init__(self, name, func, workers=1):
+        self.name = name
+        self.func = func
+        self.workers = max(1, int(workers))
+
+
+class StagedPipeline:
+    """Run every input through all stages; results come back in input order.
+
+    The first exception raised by any stage stops the pipeline and is re-raised
+    from run() in the caller's thread.
+    """
+
+    def __init__(self, stages, queue_size=2):
+        """
+        Args:
+            stages (list[PipelineStage]): Stages in order
+            queue_size (int): Capacity of each queue between stages
+        """
+        self.stages = list(stages)
+        self.queue_size = max(1, int(queue_size))
+
+    def run(self, items, on_event=None, poll=None):
+        """Process `items` and return the last stage's results in input order.
+
+        Args:
+            items (iterable): Inputs for the first stage
+            on_event (callable | None): on_event(stage_name, index, finished) called in the
+                caller's thread when an input enters (finished=False) or leaves
+                (finished=True) a stage
+            poll (callable | None): Called in the caller's thread while waiting
+                (e.g. a Tk page's update_idletasks)
+
+        Returns:
+            list: One result per input, in input order
+        """
+        items = list(items)
+        stop = threading.Event()
+        events = queue.Queue()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results = [None] * len(items)
+        threads = []
+
+        def put(target, value):
+            # Bounded put that gives up once the pipeline is stopping
+            while not stop.is_set():
+                try:
+                    target.put(value, timeout=_POLL_SECONDS)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def feed():
+            for index, item in enumerate(items):
+                if not put(queues[0], (index, item)):
+                    return
+            for _ in range(self.stages[0].workers):
+                put(queues[0], _DONE)
+
+        def work(position, stage, finished_workers, lock):
+            inbox = queues[position]
+            last = position == len(self.stages) - 1
+            while not stop.is_set():
+                try:
+                    entry = inbox.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    continue
+                if entry is _DONE:
+                    break
+                index, value = entry
+                events.put(("start", stage.name, index, None))
+                try:
+                    value = stage.func(value)
+                except BaseException as exc:  # reported to the caller's thread
+                    stop.set()
+                    events.put(("error", stage.name, index, exc))
+                    return
+                events.put(("finish", stage.name, index, value if last else None))
+                if not last and not put(queues[position + 1], (index, value)):
+                    return
+            # The last worker of a stage closes the next stage's queue
+            with lock:
+                finished_workers[0] += 1
+                closing = finished_workers[0] == stage.workers
+            if closing and not last:
+                for _ in range(self.stages[position + 1].workers):
+                    put(queues[position + 1], _DONE)
+
+        threads.append(threading.Thread(target=feed, daemon=True))
+        for position, stage in enumerate(self.stages):
+            finished_workers, lock = [0], threading.Lock()
+            for _ in range(stage.workers):
+                threads.append(threading.Thread(
+                    target=work, args=(position, stage, finished_workers, lock), daemon=True
+                ))
+        for thread in threads:
+            thread.start()
+
+        last_name = self.stages[-1].name
+        remaining = len(items)
+        error = None
+        try:
+            while remaining and error is None:
+                try:
+                    kind, stage_name, index, payload = events.get(timeout=_POLL_SECONDS)
+                except queue.Empty:
+                    if poll:
+                        poll()
+                    continue
+                if kind == "error":
+                    error = payload
+                    break
+                if kind == "finish" and stage_name == last_name:
+                    results[index] = payload
+                    remaining -= 1
+                if on_event:
+                    on_event(stage_name, index, kind == "finish")
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+        if error is not None:
+            raise error
+        return results
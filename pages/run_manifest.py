@@ -0,0 +1,107 @@
+"""
+Checkpoint manifest for batch runs.
+
+A RunManifest lives in a batch's output directory and records every completed
+unit of work: the unit's key (input fingerprint plus the settings that shape
+its output) mapped to the output file it produced and that file's SHA-256.
+Re-running the same batch skips units whose recorded output is still on disk
+unchanged, so an interrupted run resumes at the first incomplete unit.
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+
+MANIFEST_FILENAME = "run_manifest.json"
+MANIFEST_VERSION = 1
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_fingerprint(path):
+    """Fingerprint of an input file: its size and content hash (not its name or mtime)."""
+    return f"{os.path.getsize(path)}:{file_sha256(path)}"
+
+
+def settings_digest(settings):
+    """Short stable digest of the JSON-serialisable settings that affect a unit's output."""
+    text = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+class RunManifest:
+    """Completed-unit records for one output directory (thread-safe).
+
+    Attributes:
+        path (str): Location of the manifest file
+        entries (dict): unit key -> {"output", "sha256", "completed_at", ...extra}
+    """
+
+    def __init__(self, directory, filename=MANIFEST_FILENAME):
+        self.path = os.path.join(directory, filename)
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable manifest: every unit is treated as incomplete
+            return
+        if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+            self.entries = dict(data.get("units", {}))
+
+    def _save(self):
+        # Write a temporary file and swap it in, so a crash never leaves a torn manifest
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "units": self.entries}, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def completed(self, key):
+        """Entry for `key` if its output still exists with the recorded hash, else None."""
+        with self._lock:
+            entry = self.entries.get(key)
+        if not entry:
+            return None
+        output = entry.get("output")
+        if not output or not os.path.isfile(output):
+            return None
+        try:
+            if file_sha256(output) != entry.get("sha256"):
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def record(self, key, output_path, **extra):
+        """Mark a unit complete and persist the manifest immediately.
+
+        Args:
+            key (str): Unit key
+            output_path (str): File the unit produced
+            **extra: JSON-serialisable details kept with the entry (e.g. row counts)
+        """
+        entry = {
+            "output": os.path.abspath(output_path),
+            "sha256": file_sha256(output_path),
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        }
+        entry.update(extra)
+        with self._lock:
+            self.entries[key] = entry
+            self._save()
+        return entry
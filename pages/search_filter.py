@@ -0,0 +1,96 @@
+"""
+Search filtering for result tables.
+
+SearchIndex holds one lowercase haystack per row, built once per dataset, and
+answers substring queries with the matching row indices. A query that contains
+an earlier query (typically the user typing one more character) only rescans
+that query's matches, and recent results are kept so backspacing is free.
+DebouncedSearch runs the search once typing pauses instead of on every key.
+"""
+from collections import OrderedDict
+
+
+# Delay after the last keystroke before filtering (milliseconds)
+SEARCH_DELAY_MS = 150
+
+# Recent query results kept per index for narrowing and backspacing
+_RESULT_CACHE_SIZE = 16
+
+
+def row_haystack(row):
+    """Default haystack: every cell as text, space separated, lowercased."""
+    return " ".join(map(str, row)).lower()
+
+
+class SearchIndex:
+    """Precomputed lowercase haystacks with incremental substring search."""
+
+    def __init__(self, haystacks):
+        self._haystacks = list(haystacks)
+        self._results = OrderedDict()
+
+    @classmethod
+    def from_rows(cls, rows, text=row_haystack):
+        """Index rows by `text(row)` (already lowercase)."""
+        return cls(text(row) for row in rows)
+
+    def __len__(self):
+        return len(self._haystacks)
+
+    def search(self, term):
+        """Indices of rows whose haystack contains `term` (case-insensitive), in row order.
+
+        Returns:
+            list[int] | None: Matching indices, or None for an empty term (every row)
+        """
+        term = (term or "").lower().strip()
+        if not term:
+            return None
+        cached = self._results.get(term)
+        if cached is not None:
+            self._results.move_to_end(term)
+            return cached
+
+        # Any match of `term` also matches every cached query it contains, so
+        # only the smallest such result set needs scanning
+        candidates = None
+        for previous, matches in self._results.items():
+            if previous in term and (candidates is None or len(matches) < len(candidates)):
+                candidates = matches
+        haystacks = self._haystacks
+        if candidates is None:
+            matches = [index for index, haystack in enumerate(haystacks) if term in haystack]
+        else:
+            matches = [index for index in candidates if term in haystacks[index]]
+
+        self._results[term] = matches
+        if len(self._results) > _RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return matches
+
+
+class DebouncedSearch:
+    """Calls `callback(term)` once a StringVar has stopped changing for `delay_ms`."""
+
+    def __init__(self, widget, variable, callback, delay_ms=SEARCH_DELAY_MS):
+        self.widget = widget
+        self.variable = variable
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._pending = None
+        variable.trace_add("write", self._schedule)
+
+    def _schedule(self, *_):
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+        self._pending = self.widget.after(self.delay_ms, self._fire)
+
+    def _fire(self):
+        self._pending = None
+        self.callback(self.variable.get())
+
+    def flush(self):
+        """Run a pending search now (e.g. on Return)."""
+        if self._pending is not None:
+            self.widget.after_cancel(self._pending)
+            self._fire()
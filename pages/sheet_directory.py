@@ -0,0 +1,122 @@
+"""
+Sheet listing without loading workbooks.
+
+For .xlsx/.xlsm the sheet names come from xl/workbook.xml inside the ZIP, and
+the optional dimensions from the <dimension> element at the top of each sheet's
+XML, so no cell data is parsed. For .xls, xlrd opens the workbook on demand and
+only reads the sheet directory (dimensions load the sheet itself).
+"""
+import os
+import posixpath
+import zipfile
+from collections import namedtuple
+from xml.etree.ElementTree import iterparse
+
+
+SheetInfo = namedtuple("SheetInfo", ["name", "rows", "columns"])
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+
+def _column_number(letters):
+    number = 0
+    for letter in letters:
+        number = number * 26 + (ord(letter.upper()) - 64)
+    return number
+
+
+def _ref_size(ref):
+    """(rows, columns) of an A1 range such as 'A1:K200' (a single cell counts as 1 x 1)."""
+    last = ref.split(":")[-1].replace("$", "")
+    letters = "".join(ch for ch in last if ch.isalpha())
+    digits = "".join(ch for ch in last if ch.isdigit())
+    if not letters or not digits:
+        return None, None
+    return int(digits), _column_number(letters)
+
+
+def _sheet_dimension(archive, member):
+    """Read a sheet's XML only up to its <dimension> element (it precedes <sheetData>)."""
+    try:
+        with archive.open(member) as stream:
+            for _, element in iterparse(stream, events=("start",)):
+                tag = element.tag.rsplit("}", 1)[-1]
+                if tag == "dimension":
+                    return _ref_size(element.get("ref", ""))
+                if tag == "sheetData":
+                    break
+    except (KeyError, SyntaxError):
+        pass
+    return None, None
+
+
+def _xlsx_sheets(file_path, dimensions):
+    with zipfile.ZipFile(file_path) as archive:
+        targets = {}
+        if dimensions:
+            with archive.open("xl/_rels/workbook.xml.rels") as stream:
+                for _, element in iterparse(stream):
+                    if element.tag == f"{{{_PACKAGE_REL_NS}}}Relationship":
+                        target = element.get("Target", "")
+                        target = target.lstrip("/") if target.startswith("/") else posixpath.join("xl", target)
+                        targets[element.get("Id")] = posixpath.normpath(target)
+
+        sheets = []
+        with archive.open("xl/workbook.xml") as stream:
+            for _, element in iterparse(stream):
+                if element.tag == f"{{{_MAIN_NS}}}sheet":
+                    rows = columns = None
+                    member = targets.get(element.get(f"{{{_REL_NS}}}id"))
+                    if member:
+                        rows, columns = _sheet_dimension(archive, member)
+                    sheets.append(SheetInfo(element.get("name"), rows, columns))
+                elif element.tag == f"{{{_MAIN_NS}}}sheets":
+                    # Everything after <sheets> (defined names, calc settings) is irrelevant
+                    break
+        return sheets
+
+
+def _xls_sheets(file_path, dimensions):
+    import xlrd
+
+    book = xlrd.open_workbook(file_path, on_demand=True)
+    try:
+        if not dimensions:
+            return [SheetInfo(name, None, None) for name in book.sheet_names()]
+        sheets = []
+        for index, name in enumerate(book.sheet_names()):
+            sheet = book.sheet_by_index(index)
+            sheets.append(SheetInfo(name, sheet.nrows, sheet.ncols))
+            book.unload_sheet(index)
+        return sheets
+    finally:
+        book.release_resources()
+
+
+def read_sheet_directory(file_path, dimensions=False):
+    """List a workbook's sheets in workbook order without loading their cells.
+
+    Args:
+        file_path (str): .xlsx/.xlsm or .xls workbook
+        dimensions (bool): Also report each sheet's used range (rows/columns are
+            None when the file does not record it)
+
+    Returns:
+        list[SheetInfo]: (name, rows, columns) per sheet
+
+    Raises:
+        ValueError: The file is not a workbook this reader understands
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == ".xls":
+        return _xls_sheets(file_path, dimensions)
+    if zipfile.is_zipfile(file_path):
+        return _xlsx_sheets(file_path, dimensions)
+    raise ValueError(f"Unsupported workbook format: {os.path.basename(file_path)}")
+
+
+def read_sheet_names(file_path):
+    """Sheet names of a workbook, in workbook order."""
+    return [sheet.name for sheet in read_sheet_directory(file_path)]
@@ -0,0 +1,227 @@
+"""
+Exchange trading calendar: weekends plus known holidays, per exchange.
+
+The calendar lives in trading_calendar.json in the app directory:
+
+    {
+      "NSE": {
+        "holidays": {"2025-02-26": "Mahashivratri"},
+        "learned_holidays": {"2025-03-14": "bhavcopy not published (HTTP 404)"}
+      }
+    }
+
+"holidays" is configuration and is never rewritten by the app. "learned_holidays"
+is filled in when a past weekday's bhavcopy is confirmed missing: HTTP 404 for
+both segments while the trading days either side have bhavcopies. Later range
+downloads skip that date without a request. Delete a learned entry to have the
+date tried again.
+
+The same calendar gives T+n arithmetic for settle dates: add_trading_days() for
+single dates and add_trading_days_array() for whole columns.
+"""
+import json
+import os
+import threading
+from datetime import date, datetime, timedelta
+
+
+CALENDAR_FILENAME = "trading_calendar.json"
+DEFAULT_EXCHANGE = "NSE"
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _parse_day(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d").date()
+
+
+class TradingCalendar:
+    """Trading days of one exchange (thread-safe).
+
+    Attributes:
+        path (str): Location of trading_calendar.json
+        exchange (str): Exchange section of the file
+        holidays (dict): date -> description, from configuration
+        learned_holidays (dict): date -> description, recorded by the app
+    """
+
+    def __init__(self, path, exchange=DEFAULT_EXCHANGE):
+        self.path = path
+        self.exchange = exchange
+        self.holidays = {}
+        self.learned_holidays = {}
+        self._closed = frozenset()
+        self._busday_calendar = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # Missing or unreadable calendar: weekends only
+            return
+        section = data.get(self.exchange, {}) if isinstance(data, dict) else {}
+        for attribute in ("holidays", "learned_holidays"):
+            days = {}
+            for value, description in (section.get(attribute) or {}).items():
+                try:
+                    days[_parse_day(value)] = description
+                except ValueError:
+                    print(f"Warning: ignoring invalid date '{value}' in {CALENDAR_FILENAME}")
+            setattr(self, attribute, days)
+        self._refresh()
+
+    def _refresh(self):
+        self._closed = frozenset(self.holidays) | frozenset(self.learned_holidays)
+        self._busday_calendar = None
+
+    def is_holiday(self, day):
+        """True if `day` is a known holiday (weekends are not holidays)"""
+        return _parse_day(day) in self._closed
+
+    def is_trading_day(self, day):
+        day = _parse_day(day)
+        return day.weekday() < 5 and day not in self._closed
+
+    def holiday_reason(self, day):
+        """Description of a known holiday, or None"""
+        day = _parse_day(day)
+        return self.holidays.get(day) or self.learned_holidays.get(day)
+
+    def trading_days(self, start, end):
+        """Trading days from `start` to `end` inclusive, in order"""
+        start, end = _parse_day(start), _parse_day(end)
+        days = []
+        while start <= end:
+            if self.is_trading_day(start):
+                days.append(start)
+            start += timedelta(days=1)
+        return days
+
+    def add_trading_days(self, day, n):
+        """T+n: roll `day` forward to a trading day, then move `n` trading days (n may be negative).
+
+        Matches numpy.busday_offset(..., roll="forward"), which
+        add_trading_days_array() uses for whole columns.
+        """
+        day = _parse_day(day)
+        while not self.is_trading_day(day):
+            day += timedelta(days=1)
+        step = timedelta(days=1 if n >= 0 else -1)
+        for _ in range(abs(n)):
+            day += step
+            while not self.is_trading_day(day):
+                day += step
+        return day
+
+    def previous_trading_day(self, day):
+        """Last trading day strictly before `day`"""
+        day = _parse_day(day) - timedelta(days=1)
+        while not self.is_trading_day(day):
+            day -= timedelta(days=1)
+        return day
+
+    def add_trading_days_array(self, values, n):
+        """Vectorised add_trading_days for a column of dates.
+
+        Args:
+            values: Sequence, numpy array or pandas Series of dates (no missing values)
+            n (int | array): Trading days to add, per value or for all
+
+        Returns:
+            numpy.ndarray: datetime64[D] settle dates
+        """
+        import numpy as np
+
+        if self._busday_calendar is None:
+            self._busday_calendar = np.busdaycalendar(
+                weekmask="1111100", holidays=sorted(np.datetime64(day, "D") for day in self._closed)
+            )
+        days = np.asarray(values, dtype="datetime64[D]")
+        return np.busday_offset(days, n, roll="forward", busdaycal=self._busday_calendar)
+
+    def learn_holiday(self, day, description):
+        """Record a confirmed non-trading weekday; call save() to persist.
+
+        Returns:
+            bool: True if the date was not already known
+        """
+        day = _parse_day(day)
+        with self._lock:
+            if day.weekday() >= 5 or day in self._closed:
+                return False
+            self.learned_holidays[day] = description
+            self._refresh()
+            self._dirty = True
+            return True
+
+    def forget_holiday(self, day):
+        """Drop a learned holiday (configured holidays are left alone); call save() to persist"""
+        day = _parse_day(day)
+        with self._lock:
+            if self.learned_holidays.pop(day, None) is None:
+                return False
+            self._refresh()
+            self._dirty = True
+            return True
+
+    def save(self):
+        """Write learned holidays back to the file, keeping every other section as it is"""
+        with self._lock:
+            if not self._dirty:
+                return False
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if not isinstance(data, dict):
+                    data = {}
+            except (OSError, ValueError):
+                data = {}
+            section = data.setdefault(self.exchange, {})
+            section.setdefault("holidays", {})
+            section["learned_holidays"] = {
+                day.isoformat(): description for day, description in sorted(self.learned_holidays.items())
+            }
+            # Write a temporary file and swap it in, so a crash never leaves a torn calendar
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+            return True
+
+
+def load_trading_calendar(exchange=DEFAULT_EXCHANGE, path=None):
+    """Shared TradingCalendar for an exchange, re-read when the file changes on disk.
+
+    Args:
+        exchange (str): Exchange section of the file
+        path (str | None): Defaults to trading_calendar.json in the app directory
+
+    Returns:
+        TradingCalendar
+    """
+    if path is None:
+        from my_app.file_utils import get_app_directory
+        path = os.path.join(get_app_directory(), CALENDAR_FILENAME)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    key = (os.path.abspath(path), exchange)
+    with _cache_lock:
+        cached = _cache.get(key)
+        # A calendar with unsaved learned holidays is newer than the file
+        if cached and (cached[0] == mtime_ns or cached[1]._dirty):
+            return cached[1]
+        calendar = TradingCalendar(path, exchange)
+        _cache[key] = (mtime_ns, calendar)
+        return calendar
@@ -0,0 +1,426 @@
+"""
+Virtual result table.
+
+TableModel keeps a table's rows column by column (one list per column) plus
+the current sort order and filter as lists of row indices. VirtualTable shows a
+model in a ttk.Treeview but only ever holds as many Treeview items as fit on
+screen: scrolling re-fills those items with the rows of the new window instead
+of inserting every row up front. Counting, sorting and exporting use the model.
+"""
+import tkinter as tk
+from decimal import Decimal, InvalidOperation
+from itertools import zip_longest
+from tkinter import ttk
+
+from .search_filter import SearchIndex
+
+
+# Treeview row height used until the real one can be measured
+DEFAULT_ROW_HEIGHT = 20
+
+_SORT_ARROWS = (" ▲", " ▼")
+
+
+def _sort_key(value):
+    """Numbers (and numeric text) sort by value before any text; text sorts case-insensitively."""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        if value == value:  # not NaN
+            return (0, value, "")
+        return (1, 0, "nan")
+    text = "" if value is None else str(value).strip()
+    try:
+        number = Decimal(text.replace(",", ""))
+        if number.is_finite():
+            return (0, number, "")
+    except InvalidOperation:
+        pass
+    return (1, 0, text.lower())
+
+
+class TableModel:
+    """Column-oriented rows with a sort order and a filter.
+
+    Positions (0 .. len(model) - 1) refer to rows as currently shown: sorted and
+    filtered. Indices refer to rows in the order they were loaded.
+    """
+
+    def __init__(self, columns=(), rows=()):
+        self.columns = tuple(columns)
+        self._data = []
+        self._size = 0
+        self._order = None    # sorted indices, or None for load order
+        self._matches = None  # indices passing the filter, or None for no filter
+        self._search_index = None  # built on the first filter of a dataset
+        self._view = None     # visible indices, or None for every row in load order
+        self.sort_column = None
+        self.sort_descending = False
+        self.filter_term = ""
+        self.set_rows(rows)
+
+    # ---- Data ----
+    def set_rows(self, rows, columns=None, filter_term=None):
+        """Replace the data; the current sort column and filter term are re-applied.
+
+        Args:
+            rows (iterable): Row sequences (missing trailing cells show as "")
+            columns (tuple | None): New column names
+            filter_term (str | None): New filter term (None keeps the current one)
+        """
+        if columns is not None:
+            self.columns = tuple(columns)
+        if filter_term is not None:
+            self.filter_term = filter_term.lower().strip()
+        rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+        width = len(self.columns) or max((len(row) for row in rows), default=0)
+        if rows:
+            data = [list(column) for column in zip_longest(*rows, fillvalue="")]
+            data = data[:width] + [[""] * len(rows) for _ in range(width - len(data))]
+        else:
+            data = [[] for _ in range(width)]
+        self._data = data
+        self._size = len(rows)
+        self._order = None
+        self._matches = None
+        self._search_index = None
+        if self.sort_column is not None and self.sort_column < width:
+            self._order = self._sorted_indices(self.sort_column, self.sort_descending)
+        else:
+            self.sort_column = None
+        if self.filter_term:
+            self._matches = self._match(self.filter_term)
+        self._update_view()
+
+    def clear(self):
+        self.set_rows([])
+
+    @property
+    def size(self):
+        """Number of rows loaded (ignoring the filter)."""
+        return self._size
+
+    def __len__(self):
+        """Number of rows that pass the filter."""
+        return self._size if self._view is None else len(self._view)
+
+    def index(self, position):
+        return position if self._view is None else self._view[position]
+
+    def row(self, position):
+        """Row at a visible position, as a tuple."""
+        index = self.index(position)
+        return tuple(column[index] for column in self._data)
+
+    def rows(self, visible=True):
+        """Rows as tuples: visible rows in view order, or every row in load order."""
+        indices = range(self._size) if not visible or self._view is None else self._view
+        data = self._data
+        for index in indices:
+            yield tuple(column[index] for column in data)
+
+    def column_values(self, column):
+        """All values of one column (by position or name) in load order."""
+        if isinstance(column, str):
+            column = self.columns.index(column)
+        return self._data[column]
+
+    # ---- Sort and filter ----
+    def sort(self, column, descending=False):
+        """Sort by a column (position or name); None restores load order."""
+        if isinstance(column, str):
+            column = self.columns.index(column)
+        self.sort_column = column
+        self.sort_descending = descending
+        self._order = None if column is None else self._sorted_indices(column, descending)
+        self._update_view()
+
+    def set_filter(self, term):
+        """Keep rows whose text contains `term` (case-insensitive); empty shows all.
+
+        Row text is indexed once per dataset (see search_filter.SearchIndex).
+        """
+        term = (term or "").lower().strip()
+        if term == self.filter_term:
+            return
+        self.filter_term = term
+        self._matches = self._match(term) if term else None
+        self._update_view()
+
+    def _sorted_indices(self, column, descending):
+        keys = [_sort_key(value) for value in self._data[column]]
+        return sorted(range(self._size), key=keys.__getitem__, reverse=descending)
+
+    def _match(self, term):
+        if self._search_index is None:
+            data = self._data
+            self._search_index = SearchIndex(
+                " ".join(str(column[index]) for column in data).lower()
+                for index in range(self._size)
+            )
+        return self._search_index.search(term)
+
+    def _update_view(self):
+        if self._order is None and self._matches is None:
+            self._view = None
+            return
+        if self._matches is None:
+            self._view = list(self._order)
+        elif self._order is None:
+            self._view = self._matches
+        else:
+            matched = set(self._matches)
+            self._view = [index for index in self._order if index in matched]
+
+
+class VirtualTable(tk.Frame):
+    """A Treeview with scrollbars that materializes only the visible rows of a TableModel.
+
+    `tree` is the underlying ttk.Treeview (for heading/column configuration);
+    its items are recycled, so callers should not insert into it directly.
+    """
+
+    def __init__(self, parent, columns=(), height=12, sortable=True, **kwargs):
+        if "bg" not in kwargs:
+            try:
+                kwargs["bg"] = parent.cget("bg")
+            except tk.TclError:
+                pass  # ttk parents have no bg option
+        super().__init__(parent, **kwargs)
+        self.model = TableModel(columns)
+        self.sortable = sortable
+        self._offset = 0
+        self._items = []
+        self._shown = []  # row currently displayed by each pooled item
+        self._visible_rows = height
+        self._row_height = None
+        self._header_height = None
+        self._selected = set()
+        self._refreshing = False
+        self._source = None
+
+        self.tree = ttk.Treeview(self, columns=tuple(columns), show="headings", height=height)
+        self.y_scroll = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.x_scroll = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.x_scroll.set)
+
+        # Grid layout so the bottom scrollbar spans full width
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.y_scroll.grid(row=0, column=1, sticky="ns")
+        self.x_scroll.grid(row=1, column=0, columnspan=2, sticky="ew")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self._set_heading_commands()
+        self.tree.bind("<Configure>", self._on_configure)
+        self.tree.bind("<<TreeviewSelect>>", self._on_select)
+        # Widget bindings return "break" so the Treeview never scrolls itself
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(3))
+        for key, delta in (("<Up>", -1), ("<Down>", 1)):
+            self.tree.bind(key, lambda e, d=delta: self._move_focus(d))
+        for key, pages in (("<Prior>", -1), ("<Next>", 1)):
+            self.tree.bind(key, lambda e, p=pages: self._move_focus(p * max(1, self._visible_rows - 1)))
+        self.tree.bind("<Home>", lambda e: self._move_focus(-len(self.model)))
+        self.tree.bind("<End>", lambda e: self._move_focus(len(self.model)))
+
+    # ---- Data ----
+    def set_rows(self, rows):
+        """Show new data, keeping the sort column and filter; scrolls to the top."""
+        self._source = rows
+        self.model.set_rows(rows)
+        self._reset_view()
+
+    def show(self, rows, term=""):
+        """Show `rows` filtered by `term`.
+
+        The model is only reloaded when a different (or resized) row list is
+        passed, so re-rendering for a new search term costs just the filter.
+        """
+        if rows is not self._source or len(rows) != self.model.size:
+            self._source = rows
+            self.model.set_rows(rows, filter_term=term or "")
+        else:
+            self.model.set_filter(term)
+        self._reset_view()
+
+    def clear(self):
+        self.set_rows([])
+
+    def set_columns(self, columns):
+        """Replace the columns (and clear the data)."""
+        columns = tuple(columns)
+        self.tree.delete(*self._items)
+        self._items = []
+        self._shown = []
+        self.tree.configure(columns=columns)
+        self.model = TableModel(columns)
+        self._source = None
+        self._set_heading_commands()
+        self._reset_view()
+
+    def set_filter(self, term):
+        """Filter rows by case-insensitive text match; scrolls to the top."""
+        self.model.set_filter(term)
+        self._reset_view()
+
+    def sort_by(self, column):
+        """Sort by a column name; clicking the same column again reverses the order."""
+        position = self.model.columns.index(column)
+        descending = self.model.sort_column == position and not self.model.sort_descending
+        self.model.sort(position, descending)
+        self._update_heading_arrows()
+        self._reset_view()
+
+    @property
+    def row_count(self):
+        """Rows currently shown (after filtering)."""
+        return len(self.model)
+
+    def visible_rows(self):
+        """Rows in the order shown (sorted and filtered), e.g. for export."""
+        return list(self.model.rows(visible=True))
+
+    def selected_rows(self):
+        """Selected rows in view order."""
+        return [self.model.row(position) for position in sorted(self._selected) if position < len(self.model)]
+
+    # ---- Scrolling ----
+    def scroll(self, rows):
+        self._scroll_to(self._offset + rows)
+        return "break"
+
+    def _scroll_to(self, offset):
+        limit = max(0, len(self.model) - self._visible_rows)
+        offset = max(0, min(int(offset), limit))
+        if offset != self._offset:
+            self._offset = offset
+            self._refresh()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._scroll_to(round(float(amount) * len(self.model)))
+        elif action == "scroll":
+            step = self._visible_rows if unit == "pages" else 1
+            self._scroll_to(self._offset + int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self.scroll(-3 * delta)
+
+    def _move_focus(self, delta):
+        count = len(self.model)
+        if not count:
+            return "break"
+        focus = self.tree.focus()
+        current = self._offset + self._items.index(focus) if focus in self._items else self._offset
+        target = max(0, min(count - 1, current + delta))
+        if target < self._offset:
+            self._scroll_to(target)
+        elif target >= self._offset + self._visible_rows:
+            self._scroll_to(target - self._visible_rows + 1)
+        self._selected = {target}
+        self._refresh()
+        item = self._items[target - self._offset]
+        self.tree.focus(item)
+        return "break"
+
+    # ---- Rendering ----
+    def _reset_view(self):
+        self._offset = 0
+        self._selected = set()
+        self._refresh()
+
+    def _refresh(self):
+        """Fill the pooled Treeview items with the rows of the current window."""
+        count = len(self.model)
+        self._offset = max(0, min(self._offset, count - self._visible_rows))
+        needed = max(0, min(self._visible_rows, count - self._offset))
+
+        self._refreshing = True
+        try:
+            while len(self._items) < needed:
+                self._items.append(self.tree.insert("", "end"))
+                self._shown.append(None)
+            if len(self._items) > needed:
+                self.tree.delete(*self._items[needed:])
+                del self._items[needed:]
+                del self._shown[needed:]
+
+            # Only slots whose row changed are touched (e.g. a filter that keeps
+            # the top rows costs no Treeview updates for them)
+            selection = []
+            for slot, item in enumerate(self._items):
+                position = self._offset + slot
+                row = self.model.row(position)
+                if row != self._shown[slot]:
+                    self.tree.item(item, values=row)
+                    self._shown[slot] = row
+                if position in self._selected:
+                    selection.append(item)
+            if set(selection) != set(self.tree.selection()):
+                self.tree.selection_set(selection)
+        finally:
+            self._refreshing = False
+
+        if self._row_height is None and self._items:
+            # Fit the window to the real row height once the first row is drawn
+            self.after_idle(lambda: self._fit_rows(self.tree.winfo_height()))
+
+        if count:
+            self.y_scroll.set(self._offset / count, min(1.0, (self._offset + needed) / count))
+        else:
+            self.y_scroll.set(0.0, 1.0)
+
+    def _on_select(self, _event=None):
+        if self._refreshing:
+            return
+        window = range(self._offset, self._offset + len(self._items))
+        kept = {position for position in self._selected if position not in window}
+        selected = set(self.tree.selection())
+        self._selected = kept | {
+            self._offset + slot for slot, item in enumerate(self._items) if item in selected
+        }
+
+    def _measure(self):
+        """Row and header height from the first materialized row, once it is on screen."""
+        if self._row_height or not self._items:
+            return
+        bbox = self.tree.bbox(self._items[0])
+        if bbox:
+            self._header_height = bbox[1]
+            self._row_height = bbox[3]
+
+    def _on_configure(self, event):
+        self._fit_rows(event.height)
+
+    def _fit_rows(self, height):
+        try:
+            self._measure()
+        except tk.TclError:
+            return  # widget destroyed
+        if height <= 1:
+            return  # not laid out yet
+        row_height = self._row_height or DEFAULT_ROW_HEIGHT
+        header_height = self._header_height or row_height
+        rows = max(1, (height - header_height) // row_height)
+        if rows != self._visible_rows:
+            self._visible_rows = rows
+            self._refresh()
+
+    # ---- Headings ----
+    def _set_heading_commands(self):
+        if not self.sortable:
+            return
+        for column in self.model.columns:
+            self.tree.heading(column, command=lambda c=column: self.sort_by(c))
+
+    def _update_heading_arrows(self):
+        for position, column in enumerate(self.model.columns):
+            text = self.tree.heading(column, "text") or column
+            for arrow in _SORT_ARROWS:
+                if text.endswith(arrow):
+                    text = text[:-len(arrow)]
+            if position == self.model.sort_column:
+                text += _SORT_ARROWS[1 if self.model.sort_descending else 0]
+            self.tree.heading(column, text=text)
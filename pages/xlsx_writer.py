@@ -0,0 +1,141 @@
+"""
+XLSX output and sheet styling for template exports and reconciliation reports.
+
+Rows are streamed into an openpyxl write-only (constant-memory) workbook: data
+cells are written as plain values, the header uses one shared named style, and
+zebra striping is a single conditional-formatting rule over the data range
+instead of a fill object on every cell of every other row. format_sheet applies
+the same styling to a sheet that has already been written (e.g. by pandas).
+"""
+from collections.abc import Mapping
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.formatting.rule import FormulaRule
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
+
+from .fixed_point import FixedPointValue
+
+
+# Template colours (same as the original per-cell styling)
+HEADER_FILL_COLOR = "87CEEB"
+HEADER_FONT_COLOR = "FFFFFF"
+ZEBRA_FILL_COLOR = "DCE6F1"
+
+HEADER_STYLE_NAME = "template_header"
+
+# Reconciliation report colours: Blue, Accent 1, Darker 25% header, light blue zebra
+RECON_HEADER_FILL_COLOR = "305496"
+RECON_ZEBRA_FILL_COLOR = "D9E1F2"
+RECON_HEADER_STYLE_NAME = "recon_header"
+
+
+def header_style(name=HEADER_STYLE_NAME, fill_color=HEADER_FILL_COLOR, font_color=HEADER_FONT_COLOR,
+                 centered=False):
+    """Named style shared by every header cell of a sheet (no borders)."""
+    return NamedStyle(
+        name=name,
+        fill=PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid"),
+        font=Font(color=font_color, bold=True),
+        alignment=Alignment(horizontal="center", vertical="center") if centered else Alignment(),
+        border=Border(),
+    )
+
+
+def zebra_rule(fill_color=ZEBRA_FILL_COLOR):
+    """Conditional-format rule filling even rows (row 2, 4, ...) with the zebra colour."""
+    return FormulaRule(
+        formula=["MOD(ROW(),2)=0"],
+        fill=PatternFill(start_color=fill_color, end_color=fill_color, fill_type="solid"),
+    )
+
+
+def zebra_range(column_count, last_row, first_row=2):
+    """A1-style range covering the data rows to stripe, or None if there are none."""
+    if column_count <= 0 or last_row < first_row:
+        return None
+    return f"A{first_row}:{get_column_letter(column_count)}{last_row}"
+
+
+def _cell_value(value):
+    """FixedPointValue cells are written as Decimals (numeric in Excel); the rest as-is."""
+    return value.to_decimal() if isinstance(value, FixedPointValue) else value
+
+
+def row_values(rows, headers):
+    """Yield every row as a list in header order.
+
+    Args:
+        rows: Iterable of dicts (looked up by header, missing keys become "")
+            or of sequences already in header order
+        headers (list[str]): Header column names
+    """
+    for row in rows:
+        if isinstance(row, Mapping):
+            yield [_cell_value(row.get(header, "")) for header in headers]
+        else:
+            yield [_cell_value(value) for value in row]
+
+
+def write_template_xlsx(rows, headers, output, sheet_title="Sheet1"):
+    """Stream rows into a styled single-sheet workbook.
+
+    Args:
+        rows: Iterable of row dicts or row sequences (may be a generator)
+        headers (list[str]): Header column names
+        output: File path or binary file object to save to
+        sheet_title (str): Worksheet title
+
+    Returns:
+        int: Number of data rows written
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_title)
+    wb.add_named_style(header_style())
+
+    header_cells = []
+    for title in headers:
+        cell = WriteOnlyCell(ws, value=title)
+        cell.style = HEADER_STYLE_NAME
+        header_cells.append(cell)
+    ws.append(header_cells)
+
+    row_count = 0
+    for values in row_values(rows, headers):
+        ws.append(values)
+        row_count += 1
+
+    stripe_range = zebra_range(len(headers), row_count + 1)
+    if stripe_range:
+        ws.conditional_formatting.add(stripe_range, zebra_rule())
+
+    wb.save(output)
+    return row_count
+
+
+def format_sheet(worksheet, num_rows, num_cols, style=None, zebra_color=RECON_ZEBRA_FILL_COLOR):
+    """Style an already-written sheet: header row plus zebra-striped data rows.
+
+    The header named style is registered on the workbook once and the stripes are
+    one conditional-formatting rule, so the cost does not grow with the row count.
+
+    Args:
+        worksheet: openpyxl worksheet with the header in row 1
+        num_rows (int): Number of data rows below the header
+        num_cols (int): Number of columns
+        style (NamedStyle | None): Header style; defaults to the reconciliation header
+        zebra_color (str): Fill colour of the even rows
+    """
+    if style is None:
+        style = header_style(RECON_HEADER_STYLE_NAME, RECON_HEADER_FILL_COLOR, centered=True)
+    workbook = worksheet.parent
+    if style.name not in workbook.style_names:
+        workbook.add_named_style(style)
+
+    for col in range(1, num_cols + 1):
+        worksheet.cell(row=1, column=col).style = style.name
+
+    stripe_range = zebra_range(num_cols, num_rows + 1)
+    if stripe_range:
+        worksheet.conditional_formatting.add(stripe_range, zebra_rule(zebra_color))
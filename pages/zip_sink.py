@@ -0,0 +1,92 @@
+"""
+ZIP archives written member by member.
+
+Each member goes into the target archive (a path on disk or a binary file
+object) as soon as it is produced, instead of being collected in memory and
+copied into a second in-memory ZIP first. Members that are already compressed
+(.xlsx, nested .zip, ...) are stored as-is rather than deflated again.
+"""
+import os
+import shutil
+import zipfile
+
+
+# Compression level used by the exports (fast; output is dominated by already-compressed XLSX)
+DEFAULT_COMPRESSLEVEL = 1
+
+# Formats that are themselves ZIP/deflate containers; recompressing them only costs time
+STORED_EXTENSIONS = (".xlsx", ".xlsm", ".zip", ".gz", ".7z", ".png", ".jpg", ".jpeg", ".pdf")
+
+
+def member_compression(filename):
+    """ZIP compression type for a member, chosen from its extension."""
+    if filename.lower().endswith(STORED_EXTENSIONS):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+class ZipSink:
+    """Write-only ZIP archive that streams each member straight to its target.
+
+    Use as a context manager. If the block raises and the target is a path, the
+    partially written archive is removed.
+
+    Attributes:
+        names (list[str]): Member names written so far, in order
+    """
+
+    def __init__(self, target, compresslevel=DEFAULT_COMPRESSLEVEL):
+        """
+        Args:
+            target: Output path or writable binary file object
+            compresslevel (int): Deflate level (0-9) for compressible members
+        """
+        self.target = target
+        self.compresslevel = compresslevel
+        self.names = []
+        self._zip = zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+
+    def add(self, filename, content):
+        """Write one member.
+
+        Args:
+            filename (str): Name inside the archive
+            content: bytes, or a binary file object (read from the start in chunks)
+        """
+        with self.open(filename) as member:
+            if isinstance(content, (bytes, bytearray, memoryview)):
+                member.write(content)
+            else:
+                content.seek(0)
+                shutil.copyfileobj(content, member)
+
+    def add_file(self, path, filename=None):
+        """Copy a file from disk into the archive without loading it whole."""
+        filename = filename or os.path.basename(path)
+        with open(path, "rb") as source:
+            self.add(filename, source)
+
+    def open(self, filename):
+        """Open a writable stream for one member (e.g. to save a workbook straight into the archive)."""
+        # Opening by name makes ZipFile stamp the member with the current time and the
+        # archive's compresslevel; only the compression type varies per member
+        self._zip.compression = member_compression(filename)
+        self.names.append(filename)
+        # force_zip64 lets members larger than 2 GiB stream without knowing their size up front
+        return self._zip.open(filename, "w", force_zip64=True)
+
+    def close(self):
+        self._zip.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        if exc_type is not None and isinstance(self.target, (str, os.PathLike)):
+            try:
+                os.remove(self.target)
+            except OSError:
+                pass
+        return False
+
@@ -0,0 +1,333 @@
+"""
+Cold-start tracing for the app (development runs and the PyInstaller EXE).
+
+Enable it with the environment variable FUND_APP_TRACE_STARTUP=1 (or set it to
+an output path) or with the command-line flag --trace-startup[=PATH]. While
+enabled, the trace records:
+    - when the process started and, in a frozen build, when the bootloader
+      process that unpacked it started (the gap is the unpacking time)
+    - each startup phase wrapped in phase() (window, icon, config file, ...)
+    - every module import that took at least IMPORT_THRESHOLD_MS, with nesting
+finish() writes the trace as JSON (default: startup_trace.json next to the
+app) and a top-offenders report as .txt next to it. To print the report for an
+existing trace file:
+    python startup_trace.py startup_trace.json
+"""
+import importlib.abc
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+
+ENV_VAR = "FUND_APP_TRACE_STARTUP"
+CLI_FLAG = "--trace-startup"
+
+# Imports faster than this are not recorded (milliseconds)
+IMPORT_THRESHOLD_MS = 1.0
+
+# Entries listed per section of the report
+REPORT_TOP = 15
+
+_trace = None
+
+
+def _windows_process_start(pid):
+    import ctypes
+    from ctypes import wintypes
+
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    kernel32 = ctypes.windll.kernel32
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        creation, exited, kernel, user = (wintypes.FILETIME() for _ in range(4))
+        if not kernel32.GetProcessTimes(handle, ctypes.byref(creation), ctypes.byref(exited),
+                                        ctypes.byref(kernel), ctypes.byref(user)):
+            return None
+        ticks = (creation.dwHighDateTime << 32) | creation.dwLowDateTime
+        # FILETIME counts 100 ns intervals since 1601-01-01
+        return (ticks - 116444736000000000) / 1e7
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def _linux_process_start(pid):
+    with open(f"/proc/{pid}/stat") as f:
+        # Field 22 (after the parenthesised command name) is the start time in clock ticks since boot
+        start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+    with open("/proc/stat") as f:
+        boot_time = next(int(line.split()[1]) for line in f if line.startswith("btime"))
+    return boot_time + start_ticks / os.sysconf("SC_CLK_TCK")
+
+
+def process_start_time(pid=None):
+    """Wall-clock start time (epoch seconds) of a process, or None where it cannot be read."""
+    pid = pid or os.getpid()
+    try:
+        if sys.platform == "win32":
+            return _windows_process_start(pid)
+        return _linux_process_start(pid)
+    except Exception:
+        return None
+
+
+class _TimedLoader:
+    """Wraps a module loader and records how long exec_module takes."""
+
+    def __init__(self, loader, trace):
+        self._loader = loader
+        self._trace = trace
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create else None
+
+    def exec_module(self, module):
+        trace = self._trace
+        depth = trace._enter_import()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            trace._leave_import(module.__name__, start, time.perf_counter(), depth)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta path finder that wraps the loader found by the finders after it."""
+
+    def __init__(self, trace):
+        self._trace = trace
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._trace)
+                return spec
+        return None
+
+
+class StartupTrace:
+    """Collects startup phases and import timings; see the module docstring."""
+
+    def __init__(self, output_path):
+        self.output_path = output_path
+        self.wall_start = time.time()
+        self._perf_start = time.perf_counter()
+        self.process_start = process_start_time()
+        self.bootloader_start = process_start_time(os.getppid()) if getattr(sys, "frozen", False) else None
+        self.phases = []
+        self.imports = []
+        self.marks = []
+        self._local = threading.local()
+        self._finder = _ImportTimer(self)
+        self.finished = False
+
+    def _offset(self, perf_time):
+        """Seconds since the trace started"""
+        return perf_time - self._perf_start
+
+    def _enter_import(self):
+        depth = getattr(self._local, "depth", 0)
+        self._local.depth = depth + 1
+        return depth
+
+    def _leave_import(self, name, start, end, depth):
+        self._local.depth = depth
+        duration_ms = (end - start) * 1000
+        if duration_ms >= IMPORT_THRESHOLD_MS:
+            self.imports.append({
+                "module": name,
+                "start": round(self._offset(start), 6),
+                "duration_ms": round(duration_ms, 3),
+                "depth": depth,
+                "thread": threading.current_thread().name,
+            })
+
+    def install(self):
+        sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self):
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append({
+                "phase": name,
+                "start": round(self._offset(start), 6),
+                "duration_ms": round((end - start) * 1000, 3),
+            })
+
+    def mark(self, name):
+        self.marks.append({"mark": name, "at": round(self._offset(time.perf_counter()), 6)})
+
+    def to_dict(self):
+        """Trace as JSON-ready data; all times are seconds since the trace started unless noted"""
+        before = []
+        if self.bootloader_start and self.process_start:
+            before.append({"phase": "bootloader/unpack",
+                           "duration_ms": round((self.process_start - self.bootloader_start) * 1000, 3)})
+        if self.process_start:
+            before.append({"phase": "interpreter start",
+                           "duration_ms": round((self.wall_start - self.process_start) * 1000, 3)})
+        return {
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "executable": sys.executable,
+            "python": sys.version.split()[0],
+            "trace_started_epoch": self.wall_start,
+            "process_started_epoch": self.process_start,
+            "bootloader_started_epoch": self.bootloader_start,
+            "total_ms": round(self._offset(time.perf_counter()) * 1000, 3),
+            "before_trace": before,
+            "phases": self.phases,
+            "marks": self.marks,
+            "imports": self.imports,
+        }
+
+    def finish(self):
+        """Stop recording and write the JSON trace and the text report"""
+        if self.finished:
+            return None
+        self.finished = True
+        self.mark("trace finished")
+        self.uninstall()
+        data = self.to_dict()
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        report_path = os.path.splitext(self.output_path)[0] + ".txt"
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(format_report(data))
+        return self.output_path
+
+
+def format_report(data, top=REPORT_TOP):
+    """Top-offenders report for a trace (as written by StartupTrace.finish)"""
+    lines = [
+        f"Startup trace ({'frozen EXE' if data.get('frozen') else 'script'}, Python {data.get('python')})",
+        f"Traced time until first idle: {data.get('total_ms', 0):,.0f} ms",
+        "",
+    ]
+    for item in data.get("before_trace", []):
+        lines.append(f"  {item['phase']:<44} {item['duration_ms']:10,.1f} ms")
+
+    lines += ["", "Slowest phases:"]
+    for item in sorted(data.get("phases", []), key=lambda p: p["duration_ms"], reverse=True)[:top]:
+        lines.append(f"  {item['phase']:<44} {item['duration_ms']:10,.1f} ms   at {item['start']:7.3f} s")
+
+    imports = data.get("imports", [])
+    # Self time: the module's own time minus the direct children recorded inside it
+    ordered = sorted(imports, key=lambda i: i["start"])
+    self_ms = {}
+    for index, item in enumerate(ordered):
+        end = item["start"] + item["duration_ms"] / 1000
+        children = sum(
+            child["duration_ms"] for child in ordered[index + 1:]
+            if child["depth"] == item["depth"] + 1 and child["thread"] == item["thread"]
+            and child["start"] < end
+        )
+        self_ms[id(item)] = max(item["duration_ms"] - children, 0.0)
+
+    lines += ["", "Slowest top-level imports (including their dependencies):"]
+    top_level = [i for i in imports if i["depth"] == 0]
+    for item in sorted(top_level, key=lambda i: i["duration_ms"], reverse=True)[:top]:
+        lines.append(f"  {item['module']:<44} {item['duration_ms']:10,.1f} ms   [{item['thread']}]")
+
+    lines += ["", "Modules with the most import time of their own:"]
+    for item in sorted(imports, key=lambda i: self_ms[id(i)], reverse=True)[:top]:
+        lines.append(f"  {item['module']:<44} {self_ms[id(item)]:10,.1f} ms")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def enable(output_path=None):
+    """Start tracing (idempotent) and return the StartupTrace"""
+    global _trace
+    if _trace is None:
+        if not output_path:
+            if getattr(sys, "frozen", False):
+                directory = os.path.dirname(sys.executable)
+            else:
+                directory = os.path.dirname(os.path.abspath(__file__))
+            output_path = os.path.join(directory, "startup_trace.json")
+        _trace = StartupTrace(output_path)
+        _trace.install()
+    return _trace
+
+
+def enable_from_environment(argv=None):
+    """Enable tracing if FUND_APP_TRACE_STARTUP or --trace-startup asks for it.
+
+    The flag is removed from `argv` (normally sys.argv) so nothing else sees it.
+
+    Returns:
+        StartupTrace | None
+    """
+    argv = sys.argv if argv is None else argv
+    output_path = None
+    requested = False
+    for arg in list(argv[1:]):
+        if arg == CLI_FLAG or arg.startswith(CLI_FLAG + "="):
+            requested = True
+            output_path = arg.partition("=")[2] or output_path
+            argv.remove(arg)
+    value = os.environ.get(ENV_VAR, "").strip()
+    if value and value.lower() not in ("0", "false", "no"):
+        requested = True
+        if value.lower() not in ("1", "true", "yes"):
+            output_path = output_path or value
+    return enable(output_path) if requested else None
+
+
+def enabled():
+    return _trace is not None and not _trace.finished
+
+
+@contextmanager
+def phase(name):
+    """Record a startup phase (does nothing when tracing is off)"""
+    if enabled():
+        with _trace.phase(name):
+            yield
+    else:
+        yield
+
+
+def mark(name):
+    """Record a point in time (does nothing when tracing is off)"""
+    if enabled():
+        _trace.mark(name)
+
+
+def finish():
+    """Write the trace if tracing is on; returns the JSON path or None"""
+    if not enabled():
+        return None
+    try:
+        return _trace.finish()
+    except Exception as e:
+        print(f"Could not write startup trace: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("Usage: python startup_trace.py <startup_trace.json>")
+        sys.exit(2)
+    with open(sys.argv[1], encoding="utf-8") as f:
+        print(format_report(json.load(f)))